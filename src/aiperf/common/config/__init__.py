@@ -76,6 +76,8 @@ from aiperf.common.config.loader import (
 )
 from aiperf.common.config.loadgen_config import (
     LoadGeneratorConfig,
+    LoadStageConfig,
+    parse_load_stages,
 )
 from aiperf.common.config.output_config import (
     OutputConfig,
@@ -136,6 +138,7 @@ __all__ = [
     "InputTokensDefaults",
     "LoadGeneratorConfig",
     "LoadGeneratorDefaults",
+    "LoadStageConfig",
     "OutputConfig",
     "OutputDefaults",
     "OutputTokensConfig",
@@ -165,6 +168,7 @@ __all__ = [
     "load_service_config",
     "load_user_config",
     "parse_file",
+    "parse_load_stages",
     "parse_service_types",
     "parse_str_as_numeric_dict",
     "parse_str_or_csv_list",
@@ -12,10 +12,12 @@ from aiperf.common.enums import (
     EndpointType,
     ExportLevel,
     ImageFormat,
+    MessageCodecType,
     ModelSelectionStrategy,
     RequestRateMode,
     ServiceRunType,
     TimingMode,
+    TokenRateType,
     VideoFormat,
     VideoSynthType,
 )
@@ -137,8 +139,14 @@ class OutputDefaults:
     LOG_FOLDER = Path("logs")
     LOG_FILE = Path("aiperf.log")
     INPUTS_JSON_FILE = Path("inputs.json")
+    PROFILE_EXPORT_AIPERF_ADAPTIVE_JSON_FILE = Path(
+        "profile_export_aiperf_adaptive.json"
+    )
     PROFILE_EXPORT_AIPERF_CSV_FILE = Path("profile_export_aiperf.csv")
     PROFILE_EXPORT_AIPERF_JSON_FILE = Path("profile_export_aiperf.json")
+    PROFILE_EXPORT_AIPERF_SEARCH_JSON_FILE = Path("profile_export_aiperf_search.json")
+    PROFILE_EXPORT_AIPERF_STAGES_CSV_FILE = Path("profile_export_aiperf_stages.csv")
+    PROFILE_EXPORT_AIPERF_STAGES_JSON_FILE = Path("profile_export_aiperf_stages.json")
     PROFILE_EXPORT_AIPERF_TIMESLICES_CSV_FILE = Path(
         "profile_export_aiperf_timeslices.csv"
     )
@@ -169,6 +177,7 @@ class ServiceDefaults:
     SERVICE_RUN_TYPE = ServiceRunType.MULTIPROCESSING
     COMM_BACKEND = CommunicationBackend.ZMQ_IPC
     COMM_CONFIG = None
+    MESSAGE_CODEC = MessageCodecType.JSON
     LOG_LEVEL = AIPerfLogLevel.INFO
     VERBOSE = False
     EXTRA_VERBOSE = False
@@ -186,6 +195,35 @@ class LoadGeneratorDefaults:
     REQUEST_COUNT = 10
     WARMUP_REQUEST_COUNT = 0
     REQUEST_RATE_MODE = RequestRateMode.POISSON
+    REQUEST_RATE_END = None
+    REQUEST_RATE_RAMP_DURATION = None
+    REQUEST_RATE_STEP = None
+    REQUEST_RATE_STEP_DURATION = None
+    REQUEST_RATE_AMPLITUDE = None
+    REQUEST_RATE_PERIOD = None
+    REQUEST_RATE_CV = None
+    LOAD_STAGES = None
+    SEARCH_MODE = None
+    SEARCH_MIN = 1.0
+    SEARCH_MAX = None
+    SEARCH_PROBE_DURATION = 30.0
+    SEARCH_MAX_PROBES = 8
+    SEARCH_SLO_ATTAINMENT = 99.0
+    ADAPTIVE_TARGET = None
+    ADAPTIVE_METRIC = "time_to_first_token"
+    ADAPTIVE_PERCENTILE = 90.0
+    ADAPTIVE_WINDOW = 10.0
+    ADAPTIVE_INTERVAL = 2.0
+    ADAPTIVE_MIN_CONCURRENCY = 1
+    ADAPTIVE_MAX_CONCURRENCY = None
+    ADAPTIVE_INCREASE = 1
+    ADAPTIVE_DECREASE = 0.75
+    TOKENS_PER_MINUTE = None
+    TOKEN_RATE_TYPE = TokenRateType.INPUT
+    TOKEN_RATE_BURST = None
+    TOKEN_RATE_FEEDBACK = False
+    PER_TURN_CREDITS = False
+    CREDIT_SCHEDULER = None
     TIMING_MODE = TimingMode.REQUEST_RATE
     REQUEST_CANCELLATION_RATE = 0.0
     REQUEST_CANCELLATION_DELAY = 0.0
@@ -3,7 +3,7 @@
 
 from typing import Annotated, Any
 
-from pydantic import BeforeValidator, Field, model_validator
+from pydantic import BeforeValidator, Field, field_serializer, model_validator
 from typing_extensions import Self
 
 from aiperf.common import random_generator as rng
@@ -114,6 +114,14 @@ class InputConfig(BaseConfig):
 
         return self
 
+    @field_serializer("goodput")
+    def serialize_goodput(self, goodput: dict[str, float] | None) -> str | None:
+        """Serialize the goodput SLOs in the 'KEY:VALUE' format of --goodput, so that the dumped config can be
+        validated again, such as when loading an exported profile."""
+        if goodput is None:
+            return None
+        return " ".join(f"{tag}:{value}" for tag, value in goodput.items())
+
     @model_validator(mode="after")
     def validate_dataset_sampling_strategy(self) -> Self:
         """Validate the dataset sampling strategy configuration."""
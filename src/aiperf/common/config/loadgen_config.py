@@ -1,15 +1,128 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Any
 
-from pydantic import Field
+import orjson
+from pydantic import BeforeValidator, Field, model_validator
+from typing_extensions import Self
 
 from aiperf.common.config.base_config import BaseConfig
 from aiperf.common.config.cli_parameter import CLIParameter
 from aiperf.common.config.config_defaults import LoadGeneratorDefaults
 from aiperf.common.config.groups import Groups
-from aiperf.common.enums import RequestRateMode
+from aiperf.common.enums import (
+    CreditSchedulerType,
+    RequestRateMode,
+    ThroughputSearchMode,
+    TokenRateType,
+)
+from aiperf.common.utils import load_json_str
+
+
+class LoadStageConfig(BaseConfig):
+    """
+    A configuration class for a single stage of a multi-stage load profile.
+
+    Each stage runs back-to-back in the profiling phase with its own load, and either a request count or a duration.
+    The request rate options have the same meaning as their top-level counterparts.
+    """
+
+    name: str | None = Field(
+        default=None,
+        description="The name of the stage, used in the logs and exports. Defaults to the stage index.",
+    )
+    concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="The concurrency of the stage.",
+    )
+    request_rate: float | None = Field(
+        default=None,
+        gt=0,
+        description="The request rate of the stage. Unit: requests/second",
+    )
+    request_rate_mode: RequestRateMode | None = Field(
+        default=None,
+        description="The request rate mode of the stage. Defaults to poisson when a request rate is set, "
+        "and concurrency_burst otherwise.",
+    )
+    request_count: int | None = Field(
+        default=None,
+        ge=1,
+        description="The number of requests to send in the stage.",
+    )
+    duration: float | None = Field(
+        default=None,
+        gt=0,
+        description="The duration of the stage in seconds.",
+    )
+    request_rate_end: float | None = Field(default=None, gt=0)
+    request_rate_ramp_duration: float | None = Field(default=None, gt=0)
+    request_rate_step: float | None = Field(default=None, gt=0)
+    request_rate_step_duration: float | None = Field(default=None, gt=0)
+    request_rate_amplitude: float | None = Field(default=None, ge=0)
+    request_rate_period: float | None = Field(default=None, gt=0)
+    request_rate_cv: float | None = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def validate_stage(self) -> Self:
+        """Validate the load and the length of the stage, and resolve the default request rate mode."""
+        if (self.request_count is None) == (self.duration is None):
+            raise ValueError(
+                "Each load stage must set exactly one of 'request_count' or 'duration'."
+            )
+        if self.request_rate is None:
+            if self.concurrency is None:
+                raise ValueError(
+                    "Each load stage must set a 'concurrency', a 'request_rate', or both."
+                )
+            if self.request_rate_mode not in (None, RequestRateMode.CONCURRENCY_BURST):
+                raise ValueError(
+                    f"Load stage request rate mode {self.request_rate_mode!r} requires a 'request_rate'."
+                )
+            self.request_rate_mode = RequestRateMode.CONCURRENCY_BURST
+        elif self.request_rate_mode == RequestRateMode.CONCURRENCY_BURST:
+            raise ValueError(
+                f"Load stage request rate mode cannot be {RequestRateMode.CONCURRENCY_BURST!r} when a request rate is specified."
+            )
+        elif self.request_rate_mode is None:
+            self.request_rate_mode = RequestRateMode.POISSON
+        return self
+
+
+def parse_load_stages(input: Any) -> list[LoadStageConfig] | None:
+    """
+    Parses the load stages from a JSON list, either as a string or as the path to a JSON file, or from a list of
+    dictionaries (such as from a config file).
+
+    Raises:
+        ValueError: If the input is not a valid list of load stages.
+    """
+    if input is None:
+        return None
+
+    if isinstance(input, str | Path):
+        try:
+            if isinstance(input, str) and input.lstrip().startswith("["):
+                input = load_json_str(input)
+            else:
+                input = load_json_str(Path(input).read_text())
+        except (OSError, orjson.JSONDecodeError) as e:
+            raise ValueError(
+                f"User Config: {input} - load stages must be a JSON list or the path to a JSON file"
+            ) from e
+
+    if not isinstance(input, list | tuple) or not input:
+        raise ValueError(
+            f"User Config: {input} - load stages must be a non-empty list of stages"
+        )
+
+    return [
+        stage if isinstance(stage, LoadStageConfig) else LoadStageConfig(**stage)
+        for stage in input
+    ]
 
 
 class LoadGeneratorConfig(BaseConfig):
@@ -80,9 +193,18 @@ class LoadGeneratorConfig(BaseConfig):
     request_rate_mode: Annotated[
         RequestRateMode,
         Field(
-            description="Sets the request rate mode for the load generated by AIPerf. Valid values: constant, poisson.\n"
+            description="Sets the request rate mode for the load generated by AIPerf. "
+            "Valid values: constant, poisson, ramp, step, sinusoidal, gamma.\n"
             "constant: Generate requests at a fixed rate.\n"
-            "poisson: Generate requests using a poisson distribution."
+            "poisson: Generate requests using a poisson distribution.\n"
+            "ramp: Ramp the rate of a poisson distribution linearly from --request-rate to --request-rate-end "
+            "over --request-rate-ramp-duration.\n"
+            "step: Increase the rate of a poisson distribution by --request-rate-step every "
+            "--request-rate-step-duration, starting at --request-rate and up to --request-rate-end if set.\n"
+            "sinusoidal: Vary the rate of a poisson distribution around --request-rate with "
+            "--request-rate-amplitude and --request-rate-period.\n"
+            "gamma: Generate bursty requests using a gamma distribution at --request-rate, "
+            "with the coefficient of variation --request-rate-cv."
         ),
         CLIParameter(
             name=("--request-rate-mode"),
@@ -91,6 +213,443 @@ class LoadGeneratorConfig(BaseConfig):
         ),
     ] = LoadGeneratorDefaults.REQUEST_RATE_MODE
 
+    # NEW AIPerf Option
+    request_rate_end: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The request rate at the end of the ramp for the ramp request rate mode, "
+            "and the maximum request rate for the step request rate mode. Unit: requests/second",
+        ),
+        CLIParameter(
+            name=("--request-rate-end",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_END
+
+    # NEW AIPerf Option
+    request_rate_ramp_duration: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The duration in seconds of the ramp for the ramp request rate mode. "
+            "Defaults to --benchmark-duration.",
+        ),
+        CLIParameter(
+            name=("--request-rate-ramp-duration",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_RAMP_DURATION
+
+    # NEW AIPerf Option
+    request_rate_step: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The increase of the request rate at each step for the step request rate mode. "
+            "Unit: requests/second",
+        ),
+        CLIParameter(
+            name=("--request-rate-step",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_STEP
+
+    # NEW AIPerf Option
+    request_rate_step_duration: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The duration in seconds of each step for the step request rate mode. "
+            "Also used as the --slice-duration if it is not set, so metrics are reported for each step.",
+        ),
+        CLIParameter(
+            name=("--request-rate-step-duration",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_STEP_DURATION
+
+    # NEW AIPerf Option
+    request_rate_amplitude: Annotated[
+        float | None,
+        Field(
+            ge=0,
+            description="The amplitude of the sinusoid for the sinusoidal request rate mode. "
+            "Must be less than --request-rate. Unit: requests/second",
+        ),
+        CLIParameter(
+            name=("--request-rate-amplitude",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_AMPLITUDE
+
+    # NEW AIPerf Option
+    request_rate_period: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The period in seconds of the sinusoid for the sinusoidal request rate mode.",
+        ),
+        CLIParameter(
+            name=("--request-rate-period",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_PERIOD
+
+    # NEW AIPerf Option
+    request_rate_cv: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The coefficient of variation of the inter-arrival times for the gamma request rate mode. "
+            "Values greater than 1 are burstier than a poisson distribution, and less than 1 are more regular.",
+        ),
+        CLIParameter(
+            name=("--request-rate-cv",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.REQUEST_RATE_CV
+
+    # NEW AIPerf Option
+    load_stages: Annotated[
+        Any,
+        Field(
+            description="Run a multi-stage load profile, where each stage runs back-to-back in the same benchmark "
+            "with its own load. Provided as a JSON list, or the path to a JSON file, of stages with the keys: "
+            "name, concurrency, request_rate, request_rate_mode, and either request_count or duration "
+            "(plus any of the request rate mode options, such as request_rate_cv). "
+            "All stages must use either request_count or duration. Metrics are reported for each stage. "
+            "Cannot be used with --concurrency, --request-rate, --request-count or --benchmark-duration.\n"
+            'Example: \'[{"concurrency": 8, "duration": 60}, {"concurrency": 32, "duration": 60}]\'',
+        ),
+        CLIParameter(
+            name=("--load-stages",),
+            group=_CLI_GROUP,
+        ),
+        BeforeValidator(parse_load_stages),
+    ] = LoadGeneratorDefaults.LOAD_STAGES
+
+    @property
+    def load_stages_request_count(self) -> int | None:
+        """The total request count of the load stages, or None if they are duration-based or not set."""
+        if not self.load_stages or self.load_stages[0].request_count is None:
+            return None
+        return sum(stage.request_count for stage in self.load_stages)
+
+    @property
+    def load_stages_duration(self) -> float | None:
+        """The total duration of the load stages, or None if they are count-based or not set."""
+        if not self.load_stages or self.load_stages[0].duration is None:
+            return None
+        return sum(stage.duration for stage in self.load_stages)
+
+    # NEW AIPerf Option
+    search_mode: Annotated[
+        ThroughputSearchMode | None,
+        Field(
+            description="Search for the highest load at which the --goodput SLOs are met, by running a series of "
+            "short probes of --search-probe-duration seconds at different loads, between --search-min and "
+            "--search-max. Valid values: concurrency, request_rate.\n"
+            "concurrency: Vary the concurrency of each probe.\n"
+            "request_rate: Vary the request rate of each probe, with --concurrency as an optional cap.\n"
+            "A probe passes when at least --search-slo-attainment percent of its requests meet all of the "
+            "--goodput SLOs. Requires --goodput, and cannot be used with --request-rate, --request-count, "
+            "--benchmark-duration or --load-stages.",
+        ),
+        CLIParameter(
+            name=("--search-mode",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_MODE
+
+    # NEW AIPerf Option
+    search_min: Annotated[
+        float,
+        Field(
+            gt=0,
+            description="The lowest load probed by --search-mode. "
+            "A concurrency, or a request rate in requests/second.",
+        ),
+        CLIParameter(
+            name=("--search-min",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_MIN
+
+    # NEW AIPerf Option
+    search_max: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The highest load probed by --search-mode. Required with --search-mode. "
+            "A concurrency, or a request rate in requests/second.",
+        ),
+        CLIParameter(
+            name=("--search-max",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_MAX
+
+    # NEW AIPerf Option
+    search_probe_duration: Annotated[
+        float,
+        Field(
+            ge=1,
+            description="The duration in seconds of each probe of --search-mode. Each probe waits up to "
+            "--benchmark-grace-period seconds for its in-flight requests before the next probe starts.",
+        ),
+        CLIParameter(
+            name=("--search-probe-duration",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_PROBE_DURATION
+
+    # NEW AIPerf Option
+    search_max_probes: Annotated[
+        int,
+        Field(
+            ge=2,
+            description="The maximum number of probes run by --search-mode, including the probes at "
+            "--search-min and --search-max.",
+        ),
+        CLIParameter(
+            name=("--search-max-probes",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_MAX_PROBES
+
+    # NEW AIPerf Option
+    search_slo_attainment: Annotated[
+        float,
+        Field(
+            gt=0,
+            le=100,
+            description="The minimum percentage of the requests of a probe that must meet all of the --goodput "
+            "SLOs for the probe to pass. For example, 99 requires the SLOs to hold at the 99th percentile.",
+        ),
+        CLIParameter(
+            name=("--search-slo-attainment",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SEARCH_SLO_ATTAINMENT
+
+    # NEW AIPerf Option
+    adaptive_target: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="Adjust the concurrency during the profiling phase to hold the --adaptive-percentile of "
+            "--adaptive-metric at this target, in the metric's display unit (such as ms). Every "
+            "--adaptive-interval seconds, the percentile over the requests completed in the last --adaptive-window "
+            "seconds is compared against the target. The concurrency is increased by --adaptive-increase while "
+            "the target is met, and multiplied by --adaptive-decrease once it is exceeded (AIMD), between "
+            "--adaptive-min-concurrency and --adaptive-max-concurrency. --concurrency sets the initial concurrency. "
+            "Requires --adaptive-max-concurrency, and cannot be used with --request-rate, --load-stages or "
+            "--search-mode.",
+        ),
+        CLIParameter(
+            name=("--adaptive-target",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_TARGET
+
+    # NEW AIPerf Option
+    adaptive_metric: Annotated[
+        str,
+        Field(
+            description="The tag of the per-request latency metric that --adaptive-target applies to, "
+            "such as 'time_to_first_token', 'inter_token_latency' or 'request_latency'.",
+        ),
+        CLIParameter(
+            name=("--adaptive-metric",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_METRIC
+
+    # NEW AIPerf Option
+    adaptive_percentile: Annotated[
+        float,
+        Field(
+            gt=0,
+            le=100,
+            description="The percentile of --adaptive-metric that is held at --adaptive-target.",
+        ),
+        CLIParameter(
+            name=("--adaptive-percentile",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_PERCENTILE
+
+    # NEW AIPerf Option
+    adaptive_window: Annotated[
+        float,
+        Field(
+            gt=0,
+            description="The duration in seconds of the sliding window of completed requests that the "
+            "--adaptive-percentile is computed over. Requests started before the last change of the concurrency "
+            "are excluded, so that each decision only reflects the current concurrency.",
+        ),
+        CLIParameter(
+            name=("--adaptive-window",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_WINDOW
+
+    # NEW AIPerf Option
+    adaptive_interval: Annotated[
+        float,
+        Field(
+            gt=0,
+            description="The interval in seconds between the adjustments of the concurrency by --adaptive-target.",
+        ),
+        CLIParameter(
+            name=("--adaptive-interval",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_INTERVAL
+
+    # NEW AIPerf Option
+    adaptive_min_concurrency: Annotated[
+        int,
+        Field(
+            ge=1,
+            description="The lowest concurrency that --adaptive-target can decrease to.",
+        ),
+        CLIParameter(
+            name=("--adaptive-min-concurrency",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_MIN_CONCURRENCY
+
+    # NEW AIPerf Option
+    adaptive_max_concurrency: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            description="The highest concurrency that --adaptive-target can increase to. "
+            "Required with --adaptive-target.",
+        ),
+        CLIParameter(
+            name=("--adaptive-max-concurrency",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_MAX_CONCURRENCY
+
+    # NEW AIPerf Option
+    adaptive_increase: Annotated[
+        int,
+        Field(
+            ge=1,
+            description="The amount the concurrency is increased by, each interval that --adaptive-target is met.",
+        ),
+        CLIParameter(
+            name=("--adaptive-increase",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_INCREASE
+
+    # NEW AIPerf Option
+    adaptive_decrease: Annotated[
+        float,
+        Field(
+            gt=0,
+            lt=1,
+            description="The factor the concurrency is multiplied by, each interval that --adaptive-target is "
+            "exceeded.",
+        ),
+        CLIParameter(
+            name=("--adaptive-decrease",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.ADAPTIVE_DECREASE
+
+    # NEW AIPerf Option
+    tokens_per_minute: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="Send requests to meet a target token throughput in tokens per minute, such as the TPM budget "
+            "of a provider, instead of a request rate. The token count of each conversation is charged against a "
+            "token bucket, which refills at this rate, and each request is sent once its tokens are available. "
+            "--concurrency optionally limits the number of concurrent requests. Cannot be used with --request-rate, "
+            "--load-stages, --search-mode or --adaptive-target.",
+        ),
+        CLIParameter(
+            name=("--tokens-per-minute", "--tpm"),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.TOKENS_PER_MINUTE
+
+    # NEW AIPerf Option
+    token_rate_type: Annotated[
+        TokenRateType,
+        Field(
+            description="The tokens that are counted against --tokens-per-minute. 'input' counts the input tokens of "
+            "each request, and 'total' also counts the estimated output tokens, from the max_tokens of each turn.",
+        ),
+        CLIParameter(
+            name=("--token-rate-type",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.TOKEN_RATE_TYPE
+
+    # NEW AIPerf Option
+    token_rate_burst: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The capacity of the token bucket of --tokens-per-minute, which is the largest number of "
+            "tokens that can be sent in a burst. Defaults to one second of tokens.",
+        ),
+        CLIParameter(
+            name=("--token-rate-burst",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.TOKEN_RATE_BURST
+
+    # NEW AIPerf Option
+    token_rate_feedback: Annotated[
+        bool,
+        Field(
+            description="Estimate the output tokens of each request from the mean output sequence length measured "
+            "so far in the profiling phase, instead of from its max_tokens, which is only an upper bound. "
+            "Requires --token-rate-type total.",
+        ),
+        CLIParameter(
+            name=("--token-rate-feedback",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.TOKEN_RATE_FEEDBACK
+
+    # NEW AIPerf Option
+    per_turn_credits: Annotated[
+        bool,
+        Field(
+            description="Issue each turn of a multi-turn conversation as its own credit, instead of a single credit for "
+            "the whole conversation. The concurrency slot of a conversation is released during its turn delays, so that "
+            "--concurrency limits the number of in-flight requests instead of the number of open conversations.",
+        ),
+        CLIParameter(
+            name=("--per-turn-credits",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.PER_TURN_CREDITS
+
+    # NEW AIPerf Option
+    credit_scheduler: Annotated[
+        CreditSchedulerType | None,
+        Field(
+            description="How the timing manager waits for the scheduled time of each request. 'asyncio' uses event "
+            "loop timers, and 'hybrid_spin' uses a dedicated thread that sleeps, then spin-waits until the scheduled "
+            "time, which is more precise at sub-millisecond inter-arrival times at the cost of a busy CPU core. "
+            "Defaults to the AIPERF_TIMING_SCHEDULER environment variable, which defaults to 'asyncio'.",
+        ),
+        CLIParameter(
+            name=("--credit-scheduler",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.CREDIT_SCHEDULER
+
     request_count: Annotated[
         int,
         Field(
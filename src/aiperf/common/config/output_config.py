@@ -62,8 +62,20 @@ class OutputConfig(BaseConfig):
         ),
     ] = OutputDefaults.EXPORT_LEVEL
 
+    _profile_export_adaptive_json_file: Path = (
+        OutputDefaults.PROFILE_EXPORT_AIPERF_ADAPTIVE_JSON_FILE
+    )
     _profile_export_csv_file: Path = OutputDefaults.PROFILE_EXPORT_AIPERF_CSV_FILE
     _profile_export_json_file: Path = OutputDefaults.PROFILE_EXPORT_AIPERF_JSON_FILE
+    _profile_export_search_json_file: Path = (
+        OutputDefaults.PROFILE_EXPORT_AIPERF_SEARCH_JSON_FILE
+    )
+    _profile_export_stages_csv_file: Path = (
+        OutputDefaults.PROFILE_EXPORT_AIPERF_STAGES_CSV_FILE
+    )
+    _profile_export_stages_json_file: Path = (
+        OutputDefaults.PROFILE_EXPORT_AIPERF_STAGES_JSON_FILE
+    )
     _profile_export_timeslices_csv_file: Path = (
         OutputDefaults.PROFILE_EXPORT_AIPERF_TIMESLICES_CSV_FILE
     )
@@ -88,6 +100,10 @@ class OutputConfig(BaseConfig):
         suffixes_to_strip = [
             "_timeslices.csv",
             "_timeslices.json",
+            "_search.json",
+            "_adaptive.json",
+            "_stages.csv",
+            "_stages.json",
             "_gpu_telemetry.jsonl",
             "_raw.jsonl",
             ".csv",
@@ -101,6 +117,10 @@ class OutputConfig(BaseConfig):
 
         self._profile_export_csv_file = Path(f"{base_str}.csv")
         self._profile_export_json_file = Path(f"{base_str}.json")
+        self._profile_export_search_json_file = Path(f"{base_str}_search.json")
+        self._profile_export_adaptive_json_file = Path(f"{base_str}_adaptive.json")
+        self._profile_export_stages_csv_file = Path(f"{base_str}_stages.csv")
+        self._profile_export_stages_json_file = Path(f"{base_str}_stages.json")
         self._profile_export_timeslices_csv_file = Path(f"{base_str}_timeslices.csv")
         self._profile_export_timeslices_json_file = Path(f"{base_str}_timeslices.json")
         self._profile_export_jsonl_file = Path(f"{base_str}.jsonl")
@@ -130,6 +150,22 @@ class OutputConfig(BaseConfig):
     def profile_export_json_file(self) -> Path:
         return self.artifact_directory / self._profile_export_json_file
 
+    @property
+    def profile_export_search_json_file(self) -> Path:
+        return self.artifact_directory / self._profile_export_search_json_file
+
+    @property
+    def profile_export_adaptive_json_file(self) -> Path:
+        return self.artifact_directory / self._profile_export_adaptive_json_file
+
+    @property
+    def profile_export_stages_csv_file(self) -> Path:
+        return self.artifact_directory / self._profile_export_stages_csv_file
+
+    @property
+    def profile_export_stages_json_file(self) -> Path:
+        return self.artifact_directory / self._profile_export_stages_json_file
+
     @property
     def profile_export_timeslices_csv_file(self) -> Path:
         return self.artifact_directory / self._profile_export_timeslices_csv_file
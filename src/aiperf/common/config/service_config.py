@@ -19,6 +19,7 @@ from aiperf.common.config.zmq_config import (
 from aiperf.common.enums import (
     AIPerfLogLevel,
     AIPerfUIType,
+    MessageCodecType,
     ServiceRunType,
 )
 
@@ -163,6 +164,20 @@ class ServiceConfig(BaseConfig):
         ),
     ] = ServiceDefaults.UI_TYPE
 
+    message_codec: Annotated[
+        MessageCodecType,
+        Field(
+            description="The wire format of the messages exchanged between services over the push/pull and dealer/router sockets. "
+            "`json` is human readable and useful for debugging. `msgpack` is a compact binary format which "
+            "sends large byte fields as separate frames, and can be used to reduce the encoding cost and size "
+            "of high volume messages. Messages are still validated when they are decoded with either codec.",
+        ),
+        CLIParameter(
+            name=("--message-codec"),
+            group=_CLI_GROUP,
+        ),
+    ] = ServiceDefaults.MESSAGE_CODEC
+
     @property
     def comm_config(self) -> BaseZMQCommunicationConfig:
         """Get the communication configuration."""
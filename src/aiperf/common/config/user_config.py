@@ -20,7 +20,13 @@ from aiperf.common.config.loadgen_config import LoadGeneratorConfig
 from aiperf.common.config.output_config import OutputConfig
 from aiperf.common.config.tokenizer_config import TokenizerConfig
 from aiperf.common.enums import CustomDatasetType, GPUTelemetryMode
-from aiperf.common.enums.timing_enums import RequestRateMode, TimingMode
+from aiperf.common.enums.timing_enums import (
+    RequestRateMode,
+    ThroughputSearchMode,
+    TimingMode,
+    TokenRateType,
+)
+from aiperf.common.exceptions import MetricTypeError
 from aiperf.common.utils import load_json_str
 
 _logger = AIPerfLogger(__name__)
@@ -47,16 +53,188 @@ class UserConfig(BaseConfig):
             self.cli_command = " ".join(["aiperf", *args])
         return self
 
+    @model_validator(mode="after")
+    def validate_load_stages(self) -> Self:
+        """Validate that the load stages are not combined with the options that they replace."""
+        if not self.loadgen.load_stages:
+            return self
+
+        conflicting_options = {
+            "concurrency": "--concurrency",
+            "request_rate": "--request-rate",
+            "request_rate_mode": "--request-rate-mode",
+            "request_count": "--request-count",
+            "benchmark_duration": "--benchmark-duration",
+        }
+        for field, option in conflicting_options.items():
+            if field in self.loadgen.model_fields_set:
+                raise ValueError(
+                    f"--load-stages cannot be used with {option}. Set it for each stage instead."
+                )
+        if self.input.fixed_schedule:
+            raise ValueError("--load-stages cannot be used with --fixed-schedule.")
+        if len({stage.duration is None for stage in self.loadgen.load_stages}) > 1:
+            raise ValueError(
+                "All load stages must use either request_count or duration, and cannot be mixed."
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_throughput_search(self) -> Self:
+        """Validate that the throughput search has SLOs to search against, and is not combined with the options
+        that it replaces."""
+        if self.loadgen.search_mode is None:
+            return self
+
+        if not self.input.goodput:
+            raise ValueError(
+                "--search-mode requires --goodput, to define the SLOs that each probe is checked against."
+            )
+        conflicting_options = {
+            "request_rate": "--request-rate",
+            "request_count": "--request-count",
+            "benchmark_duration": "--benchmark-duration",
+            "load_stages": "--load-stages",
+        }
+        if self.loadgen.search_mode == ThroughputSearchMode.CONCURRENCY:
+            conflicting_options["concurrency"] = "--concurrency"
+            conflicting_options["request_rate_mode"] = "--request-rate-mode"
+        for field, option in conflicting_options.items():
+            if field in self.loadgen.model_fields_set:
+                raise ValueError(
+                    f"--search-mode {self.loadgen.search_mode} cannot be used with {option}."
+                )
+        if self.loadgen.request_rate_mode not in (
+            RequestRateMode.CONSTANT,
+            RequestRateMode.POISSON,
+            RequestRateMode.GAMMA,
+        ):
+            raise ValueError(
+                "--search-mode only supports the constant, poisson and gamma request rate modes."
+            )
+        if self.input.fixed_schedule:
+            raise ValueError("--search-mode cannot be used with --fixed-schedule.")
+        if self.loadgen.search_max is None:
+            raise ValueError("--search-mode requires --search-max.")
+        if self.loadgen.search_max <= self.loadgen.search_min:
+            raise ValueError("--search-max must be greater than --search-min.")
+        if self.loadgen.search_mode == ThroughputSearchMode.CONCURRENCY and not (
+            self.loadgen.search_min.is_integer()
+            and self.loadgen.search_max.is_integer()
+        ):
+            raise ValueError(
+                "--search-min and --search-max must be whole numbers when searching for a concurrency."
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_adaptive_concurrency(self) -> Self:
+        """Validate that the adaptive concurrency controller has a valid metric and bounds, and is not combined with
+        the options that it replaces."""
+        if self.loadgen.adaptive_target is None:
+            return self
+
+        conflicting_options = {
+            "request_rate": "--request-rate",
+            "request_rate_mode": "--request-rate-mode",
+            "load_stages": "--load-stages",
+            "search_mode": "--search-mode",
+        }
+        for field, option in conflicting_options.items():
+            if field in self.loadgen.model_fields_set:
+                raise ValueError(f"--adaptive-target cannot be used with {option}.")
+        if self.input.fixed_schedule:
+            raise ValueError("--adaptive-target cannot be used with --fixed-schedule.")
+        if self.loadgen.adaptive_max_concurrency is None:
+            raise ValueError("--adaptive-target requires --adaptive-max-concurrency.")
+        if (
+            self.loadgen.adaptive_max_concurrency
+            <= self.loadgen.adaptive_min_concurrency
+        ):
+            raise ValueError(
+                "--adaptive-max-concurrency must be greater than --adaptive-min-concurrency."
+            )
+        if self.loadgen.concurrency is not None and not (
+            self.loadgen.adaptive_min_concurrency
+            <= self.loadgen.concurrency
+            <= self.loadgen.adaptive_max_concurrency
+        ):
+            raise ValueError(
+                "--concurrency must be between --adaptive-min-concurrency and --adaptive-max-concurrency, "
+                "as it sets the initial concurrency of --adaptive-target."
+            )
+
+        from aiperf.common.enums import MetricType
+        from aiperf.metrics.metric_registry import MetricRegistry
+
+        tag = self.loadgen.adaptive_metric
+        try:
+            metric_cls = MetricRegistry.get_class(tag)
+        except MetricTypeError as e:
+            raise ValueError(f"Unknown metric tag in --adaptive-metric: {tag}") from e
+        if metric_cls.type != MetricType.RECORD:
+            raise ValueError(
+                f"Metric '{tag}' is not a per-request metric and cannot be used for --adaptive-metric. "
+                "Use a per-request metric instead (e.g., 'time_to_first_token', 'inter_token_latency')."
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_token_rate(self) -> Self:
+        """Validate that the token rate is not combined with the options that it replaces."""
+        if self.loadgen.tokens_per_minute is None:
+            return self
+
+        conflicting_options = {
+            "request_rate": "--request-rate",
+            "request_rate_mode": "--request-rate-mode",
+            "load_stages": "--load-stages",
+            "search_mode": "--search-mode",
+            "adaptive_target": "--adaptive-target",
+        }
+        for field, option in conflicting_options.items():
+            if field in self.loadgen.model_fields_set:
+                raise ValueError(f"--tokens-per-minute cannot be used with {option}.")
+        if self.input.fixed_schedule:
+            raise ValueError(
+                "--tokens-per-minute cannot be used with --fixed-schedule."
+            )
+        if (
+            self.loadgen.token_rate_feedback
+            and self.loadgen.token_rate_type != TokenRateType.TOTAL
+        ):
+            raise ValueError(
+                "--token-rate-feedback requires --token-rate-type total, as it estimates the output tokens."
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_timing_mode(self) -> Self:
         """Set the timing mode based on the user config. Will be called after all user config is set."""
         if self.input.fixed_schedule:
             self._timing_mode = TimingMode.FIXED_SCHEDULE
+        elif self.loadgen.search_mode is not None:
+            # The load of each probe is set by the search itself, so the top-level defaults are left untouched
+            self._timing_mode = TimingMode.THROUGHPUT_SEARCH
+        elif self.loadgen.adaptive_target is not None:
+            # The controller starts at the lowest concurrency unless one is set, and sends requests as soon as possible
+            if self.loadgen.concurrency is None:
+                self.loadgen.concurrency = self.loadgen.adaptive_min_concurrency
+            self._timing_mode = TimingMode.ADAPTIVE_CONCURRENCY
+            self.loadgen.request_rate_mode = RequestRateMode.CONCURRENCY_BURST
+            # Not a user choice, so that validating the config again does not see it as a conflicting option
+            self.loadgen.model_fields_set.discard("request_rate_mode")
+        elif self.loadgen.tokens_per_minute is not None:
+            # Requests are paced by the token bucket, and optionally limited by the concurrency
+            self._timing_mode = TimingMode.TOKEN_RATE
         elif self._should_use_fixed_schedule_for_mooncake_trace():
             self._timing_mode = TimingMode.FIXED_SCHEDULE
             _logger.info(
                 "Automatically enabling fixed schedule mode for mooncake_trace dataset with timestamps"
             )
+        elif self.loadgen.load_stages:
+            # The load of each stage is set by the stage itself, so the top-level defaults are left untouched
+            self._timing_mode = TimingMode.REQUEST_RATE
         elif self.loadgen.request_rate is not None:
             # Request rate is checked first, as if user has provided request rate and concurrency,
             # we will still use the request rate strategy.
@@ -75,6 +253,20 @@ class UserConfig(BaseConfig):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_step_slice_duration(self) -> Self:
+        """Report the metrics of each step of the step request rate mode, unless a slice duration is already set."""
+        if (
+            self.loadgen.request_rate_mode == RequestRateMode.STEP
+            and self.loadgen.request_rate_step_duration is not None
+            and self.output.slice_duration is None
+        ):
+            self.output.slice_duration = self.loadgen.request_rate_step_duration
+            _logger.info(
+                f"Using a slice duration of {self.output.slice_duration}s to report the metrics of each request rate step"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_benchmark_mode(self) -> Self:
         """Validate benchmarking is count-based or timing-based, plus associated args are correctly set."""
@@ -90,10 +282,12 @@ class UserConfig(BaseConfig):
         if (
             "benchmark_grace_period" in self.loadgen.model_fields_set
             and "benchmark_duration" not in self.loadgen.model_fields_set
+            and self.loadgen.load_stages_duration is None
+            and self.loadgen.search_mode is None
         ):
             raise ValueError(
-                "--benchmark-grace-period can only be used with "
-                "duration-based benchmarking (--benchmark-duration)."
+                "--benchmark-grace-period can only be used with duration-based benchmarking "
+                "(--benchmark-duration, duration-based --load-stages or --search-mode)."
             )
 
         return self
@@ -102,7 +296,8 @@ class UserConfig(BaseConfig):
         """Get the effective number of requests to send.
 
         For mooncake_trace custom datasets, always use the dataset size to ensure
-        exact trace replay. For all other scenarios, use the configured request_count.
+        exact trace replay. For count-based load stages, use the total request count of the stages.
+        For all other scenarios, use the configured request_count.
 
         Returns:
             int: The number of requests that should be sent
@@ -119,6 +314,9 @@ class UserConfig(BaseConfig):
                     f"Could not read mooncake_trace dataset file: {e}"
                 ) from e
 
+        if self.loadgen.load_stages_request_count is not None:
+            return self.loadgen.load_stages_request_count
+
         return self.loadgen.request_count
 
     def _should_use_fixed_schedule_for_mooncake_trace(self) -> bool:
@@ -340,6 +538,8 @@ class UserConfig(BaseConfig):
     def _get_artifact_stimulus(self) -> str:
         """Get the stimulus name based on the timing mode."""
         match self._timing_mode:
+            case TimingMode.REQUEST_RATE if self.loadgen.load_stages:
+                return f"load_stages{len(self.loadgen.load_stages)}"
             case TimingMode.REQUEST_RATE:
                 stimulus = []
                 if self.loadgen.concurrency is not None:
@@ -349,6 +549,12 @@ class UserConfig(BaseConfig):
                 return "-".join(stimulus)
             case TimingMode.FIXED_SCHEDULE:
                 return "fixed_schedule"
+            case TimingMode.THROUGHPUT_SEARCH:
+                return f"search_{self.loadgen.search_mode}"
+            case TimingMode.ADAPTIVE_CONCURRENCY:
+                return f"adaptive_{self.loadgen.adaptive_metric}{self.loadgen.adaptive_target:g}"
+            case TimingMode.TOKEN_RATE:
+                return f"tpm{self.loadgen.tokens_per_minute:g}_{self.loadgen.token_rate_type}"
             case _:
                 raise ValueError(f"Unknown timing mode '{self._timing_mode}'.")
 
@@ -21,6 +21,7 @@ from aiperf.common.enums.communication_enums import (
     CommAddress,
     CommClientType,
     CommunicationBackend,
+    MessageCodecType,
     ZMQProxyType,
 )
 from aiperf.common.enums.data_exporter_enums import (
@@ -102,8 +103,11 @@ from aiperf.common.enums.telemetry_enums import (
 )
 from aiperf.common.enums.timing_enums import (
     CreditPhase,
+    CreditSchedulerType,
     RequestRateMode,
+    ThroughputSearchMode,
     TimingMode,
+    TokenRateType,
 )
 from aiperf.common.enums.worker_enums import (
     WorkerStatus,
@@ -126,6 +130,7 @@ __all__ = [
     "ComposerType",
     "ConsoleExporterType",
     "CreditPhase",
+    "CreditSchedulerType",
     "CustomDatasetType",
     "DataExporterType",
     "DatasetSamplingStrategy",
@@ -140,6 +145,7 @@ __all__ = [
     "ImageFormat",
     "LifecycleState",
     "MediaType",
+    "MessageCodecType",
     "MessageType",
     "MetricFlags",
     "MetricOverTimeUnit",
@@ -168,7 +174,9 @@ __all__ = [
     "SystemState",
     "TemperatureMetricUnit",
     "TemperatureMetricUnitInfo",
+    "ThroughputSearchMode",
     "TimingMode",
+    "TokenRateType",
     "TransportType",
     "VideoFormat",
     "VideoSynthType",
@@ -5,12 +5,15 @@ from aiperf.common.enums.base_enums import CaseInsensitiveStrEnum
 
 
 class CommandType(CaseInsensitiveStrEnum):
+    ADAPTIVE_WINDOW_METRIC = "adaptive_window_metric"
+    OUTPUT_TOKEN_STATS = "output_token_stats"
     REALTIME_METRICS = "realtime_metrics"
     PROCESS_RECORDS = "process_records"
     PROFILE_CANCEL = "profile_cancel"
     PROFILE_CONFIGURE = "profile_configure"
     PROFILE_START = "profile_start"
     REGISTER_SERVICE = "register_service"
+    SEARCH_PROBE_RESULT = "search_probe_result"
     SHUTDOWN = "shutdown"
     SHUTDOWN_WORKERS = "shutdown_workers"
     SPAWN_WORKERS = "spawn_workers"
@@ -50,6 +50,16 @@ class CommAddress(CaseInsensitiveStrEnum):
     """Backend address for the InferenceParser to receive raw inference messages from Workers."""
 
 
+class MessageCodecType(CaseInsensitiveStrEnum):
+    """The wire format used to encode messages sent over the push/pull and dealer/router clients."""
+
+    JSON = "json"
+    """Human readable JSON, useful for debugging."""
+
+    MSGPACK = "msgpack"
+    """Compact binary msgpack, with large byte fields sent as separate zero-copy frames."""
+
+
 class ZMQProxyType(CaseInsensitiveStrEnum):
     DEALER_ROUTER = "dealer_router"
     XPUB_XSUB = "xpub_xsub"
@@ -19,6 +19,10 @@ class DataExporterType(CaseInsensitiveStrEnum):
     RAW_RECORD_AGGREGATOR = "raw_record_aggregator"
     TIMESLICE_JSON = "timeslice_json"
     TIMESLICE_CSV = "timeslice_csv"
+    STAGE_JSON = "stage_json"
+    STAGE_CSV = "stage_csv"
+    SEARCH_JSON = "search_json"
+    ADAPTIVE_JSON = "adaptive_json"
 
 
 class ExportLevel(CaseInsensitiveStrEnum):
@@ -16,20 +16,28 @@ class MessageType(CaseInsensitiveStrEnum):
     COMMAND = "command"
     COMMAND_RESPONSE = "command_response"
     CONNECTION_PROBE = "connection_probe"
+    CONVERSATION_BATCH_REQUEST = "conversation_batch_request"
+    CONVERSATION_BATCH_RESPONSE = "conversation_batch_response"
+    CONVERSATION_ID_REQUEST = "conversation_id_request"
+    CONVERSATION_ID_RESPONSE = "conversation_id_response"
     CONVERSATION_REQUEST = "conversation_request"
     CONVERSATION_RESPONSE = "conversation_response"
     CONVERSATION_TURN_REQUEST = "conversation_turn_request"
     CONVERSATION_TURN_RESPONSE = "conversation_turn_response"
     CREDITS_COMPLETE = "credits_complete"
     CREDIT_DROP = "credit_drop"
+    CREDIT_DROP_BATCH = "credit_drop_batch"
     CREDIT_PHASE_COMPLETE = "credit_phase_complete"
     CREDIT_PHASE_PROGRESS = "credit_phase_progress"
     CREDIT_PHASE_SENDING_COMPLETE = "credit_phase_sending_complete"
     CREDIT_PHASE_START = "credit_phase_start"
     CREDIT_RETURN = "credit_return"
+    CREDIT_RETURN_BATCH = "credit_return_batch"
     DATASET_CONFIGURED_NOTIFICATION = "dataset_configured_notification"
     DATASET_TIMING_REQUEST = "dataset_timing_request"
     DATASET_TIMING_RESPONSE = "dataset_timing_response"
+    DATASET_TOKEN_LENGTHS_REQUEST = "dataset_token_lengths_request"
+    DATASET_TOKEN_LENGTHS_RESPONSE = "dataset_token_lengths_response"
     ERROR = "error"
     HEARTBEAT = "heartbeat"
     INFERENCE_RESULTS = "inference_results"
@@ -47,5 +55,6 @@ class MessageType(CaseInsensitiveStrEnum):
     STATUS = "status"
     TELEMETRY_RECORDS = "telemetry_records"
     TELEMETRY_STATUS = "telemetry_status"
+    TURN_CREDIT_DROP = "turn_credit_drop"
     WORKER_HEALTH = "worker_health"
     WORKER_STATUS_SUMMARY = "worker_status_summary"
@@ -38,3 +38,8 @@ class TransportType(CaseInsensitiveStrEnum):
     """The various types of transports for an endpoint."""
 
     HTTP = "http"
+    """HTTP/1.1 transport using aiohttp."""
+
+    RAW_HTTP = "raw_http"
+    """Lean HTTP/1.1 transport built directly on asyncio protocols, for minimum client overhead
+    when measuring many concurrent streams."""
@@ -31,6 +31,9 @@ class ResultsProcessorType(CaseInsensitiveStrEnum):
     """Processor that processes the metric results from METRIC_RECORD and computes metrics from MetricType.DERIVED. as well as aggregates the results.
     This is the last stage of the metrics processing pipeline, and is done by the RecordsManager after all the service instances have completed their processing."""
 
+    STAGE = "stage"
+    """Processor that processes metric results for each load stage of a multi-stage load profile."""
+
     TELEMETRY_RESULTS = "telemetry_results"
     """Processor that processes telemetry records from GPU monitoring and computes metrics from MetricType.TELEMETRY.
     This processes per-GPU telemetry data and aggregates it using the MetricTelemetryDict and PerGpuMetricArray classes."""
@@ -15,6 +15,21 @@ class TimingMode(CaseInsensitiveStrEnum):
     Optionally, a max concurrency limit can be specified as well.
     """
 
+    THROUGHPUT_SEARCH = "throughput_search"
+    """A mode where the TimingManager will run a series of short probes at different concurrency or request rate
+    levels, searching for the highest load at which the goodput SLOs are still met.
+    """
+
+    ADAPTIVE_CONCURRENCY = "adaptive_concurrency"
+    """A mode where the TimingManager will adjust the concurrency during the profiling phase, based on a latency
+    percentile over a sliding window of the most recent requests, to find and hold the saturation point of the server.
+    """
+
+    TOKEN_RATE = "token_rate"
+    """A mode where the TimingManager will send requests to meet a target token throughput, such as a tokens per
+    minute budget, by charging the token count of each conversation against a token bucket.
+    """
+
 
 class RequestRateMode(CaseInsensitiveStrEnum):
     """The different ways the RequestRateStrategy should generate requests."""
@@ -28,6 +43,53 @@ class RequestRateMode(CaseInsensitiveStrEnum):
     CONCURRENCY_BURST = "concurrency_burst"
     """Generate requests as soon as possible, up to a max concurrency limit. Only allowed when a request rate is not specified."""
 
+    RAMP = "ramp"
+    """Generate requests using a poisson process whose rate increases linearly from the request rate to the end
+    request rate over the ramp duration, and then stays at the end request rate."""
+
+    STEP = "step"
+    """Generate requests using a poisson process whose rate increases by the rate step every step duration, starting
+    at the request rate, and optionally capped at the end request rate."""
+
+    SINUSOIDAL = "sinusoidal"
+    """Generate requests using a poisson process whose rate follows a sinusoid around the request rate, with the
+    given amplitude and period, such as to model diurnal traffic."""
+
+    GAMMA = "gamma"
+    """Generate requests with gamma distributed inter-arrival times at the request rate, whose coefficient of
+    variation controls how bursty the traffic is. A coefficient of variation of 1 is a poisson process."""
+
+
+class ThroughputSearchMode(CaseInsensitiveStrEnum):
+    """The load dimension that is varied by the throughput search."""
+
+    CONCURRENCY = "concurrency"
+    """Search for the highest concurrency at which the goodput SLOs are met."""
+
+    REQUEST_RATE = "request_rate"
+    """Search for the highest request rate at which the goodput SLOs are met."""
+
+
+class TokenRateType(CaseInsensitiveStrEnum):
+    """The tokens that are counted against the token rate budget."""
+
+    INPUT = "input"
+    """Count the input tokens of each request."""
+
+    TOTAL = "total"
+    """Count the input tokens and the estimated output tokens of each request."""
+
+
+class CreditSchedulerType(CaseInsensitiveStrEnum):
+    """The different ways the credit issuing strategies wait for the scheduled time of the next credit."""
+
+    ASYNCIO = "asyncio"
+    """Wait using asyncio timers on the event loop. Timers have a granularity of about 1ms, and are delayed when the event loop is busy."""
+
+    HYBRID_SPIN = "hybrid_spin"
+    """Wait on a dedicated thread, using a coarse sleep followed by a short spin-wait until the scheduled time.
+    This is more precise at sub-millisecond inter-arrival times, at the cost of keeping one CPU core busy while spinning."""
+
 
 class CreditPhase(CaseInsensitiveStrEnum):
     """The type of credit phase. This is used to identify which phase of the
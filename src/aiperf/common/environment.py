@@ -15,6 +15,7 @@ Structure:
     Environment.METRICS.*  - Metrics collection and storage
     Environment.RECORD.*   - Record processing
     Environment.SERVICE.*  - Service lifecycle and communication
+    Environment.TIMING.*   - Credit issuing and timing
     Environment.UI.*       - User interface settings
     Environment.WORKER.*   - Worker management and scaling
     Environment.ZMQ.*      - ZMQ communication settings
@@ -29,7 +30,9 @@ Examples:
     print(f"Workers: {Environment.WORKER.CPU_UTILIZATION_FACTOR}")
 """
 
+import os
 import platform
+from pathlib import Path
 from typing import Annotated
 
 from pydantic import BeforeValidator, Field, model_validator
@@ -42,12 +45,19 @@ from aiperf.common.config.config_validators import (
     parse_str_or_csv_list,
 )
 from aiperf.common.enums.service_enums import ServiceType
+from aiperf.common.enums.timing_enums import CreditSchedulerType
 
 _logger = AIPerfLogger(__name__)
 
 __all__ = ["Environment"]
 
 
+def _user_cache_dir(name: str) -> Path:
+    """Get a directory in the aiperf cache of the current user, under $XDG_CACHE_HOME or ~/.cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "aiperf" / name
+
+
 class _DatasetSettings(BaseSettings):
     """Dataset loading and configuration.
 
@@ -64,12 +74,78 @@ class _DatasetSettings(BaseSettings):
         default=300.0,
         description="Timeout in seconds for dataset configuration operations",
     )
+    CONVERSATION_CACHE: bool = Field(
+        default=False,
+        description="Cache the conversations of the dataset on disk, keyed by a hash of the input configuration, "
+        "tokenizer, random seed and aiperf version, so that repeated runs with the same dataset load it instead of "
+        "generating it again. Only used when --random-seed is set, as the dataset is random otherwise",
+    )
+    CONVERSATION_CACHE_DIR: Path = Field(
+        default_factory=lambda: _user_cache_dir("conversations"),
+        description="Directory of the on-disk conversation cache. Defaults to aiperf/conversations in the cache "
+        "directory of the user ($XDG_CACHE_HOME, or ~/.cache)",
+    )
+    CORPUS_CACHE: bool = Field(
+        default=True,
+        description="Cache the tokenized prompt corpus on disk, keyed by the tokenizer, so that it is memory-mapped "
+        "instead of tokenized again on startup",
+    )
+    CORPUS_CACHE_DIR: Path = Field(
+        default_factory=lambda: _user_cache_dir("corpus"),
+        description="Directory of the on-disk tokenized corpus cache. Defaults to aiperf/corpus in the cache directory "
+        "of the user ($XDG_CACHE_HOME, or ~/.cache)",
+    )
+    GENERATION_WORKERS: int = Field(
+        ge=0,
+        le=1024,
+        default=0,
+        description="Number of processes that generate the conversations of synthetic datasets when PARALLEL_GENERATION "
+        "is enabled. 0 to use all CPU cores",
+    )
+    LAZY_CACHE_SIZE: int = Field(
+        ge=1,
+        le=10000000,
+        default=10000,
+        description="Number of conversations that the DatasetManager keeps in an LRU cache when the dataset is loaded "
+        "lazily. A conversation that was evicted is created again the next time it is requested",
+    )
+    LAZY_MOONCAKE_TRACE: bool = Field(
+        default=False,
+        description="Load mooncake_trace datasets lazily. Only the line offsets of the trace file are indexed up front, "
+        "and the conversation of each session is created from its lines in the memory-mapped file when it is requested, "
+        "so that multi-million-line traces start quickly with bounded memory",
+    )
+    PARALLEL_GENERATION: bool = Field(
+        default=False,
+        description="Generate the conversations of synthetic datasets in a pool of GENERATION_WORKERS processes. Each "
+        "conversation uses its own RNG streams, derived from --random-seed and the index of the conversation, so the "
+        "dataset is identical to the one generated without this option, for any number of processes. The "
+        "DatasetManager is not run as a daemon process when this is enabled, as daemon processes cannot have children",
+    )
+    PRERENDER_PAYLOADS: bool = Field(
+        default=False,
+        description="Render the request body of the first turn of each conversation once in the DatasetManager, "
+        "so that workers send it as-is instead of formatting and serializing it for every request",
+    )
     PUBLIC_DATASET_TIMEOUT: float = Field(
         ge=1.0,
         le=100000.0,
         default=300.0,
         description="Timeout in seconds for public dataset loading operations",
     )
+    SHARED_MEMORY: bool = Field(
+        default=False,
+        description="Write the dataset into a shared-memory segment once, so that workers on the same host read "
+        "conversations directly from it instead of receiving them from the DatasetManager over ZMQ",
+    )
+    TOKEN_LENGTHS_SAMPLE_SIZE: int = Field(
+        ge=1,
+        le=10000000,
+        default=1000,
+        description="Maximum number of conversations that the DatasetManager tokenizes to count the tokens of each "
+        "conversation for --tokens-per-minute. The input tokens of larger datasets are estimated from the length of "
+        "their text, using the tokens per character of an evenly spaced sample of this many conversations",
+    )
 
 
 class _DeveloperSettings(BaseSettings):
@@ -185,6 +261,13 @@ class _HTTPSettings(BaseSettings):
         default=300,
         description="HTTP connection keepalive timeout in seconds for connection pooling",
     )
+    PREWARM_CONNECTIONS: int = Field(
+        ge=0,
+        le=65000,
+        default=0,
+        description="Number of keep-alive connections each worker opens and validates during profile configuration, "
+        "so that the first requests do not include the TCP connect and TLS handshake in their latency. 0 to disable",
+    )
     SO_RCVBUF: int = Field(
         ge=1024,
         default=10485760,  # 10MB
@@ -231,6 +314,11 @@ class _HTTPSettings(BaseSettings):
         default=30000,
         description="TCP user timeout in milliseconds (Linux-specific, detects dead connections)",
     )
+    TRACE_TIMINGS: bool = Field(
+        default=False,
+        description="Capture per-request connection timings (connection pool wait, DNS, connect, request send, and time to first byte) "
+        "using the HTTP client's tracing hooks. Adds a small amount of client overhead to each request",
+    )
     TTL_DNS_CACHE: int = Field(
         ge=1,
         le=1000000,
@@ -291,6 +379,13 @@ class _RecordSettings(BaseSettings):
         env_prefix="AIPERF_RECORD_",
     )
 
+    ADAPTIVE_MIN_SAMPLES: int = Field(
+        ge=1,
+        le=100000,
+        default=10,
+        description="Minimum number of requests in the sliding window of the adaptive concurrency controller for "
+        "the percentile of the window to be reported. The concurrency is left unchanged until then",
+    )
     EXPORT_BATCH_SIZE: int = Field(
         ge=1,
         le=1000000,
@@ -316,6 +411,19 @@ class _RecordSettings(BaseSettings):
         default=2.0,
         description="Interval in seconds between records progress report messages",
     )
+    RAW_RESPONSE_BUFFER: bool = Field(
+        default=False,
+        description="Store streamed responses as a single raw bytes buffer with per-response offsets and timestamps, "
+        "which is decoded on demand by the record processors, instead of a list of parsed SSE messages. "
+        "Reduces worker CPU usage, message size and record processor memory",
+    )
+    SEARCH_PROBE_TIMEOUT: float = Field(
+        ge=0.1,
+        le=600.0,
+        default=10.0,
+        description="Maximum time in seconds the RecordsManager waits for the records of a throughput search probe "
+        "to be processed before computing the result of the probe from the records received so far",
+    )
 
 
 class _ServiceSettings(BaseSettings):
@@ -423,6 +531,87 @@ class _ServiceSettings(BaseSettings):
         return self
 
 
+class _TimingSettings(BaseSettings):
+    """Credit issuing and timing configuration.
+
+    Controls how the TimingManager schedules and sends credits to the workers. Batching credit drops
+    reduces the per-credit messaging overhead of the TimingManager at very high request rates, and the
+    hybrid spin scheduler improves the precision of sub-millisecond inter-arrival times.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="AIPERF_TIMING_",
+    )
+
+    ARRIVAL_SCHEDULE_CHUNK_SIZE: int = Field(
+        ge=1,
+        le=1000000,
+        default=1024,
+        description="Number of credit arrival times the request rate strategy generates at once, when scheduling "
+        "credits against an absolute timeline in the constant and poisson request rate modes",
+    )
+    CREDIT_DROP_BATCH_SIZE: int = Field(
+        ge=1,
+        le=100000,
+        default=1,
+        description="Maximum number of credits the request rate and fixed schedule strategies issue in a single batch. "
+        "The credits after the first one are issued ahead of time, each with its own scheduled time as its target, and "
+        "the TimingManager splits each batch across the workers. 1 to disable batching",
+    )
+    CREDIT_DROP_BATCH_WINDOW: float = Field(
+        ge=0.0,
+        le=1.0,
+        default=0.001,
+        description="Time in seconds after the scheduled time of the first credit of a batch, within which the credits "
+        "scheduled are added to the same batch. Only used when CREDIT_DROP_BATCH_SIZE is greater than 1",
+    )
+    CREDIT_LEAD_TIME: float = Field(
+        ge=0.0,
+        le=10.0,
+        default=0.0,
+        description="Time in seconds ahead of its scheduled time that each credit is issued to a worker, with the "
+        "scheduled time as its target. The worker retrieves the conversation and prepares the request in the "
+        "meantime, and sends it at the target time, which removes the messaging and dataset latency from the arrival "
+        "times. Only applies to the constant and poisson request rate modes and to fixed schedules. 0 to disable",
+    )
+    FIXED_SCHEDULE_CHUNK_SIZE: int = Field(
+        ge=1,
+        le=10000000,
+        default=100000,
+        description="Number of fixed schedule entries the TimingManager requests from the DatasetManager at once. The "
+        "fixed schedule strategy sends the credits of one chunk while the next chunk is being fetched",
+    )
+    SCHEDULER: CreditSchedulerType = Field(
+        default=CreditSchedulerType.ASYNCIO,
+        description="How the credit issuing strategies wait for the scheduled time of each credit, when the "
+        "--credit-scheduler option is not set. 'asyncio' uses event loop timers, and 'hybrid_spin' uses a dedicated "
+        "thread that sleeps, then spin-waits for the last SPIN_WINDOW seconds",
+    )
+    SPIN_WINDOW: float = Field(
+        ge=0.0,
+        le=0.1,
+        default=0.002,
+        description="Time in seconds before the scheduled time of a credit at which the hybrid spin scheduler stops "
+        "sleeping and starts spin-waiting. Larger values are more precise, but keep a CPU core busy for longer",
+    )
+    TOKEN_RATE_FEEDBACK_INTERVAL: float = Field(
+        ge=0.1,
+        le=60.0,
+        default=2.0,
+        description="Interval in seconds at which the token rate strategy updates its estimate of the output tokens "
+        "of each request from the output tokens measured by the RecordsManager, when --token-rate-feedback is set",
+    )
+    TURN_CREDIT_TIMEOUT: float = Field(
+        ge=1.0,
+        le=100000.0,
+        default=900.0,
+        description="Time in seconds to wait for the return of the credit of the next turn of a conversation, sent to "
+        "the worker that keeps its session with --per-turn-credits. Credits that are not returned in time, because they "
+        "were lost or the worker has gone away, are counted as completed, so the phase does not wait for them. Should be "
+        "longer than --request-timeout-seconds",
+    )
+
+
 class _UISettings(BaseSettings):
     """User interface and dashboard configuration.
 
@@ -484,6 +673,22 @@ class _WorkerSettings(BaseSettings):
         default=1.0,
         description="Interval in seconds between worker status checks by WorkerManager",
     )
+    CONVERSATION_CACHE_SIZE: int = Field(
+        ge=0,
+        le=1000000,
+        default=128,
+        description="Number of conversations requested by ID (such as from a fixed schedule) that each worker keeps in a "
+        "local LRU cache, to avoid a round trip to the DatasetManager when they are requested again. 0 to disable",
+    )
+    CONVERSATION_PREFETCH_SIZE: int = Field(
+        ge=0,
+        le=100000,
+        default=0,
+        description="Number of conversations each worker requests from the DatasetManager at once, and buffers ahead of "
+        "the credits that need them. The buffer is refilled in the background once it is half empty. Note that with "
+        "the sequential and shuffle sampling strategies, conversations are handed out to workers in batches, so they "
+        "are no longer sent in exact dataset order across workers. 0 to disable",
+    )
     CPU_UTILIZATION_FACTOR: float = Field(
         ge=0.1,
         le=1.0,
@@ -491,6 +696,20 @@ class _WorkerSettings(BaseSettings):
         description="Factor multiplied by CPU count to determine default max workers (0.0-1.0). "
         "Formula: max(1, min(int(cpu_count * factor) - 1, MAX_WORKERS_CAP))",
     )
+    CREDIT_RETURN_BATCH_SIZE: int = Field(
+        ge=1,
+        le=100000,
+        default=64,
+        description="Maximum number of credit returns each worker coalesces into a single message. "
+        "Only used when CREDIT_RETURN_BATCH_WINDOW is greater than 0",
+    )
+    CREDIT_RETURN_BATCH_WINDOW: float = Field(
+        ge=0.0,
+        le=1.0,
+        default=0.0,
+        description="Time window in seconds over which each worker coalesces credit returns before sending them to "
+        "the TimingManager in a single message. 0 to disable",
+    )
     ERROR_RECOVERY_TIME: float = Field(
         ge=0.1,
         le=1000.0,
@@ -552,6 +771,13 @@ class _ZMQSettings(BaseSettings):
         default=10.0,
         description="Timeout in seconds for terminating the ZMQ context during shutdown",
     )
+    MSGPACK_MULTIPART_THRESHOLD: int = Field(
+        ge=0,
+        le=1_000_000_000,
+        default=65536,
+        description="Minimum size in bytes of a byte field to send it as a separate zero-copy frame when using the "
+        "msgpack message codec over push/pull sockets (0 to always send a single frame)",
+    )
     PULL_MAX_CONCURRENCY: int = Field(
         ge=1,
         le=10000000,
@@ -653,6 +879,10 @@ class _Environment(BaseSettings):
         default_factory=_ServiceSettings,
         description="Service lifecycle and communication settings",
     )
+    TIMING: _TimingSettings = Field(
+        default_factory=_TimingSettings,
+        description="Credit issuing and timing settings",
+    )
     UI: _UISettings = Field(
         default_factory=_UISettings,
         description="User interface and dashboard settings",
@@ -12,9 +12,11 @@ from aiperf.common.enums import (
     CommunicationBackend,
     ComposerType,
     ConsoleExporterType,
+    CreditSchedulerType,
     CustomDatasetType,
     DataExporterType,
     EndpointType,
+    MessageCodecType,
     RecordProcessorType,
     RequestRateMode,
     ResultsProcessorType,
@@ -54,8 +56,10 @@ if TYPE_CHECKING:
         CommunicationClientProtocol,
         CommunicationProtocol,
         ConsoleExporterProtocol,
+        CreditSchedulerProtocol,
         DataExporterProtocol,
         DatasetSamplingStrategyProtocol,
+        MessageCodecProtocol,
         RecordProcessorProtocol,
         RequestRateGeneratorProtocol,
         ResultsProcessorProtocol,
@@ -418,6 +422,22 @@ class ConsoleExporterFactory(
         )
 
 
+class CreditSchedulerFactory(
+    AIPerfFactory[CreditSchedulerType, "CreditSchedulerProtocol"]
+):
+    """Factory for registering and creating CreditSchedulerProtocol instances based on the specified credit scheduler type.
+    see: :class:`aiperf.common.factories.AIPerfFactory` for more details.
+    """
+
+    @classmethod
+    def create_instance(  # type: ignore[override]
+        cls,
+        class_type: CreditSchedulerType | str,
+        **kwargs,
+    ) -> "CreditSchedulerProtocol":
+        return super().create_instance(class_type, **kwargs)
+
+
 class CustomDatasetFactory(
     AIPerfFactory[CustomDatasetType, "CustomDatasetLoaderProtocol"]
 ):
@@ -495,6 +515,20 @@ class EndpointFactory(AIPerfFactory[EndpointType, "EndpointProtocol"]):
         return cls.get_class_from_type(class_type).metadata()
 
 
+class MessageCodecFactory(AIPerfFactory[MessageCodecType, "MessageCodecProtocol"]):
+    """Factory for registering and creating MessageCodecProtocol instances based on the specified message codec type.
+    see: :class:`aiperf.common.factories.AIPerfFactory` for more details.
+    """
+
+    @classmethod
+    def create_instance(  # type: ignore[override]
+        cls,
+        class_type: MessageCodecType | str,
+        **kwargs,
+    ) -> "MessageCodecProtocol":
+        return super().create_instance(class_type, **kwargs)
+
+
 class ServiceFactory(AIPerfFactory[ServiceType, "ServiceProtocol"]):
     """Factory for registering and creating ServiceProtocol instances based on the specified service type.
     see: :class:`aiperf.common.factories.AIPerfFactory` for more details.
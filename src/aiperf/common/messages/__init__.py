@@ -14,6 +14,8 @@ from aiperf.common.messages.base_messages import (
     RequiresRequestNSMixin,
 )
 from aiperf.common.messages.command_messages import (
+    AdaptiveWindowMetricCommand,
+    AdaptiveWindowMetricResponse,
     CommandAcknowledgedResponse,
     CommandErrorResponse,
     CommandMessage,
@@ -21,6 +23,8 @@ from aiperf.common.messages.command_messages import (
     CommandSuccessResponse,
     CommandUnhandledResponse,
     ConnectionProbeMessage,
+    OutputTokenStatsCommand,
+    OutputTokenStatsResponse,
     ProcessRecordsCommand,
     ProcessRecordsResponse,
     ProfileCancelCommand,
@@ -28,6 +32,8 @@ from aiperf.common.messages.command_messages import (
     ProfileStartCommand,
     RealtimeMetricsCommand,
     RegisterServiceCommand,
+    SearchProbeResultCommand,
+    SearchProbeResultResponse,
     ShutdownCommand,
     ShutdownWorkersCommand,
     SpawnWorkersCommand,
@@ -35,15 +41,22 @@ from aiperf.common.messages.command_messages import (
     TargetedServiceMessage,
 )
 from aiperf.common.messages.credit_messages import (
+    CreditDropBatchMessage,
     CreditDropMessage,
     CreditPhaseCompleteMessage,
     CreditPhaseProgressMessage,
     CreditPhaseSendingCompleteMessage,
     CreditPhaseStartMessage,
+    CreditReturnBatchMessage,
     CreditReturnMessage,
     CreditsCompleteMessage,
+    TurnCreditDropMessage,
 )
 from aiperf.common.messages.dataset_messages import (
+    ConversationBatchRequestMessage,
+    ConversationBatchResponseMessage,
+    ConversationIdRequestMessage,
+    ConversationIdResponseMessage,
     ConversationRequestMessage,
     ConversationResponseMessage,
     ConversationTurnRequestMessage,
@@ -51,6 +64,8 @@ from aiperf.common.messages.dataset_messages import (
     DatasetConfiguredNotification,
     DatasetTimingRequest,
     DatasetTimingResponse,
+    DatasetTokenLengthsRequest,
+    DatasetTokenLengthsResponse,
 )
 from aiperf.common.messages.inference_messages import (
     InferenceResultsMessage,
@@ -86,6 +101,8 @@ from aiperf.common.messages.worker_messages import (
 )
 
 __all__ = [
+    "AdaptiveWindowMetricCommand",
+    "AdaptiveWindowMetricResponse",
     "AllRecordsReceivedMessage",
     "BaseServiceErrorMessage",
     "BaseServiceMessage",
@@ -97,26 +114,36 @@ __all__ = [
     "CommandSuccessResponse",
     "CommandUnhandledResponse",
     "ConnectionProbeMessage",
+    "ConversationBatchRequestMessage",
+    "ConversationBatchResponseMessage",
+    "ConversationIdRequestMessage",
+    "ConversationIdResponseMessage",
     "ConversationRequestMessage",
     "ConversationResponseMessage",
     "ConversationTurnRequestMessage",
     "ConversationTurnResponseMessage",
+    "CreditDropBatchMessage",
     "CreditDropMessage",
     "CreditPhaseCompleteMessage",
     "CreditPhaseProgressMessage",
     "CreditPhaseSendingCompleteMessage",
     "CreditPhaseStartMessage",
+    "CreditReturnBatchMessage",
     "CreditReturnMessage",
     "CreditsCompleteMessage",
     "DatasetConfiguredNotification",
     "DatasetTimingRequest",
     "DatasetTimingResponse",
+    "DatasetTokenLengthsRequest",
+    "DatasetTokenLengthsResponse",
     "ErrorMessage",
     "HeartbeatMessage",
     "InferenceResultsMessage",
     "Message",
     "MetricRecordsData",
     "MetricRecordsMessage",
+    "OutputTokenStatsCommand",
+    "OutputTokenStatsResponse",
     "ProcessRecordsCommand",
     "ProcessRecordsResponse",
     "ProcessRecordsResultMessage",
@@ -134,6 +161,8 @@ __all__ = [
     "RegisterServiceCommand",
     "RegistrationMessage",
     "RequiresRequestNSMixin",
+    "SearchProbeResultCommand",
+    "SearchProbeResultResponse",
     "ShutdownCommand",
     "ShutdownWorkersCommand",
     "SpawnWorkersCommand",
@@ -142,6 +171,7 @@ __all__ = [
     "TargetedServiceMessage",
     "TelemetryRecordsMessage",
     "TelemetryStatusMessage",
+    "TurnCreditDropMessage",
     "WorkerHealthMessage",
     "WorkerStatusSummaryMessage",
 ]
@@ -14,8 +14,11 @@ from aiperf.common.enums import (
 from aiperf.common.enums.service_enums import LifecycleState
 from aiperf.common.messages.service_messages import BaseServiceMessage
 from aiperf.common.models import (
+    AdaptiveConcurrencySample,
     ErrorDetails,
+    OutputTokenStats,
     ProcessRecordsResult,
+    SearchProbeResult,
 )
 from aiperf.common.types import CommandTypeT, MessageTypeT, ServiceTypeT
 
@@ -282,6 +285,55 @@ class RegisterServiceCommand(CommandMessage):
     state: LifecycleState = Field(..., description="The current state of the service")
 
 
+class SearchProbeResultCommand(CommandMessage):
+    """Command message sent by the TimingManager to the RecordsManager to get the result of a throughput search probe,
+    once the probe has finished sending requests."""
+
+    command: CommandTypeT = CommandType.SEARCH_PROBE_RESULT
+
+    stage_index: int = Field(
+        ..., description="The index of the probe, which tags the requests it sent"
+    )
+    load: float = Field(
+        ...,
+        description="The load of the probe, as a concurrency or a request rate depending on the search mode",
+    )
+    concurrency: int | None = Field(
+        default=None, description="The concurrency (limit) of the probe, if any"
+    )
+    request_rate: float | None = Field(
+        default=None, description="The request rate of the probe, if any"
+    )
+    expected_records: int = Field(
+        ...,
+        ge=0,
+        description="The number of records to wait for before computing the result of the probe",
+    )
+
+
+class AdaptiveWindowMetricCommand(CommandMessage):
+    """Command message sent by the TimingManager to the RecordsManager to sample the metric of the adaptive
+    concurrency controller over its sliding window."""
+
+    command: CommandTypeT = CommandType.ADAPTIVE_WINDOW_METRIC
+
+    concurrency: int = Field(
+        ..., ge=1, description="The concurrency currently in effect"
+    )
+    since_ns: int = Field(
+        ...,
+        description="The wall clock timestamp of the last change of the concurrency. "
+        "Requests started before it are excluded from the window.",
+    )
+
+
+class OutputTokenStatsCommand(CommandMessage):
+    """Command message sent by the TimingManager to the RecordsManager to get the output tokens of the requests
+    of the profiling phase so far, as feedback for the token rate strategy."""
+
+    command: CommandTypeT = CommandType.OUTPUT_TOKEN_STATS
+
+
 class ProcessRecordsResponse(CommandSuccessResponse):
     """Response to the process records command."""
 
@@ -293,6 +345,39 @@ class ProcessRecordsResponse(CommandSuccessResponse):
     )
 
 
+class SearchProbeResultResponse(CommandSuccessResponse):
+    """Response to the search probe result command."""
+
+    command: CommandTypeT = CommandType.SEARCH_PROBE_RESULT
+
+    data: SearchProbeResult | None = Field(  # type: ignore[assignment]
+        default=None,
+        description="The result of the throughput search probe",
+    )
+
+
+class AdaptiveWindowMetricResponse(CommandSuccessResponse):
+    """Response to the adaptive window metric command."""
+
+    command: CommandTypeT = CommandType.ADAPTIVE_WINDOW_METRIC
+
+    data: AdaptiveConcurrencySample | None = Field(  # type: ignore[assignment]
+        default=None,
+        description="The sample of the metric over the sliding window",
+    )
+
+
+class OutputTokenStatsResponse(CommandSuccessResponse):
+    """Response to the output token stats command."""
+
+    command: CommandTypeT = CommandType.OUTPUT_TOKEN_STATS
+
+    data: OutputTokenStats | None = Field(  # type: ignore[assignment]
+        default=None,
+        description="The output tokens of the requests of the profiling phase so far",
+    )
+
+
 class ConnectionProbeMessage(TargetedServiceMessage):
     """Message containing a connection probe from a service. This is used to probe the connection to the service."""
 
@@ -6,7 +6,9 @@ import uuid
 from pydantic import Field
 
 from aiperf.common.enums import CreditPhase, MessageType
+from aiperf.common.messages.command_messages import TargetedServiceMessage
 from aiperf.common.messages.service_messages import BaseServiceMessage
+from aiperf.common.models import NextTurnCredit
 from aiperf.common.types import MessageTypeT
 
 
@@ -47,6 +49,37 @@ class CreditDropMessage(BaseServiceMessage):
         ge=0,
         description="Delay in nanoseconds after which the request should be cancelled. Only applicable if should_cancel is True.",
     )
+    schedule_lag_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The number of nanoseconds the credit was issued after its scheduled arrival time by the timing strategy, "
+        "or None if the timing strategy does not follow an arrival schedule.",
+    )
+    stage_index: int | None = Field(
+        default=None,
+        ge=0,
+        description="The index of the load stage that the credit was issued in, or None if load stages are not used.",
+    )
+    turn_index: int = Field(
+        default=0,
+        ge=0,
+        description="The index of the turn of the conversation to send. Only turns after the first are sent as their own credit, "
+        "when each turn is issued as its own credit.",
+    )
+    session_id: str | None = Field(
+        default=None,
+        description="The ID of the session of the conversation, which the worker keeps the history of. Only set for "
+        "the turns after the first, when each turn is issued as its own credit.",
+    )
+
+
+class TurnCreditDropMessage(CreditDropMessage, TargetedServiceMessage):
+    """Message for the credit of a turn after the first of a multi-turn conversation, when each turn is issued as
+    its own credit. It is published to the worker that keeps the history of the session, instead of being pushed to
+    the next worker in turn.
+    """
+
+    message_type: MessageTypeT = MessageType.TURN_CREDIT_DROP
 
 
 class CreditReturnMessage(BaseServiceMessage):
@@ -76,12 +109,46 @@ class CreditReturnMessage(BaseServiceMessage):
         ge=0,
         description="The number of requests that were sent for this credit drop. This can be more than one in multi turn conversations.",
     )
+    next_turn: NextTurnCredit | None = Field(
+        default=None,
+        description="The next turn of the conversation to issue as its own credit, when each turn is issued as its own credit. "
+        "None if the conversation is complete.",
+    )
 
     @property
     def delayed(self) -> bool:
         return self.delayed_ns is not None
 
 
+class CreditDropBatchMessage(BaseServiceMessage):
+    """Message containing a batch of credit drops.
+    This message is sent by the timing manager to a worker when credit drop batching is enabled,
+    to reduce the per-credit messaging overhead at high request rates.
+    """
+
+    message_type: MessageTypeT = MessageType.CREDIT_DROP_BATCH
+
+    credits: list[CreditDropMessage] = Field(
+        ...,
+        min_length=1,
+        description="The credit drops in the batch, in the order they were issued. Each credit keeps its own target timestamp.",
+    )
+
+
+class CreditReturnBatchMessage(BaseServiceMessage):
+    """Message containing a batch of credit returns.
+    This message is sent by a worker to the timing manager when credit return coalescing is enabled.
+    """
+
+    message_type: MessageTypeT = MessageType.CREDIT_RETURN_BATCH
+
+    credit_returns: list[CreditReturnMessage] = Field(
+        ...,
+        min_length=1,
+        description="The credit returns in the batch, in the order the credits were completed.",
+    )
+
+
 class CreditPhaseStartMessage(BaseServiceMessage):
     """Message for credit phase start. Sent by the TimingManager to report that a credit phase has started."""
 
@@ -1,11 +1,15 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from pydantic import Field
+import base64
+from typing import Any
+
+import numpy as np
+from pydantic import Field, field_serializer, field_validator
 
 from aiperf.common.enums import CreditPhase, MessageType
 from aiperf.common.messages.service_messages import BaseServiceMessage
-from aiperf.common.models import Conversation, Turn
+from aiperf.common.models import Conversation, ConversationTokenLengths, Turn
 from aiperf.common.types import MessageTypeT
 
 
@@ -30,6 +34,48 @@ class ConversationResponseMessage(BaseServiceMessage):
     conversation: Conversation = Field(..., description="The conversation data")
 
 
+class ConversationBatchRequestMessage(BaseServiceMessage):
+    """Message to request a batch of conversations, selected by the dataset sampling strategy."""
+
+    message_type: MessageTypeT = MessageType.CONVERSATION_BATCH_REQUEST
+
+    count: int = Field(
+        ..., ge=1, description="The number of conversations to return in the batch"
+    )
+    credit_phase: CreditPhase | None = Field(
+        default=None,
+        description="The type of credit phase (either warmup or profiling). If not provided, the timing manager will use the default credit phase.",
+    )
+
+
+class ConversationBatchResponseMessage(BaseServiceMessage):
+    """Message containing a batch of conversations."""
+
+    message_type: MessageTypeT = MessageType.CONVERSATION_BATCH_RESPONSE
+    conversations: list[Conversation] = Field(
+        ..., description="The conversations, in the order they were sampled"
+    )
+
+
+class ConversationIdRequestMessage(BaseServiceMessage):
+    """Message to request the ID of the next conversation, selected by the dataset sampling strategy.
+    Used by workers that read the conversations directly from the shared-memory dataset store."""
+
+    message_type: MessageTypeT = MessageType.CONVERSATION_ID_REQUEST
+
+    credit_phase: CreditPhase | None = Field(
+        default=None,
+        description="The type of credit phase (either warmup or profiling). If not provided, the timing manager will use the default credit phase.",
+    )
+
+
+class ConversationIdResponseMessage(BaseServiceMessage):
+    """Message containing the ID of the next conversation."""
+
+    message_type: MessageTypeT = MessageType.CONVERSATION_ID_RESPONSE
+    conversation_id: str = Field(..., description="The session ID of the conversation")
+
+
 class ConversationTurnRequestMessage(BaseServiceMessage):
     """Message to request a single turn from a conversation."""
 
@@ -55,19 +101,83 @@ class ConversationTurnResponseMessage(BaseServiceMessage):
 
 
 class DatasetTimingRequest(BaseServiceMessage):
-    """Message for a dataset timing request."""
+    """Message for a dataset timing request, for a chunk of the timing data sorted by timestamp."""
 
     message_type: MessageTypeT = MessageType.DATASET_TIMING_REQUEST
 
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="The index of the first entry of the sorted timing data to return.",
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of entries to return. If not set, all of the entries from the offset are returned.",
+    )
+
 
 class DatasetTimingResponse(BaseServiceMessage):
-    """Message for a dataset timing response."""
+    """Message for a dataset timing response, containing a chunk of the timing data sorted by timestamp.
+
+    The chunk is packed as two int64 buffers, the timestamps and the index of each conversation in the conversation
+    IDs of the chunk, so it is cheap to serialize and is read back as numpy arrays without creating an object per entry.
+    """
 
     message_type: MessageTypeT = MessageType.DATASET_TIMING_RESPONSE
 
-    timing_data: list[tuple[int, str]] = Field(
+    timestamps: bytes = Field(
+        default=b"",
+        description="The timestamps of the chunk of the timing data, sorted, as a buffer of int64 values.",
+    )
+    conversation_indices: bytes = Field(
+        default=b"",
+        description="The index of the conversation of each timestamp in conversation_ids, as a buffer of int64 values.",
+    )
+    conversation_ids: list[str] = Field(
+        default_factory=list,
+        description="The IDs of the conversations in the chunk, each listed once.",
+    )
+    total_count: int = Field(
         ...,
-        description="The timing data of the dataset. Tuple of (timestamp, conversation_id)",
+        ge=0,
+        description="The total number of entries in the timing data of the dataset, across all chunks.",
+    )
+
+    @field_validator("timestamps", "conversation_indices", mode="before")
+    @classmethod
+    def _decode_buffer(cls, value: Any) -> Any:
+        # Messages are sent as JSON, where the buffers are base64 encoded
+        if isinstance(value, str):
+            return base64.b64decode(value)
+        return value
+
+    @field_serializer("timestamps", "conversation_indices", when_used="json")
+    def _encode_buffer(self, value: bytes) -> str:
+        return base64.b64encode(value).decode("ascii")
+
+    def timing_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the timestamps and conversation indices of the chunk as numpy arrays, without copying them."""
+        return (
+            np.frombuffer(self.timestamps, dtype=np.int64),
+            np.frombuffer(self.conversation_indices, dtype=np.int64),
+        )
+
+
+class DatasetTokenLengthsRequest(BaseServiceMessage):
+    """Message for a dataset token lengths request."""
+
+    message_type: MessageTypeT = MessageType.DATASET_TOKEN_LENGTHS_REQUEST
+
+
+class DatasetTokenLengthsResponse(BaseServiceMessage):
+    """Message for a dataset token lengths response."""
+
+    message_type: MessageTypeT = MessageType.DATASET_TOKEN_LENGTHS_RESPONSE
+
+    token_lengths: list[ConversationTokenLengths] = Field(
+        ...,
+        description="The token lengths of each conversation in the dataset.",
     )
 
 
@@ -75,3 +185,8 @@ class DatasetConfiguredNotification(BaseServiceMessage):
     """Notification sent to notify other services that the dataset has been configured."""
 
     message_type: MessageTypeT = MessageType.DATASET_CONFIGURED_NOTIFICATION
+
+    shared_memory_name: str | None = Field(
+        default=None,
+        description="The name of the shared-memory segment containing the dataset, if the shared-memory dataset store is enabled.",
+    )
@@ -20,5 +20,6 @@ class CommunicationMixin(AIPerfLifecycleMixin, ABC):
         self.comms: CommunicationProtocol = CommunicationFactory.get_or_create_instance(
             self.service_config.comm_config.comm_backend,
             config=self.service_config.comm_config,
+            message_codec=self.service_config.message_codec,
         )
         self.attach_child_lifecycle(self.comms)
@@ -17,11 +17,13 @@ from aiperf.common.models.base_models import (
 from aiperf.common.models.credit_models import (
     CreditPhaseConfig,
     CreditPhaseStats,
+    NextTurnCredit,
     ProcessingStats,
 )
 from aiperf.common.models.dataset_models import (
     Audio,
     Conversation,
+    ConversationTokenLengths,
     Image,
     InputsFile,
     Media,
@@ -36,12 +38,18 @@ from aiperf.common.models.error_models import (
     ExitErrorInfo,
 )
 from aiperf.common.models.export_models import (
+    AdaptiveConcurrencyExportData,
+    AdaptiveConcurrencyPoint,
     EndpointData,
     GpuSummary,
     JsonExportData,
     JsonMetricResult,
+    SearchProbeData,
+    StageCollectionExportData,
+    StageData,
     TelemetryExportData,
     TelemetrySummary,
+    ThroughputSearchExportData,
     TimesliceCollectionExportData,
     TimesliceData,
 )
@@ -70,13 +78,17 @@ from aiperf.common.models.progress_models import (
     WorkerStats,
 )
 from aiperf.common.models.record_models import (
+    AdaptiveConcurrencyResults,
+    AdaptiveConcurrencySample,
     BaseInferenceServerResponse,
     BaseResponseData,
     EmbeddingResponseData,
+    HttpTraceTimings,
     MetricRecordInfo,
     MetricRecordMetadata,
     MetricResult,
     MetricValue,
+    OutputTokenStats,
     ParsedResponse,
     ParsedResponseRecord,
     ProcessRecordsResult,
@@ -84,13 +96,16 @@ from aiperf.common.models.record_models import (
     RAGSources,
     RankingsResponseData,
     RawRecordInfo,
+    RawResponseBuffer,
     ReasoningResponseData,
     RequestInfo,
     RequestRecord,
+    SearchProbeResult,
     SSEField,
     SSEMessage,
     TextResponse,
     TextResponseData,
+    ThroughputSearchResults,
 )
 from aiperf.common.models.sequence_distribution import (
     DistributionParser,
@@ -118,18 +133,25 @@ from aiperf.common.models.usage_models import (
     Usage,
 )
 from aiperf.common.models.worker_models import (
+    ConnectionPrewarmStats,
     WorkerTaskStats,
 )
 
 __all__ = [
     "AIPerfBaseModel",
+    "AdaptiveConcurrencyExportData",
+    "AdaptiveConcurrencyPoint",
+    "AdaptiveConcurrencyResults",
+    "AdaptiveConcurrencySample",
     "Audio",
     "AutoRoutedModel",
     "BaseInferenceServerResponse",
     "BaseResponseData",
     "CPUTimes",
     "ComputedStats",
+    "ConnectionPrewarmStats",
     "Conversation",
+    "ConversationTokenLengths",
     "CreditPhaseConfig",
     "CreditPhaseStats",
     "CtxSwitches",
@@ -147,6 +169,7 @@ __all__ = [
     "GpuSummary",
     "GpuTelemetryData",
     "GpuTelemetrySnapshot",
+    "HttpTraceTimings",
     "IOCounters",
     "Image",
     "InputsFile",
@@ -160,6 +183,8 @@ __all__ = [
     "ModelEndpointInfo",
     "ModelInfo",
     "ModelListInfo",
+    "NextTurnCredit",
+    "OutputTokenStats",
     "ParsedResponse",
     "ParsedResponseRecord",
     "ProcessHealth",
@@ -170,6 +195,7 @@ __all__ = [
     "RAGSources",
     "RankingsResponseData",
     "RawRecordInfo",
+    "RawResponseBuffer",
     "ReasoningResponseData",
     "RecordsStats",
     "RequestInfo",
@@ -177,10 +203,14 @@ __all__ = [
     "RequestsStats",
     "SSEField",
     "SSEMessage",
+    "SearchProbeData",
+    "SearchProbeResult",
     "SequenceLengthDistribution",
     "SequenceLengthPair",
     "ServiceRunInfo",
     "SessionPayloads",
+    "StageCollectionExportData",
+    "StageData",
     "StatsProtocol",
     "TelemetryExportData",
     "TelemetryHierarchy",
@@ -191,6 +221,8 @@ __all__ = [
     "Text",
     "TextResponse",
     "TextResponseData",
+    "ThroughputSearchExportData",
+    "ThroughputSearchResults",
     "TimesliceCollectionExportData",
     "TimesliceData",
     "TransportMetadata",
@@ -135,6 +135,36 @@ class CreditPhaseStats(CreditPhaseConfig):
         )
 
 
+class NextTurnCredit(AIPerfBaseModel):
+    """Model for the next turn of a multi-turn conversation, when each turn is issued as its own credit.
+    This is returned by the worker with the credit of the previous turn, so that the TimingManager can issue
+    the next turn once its turn delay has elapsed, to the worker that keeps the history of the session."""
+
+    conversation_id: str = Field(..., description="The ID of the conversation.")
+    session_id: str = Field(
+        ...,
+        description="The ID of the session of the conversation, which the worker keeps the history of.",
+    )
+    turn_index: int = Field(
+        ..., ge=1, description="The index of the next turn in the conversation."
+    )
+    credit_num: int = Field(
+        ...,
+        ge=0,
+        description="The credit number of the first turn of the conversation, which is kept by every turn.",
+    )
+    delay_ns: int = Field(
+        default=0,
+        ge=0,
+        description="The turn delay to wait for before sending the next turn, in nanoseconds.",
+    )
+    stage_index: int | None = Field(
+        default=None,
+        ge=0,
+        description="The index of the load stage that the conversation was started in, or None if load stages are not used.",
+    )
+
+
 class ProcessingStats(AIPerfBaseModel):
     """Model for phase processing stats. How many requests were processed and
     how many errors were encountered."""
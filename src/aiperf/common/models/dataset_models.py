@@ -76,6 +76,11 @@ class Turn(AIPerfBaseModel):
     videos: list[Video] = Field(
         default=[], description="Collection of video data in each turn."
     )
+    rendered_payload: str | None = Field(
+        default=None,
+        description="The serialized request body for this turn when it is sent as the first turn of a conversation, "
+        "pre-rendered by the DatasetManager. Later turns include the conversation history, and are always rendered by the worker.",
+    )
 
 
 class Conversation(AIPerfBaseModel):
@@ -91,6 +96,23 @@ class Conversation(AIPerfBaseModel):
     session_id: str = Field(default="", description="Session ID of the conversation.")
 
 
+class ConversationTokenLengths(AIPerfBaseModel):
+    """The token lengths of a conversation, summed over its turns, used to pace requests by their token count."""
+
+    conversation_id: str = Field(..., description="Session ID of the conversation.")
+    input_tokens: int = Field(
+        ..., ge=0, description="Number of input tokens in the text of all turns."
+    )
+    output_tokens: int | None = Field(
+        default=None,
+        ge=0,
+        description="Sum of the max_tokens of all turns, or None if any turn does not set max_tokens.",
+    )
+    turns: int = Field(
+        default=1, ge=0, description="Number of turns in the conversation."
+    )
+
+
 class SessionPayloads(AIPerfBaseModel):
     """A single session, with its session ID and a list of formatted payloads (one per turn)."""
 
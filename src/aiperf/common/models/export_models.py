@@ -5,7 +5,8 @@ from datetime import datetime
 
 from pydantic import ConfigDict, Field
 
-from aiperf.common.config import UserConfig
+from aiperf.common.config import LoadStageConfig, UserConfig
+from aiperf.common.enums import ThroughputSearchMode
 from aiperf.common.models import ErrorDetailsCount
 from aiperf.common.models.base_models import AIPerfBaseModel
 
@@ -67,6 +68,87 @@ class TelemetryExportData(AIPerfBaseModel):
     endpoints: dict[str, EndpointData]
 
 
+class StageData(AIPerfBaseModel):
+    """Data for a single load stage.
+
+    Contains the configuration and metrics for one load stage, with dynamic metric fields
+    added via Pydantic's extra="allow" setting.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    stage_index: int
+    stage_name: str | None = None
+    stage_config: LoadStageConfig | None = None
+
+
+class StageCollectionExportData(AIPerfBaseModel):
+    """Export data for all load stages in a single file.
+
+    Contains an array of load stage data objects with metadata.
+    """
+
+    stages: list[StageData]
+    input_config: UserConfig | None = None
+
+
+class SearchProbeData(AIPerfBaseModel):
+    """Data for a single probe of the throughput search.
+
+    Contains the result and metrics for one probe, with dynamic metric fields
+    added via Pydantic's extra="allow" setting.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    stage_index: int
+    load: float
+    concurrency: int | None = None
+    request_rate: float | None = None
+    slo_attainment: float
+    passed: bool
+
+
+class ThroughputSearchExportData(AIPerfBaseModel):
+    """Export data for the throughput search in a single file.
+
+    Contains the latency-vs-throughput curve as an array of probes sorted by load,
+    and the knee of the curve, which is the highest load that met the SLOs.
+    """
+
+    search_mode: ThroughputSearchMode
+    slo_attainment_target: float
+    knee: SearchProbeData | None = None
+    probes: list[SearchProbeData]
+    input_config: UserConfig | None = None
+
+
+class AdaptiveConcurrencyPoint(AIPerfBaseModel):
+    """A single point of the concurrency trajectory of the adaptive concurrency controller."""
+
+    elapsed_sec: float
+    concurrency: int
+    request_count: int
+    metric_value: float | None = None
+    target_met: bool | None = None
+
+
+class AdaptiveConcurrencyExportData(AIPerfBaseModel):
+    """Export data for the adaptive concurrency controller in a single file.
+
+    Contains the concurrency trajectory as an array of points in the order they were sampled,
+    with the time of each point relative to the start of the profiling phase.
+    """
+
+    metric_tag: str
+    percentile: float
+    target: float
+    unit: str
+    final_concurrency: int | None = None
+    trajectory: list[AdaptiveConcurrencyPoint]
+    input_config: UserConfig | None = None
+
+
 class TimesliceData(AIPerfBaseModel):
     """Data for a single timeslice.
 
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
 import sys
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import cached_property
 from typing import Any, AnyStr
 
@@ -12,12 +14,14 @@ from pydantic import (
     Field,
     RootModel,
     SerializeAsAny,
+    field_serializer,
+    field_validator,
 )
 from typing_extensions import Self
 
 from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.constants import NANOS_PER_SECOND, STAT_KEYS
-from aiperf.common.enums import CreditPhase, SSEFieldType
+from aiperf.common.enums import CreditPhase, SSEFieldType, ThroughputSearchMode
 from aiperf.common.enums.metric_enums import MetricValueTypeT
 from aiperf.common.exceptions import InvalidInferenceResultError
 from aiperf.common.models.base_models import AIPerfBaseModel
@@ -130,6 +134,134 @@ class MetricRecordMetadata(AIPerfBaseModel):
         description="The wall clock timestamp of the request cancellation time measured as time.time_ns(), if applicable. "
         "This is only applicable to requests that were cancelled.",
     )
+    stage_index: int | None = Field(
+        default=None,
+        description="The index of the load stage that the request was sent in, when using load stages.",
+    )
+
+
+class SearchProbeResult(AIPerfBaseModel):
+    """The result of a single probe of the throughput search."""
+
+    stage_index: int = Field(
+        ..., description="The index of the probe, which tags the requests it sent"
+    )
+    load: float = Field(
+        ...,
+        description="The load of the probe, as a concurrency or a request rate depending on the search mode",
+    )
+    concurrency: int | None = Field(
+        default=None, description="The concurrency (limit) of the probe, if any"
+    )
+    request_rate: float | None = Field(
+        default=None, description="The request rate of the probe, if any"
+    )
+    request_count: int = Field(
+        default=0, description="The number of valid requests of the probe"
+    )
+    error_request_count: int = Field(
+        default=0, description="The number of failed requests of the probe"
+    )
+    good_request_count: int = Field(
+        default=0,
+        description="The number of requests of the probe that met all of the goodput SLOs",
+    )
+    slo_attainment: float = Field(
+        default=0.0,
+        description="The percentage of the requests of the probe, including failed requests, that met all of the goodput SLOs",
+    )
+    request_throughput: float | None = Field(
+        default=None,
+        description="The request throughput of the probe in requests/sec (if known)",
+    )
+    passed: bool = Field(
+        default=False,
+        description="Whether the SLO attainment of the probe met the search target",
+    )
+
+
+class ThroughputSearchResults(AIPerfBaseModel):
+    """The results of the throughput search, from which the latency-vs-throughput curve is built."""
+
+    search_mode: ThroughputSearchMode = Field(
+        ..., description="The load dimension that was varied by the search"
+    )
+    slo_attainment_target: float = Field(
+        ..., description="The SLO attainment percentage each probe had to reach"
+    )
+    probes: list[SearchProbeResult] = Field(
+        default_factory=list, description="The results of each probe, sorted by load"
+    )
+    knee: SearchProbeResult | None = Field(
+        default=None,
+        description="The probe with the highest load that met the SLO attainment target, if any",
+    )
+
+
+class AdaptiveConcurrencySample(AIPerfBaseModel):
+    """A single sample of the sliding window of the adaptive concurrency controller."""
+
+    timestamp_ns: int = Field(
+        ..., description="The wall clock timestamp at which the sample was taken"
+    )
+    concurrency: int = Field(
+        ..., description="The concurrency in effect when the sample was taken"
+    )
+    request_count: int = Field(
+        default=0,
+        description="The number of valid requests in the window that started at the current concurrency",
+    )
+    metric_value: float | None = Field(
+        default=None,
+        description="The percentile of the metric over the window, in its display unit, "
+        "or None if the window did not have enough requests",
+    )
+    target_met: bool | None = Field(
+        default=None,
+        description="Whether the percentile met the target, or None if the window did not have enough requests",
+    )
+
+
+class AdaptiveConcurrencyResults(AIPerfBaseModel):
+    """The results of the adaptive concurrency controller, from which the concurrency trajectory is built."""
+
+    metric_tag: MetricTagT = Field(
+        ..., description="The tag of the metric that was held at the target"
+    )
+    percentile: float = Field(
+        ..., description="The percentile of the metric that was held at the target"
+    )
+    target: float = Field(
+        ..., description="The target of the percentile, in the metric's display unit"
+    )
+    unit: str = Field(..., description="The display unit of the metric")
+    samples: list[AdaptiveConcurrencySample] = Field(
+        default_factory=list,
+        description="The samples taken by the controller, in the order they were taken",
+    )
+
+
+class OutputTokenStats(AIPerfBaseModel):
+    """The output tokens of the valid requests of the profiling phase so far, used as feedback by the token rate
+    strategy to estimate the output tokens of the next requests."""
+
+    request_count: int = Field(
+        default=0,
+        ge=0,
+        description="The number of valid requests with an output sequence length",
+    )
+    output_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="The total output sequence length of those requests",
+    )
+
+    @property
+    def mean_output_tokens(self) -> float | None:
+        """The mean output sequence length per request, or None if no requests have completed."""
+        if not self.request_count:
+            return None
+        return self.output_tokens / self.request_count
 
 
 class ProfileResults(AIPerfBaseModel):
@@ -140,6 +272,18 @@ class ProfileResults(AIPerfBaseModel):
         default=None,
         description="The timeslice metric results of the profile (if using timeslice mode)",
     )
+    stage_metric_results: dict[int, list[MetricResult]] | None = Field(
+        default=None,
+        description="The metric results of each load stage, keyed by the stage index (if using load stages)",
+    )
+    search_results: ThroughputSearchResults | None = Field(
+        default=None,
+        description="The results of the throughput search (if using a search mode)",
+    )
+    adaptive_results: AdaptiveConcurrencyResults | None = Field(
+        default=None,
+        description="The concurrency trajectory of the adaptive concurrency controller (if using an adaptive target)",
+    )
     total_expected: int | None = Field(
         default=None,
         description="The total number of inference requests expected to be made (if known)",
@@ -293,28 +437,24 @@ class SSEMessage(BaseInferenceServerResponse):
         if isinstance(raw_message, bytes):
             raw_message = raw_message.decode("utf-8")
 
-        message = cls(perf_ns=perf_ns)
+        packets: list[SSEField] = []
         for line in raw_message.splitlines():
             if not (line := line.strip()):
                 continue
 
-            parts = line.split(":", 1)
-            if len(parts) < 2:
+            field_name, colon, value = line.partition(":")
+            if not colon:
                 # Fields without a colon have no value, so the whole line is the field name
-                message.packets.append(SSEField(name=parts[0].strip(), value=None))
+                packets.append(SSEField(name=field_name, value=None))
                 continue
 
-            field_name, value = parts
-
             if field_name == "":
                 # Field name is empty, so this is a comment
                 field_name = SSEFieldType.COMMENT
 
-            message.packets.append(
-                SSEField(name=field_name.strip(), value=value.strip())
-            )
+            packets.append(SSEField(name=field_name.strip(), value=value.strip()))
 
-        return message
+        return cls(perf_ns=perf_ns, packets=packets)
 
     def extract_data_content(self) -> str:
         """Extract the data contents from the SSE message as a list of strings. Note that the SSE spec specifies
@@ -351,6 +491,162 @@ class SSEMessage(BaseInferenceServerResponse):
             return None
 
 
+class RawResponseBuffer(AIPerfBaseModel):
+    """The raw responses of a request, stored as one contiguous bytes buffer plus an index of
+    (offset, length, perf_ns) for each response.
+
+    This is much cheaper to build, serialize and hold in memory than a list of SSEMessage models,
+    as the responses are only decoded on demand, one at a time.
+    """
+
+    content_type: str | None = Field(
+        default=None,
+        description="The content type of the responses. e.g. 'text/event-stream', 'application/json'.",
+    )
+    data: bytes = Field(
+        default=b"",
+        description="The raw bytes of all responses, concatenated.",
+    )
+    offsets: list[int] = Field(
+        default_factory=list,
+        description="The offset of each response in the data buffer.",
+    )
+    lengths: list[int] = Field(
+        default_factory=list,
+        description="The length of each response in the data buffer.",
+    )
+    perf_ns: list[int] = Field(
+        default_factory=list,
+        description="The timestamp of each response in nanoseconds (perf_counter_ns).",
+    )
+
+    @field_validator("data", mode="before")
+    @classmethod
+    def _decode_data(cls, value: Any) -> Any:
+        # Messages are sent as JSON, where the data buffer is base64 encoded
+        if isinstance(value, str):
+            return base64.b64decode(value)
+        return value
+
+    @field_serializer("data", when_used="json")
+    def _encode_data(self, value: bytes) -> str:
+        return base64.b64encode(value).decode("ascii")
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[tuple[int, bytes]], content_type: str | None = None
+    ) -> Self:
+        """Build the buffer from (perf_ns, raw bytes) pairs, such as SSEEvent tuples."""
+        offsets: list[int] = []
+        lengths: list[int] = []
+        perf_ns: list[int] = []
+        parts: list[bytes] = []
+        offset = 0
+        for chunk_perf_ns, raw in chunks:
+            offsets.append(offset)
+            lengths.append(len(raw))
+            perf_ns.append(chunk_perf_ns)
+            parts.append(raw)
+            offset += len(raw)
+        return cls(
+            content_type=content_type,
+            data=b"".join(parts),
+            offsets=offsets,
+            lengths=lengths,
+            perf_ns=perf_ns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.perf_ns)
+
+    def get_bytes(self, index: int) -> bytes:
+        """Get the raw bytes of a single response."""
+        offset = self.offsets[index]
+        return self.data[offset : offset + self.lengths[index]]
+
+    def get_response(self, index: int) -> "SSEMessage | TextResponse":
+        """Decode a single response into an SSEMessage or TextResponse."""
+        text = self.get_bytes(index).decode("utf-8", errors="replace")
+        if self.content_type == "text/event-stream":
+            return SSEMessage.parse(text, self.perf_ns[index])
+        return TextResponse(
+            perf_ns=self.perf_ns[index], content_type=self.content_type, text=text
+        )
+
+    def get_text(self, index: int) -> str | None:
+        """Get the text representation of a single response."""
+        return self.get_response(index).get_text()
+
+    def get_json(self, index: int) -> JsonObject | None:
+        """Get the JSON representation of a single response."""
+        return self.get_response(index).get_json()
+
+    def iter_responses(self) -> Iterator["SSEMessage | TextResponse"]:
+        """Decode the responses one at a time, without keeping them in memory."""
+        for index in range(len(self.perf_ns)):
+            yield self.get_response(index)
+
+
+class HttpTraceTimings(AIPerfBaseModel):
+    """Connection level timestamps of a single HTTP request, captured from the HTTP client's tracing hooks.
+
+    All timestamps are in nanoseconds (perf_counter_ns), and are None if the event did not occur
+    for the request. For example, the connection create and DNS timestamps are only set when a new
+    connection was opened, and the connection queued timestamps are only set when the request had to
+    wait for a free connection in the pool.
+    """
+
+    request_start_perf_ns: int | None = Field(
+        default=None,
+        description="The time the HTTP client started processing the request.",
+    )
+    connection_queued_start_perf_ns: int | None = Field(
+        default=None,
+        description="The time the request started waiting for a free connection in the connection pool.",
+    )
+    connection_queued_end_perf_ns: int | None = Field(
+        default=None,
+        description="The time the request stopped waiting for a free connection in the connection pool.",
+    )
+    connection_create_start_perf_ns: int | None = Field(
+        default=None,
+        description="The time a new connection started being created. This includes DNS resolution, TCP connect and TLS handshake.",
+    )
+    connection_create_end_perf_ns: int | None = Field(
+        default=None,
+        description="The time the new connection was ready to use.",
+    )
+    connection_reused_perf_ns: int | None = Field(
+        default=None,
+        description="The time an existing keep-alive connection was acquired from the connection pool.",
+    )
+    dns_resolve_start_perf_ns: int | None = Field(
+        default=None,
+        description="The time DNS resolution of the host started. Not set if the host was in the DNS cache.",
+    )
+    dns_resolve_end_perf_ns: int | None = Field(
+        default=None,
+        description="The time DNS resolution of the host completed.",
+    )
+    request_headers_sent_perf_ns: int | None = Field(
+        default=None,
+        description="The time the request headers were written to the connection.",
+    )
+    request_body_sent_perf_ns: int | None = Field(
+        default=None,
+        description="The time the last chunk of the request body was written to the connection.",
+    )
+    response_start_perf_ns: int | None = Field(
+        default=None,
+        description="The time the first bytes of the response (the status line and headers) were received.",
+    )
+
+    @property
+    def request_sent_perf_ns(self) -> int | None:
+        """The time the request was completely written to the connection."""
+        return self.request_body_sent_perf_ns or self.request_headers_sent_perf_ns
+
+
 class RequestRecord(AIPerfBaseModel):
     """Record of a request with its associated responses."""
 
@@ -411,10 +707,19 @@ class RequestRecord(AIPerfBaseModel):
         default_factory=list,
         description="The raw responses received from the request.",
     )
+    raw_responses: RawResponseBuffer | None = Field(
+        default=None,
+        description="The raw responses received from the request, stored as a single buffer that is decoded on demand. "
+        "When set, this is used instead of the responses list. See iter_responses().",
+    )
     error: ErrorDetails | None = Field(
         default=None,
         description="The error details if the request failed.",
     )
+    http_trace: HttpTraceTimings | None = Field(
+        default=None,
+        description="The connection level timestamps of the request, if they were captured by the HTTP client.",
+    )
     delayed_ns: int | None = Field(
         default=None,
         ge=0,
@@ -431,6 +736,17 @@ class RequestRecord(AIPerfBaseModel):
         "This can be used to trace internal latency in order to identify bottlenecks or other issues.",
         ge=0,
     )
+    schedule_lag_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The number of nanoseconds the credit of the request was issued after its scheduled arrival time by the timing strategy. "
+        "This is only set for the first turn, and only when the timing strategy follows an arrival schedule.",
+    )
+    stage_index: int | None = Field(
+        default=None,
+        ge=0,
+        description="The index of the load stage that the credit of the request was issued in, when using load stages.",
+    )
     was_cancelled: bool = Field(
         default=False,
         description="Whether the request was cancelled during execution.",
@@ -459,6 +775,26 @@ class RequestRecord(AIPerfBaseModel):
         """Check if the request was delayed."""
         return self.delayed_ns is not None and self.delayed_ns > 0
 
+    @property
+    def response_count(self) -> int:
+        """Get the number of responses received."""
+        if self.raw_responses is not None:
+            return len(self.raw_responses)
+        return len(self.responses)
+
+    @property
+    def response_perf_ns(self) -> list[int]:
+        """Get the timestamp of each response in nanoseconds, without decoding any raw responses."""
+        if self.raw_responses is not None:
+            return self.raw_responses.perf_ns
+        return [response.perf_ns for response in self.responses]
+
+    def iter_responses(self) -> Iterator[SSEMessage | TextResponse]:
+        """Iterate over the responses, decoding them one at a time if they are stored in raw_responses."""
+        if self.raw_responses is not None:
+            return self.raw_responses.iter_responses()
+        return iter(self.responses)
+
     # TODO: Most of these properties will be removed once we have proper record handling and metrics.
 
     @property
@@ -476,8 +812,8 @@ class RequestRecord(AIPerfBaseModel):
         """
         return not self.has_error and (
             0 <= self.start_perf_ns < sys.maxsize
-            and len(self.responses) > 0
-            and all(0 < response.perf_ns < sys.maxsize for response in self.responses)
+            and self.response_count > 0
+            and all(0 < perf_ns < sys.maxsize for perf_ns in self.response_perf_ns)
         )
 
     def create_error_from_invalid(self) -> None:
@@ -487,16 +823,16 @@ class RequestRecord(AIPerfBaseModel):
                 lambda: f"Converting invalid request record to error record: {self}"
             )
             err = InvalidInferenceResultError("Invalid inference result")
-            if len(self.responses) == 0:
+            if self.response_count == 0:
                 err.add_note("No responses were received")
             if self.start_perf_ns <= 0 or self.start_perf_ns >= sys.maxsize:
                 err.add_note(
                     f"Start perf ns timestamp is invalid: {self.start_perf_ns}"
                 )
-            for i, response in enumerate(self.responses):
-                if response.perf_ns <= 0 or response.perf_ns >= sys.maxsize:
+            for i, perf_ns in enumerate(self.response_perf_ns):
+                if perf_ns <= 0 or perf_ns >= sys.maxsize:
                     err.add_note(
-                        f"Response {i} perf ns timestamp is invalid: {response.perf_ns}"
+                        f"Response {i} perf ns timestamp is invalid: {perf_ns}"
                     )
             self.error = ErrorDetails.from_exception(err)
 
@@ -506,7 +842,7 @@ class RequestRecord(AIPerfBaseModel):
         if not self.valid:
             return None
         return (
-            self.responses[0].perf_ns - self.start_perf_ns
+            self.response_perf_ns[0] - self.start_perf_ns
             if self.start_perf_ns
             else None
         )
@@ -514,13 +850,10 @@ class RequestRecord(AIPerfBaseModel):
     @property
     def time_to_second_response_ns(self) -> int | None:
         """Get the time to the second response in nanoseconds."""
-        if not self.valid or len(self.responses) < 2:
+        if not self.valid or self.response_count < 2:
             return None
-        return (
-            self.responses[1].perf_ns - self.responses[0].perf_ns
-            if self.responses[1].perf_ns and self.responses[0].perf_ns
-            else None
-        )
+        perf_ns = self.response_perf_ns
+        return perf_ns[1] - perf_ns[0] if perf_ns[1] and perf_ns[0] else None
 
     @property
     def time_to_last_response_ns(self) -> int | None:
@@ -534,40 +867,45 @@ class RequestRecord(AIPerfBaseModel):
     @property
     def inter_token_latency_ns(self) -> float | None:
         """Get the interval between responses in nanoseconds."""
-        if not self.valid or len(self.responses) < 2:
+        if not self.valid or self.response_count < 2:
             return None
 
+        perf_ns = self.response_perf_ns
+        last_response = (
+            self.raw_responses.get_response(-1)
+            if self.raw_responses is not None
+            else self.responses[-1]
+        )
         if (
-            isinstance(self.responses[-1], SSEMessage)
-            and self.responses[-1].packets[-1].value == "[DONE]"
+            isinstance(last_response, SSEMessage)
+            and last_response.packets[-1].value == "[DONE]"
         ):
             return (
-                (self.responses[-2].perf_ns - self.responses[0].perf_ns)
-                / (len(self.responses) - 2)
-                if self.responses[-2].perf_ns and self.responses[0].perf_ns
+                (perf_ns[-2] - perf_ns[0]) / (len(perf_ns) - 2)
+                if perf_ns[-2] and perf_ns[0]
                 else None
             )
 
         return (
-            (self.responses[-1].perf_ns - self.responses[0].perf_ns)
-            / (len(self.responses) - 1)
-            if self.responses[-1].perf_ns and self.responses[0].perf_ns
+            (perf_ns[-1] - perf_ns[0]) / (len(perf_ns) - 1)
+            if perf_ns[-1] and perf_ns[0]
             else None
         )
 
     def token_latency_ns(self, index: int) -> float | None:
         """Get the latency of a token in nanoseconds."""
-        if not self.valid or len(self.responses) < 1:
+        if not self.valid or self.response_count < 1:
             return None
+        perf_ns = self.response_perf_ns
         if index == 0:
             return (
-                self.responses[0].perf_ns - self.recv_start_perf_ns
+                perf_ns[0] - self.recv_start_perf_ns
                 if self.recv_start_perf_ns
                 else None
             )
         return (
-            self.responses[index].perf_ns - self.responses[index - 1].perf_ns
-            if self.responses[index].perf_ns and self.responses[index - 1].perf_ns
+            perf_ns[index] - perf_ns[index - 1]
+            if perf_ns[index] and perf_ns[index - 1]
             else None
         )
 
@@ -794,6 +1132,16 @@ class RequestInfo(AIPerfBaseModel):
         ge=0,
         description="The delay in nanoseconds after which the request should be cancelled, as specified in the credit drop message.",
     )
+    schedule_lag_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The number of nanoseconds the credit was issued after its scheduled arrival time, as specified in the credit drop message.",
+    )
+    stage_index: int | None = Field(
+        default=None,
+        ge=0,
+        description="The index of the load stage that the credit was issued in, as specified in the credit drop message.",
+    )
     x_request_id: str | None = Field(
         default=None,
         description="The X-Request-ID header of the request. This is a unique ID for the request.",
@@ -5,6 +5,7 @@
 from pydantic import Field
 
 from aiperf.common.models.base_models import AIPerfBaseModel
+from aiperf.common.models.error_models import ErrorDetails
 
 
 class WorkerTaskStats(AIPerfBaseModel):
@@ -37,3 +38,46 @@ class WorkerTaskStats(AIPerfBaseModel):
         This is the total number of tasks sent to the worker minus the number of failed and successfully completed tasks.
         """
         return self.total - self.completed - self.failed
+
+
+class ConnectionPrewarmStats(AIPerfBaseModel):
+    """Stats for pre-warming the connection pool of a worker before profiling starts."""
+
+    requested: int = Field(
+        default=0,
+        description="The number of connections that were requested to be opened",
+    )
+    opened: int = Field(
+        default=0,
+        description="The number of connections that were opened and validated successfully",
+    )
+    failed: int = Field(
+        default=0,
+        description="The number of connections that failed to open",
+    )
+    duration_ns: int = Field(
+        default=0,
+        description="The time it took to open all of the connections, in nanoseconds",
+    )
+    errors: list[ErrorDetails] = Field(
+        default_factory=list,
+        description="The unique errors that occurred while opening the connections",
+    )
+
+    @classmethod
+    def from_errors(
+        cls, requested: int, errors: list[BaseException], duration_ns: int
+    ) -> "ConnectionPrewarmStats":
+        """Create the stats from the list of exceptions raised while opening the connections."""
+        unique_errors: list[ErrorDetails] = []
+        for error in errors:
+            details = ErrorDetails.from_exception(error)
+            if details not in unique_errors:
+                unique_errors.append(details)
+        return cls(
+            requested=requested,
+            opened=requested - len(errors),
+            failed=len(errors),
+            duration_ns=duration_ns,
+            errors=unique_errors,
+        )
@@ -32,6 +32,7 @@ from aiperf.common.types import (
 if TYPE_CHECKING:
     import multiprocessing
 
+    import numpy as np
     from rich.console import Console
 
     from aiperf.common.config import ServiceConfig, UserConfig
@@ -316,6 +317,21 @@ class ConsoleExporterProtocol(Protocol):
     async def export(self, console: "Console") -> None: ...
 
 
+@runtime_checkable
+class CreditSchedulerProtocol(Protocol):
+    """Protocol for waiting until the scheduled time of a credit.
+    see :class:`aiperf.timing.credit_scheduler.HybridSpinCreditScheduler` for more details.
+    """
+
+    async def wait_until(self, target_perf_ns: int) -> None:
+        """Wait until time.perf_counter_ns() reaches the target time. Returns immediately if it is in the past."""
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the scheduler."""
+        ...
+
+
 @runtime_checkable
 class DataExporterProtocol(Protocol):
     """
@@ -421,6 +437,29 @@ class HooksProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class MessageCodecProtocol(Protocol):
+    """Protocol for encoding messages to the bytes sent over the ZMQ sockets, and decoding them back.
+    see :class:`aiperf.zmq.message_codec.MsgpackMessageCodec` for more details.
+    """
+
+    def encode(self, message: MessageT) -> bytes:
+        """Encode a message into a single frame."""
+        ...
+
+    def decode(self, data: bytes) -> MessageT:
+        """Decode a message from a single frame."""
+        ...
+
+    def encode_multipart(self, message: MessageT) -> list[bytes]:
+        """Encode a message into one or more frames, where the first frame is the message body."""
+        ...
+
+    def decode_multipart(self, frames: list[bytes]) -> MessageT:
+        """Decode a message from the frames created by :meth:`encode_multipart`."""
+        ...
+
+
 @runtime_checkable
 class ServiceManagerProtocol(AIPerfLifecycleProtocol, Protocol):
     """Protocol for a service manager that manages the running of services using the specific ServiceRunType.
@@ -531,12 +570,14 @@ class TelemetryResultsProcessorProtocol(Protocol):
 
 @runtime_checkable
 class RequestRateGeneratorProtocol(Protocol):
-    """Protocol for a request rate generator that generates the next interval for a request rate."""
+    """Protocol for a request rate generator that generates the next interval(s) for a request rate."""
 
     def __init__(self, config: "TimingManagerConfig") -> None: ...
 
     def next_interval(self) -> float: ...
 
+    def next_intervals(self, count: int) -> "np.ndarray": ...
+
 
 @runtime_checkable
 class TransportProtocol(AIPerfLifecycleProtocol, Protocol):
@@ -57,12 +57,19 @@ __all__ = [
     "RandomGenerator",
     "derive",
     "init",
+    "reseed_streams",
     "reset",
 ]
 
 _logger = AIPerfLogger(__name__)
 
 
+def _derive_seed(seed_string: str) -> int:
+    """Derive a 64-bit seed from a string, using SHA-256 for stable hashing across runs."""
+    hash_bytes = hashlib.sha256(seed_string.encode("utf-8")).digest()
+    return int.from_bytes(hash_bytes[:8], byteorder="big")
+
+
 class RandomGenerator:
     """Unified random number generator that encapsulates both Python random and NumPy RNG.
 
@@ -107,6 +114,8 @@ class RandomGenerator:
             )
 
         self._seed = seed
+        # The seed the generator was created with, from which the seed of each stream is derived
+        self._base_seed = seed
         self._python_rng = random.Random(seed)
         self._numpy_rng = np.random.default_rng(seed)
 
@@ -119,6 +128,26 @@ class RandomGenerator:
         """Get the seed used to initialize this generator."""
         return self._seed
 
+    def reseed_stream(self, stream: int) -> None:
+        """Reseed the generator with a seed derived from its original seed and a stream.
+
+        This gives each unit of work (e.g. each conversation of a dataset) its own
+        random sequence, which does not depend on how many values were drawn for the
+        units before it. The units can then be generated in any order, or in
+        parallel processes, with identical results.
+
+        Args:
+            stream: Stream number, such as the index of the conversation in the dataset.
+
+        Note:
+            Non-deterministic generators (seed of None) are left unchanged.
+        """
+        if self._base_seed is None:
+            return
+        self._seed = _derive_seed(f"{self._base_seed}:stream:{stream}")
+        self._python_rng.seed(self._seed)
+        self._numpy_rng = np.random.default_rng(self._seed)
+
     def integers(self, low: int, high: int | None = None, size=None):
         """Generate random integers from [low, high) using NumPy.
 
@@ -317,6 +346,31 @@ class RandomGenerator:
         """
         return self._python_rng.expovariate(lambd)
 
+    def exponential(self, scale: float = 1.0, size=None):
+        """Draw samples from exponential distribution using NumPy.
+
+        Args:
+            scale: Scale parameter (scale = 1.0 / lambd = desired mean), default 1.0
+            size: Output shape, optional
+
+        Returns:
+            Random sample(s) from exponential distribution
+        """
+        return self._numpy_rng.exponential(scale, size)
+
+    def gamma(self, shape: float, scale: float = 1.0, size=None):
+        """Draw samples from gamma distribution using NumPy.
+
+        Args:
+            shape: Shape parameter of the distribution, must be greater than 0
+            scale: Scale parameter of the distribution (mean = shape * scale), default 1.0
+            size: Output shape, optional
+
+        Returns:
+            Random sample(s) from gamma distribution
+        """
+        return self._numpy_rng.gamma(shape, scale, size)
+
     def random(self) -> float:
         """Generate random float in [0.0, 1.0).
 
@@ -380,9 +434,7 @@ class _RNGManager:
         """
         if self._root_seed is not None:
             # Deterministic: derive seed from root + identifier
-            seed_string = f"{self._root_seed}:{identifier}"
-            hash_bytes = hashlib.sha256(seed_string.encode("utf-8")).digest()
-            child_seed = int.from_bytes(hash_bytes[:8], byteorder="big")
+            child_seed = _derive_seed(f"{self._root_seed}:{identifier}")
             return RandomGenerator(child_seed, _internal=True)
         else:
             # Non-deterministic: pass through None
@@ -464,6 +516,29 @@ def derive(identifier: str) -> RandomGenerator:
     return _manager.derive(identifier)
 
 
+def reseed_streams(stream: int, *components: object) -> None:
+    """Reseed every RandomGenerator attribute of the components for a stream.
+
+    Args:
+        stream: Stream number, such as the index of the conversation in the dataset.
+        *components: Objects holding RandomGenerator attributes. None is skipped.
+
+    Example:
+        >>> for index in range(num_conversations):
+        ...     rng.reseed_streams(index, self, self.prompt_generator)
+        ...     conversations.append(self._create_conversation())
+
+    Note:
+        See RandomGenerator.reseed_stream() for details.
+    """
+    for component in components:
+        if component is None:
+            continue
+        for value in vars(component).values():
+            if isinstance(value, RandomGenerator):
+                value.reseed_stream(stream)
+
+
 def reset() -> None:
     """Reset global RNG manager to None.
 
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import contextlib
+import hashlib
 import io
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,7 @@ class Tokenizer:
         Initialize the tokenizer with default values for call, encode, and decode.
         """
         self._tokenizer = None
+        self._identity: str | None = None
         self._call_args = {"add_special_tokens": False}
         self._encode_args = {"add_special_tokens": False}
         self._decode_args = {"skip_special_tokens": True}
@@ -144,6 +146,22 @@ class Tokenizer:
             return self.eos_token_id
         return None
 
+    @property
+    def identity(self) -> str | None:
+        """
+        Return a hash of the serialized tokenizer, to key caches of tokenized data,
+        or None if the tokenizer cannot be serialized.
+
+        Only fast tokenizers are serialized, including their vocabulary, normalization
+        and added tokens, so that any change to the tokenizer changes its identity.
+        """
+        if self._identity is None and self._tokenizer is not None:
+            backend_tokenizer = getattr(self._tokenizer, "backend_tokenizer", None)
+            if backend_tokenizer is not None:
+                serialized = backend_tokenizer.to_str()
+                self._identity = hashlib.sha256(serialized.encode()).hexdigest()
+        return self._identity
+
     def __repr__(self) -> str:
         """
         Return a string representation of the underlying tokenizer.
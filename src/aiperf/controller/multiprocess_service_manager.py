@@ -11,7 +11,11 @@ from pydantic import BaseModel, ConfigDict, Field
 from aiperf.common.bootstrap import bootstrap_and_run_service
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.decorators import implements_protocol
-from aiperf.common.enums import ServiceRegistrationStatus, ServiceRunType
+from aiperf.common.enums import (
+    ServiceRegistrationStatus,
+    ServiceRunType,
+    ServiceType,
+)
 from aiperf.common.environment import Environment
 from aiperf.common.exceptions import AIPerfError
 from aiperf.common.factories import ServiceFactory, ServiceManagerFactory
@@ -60,6 +64,12 @@ class MultiProcessServiceManager(BaseServiceManager):
     ) -> None:
         """Run a service with the given number of replicas."""
         service_class = ServiceFactory.get_class_from_type(service_type)
+        # Daemon processes cannot have children, so the DatasetManager is not run as one when it generates the
+        # dataset in a pool of processes. It is still stopped or killed along with the other services.
+        daemon = not (
+            service_type == ServiceType.DATASET_MANAGER
+            and Environment.DATASET.PARALLEL_GENERATION
+        )
 
         for _ in range(num_replicas):
             service_id = f"{service_type}_{uuid.uuid4().hex[:8]}"
@@ -73,7 +83,7 @@ class MultiProcessServiceManager(BaseServiceManager):
                     "user_config": self.user_config,
                     "log_queue": self.log_queue,
                 },
-                daemon=True,
+                daemon=daemon,
             )
 
             process.start()
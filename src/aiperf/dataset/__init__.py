@@ -7,6 +7,10 @@ from aiperf.dataset.composer import (
     SyntheticDatasetComposer,
     SyntheticRankingsDatasetComposer,
 )
+from aiperf.dataset.dataset_cache import (
+    DatasetCache,
+    dataset_cache_key,
+)
 from aiperf.dataset.dataset_manager import (
     DatasetManager,
     main,
@@ -34,9 +38,11 @@ from aiperf.dataset.loader import (
     BasePublicDatasetLoader,
     CustomDatasetLoaderProtocol,
     CustomDatasetT,
+    LazyMooncakeTraceDataset,
     MediaConversionMixin,
     MooncakeTrace,
     MooncakeTraceDatasetLoader,
+    MooncakeTraceIndex,
     MultiTurn,
     MultiTurnDatasetLoader,
     RandomPool,
@@ -45,6 +51,9 @@ from aiperf.dataset.loader import (
     SingleTurn,
     SingleTurnDatasetLoader,
 )
+from aiperf.dataset.shared_memory_store import (
+    SharedMemoryDatasetStore,
+)
 from aiperf.dataset.utils import (
     check_file_exists,
     encode_image,
@@ -64,12 +73,15 @@ __all__ = [
     "CustomDatasetLoaderProtocol",
     "CustomDatasetT",
     "DEFAULT_CORPUS_FILE",
+    "DatasetCache",
     "DatasetManager",
     "ImageGenerator",
+    "LazyMooncakeTraceDataset",
     "MP3_SUPPORTED_SAMPLE_RATES",
     "MediaConversionMixin",
     "MooncakeTrace",
     "MooncakeTraceDatasetLoader",
+    "MooncakeTraceIndex",
     "MultiTurn",
     "MultiTurnDatasetLoader",
     "PromptGenerator",
@@ -79,6 +91,7 @@ __all__ = [
     "SUPPORTED_BIT_DEPTHS",
     "SequentialSampler",
     "ShareGPTLoader",
+    "SharedMemoryDatasetStore",
     "ShuffleSampler",
     "SingleTurn",
     "SingleTurnDatasetLoader",
@@ -86,6 +99,7 @@ __all__ = [
     "SyntheticRankingsDatasetComposer",
     "VideoGenerator",
     "check_file_exists",
+    "dataset_cache_key",
     "encode_image",
     "main",
     "open_image",
@@ -4,12 +4,15 @@
 from aiperf.common.config import UserConfig
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import ComposerType, CustomDatasetType
+from aiperf.common.environment import Environment
 from aiperf.common.factories import ComposerFactory, CustomDatasetFactory
 from aiperf.common.models import Conversation
 from aiperf.common.protocols import ServiceProtocol
 from aiperf.common.tokenizer import Tokenizer
 from aiperf.dataset import utils
 from aiperf.dataset.composer.base import BaseDatasetComposer
+from aiperf.dataset.loader.models import MooncakeTrace
+from aiperf.dataset.loader.mooncake_trace import LazyMooncakeTraceDataset
 
 
 @implements_protocol(ServiceProtocol)
@@ -33,6 +36,30 @@ class CustomDatasetComposer(BaseDatasetComposer):
         self._finalize_conversations(conversations)
         return conversations
 
+    def create_lazy_dataset(self) -> LazyMooncakeTraceDataset:
+        """Index a mooncake_trace file, and create the conversation of each session when it is requested.
+
+        Returns:
+            LazyMooncakeTraceDataset: A mapping of session ID to conversation, whose conversations are created on demand.
+        """
+        utils.check_file_exists(self.config.input.file)
+
+        self._create_loader_instance(CustomDatasetType.MOONCAKE_TRACE)
+        index = self.loader.build_index()
+        return LazyMooncakeTraceDataset(
+            index=index,
+            create_conversation=self._create_lazy_conversation,
+            cache_size=Environment.DATASET.LAZY_CACHE_SIZE,
+        )
+
+    def _create_lazy_conversation(
+        self, session_id: str, traces: list[MooncakeTrace]
+    ) -> Conversation:
+        """Create and finalize the conversation of a single session of the lazy dataset."""
+        conversation = self.loader.convert_session(session_id, traces)
+        self._finalize_conversations([conversation])
+        return conversation
+
     def _create_loader_instance(self, dataset_type: CustomDatasetType) -> None:
         """Initializes the dataset loader based on the custom dataset type.
 
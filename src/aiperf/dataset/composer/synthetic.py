@@ -1,9 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from aiperf.common import random_generator as rng
 from aiperf.common.config import UserConfig
-from aiperf.common.enums import ComposerType
+from aiperf.common.enums import ComposerType, ModelSelectionStrategy
+from aiperf.common.environment import Environment
 from aiperf.common.factories import ComposerFactory
 from aiperf.common.models import Audio, Conversation, Image, Text, Turn, Video
 from aiperf.common.session_id_generator import SessionIDGenerator
@@ -15,6 +20,7 @@ from aiperf.dataset.composer.base import BaseDatasetComposer
 class SyntheticDatasetComposer(BaseDatasetComposer):
     def __init__(self, config: UserConfig, tokenizer: Tokenizer):
         super().__init__(config, tokenizer)
+        self.tokenizer = tokenizer
         self.session_id_generator = SessionIDGenerator(seed=config.input.random_seed)
 
         self._turn_sampler_rng = rng.derive("composer.conversation.turn_count")
@@ -36,26 +42,109 @@ class SyntheticDatasetComposer(BaseDatasetComposer):
 
         It generates a set of conversations with a varying number of turns,
         where each turn contains synthetic text, image, and audio payloads.
+        Each conversation uses its own RNG streams, so when
+        AIPERF_DATASET_PARALLEL_GENERATION is enabled, the conversations can be
+        generated in a pool of processes with identical results. Daemon processes
+        cannot have children, so they are generated serially when this runs in one.
 
         Returns:
             list[Conversation]: A list of conversation objects.
         """
-        conversations = []
-        for _ in range(self.config.input.conversation.num_dataset_entries):
-            conversation = Conversation(session_id=self.session_id_generator.next())
-
-            num_turns = self._turn_sampler_rng.sample_positive_normal_integer(
-                self.config.input.conversation.turn.mean,
-                self.config.input.conversation.turn.stddev,
+        num_entries = self.config.input.conversation.num_dataset_entries
+        session_ids = [self.session_id_generator.next() for _ in range(num_entries)]
+        num_workers = 1
+        if Environment.DATASET.PARALLEL_GENERATION:
+            if multiprocessing.current_process().daemon:
+                self.warning(
+                    "Parallel generation is not supported in a daemon process, "
+                    "generating the synthetic conversations serially"
+                )
+            else:
+                num_workers = (
+                    Environment.DATASET.GENERATION_WORKERS or os.cpu_count() or 1
+                )
+                num_workers = min(num_workers, num_entries)
+        if num_workers <= 1:
+            return [
+                self._create_indexed_conversation(index, session_id)
+                for index, session_id in enumerate(session_ids)
+            ]
+
+        self.info(
+            f"Generating {num_entries:,} synthetic conversations in {num_workers} processes"
+        )
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_generation_worker,
+            initargs=(self.config, self.tokenizer),
+        ) as executor:
+            conversations = list(
+                executor.map(
+                    _create_conversation_in_worker,
+                    range(num_entries),
+                    session_ids,
+                    chunksize=max(1, num_entries // (num_workers * 4)),
+                )
             )
-            self.logger.debug("Creating conversation with %d turns", num_turns)
 
-            for turn_idx in range(num_turns):
-                turn = self._create_turn(is_first=(turn_idx == 0))
-                conversation.turns.append(turn)
-            conversations.append(conversation)
+        if (
+            self.config.endpoint.model_selection_strategy
+            == ModelSelectionStrategy.ROUND_ROBIN
+        ):
+            # The round robin depends on the turns of all of the previous conversations,
+            # so it is applied in order once all of the conversations are generated
+            for conversation in conversations:
+                for turn in conversation.turns:
+                    turn.model = self._select_model_name()
         return conversations
 
+    def _create_indexed_conversation(self, index: int, session_id: str) -> Conversation:
+        """Create a single synthetic conversation with its own RNG streams.
+
+        The RNGs are reseeded from the index of the conversation first, so that
+        the conversation does not depend on the conversations generated before it,
+        or on which process generates it.
+
+        Args:
+            index: The index of the conversation in the dataset.
+            session_id: The session ID of the conversation.
+
+        Returns:
+            Conversation: A conversation object.
+        """
+        rng.reseed_streams(
+            index,
+            self,
+            self.prompt_generator,
+            self.image_generator,
+            self.audio_generator,
+            self.video_generator,
+            self._seq_distribution,
+        )
+        return self._create_conversation(session_id)
+
+    def _create_conversation(self, session_id: str) -> Conversation:
+        """Create a single synthetic conversation with a varying number of turns.
+
+        Args:
+            session_id: The session ID of the conversation.
+
+        Returns:
+            Conversation: A conversation object.
+        """
+        conversation = Conversation(session_id=session_id)
+
+        num_turns = self._turn_sampler_rng.sample_positive_normal_integer(
+            self.config.input.conversation.turn.mean,
+            self.config.input.conversation.turn.stddev,
+        )
+        self.logger.debug("Creating conversation with %d turns", num_turns)
+
+        for turn_idx in range(num_turns):
+            turn = self._create_turn(is_first=(turn_idx == 0))
+            conversation.turns.append(turn)
+        return conversation
+
     def _create_turn(self, is_first: bool) -> Turn:
         """Create a turn object that contains synthetic payloads to send.
 
@@ -191,3 +280,20 @@ class SyntheticDatasetComposer(BaseDatasetComposer):
     @property
     def include_video(self) -> bool:
         return bool(self.config.input.video.width and self.config.input.video.height)
+
+
+# The composer of a generation worker process, created by the initializer of the process
+_worker_composer: SyntheticDatasetComposer | None = None
+
+
+def _init_generation_worker(config: UserConfig, tokenizer: Tokenizer) -> None:
+    """Create the composer of a generation worker process, with the same RNG seeds as the main process."""
+    global _worker_composer
+    rng.reset()
+    rng.init(config.input.random_seed)
+    _worker_composer = SyntheticDatasetComposer(config, tokenizer)
+
+
+def _create_conversation_in_worker(index: int, session_id: str) -> Conversation:
+    """Create a single synthetic conversation in a generation worker process."""
+    return _worker_composer._create_indexed_conversation(index, session_id)  # type: ignore[union-attr]
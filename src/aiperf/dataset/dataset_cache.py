@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""On-disk cache of the conversations of a dataset, keyed by everything the dataset is generated from."""
+
+import hashlib
+import importlib.metadata
+import os
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from aiperf.common.config import UserConfig
+from aiperf.common.environment import Environment
+from aiperf.common.models import Conversation
+
+# Bump when the layout of the cache files changes, to invalidate the existing entries
+_CACHE_FORMAT_VERSION = 1
+_COMPRESSION_LEVEL = 1
+
+
+def _aiperf_version() -> str:
+    try:
+        return importlib.metadata.version("aiperf")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _input_file_stats(file: Path | str | None) -> list[tuple[str, int, int]]:
+    """Get the path, size and modification time of the input file, or of each file in the input directory."""
+    if file is None:
+        return []
+    path = Path(file)
+    files = (
+        sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    )
+    stats = []
+    for f in files:
+        if f.exists():
+            stat = f.stat()
+            stats.append((str(f.resolve()), stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def dataset_cache_key(user_config: UserConfig) -> str:
+    """Compute the cache key of the dataset of a user config.
+
+    The key is a hash of the input configuration (including the random seed), the endpoint
+    options used by the composers, the tokenizer, the size and modification time of the
+    input file(s), the dataset generation settings and the aiperf version.
+
+    Args:
+        user_config: The user config to compute the cache key for.
+
+    Returns:
+        The hex digest of the cache key.
+    """
+    key_data: dict[str, Any] = {
+        "format": _CACHE_FORMAT_VERSION,
+        "aiperf_version": _aiperf_version(),
+        "input": user_config.input.model_dump(mode="json"),
+        "endpoint": user_config.endpoint.model_dump(
+            mode="json", include={"model_names", "model_selection_strategy", "type"}
+        ),
+        "tokenizer": {
+            "name": user_config.tokenizer.name or user_config.endpoint.model_names[0],
+            "revision": user_config.tokenizer.revision,
+            "trust_remote_code": user_config.tokenizer.trust_remote_code,
+        },
+        "input_files": _input_file_stats(user_config.input.file),
+        "parallel_generation": Environment.DATASET.PARALLEL_GENERATION,
+    }
+    return hashlib.sha256(
+        orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+class DatasetCache:
+    """A content-addressed cache of the conversations of datasets in a directory.
+
+    Each entry is a single file named after its cache key, containing the conversations
+    as a zlib-compressed JSON array. Entries are written to a temporary file first, and
+    then renamed, so that concurrent runs never read a partially written entry.
+    """
+
+    def __init__(self, cache_dir: Path, key: str) -> None:
+        self.key = key
+        self.path = cache_dir / f"{key}.dataset"
+
+    def load(self) -> list[Conversation] | None:
+        """Load the conversations of the cache entry.
+
+        Returns:
+            The conversations, or None if there is no cache entry.
+
+        Raises:
+            ValueError: If the cache entry is corrupted.
+        """
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return [
+                Conversation.model_validate(conversation)
+                for conversation in orjson.loads(zlib.decompress(data))
+            ]
+        except Exception as e:
+            raise ValueError(f"Corrupted dataset cache entry {self.path}: {e!r}") from e
+
+    def save(self, conversations: Iterable[Conversation]) -> None:
+        """Save the conversations to the cache entry, replacing any existing entry.
+
+        Raises:
+            OSError: If the cache entry could not be written.
+        """
+        data = orjson.dumps(
+            [
+                conversation.model_dump(mode="json", exclude_none=True)
+                for conversation in conversations
+            ]
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            temp_path.write_bytes(zlib.compress(data, _COMPRESSION_LEVEL))
+            os.replace(temp_path, self.path)
+        finally:
+            temp_path.unlink(missing_ok=True)
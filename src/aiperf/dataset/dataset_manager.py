@@ -2,8 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
 import time
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 import aiofiles
+import numpy as np
+import orjson
 
 from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.base_component_service import BaseComponentService
@@ -14,6 +18,7 @@ from aiperf.common.enums import (
     CommAddress,
     CommandType,
     ComposerType,
+    CustomDatasetType,
     MessageType,
     ServiceType,
 )
@@ -21,10 +26,15 @@ from aiperf.common.environment import Environment
 from aiperf.common.factories import (
     ComposerFactory,
     DatasetSamplingStrategyFactory,
+    EndpointFactory,
     ServiceFactory,
 )
-from aiperf.common.hooks import on_command, on_request
+from aiperf.common.hooks import on_command, on_request, on_stop
 from aiperf.common.messages import (
+    ConversationBatchRequestMessage,
+    ConversationBatchResponseMessage,
+    ConversationIdRequestMessage,
+    ConversationIdResponseMessage,
     ConversationRequestMessage,
     ConversationResponseMessage,
     ConversationTurnRequestMessage,
@@ -32,16 +42,29 @@ from aiperf.common.messages import (
     DatasetConfiguredNotification,
     DatasetTimingRequest,
     DatasetTimingResponse,
+    DatasetTokenLengthsRequest,
+    DatasetTokenLengthsResponse,
     ProfileConfigureCommand,
 )
 from aiperf.common.mixins import ReplyClientMixin
-from aiperf.common.models import Conversation, InputsFile
+from aiperf.common.models import (
+    Conversation,
+    ConversationTokenLengths,
+    InputsFile,
+    Turn,
+)
 from aiperf.common.models.dataset_models import SessionPayloads
 from aiperf.common.models.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.models.record_models import RequestInfo
-from aiperf.common.protocols import DatasetSamplingStrategyProtocol, ServiceProtocol
+from aiperf.common.protocols import (
+    DatasetSamplingStrategyProtocol,
+    EndpointProtocol,
+    ServiceProtocol,
+)
 from aiperf.common.tokenizer import Tokenizer
-from aiperf.dataset.loader import ShareGPTLoader
+from aiperf.dataset.dataset_cache import DatasetCache, dataset_cache_key
+from aiperf.dataset.loader import LazyMooncakeTraceDataset, ShareGPTLoader
+from aiperf.dataset.shared_memory_store import SharedMemoryDatasetStore
 
 _logger = AIPerfLogger(__name__)
 
@@ -71,10 +94,14 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         self.debug("Dataset manager __init__")
         self.user_config = user_config
         self.tokenizer: Tokenizer | None = None
-        self.dataset: dict[str, Conversation] = {}  # session ID -> Conversation mapping
+        # session ID -> Conversation mapping, which creates the conversations on demand if the dataset is lazy
+        self.dataset: Mapping[str, Conversation] = {}
         self._session_ids_cache: list[str] = []
+        # The timestamp of every turn and the index of its conversation in the session IDs, sorted by timestamp
+        self._timing_schedule: tuple[np.ndarray, np.ndarray] | None = None
         self.dataset_configured = asyncio.Event()
         self._dataset_sampler: DatasetSamplingStrategyProtocol | None = None
+        self._shared_memory_store: SharedMemoryDatasetStore | None = None
 
     @on_command(CommandType.PROFILE_CONFIGURE)
     async def _profile_configure_command(
@@ -91,7 +118,11 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         self.info(lambda: f"Configuring dataset for {self.service_id}")
         begin = time.perf_counter()
         await self._configure_dataset()
-        await self._generate_inputs_json_file()
+        if isinstance(self.dataset, LazyMooncakeTraceDataset):
+            # Writing every payload would create every conversation up front, which the lazy dataset avoids
+            self.info("Skipping the inputs.json file for the lazily loaded dataset")
+        else:
+            await self._generate_inputs_json_file()
         duration = time.perf_counter() - begin
         self.info(lambda: f"Dataset configured in {duration:.2f} seconds")
 
@@ -109,15 +140,8 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
             revision=self.user_config.tokenizer.revision,
         )
 
-    def _generate_input_payloads(
-        self,
-        model_endpoint: ModelEndpointInfo,
-    ) -> InputsFile:
-        """Generate input payloads from the dataset for use in the inputs.json file."""
-        inputs = InputsFile()
-        from aiperf.common.factories import EndpointFactory
-        from aiperf.common.protocols import EndpointProtocol
-
+    def _create_endpoint(self, model_endpoint: ModelEndpointInfo) -> EndpointProtocol:
+        """Create the endpoint used to format the request payloads."""
         endpoint: EndpointProtocol = EndpointFactory.create_instance(
             model_endpoint.endpoint.type,
             model_endpoint=model_endpoint,
@@ -126,6 +150,44 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
             lambda: f"Created endpoint protocol for {model_endpoint.endpoint.type}, "
             f"class: {endpoint.__class__.__name__}",
         )
+        return endpoint
+
+    def _format_turn_payload(
+        self,
+        endpoint: EndpointProtocol,
+        model_endpoint: ModelEndpointInfo,
+        turn: Turn,
+        turn_index: int,
+    ) -> dict[str, Any]:
+        """Format the payload for a single turn, sent on its own."""
+        request_info = RequestInfo(
+            model_endpoint=model_endpoint, turns=[turn], turn_index=turn_index
+        )
+        request_info.endpoint_headers = endpoint.get_endpoint_headers(request_info)
+        request_info.endpoint_params = endpoint.get_endpoint_params(request_info)
+        return endpoint.format_payload(request_info)
+
+    def _prerender_payloads(self, model_endpoint: ModelEndpointInfo) -> None:
+        """Render the request body of the first turn of each conversation, so that workers can send it as-is.
+
+        Only the first turn can be pre-rendered, as the payloads of later turns include the
+        conversation history, which contains the responses from the server.
+        """
+        endpoint = self._create_endpoint(model_endpoint)
+        for conversation in self.dataset.values():
+            if not conversation.turns:
+                continue
+            first_turn = conversation.turns[0]
+            payload = self._format_turn_payload(endpoint, model_endpoint, first_turn, 0)
+            first_turn.rendered_payload = orjson.dumps(payload).decode("utf-8")
+
+    def _generate_input_payloads(
+        self,
+        model_endpoint: ModelEndpointInfo,
+    ) -> InputsFile:
+        """Generate input payloads from the dataset for use in the inputs.json file."""
+        inputs = InputsFile()
+        endpoint = self._create_endpoint(model_endpoint)
         session_payloads_map: dict[str, list] = {}
         for conversation in self.dataset.values():
             session_id = conversation.session_id
@@ -133,16 +195,12 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
                 session_payloads_map[session_id] = []
 
             for i, turn in enumerate(conversation.turns):
-                request_info = RequestInfo(
-                    model_endpoint=model_endpoint, turns=[turn], turn_index=i
-                )
-                request_info.endpoint_headers = endpoint.get_endpoint_headers(
-                    request_info
-                )
-                request_info.endpoint_params = endpoint.get_endpoint_params(
-                    request_info
-                )
-                payload = endpoint.format_payload(request_info)
+                if turn.rendered_payload is not None:
+                    payload = orjson.loads(turn.rendered_payload)
+                else:
+                    payload = self._format_turn_payload(
+                        endpoint, model_endpoint, turn, i
+                    )
                 session_payloads_map[session_id].append(payload)
 
         for session_id, payloads in session_payloads_map.items():
@@ -190,6 +248,22 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         )
         return composer.create_dataset()
 
+    def _load_lazy_custom_dataset(self) -> LazyMooncakeTraceDataset:
+        composer = ComposerFactory.create_instance(
+            ComposerType.CUSTOM,
+            config=self.user_config,
+            tokenizer=self.tokenizer,
+        )
+        return composer.create_lazy_dataset()
+
+    def _use_lazy_dataset(self) -> bool:
+        """Whether the dataset is a mooncake_trace that should be loaded lazily."""
+        return (
+            Environment.DATASET.LAZY_MOONCAKE_TRACE
+            and self.user_config.input.custom_dataset_type
+            == CustomDatasetType.MOONCAKE_TRACE
+        )
+
     def _is_rankings_endpoint(self, endpoint_type: str) -> bool:
         return "rankings" in endpoint_type.lower()
 
@@ -208,29 +282,145 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         )
         return composer.create_dataset()
 
+    async def _load_conversations(self) -> list[Conversation]:
+        if self.user_config.input.public_dataset is not None:
+            return await self._load_public_dataset()
+        if self.user_config.input.custom_dataset_type is not None:
+            return self._load_custom_dataset()
+        return self._load_synthetic_dataset()
+
+    def _use_dataset_cache(self) -> bool:
+        """The dataset is only cached when it is seeded, as it is different on every run otherwise."""
+        return (
+            Environment.DATASET.CONVERSATION_CACHE
+            and self.user_config.input.random_seed is not None
+        )
+
+    async def _load_cached_conversations(self) -> list[Conversation]:
+        """Load the conversations from the on-disk dataset cache, or create and cache them on a cache miss."""
+        cache = DatasetCache(
+            Environment.DATASET.CONVERSATION_CACHE_DIR,
+            dataset_cache_key(self.user_config),
+        )
+        begin = time.perf_counter()
+        try:
+            conversations = cache.load()
+        except ValueError as e:
+            self.warning(f"Ignoring the dataset cache: {e}")
+            conversations = None
+        if conversations is not None:
+            duration = time.perf_counter() - begin
+            self.info(
+                lambda: f"Loaded {len(conversations):,} conversations from the dataset cache {cache.path} "
+                f"in {duration:.2f} seconds"
+            )
+            return conversations
+
+        conversations = await self._load_conversations()
+        begin = time.perf_counter()
+        try:
+            cache.save(conversations)
+        except OSError as e:
+            self.warning(f"Unable to write the dataset cache {cache.path}: {e!r}")
+        else:
+            duration = time.perf_counter() - begin
+            self.info(
+                lambda: f"Wrote {len(conversations):,} conversations to the dataset cache {cache.path} "
+                f"in {duration:.2f} seconds"
+            )
+        return conversations
+
     async def _configure_dataset(self) -> None:
         if self.user_config is None:
             raise self._service_error("User config is required for dataset manager")
 
         self.dataset_configured.clear()
+        self._release_lazy_dataset()
 
-        if self.user_config.input.public_dataset is not None:
-            conversations = await self._load_public_dataset()
-        elif self.user_config.input.custom_dataset_type is not None:
-            conversations = self._load_custom_dataset()
+        if self._use_lazy_dataset():
+            self.dataset = self._load_lazy_custom_dataset()
+            self.info(
+                lambda: f"Indexed {len(self.dataset):,} sessions, whose conversations are created on demand"
+            )
         else:
-            conversations = self._load_synthetic_dataset()
-
-        self.dataset = {conv.session_id: conv for conv in conversations}
+            if self._use_dataset_cache():
+                conversations = await self._load_cached_conversations()
+            else:
+                conversations = await self._load_conversations()
+            self.dataset = {conv.session_id: conv for conv in conversations}
         self._session_ids_cache = list(self.dataset.keys())
+        self._timing_schedule = None
+
+        is_lazy = isinstance(self.dataset, LazyMooncakeTraceDataset)
+        if is_lazy and (
+            Environment.DATASET.PRERENDER_PAYLOADS or Environment.DATASET.SHARED_MEMORY
+        ):
+            self.warning(
+                "Pre-rendered payloads and the shared-memory dataset are not supported for the lazily loaded "
+                "dataset, as they would create every conversation up front"
+            )
+        elif Environment.DATASET.PRERENDER_PAYLOADS:
+            begin = time.perf_counter()
+            self._prerender_payloads(
+                ModelEndpointInfo.from_user_config(self.user_config)
+            )
+            duration = time.perf_counter() - begin
+            self.info(
+                lambda: f"Pre-rendered request payloads in {duration:.2f} seconds"
+            )
 
         self._dataset_sampler = DatasetSamplingStrategyFactory.create_instance(
             self.user_config.input.dataset_sampling_strategy,
             conversation_ids=self._session_ids_cache,
         )
 
+        if Environment.DATASET.SHARED_MEMORY and not is_lazy:
+            self._create_shared_memory_store()
+
         self.dataset_configured.set()
-        await self.publish(DatasetConfiguredNotification(service_id=self.service_id))
+        await self.publish(
+            DatasetConfiguredNotification(
+                service_id=self.service_id,
+                shared_memory_name=self._shared_memory_store.name
+                if self._shared_memory_store is not None
+                else None,
+            )
+        )
+
+    def _create_shared_memory_store(self) -> None:
+        """Write the dataset into a new shared-memory segment, replacing any previous one."""
+        self._release_shared_memory_store()
+        begin = time.perf_counter()
+        self._shared_memory_store = SharedMemoryDatasetStore.create(
+            self.dataset.values()
+        )
+        duration = time.perf_counter() - begin
+        self.info(
+            lambda: f"Wrote dataset to shared memory segment {self._shared_memory_store.name} "
+            f"({self._shared_memory_store.size:,} bytes) in {duration:.2f} seconds"
+        )
+
+    @on_stop
+    async def _close_shared_memory_store(self) -> None:
+        """Release the shared-memory segment of the dataset when the service stops."""
+        self._release_shared_memory_store()
+
+    def _release_shared_memory_store(self) -> None:
+        """Release the shared-memory segment of the dataset, if one was created."""
+        if self._shared_memory_store is not None:
+            self._shared_memory_store.close()
+            self._shared_memory_store = None
+
+    @on_stop
+    async def _close_lazy_dataset(self) -> None:
+        """Close the trace file of the lazy dataset when the service stops."""
+        self._release_lazy_dataset()
+
+    def _release_lazy_dataset(self) -> None:
+        """Close the trace file of the lazy dataset, if the dataset is lazy."""
+        if isinstance(self.dataset, LazyMooncakeTraceDataset):
+            self.dataset.close()
+            self.dataset = {}
 
     @on_request(MessageType.CONVERSATION_REQUEST)
     async def _handle_conversation_request(
@@ -298,6 +488,58 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
             conversation=conversation,
         )
 
+    @on_request(MessageType.CONVERSATION_BATCH_REQUEST)
+    async def _handle_conversation_batch_request(
+        self, message: ConversationBatchRequestMessage
+    ) -> ConversationBatchResponseMessage:
+        """Handle a request for a batch of conversations, used by workers to prefetch conversations."""
+        self.debug(lambda: f"Handling conversation batch request: {message}")
+
+        await self._wait_for_dataset_configuration()
+
+        if not self.dataset:
+            raise self._service_error(
+                "Dataset is empty and must be configured before handling requests.",
+            )
+        if self._dataset_sampler is None:
+            raise self._service_error(
+                "Dataset sampler is not configured. Must be configured before handling requests.",
+            )
+
+        conversations = [
+            self.dataset[self._dataset_sampler.next_conversation_id()]
+            for _ in range(message.count)
+        ]
+        self.trace_or_debug(
+            lambda: f"Sending conversation batch response: {conversations}",
+            lambda: f"Sending conversation batch of {len(conversations)} conversations",
+        )
+        return ConversationBatchResponseMessage(
+            service_id=self.service_id,
+            request_id=message.request_id,
+            conversations=conversations,
+        )
+
+    @on_request(MessageType.CONVERSATION_ID_REQUEST)
+    async def _handle_conversation_id_request(
+        self, message: ConversationIdRequestMessage
+    ) -> ConversationIdResponseMessage:
+        """Handle a request for the next conversation ID, used by workers that read the conversations from shared memory."""
+        self.debug(lambda: f"Handling conversation ID request: {message}")
+
+        await self._wait_for_dataset_configuration()
+
+        if self._dataset_sampler is None:
+            raise self._service_error(
+                "Dataset sampler is not configured. Must be configured before handling requests.",
+            )
+
+        return ConversationIdResponseMessage(
+            service_id=self.service_id,
+            request_id=message.request_id,
+            conversation_id=self._dataset_sampler.next_conversation_id(),
+        )
+
     @on_request(MessageType.CONVERSATION_TURN_REQUEST)
     async def _handle_conversation_turn_request(
         self, message: ConversationTurnRequestMessage
@@ -345,15 +587,156 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
                 "Dataset is empty and must be configured before handling timing requests.",
             )
 
-        timing_dataset = []
-        for conversation_id, conversation in self.dataset.items():
-            for turn in conversation.turns:
-                timing_dataset.append((turn.timestamp, conversation_id))
+        if self._timing_schedule is None:
+            try:
+                self._timing_schedule = self._build_timing_schedule()
+            except ValueError as e:
+                raise self._service_error(
+                    f"Unable to build the fixed schedule of the dataset: {e}"
+                ) from e
+
+        # Only the requested chunk of the schedule is sent, packed with the IDs of the conversations it refers to
+        timestamps, conversation_numbers = self._timing_schedule
+        end = len(timestamps)
+        if message.limit is not None:
+            end = min(message.offset + message.limit, end)
+        numbers, conversation_indices = np.unique(
+            conversation_numbers[message.offset : end], return_inverse=True
+        )
 
         return DatasetTimingResponse(
             service_id=self.service_id,
             request_id=message.request_id,
-            timing_data=timing_dataset,
+            timestamps=timestamps[message.offset : end].tobytes(),
+            conversation_indices=conversation_indices.astype(np.int64).tobytes(),
+            conversation_ids=[self._session_ids_cache[n] for n in numbers.tolist()],
+            total_count=len(timestamps),
+        )
+
+    def _build_timing_schedule(self) -> tuple[np.ndarray, np.ndarray]:
+        """Build the timestamp of every turn in the dataset, and the index of its conversation in the session IDs,
+        sorted by timestamp. Turns with the same timestamp keep their order in the dataset.
+
+        Raises:
+            ValueError: If any of the turns do not have a timestamp.
+        """
+        if isinstance(self.dataset, LazyMooncakeTraceDataset):
+            # Read the timestamps from the index, without creating the conversations
+            timestamps, conversation_numbers = self.dataset.timing_arrays()
+        else:
+            timestamp_list: list[int | None] = []
+            number_list: list[int] = []
+            for number, conversation in enumerate(self.dataset.values()):
+                for turn in conversation.turns:
+                    timestamp_list.append(turn.timestamp)
+                    number_list.append(number)
+            missing = timestamp_list.count(None)
+            if missing:
+                raise ValueError(f"{missing:,} turns do not have a timestamp")
+            timestamps = np.array(timestamp_list, dtype=np.int64)
+            conversation_numbers = np.array(number_list, dtype=np.int64)
+
+        order = np.argsort(timestamps, kind="stable")
+        return timestamps[order], conversation_numbers[order]
+
+    @on_request(MessageType.DATASET_TOKEN_LENGTHS_REQUEST)
+    async def _handle_dataset_token_lengths_request(
+        self, message: DatasetTokenLengthsRequest
+    ) -> DatasetTokenLengthsResponse:
+        """Handle a dataset token lengths request, used by the token rate strategy to pace requests by their token count."""
+        self.trace_or_debug(
+            lambda: f"Handling dataset token lengths request: {message}",
+            "Handling dataset token lengths request",
+        )
+
+        await self._wait_for_dataset_configuration()
+
+        if not self.dataset:
+            raise self._service_error(
+                "Dataset is empty and must be configured before handling token lengths requests.",
+            )
+        if self.tokenizer is None:
+            raise self._service_error(
+                "Tokenizer is not configured. Must be configured before handling token lengths requests.",
+            )
+
+        begin = time.perf_counter()
+        token_lengths = self._dataset_token_lengths()
+        duration = time.perf_counter() - begin
+        self.info(
+            lambda: f"Counted the tokens of {len(token_lengths):,} conversations in {duration:.2f} seconds"
+        )
+        return DatasetTokenLengthsResponse(
+            service_id=self.service_id,
+            request_id=message.request_id,
+            token_lengths=token_lengths,
+        )
+
+    def _dataset_token_lengths(self) -> list[ConversationTokenLengths]:
+        """Get the token lengths of every conversation, tokenizing at most TOKEN_LENGTHS_SAMPLE_SIZE of them.
+
+        The lazy Mooncake dataset uses the input_length of its traces, without creating the conversations. Other
+        datasets are tokenized when they are small enough. Otherwise, the input tokens are estimated from the length
+        of the text, with the tokens per character measured on an evenly spaced sample of the conversations.
+        """
+        sample_size = Environment.DATASET.TOKEN_LENGTHS_SAMPLE_SIZE
+        if isinstance(self.dataset, LazyMooncakeTraceDataset):
+            text_inputs = self.dataset.index.sample_text_inputs(sample_size)
+            return self.dataset.token_lengths(self._tokens_per_char(text_inputs))
+
+        conversations = list(self.dataset.values())  # type: ignore[union-attr]
+        if len(conversations) <= sample_size:
+            return [
+                self._conversation_token_lengths(conversation)
+                for conversation in conversations
+            ]
+
+        sample = conversations[:: len(conversations) // sample_size][:sample_size]
+        tokens_per_char = self._tokens_per_char(
+            content
+            for conversation in sample
+            for turn in conversation.turns
+            for text in turn.texts
+            for content in text.contents
+        )
+        return [
+            self._conversation_token_lengths(conversation, tokens_per_char)
+            for conversation in conversations
+        ]
+
+    def _tokens_per_char(self, texts: Iterable[str]) -> float:
+        """Measure the number of tokens per character of the texts."""
+        chars = tokens = 0
+        for text in texts:
+            chars += len(text)
+            tokens += len(self.tokenizer.encode(text))  # type: ignore[union-attr]
+        return tokens / chars if chars else 0.0
+
+    def _conversation_token_lengths(
+        self, conversation: Conversation, tokens_per_char: float | None = None
+    ) -> ConversationTokenLengths:
+        """Count the input tokens in the text of each turn of a conversation, and sum the max_tokens of each turn.
+
+        If `tokens_per_char` is set, the input tokens are estimated from the length of the text instead.
+        """
+        input_tokens = 0
+        output_tokens: int | None = 0
+        for turn in conversation.turns:
+            for text in turn.texts:
+                for content in text.contents:
+                    if tokens_per_char is None:
+                        input_tokens += len(self.tokenizer.encode(content))  # type: ignore[union-attr]
+                    else:
+                        input_tokens += round(len(content) * tokens_per_char)
+            if turn.max_tokens is None or output_tokens is None:
+                output_tokens = None
+            else:
+                output_tokens += turn.max_tokens
+        return ConversationTokenLengths(
+            conversation_id=conversation.session_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            turns=len(conversation.turns),
         )
 
     async def _wait_for_dataset_configuration(self) -> None:
@@ -1,12 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import os
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 from aiperf.common import random_generator as rng
 from aiperf.common.config import PromptConfig
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import (
     ConfigurationError,
     InvalidStateError,
@@ -16,6 +20,8 @@ from aiperf.common.tokenizer import Tokenizer
 from aiperf.dataset.generator.base import BaseGenerator
 
 DEFAULT_CORPUS_FILE = "assets/shakespeare.txt"
+# Bump when the tokenization of the corpus changes, to invalidate the cached corpora
+_CORPUS_CACHE_VERSION = 1
 
 
 class PromptGenerator(BaseGenerator):
@@ -33,7 +39,7 @@ class PromptGenerator(BaseGenerator):
     def __init__(self, config: PromptConfig, tokenizer: Tokenizer, **kwargs):
         self.config = config
         self.tokenizer = tokenizer
-        self._tokenized_corpus = None
+        self._tokenized_corpus: np.ndarray | None = None
         self._corpus_size = 0
         self._prefix_prompts: list[str] = []
 
@@ -57,15 +63,74 @@ class PromptGenerator(BaseGenerator):
             self._create_prefix_prompt_pool()
 
     def _initialize_corpus(self) -> None:
-        """Load and tokenize the corpus once, storing it for reuse.
+        """Load the tokenized corpus from the on-disk cache, or tokenize it and cache it.
+
+        The cached corpus is memory-mapped read-only, so that it is shared by every
+        process of the benchmark through the page cache. The corpus is only cached for
+        fast tokenizers, which are identified by a hash of their serialization.
+        """
+        corpus_path = Path(__file__).parent / DEFAULT_CORPUS_FILE
+        cache_path = self._corpus_cache_path(corpus_path)
+        if cache_path is not None:
+            self._tokenized_corpus = self._load_cached_corpus(cache_path)
+        if self._tokenized_corpus is None:
+            self._tokenized_corpus = self._tokenize_corpus(corpus_path)
+            if cache_path is not None:
+                self._save_cached_corpus(cache_path)
+        self._corpus_size = len(self._tokenized_corpus)
+
+    def _corpus_cache_path(self, corpus_path: Path) -> Path | None:
+        """Get the path of the cached corpus, keyed by the tokenizer and the corpus contents,
+        or None if the corpus is not cached."""
+        if not Environment.DATASET.CORPUS_CACHE:
+            return None
+        identity = self.tokenizer.identity
+        if identity is None:
+            return None
+        key = hashlib.sha256()
+        key.update(f"{_CORPUS_CACHE_VERSION}:{identity}:".encode())
+        key.update(corpus_path.read_bytes())
+        return Environment.DATASET.CORPUS_CACHE_DIR / f"{key.hexdigest()}.npy"
+
+    def _load_cached_corpus(self, cache_path: Path) -> np.ndarray | None:
+        """Memory-map the cached corpus, or return None if it is missing or corrupted."""
+        try:
+            corpus = np.load(cache_path, mmap_mode="r", allow_pickle=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.warning(f"Ignoring corrupted corpus cache {cache_path}: {e!r}")
+            return None
+        if corpus.dtype != np.int32 or corpus.ndim != 1:
+            self.warning(f"Ignoring corrupted corpus cache {cache_path}")
+            return None
+        self.debug(
+            lambda: f"Loaded corpus with {len(corpus)} tokens from cache {cache_path}"
+        )
+        return corpus
+
+    def _save_cached_corpus(self, cache_path: Path) -> None:
+        """Write the tokenized corpus to the cache, through a temporary file so that
+        concurrent processes never load a partially written corpus."""
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                np.save(f, self._tokenized_corpus, allow_pickle=False)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self.warning(f"Unable to write the corpus cache {cache_path}: {e!r}")
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _tokenize_corpus(self, corpus_path: Path) -> np.ndarray:
+        """Tokenize the corpus into an array of token IDs.
 
         Uses character-based chunking for reproducibility across different machines.
         The chunk size is fixed (not CPU-dependent) to ensure the same tokenization
         boundaries regardless of hardware, which guarantees identical prompts with
         the same random seed across all environments.
         """
-        corpus_path = Path(__file__).parent / DEFAULT_CORPUS_FILE
-
         with open(corpus_path) as f:
             lines = f.readlines()
 
@@ -108,14 +173,14 @@ class PromptGenerator(BaseGenerator):
         with ThreadPoolExecutor(max_workers=num_threads) as executor:
             tokenized_chunks = list(executor.map(tokenize_chunk, chunks))
 
-        self._tokenized_corpus = [
-            token for chunk in tokenized_chunks for token in chunk
-        ]
-        self._corpus_size = len(self._tokenized_corpus)
+        tokenized_corpus = np.fromiter(
+            (token for chunk in tokenized_chunks for token in chunk), dtype=np.int32
+        )
         self.debug(
-            lambda: f"Initialized corpus with {self._corpus_size} tokens "
+            lambda: f"Tokenized corpus into {len(tokenized_corpus)} tokens "
             f"from {len(chunks)} chunks using {num_threads} threads"
         )
+        return tokenized_corpus
 
     def _create_prefix_prompt_pool(self) -> None:
         """Generate a pool of prefix prompts to sample from."""
@@ -163,7 +228,7 @@ class PromptGenerator(BaseGenerator):
         Returns:
             A synthetic prompt as a string.
         """
-        return self.tokenizer.decode(self._sample_tokens(num_tokens))
+        return self.tokenizer.decode(self._sample_tokens(num_tokens).tolist())
 
     def _generate_cached_prompt(
         self,
@@ -212,9 +277,11 @@ class PromptGenerator(BaseGenerator):
                 prompt_tokens: list[int] = []
                 if self.tokenizer.block_separation_token_id is not None:
                     prompt_tokens += [self.tokenizer.block_separation_token_id]
-                    prompt_tokens += self._sample_tokens(current_block_size - 1)
+                    prompt_tokens += self._sample_tokens(
+                        current_block_size - 1
+                    ).tolist()
                 else:
-                    prompt_tokens += self._sample_tokens(current_block_size)
+                    prompt_tokens += self._sample_tokens(current_block_size).tolist()
 
                 self._cache[hash_id] = prompt_tokens  # store to cache
 
@@ -222,20 +289,22 @@ class PromptGenerator(BaseGenerator):
 
         return self.tokenizer.decode(final_prompt, skip_special_tokens=False)
 
-    def _sample_tokens(self, num_tokens: int) -> list[int]:
-        """Generate a list of token IDs containing exactly `num_tokens` number of tokens
+    def _sample_tokens(self, num_tokens: int) -> np.ndarray:
+        """Generate an array of token IDs containing exactly `num_tokens` number of tokens
         using the preloaded tokenized corpus.
 
+        The array is a view of the corpus, unless the sample wraps around the end of the corpus.
+
         Args:
             num_tokens: Number of tokens required in the prompt.
 
         Returns:
-            A list of token IDs.
+            An array of token IDs.
 
         Raises:
             NotInitializedError: If the tokenized corpus is not initialized
         """
-        if not self._tokenized_corpus:
+        if self._tokenized_corpus is None or self._corpus_size == 0:
             raise NotInitializedError("Tokenized corpus is not initialized.")
         if num_tokens > self._corpus_size:
             self.warning(
@@ -248,7 +317,9 @@ class PromptGenerator(BaseGenerator):
         end_idx = start_idx + num_tokens
         prompt_tokens = self._tokenized_corpus[start_idx:end_idx]
         if end_idx > self._corpus_size:
-            prompt_tokens += self._tokenized_corpus[: end_idx - self._corpus_size]
+            prompt_tokens = np.concatenate(
+                (prompt_tokens, self._tokenized_corpus[: end_idx - self._corpus_size])
+            )
 
         self.trace(lambda: f"Sampled {len(prompt_tokens)} tokens from corpus")
         return prompt_tokens
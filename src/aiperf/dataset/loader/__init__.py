@@ -27,7 +27,9 @@ from aiperf.dataset.loader.models import (
     SingleTurn,
 )
 from aiperf.dataset.loader.mooncake_trace import (
+    LazyMooncakeTraceDataset,
     MooncakeTraceDatasetLoader,
+    MooncakeTraceIndex,
 )
 from aiperf.dataset.loader.multi_turn import (
     MultiTurnDatasetLoader,
@@ -52,9 +54,11 @@ __all__ = [
     "BasePublicDatasetLoader",
     "CustomDatasetLoaderProtocol",
     "CustomDatasetT",
+    "LazyMooncakeTraceDataset",
     "MediaConversionMixin",
     "MooncakeTrace",
     "MooncakeTraceDatasetLoader",
+    "MooncakeTraceIndex",
     "MultiTurn",
     "MultiTurnDatasetLoader",
     "RandomPool",
@@ -1,18 +1,174 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from collections import defaultdict
+import mmap
+import os
+from array import array
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterator, Mapping
+
+import numpy as np
+import orjson
 
 from aiperf.common.config.user_config import UserConfig
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import CustomDatasetType
 from aiperf.common.factories import CustomDatasetFactory
-from aiperf.common.models import Conversation, Text, Turn
+from aiperf.common.models import Conversation, ConversationTokenLengths, Text, Turn
 from aiperf.dataset.generator import PromptGenerator
 from aiperf.dataset.loader.base_loader import BaseFileLoader
 from aiperf.dataset.loader.models import MooncakeTrace
 from aiperf.dataset.loader.protocol import CustomDatasetLoaderProtocol
 
+# Marks a trace without a timestamp in the timestamps of the index
+_NO_TIMESTAMP = np.iinfo(np.int64).min
+# Marks a trace without an input_length or output_length in the lengths of the index
+_NO_LENGTH = -1
+
+
+class MooncakeTraceIndex:
+    """A line-offset index of a Mooncake trace file, which reads the traces of a session on demand.
+
+    The file is memory-mapped, and only the byte offset, timestamp and lengths of each line are kept in memory,
+    grouped by session in the order that the sessions first appear in the file.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        session_numbers: dict[str, int],
+        line_sessions: array,
+        line_offsets: array,
+        timestamps: array,
+        input_lengths: array,
+        output_lengths: array,
+        text_lengths: array,
+    ) -> None:
+        self.filename = filename
+        self.session_ids = list(session_numbers)
+        self._session_numbers = session_numbers
+
+        # Group the lines by session, keeping the order of the lines within each session
+        sessions = np.frombuffer(line_sessions, dtype=np.int64)
+        order = np.argsort(sessions, kind="stable")
+        self._line_offsets = np.frombuffer(line_offsets, dtype=np.int64)[order]
+        self._timestamps = np.frombuffer(timestamps, dtype=np.int64)[order]
+        # The input_length, output_length and length in characters of the text_input of each line
+        self._input_lengths = np.frombuffer(input_lengths, dtype=np.int64)[order]
+        self._output_lengths = np.frombuffer(output_lengths, dtype=np.int64)[order]
+        self._text_lengths = np.frombuffer(text_lengths, dtype=np.int64)[order]
+        self._session_starts = np.zeros(len(self.session_ids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(sessions, minlength=len(self.session_ids)),
+            out=self._session_starts[1:],
+        )
+
+        self._file = open(filename, "rb")  # noqa: SIM115
+        # An empty file cannot be memory-mapped, but it has no sessions to read either
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.fstat(self._file.fileno()).st_size > 0
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._session_numbers
+
+    @property
+    def num_traces(self) -> int:
+        """The number of traces in the index, across all sessions."""
+        return len(self._line_offsets)
+
+    def read_session(self, session_id: str) -> list[MooncakeTrace]:
+        """Read and validate the traces of a session from the file, in order.
+
+        Raises:
+            KeyError: If the session is not in the index.
+        """
+        number = self._session_numbers[session_id]
+        start, end = self._session_starts[number], self._session_starts[number + 1]
+        return [
+            MooncakeTrace.model_validate_json(self._read_line(offset))
+            for offset in self._line_offsets[start:end].tolist()
+        ]
+
+    def _read_line(self, offset: int) -> bytes:
+        end = self._mmap.find(b"\n", offset)  # type: ignore[union-attr]
+        return self._mmap[offset : end if end != -1 else len(self._mmap)]  # type: ignore[index,arg-type]
+
+    def timing_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the timestamp of every trace, and the index of its session in the session IDs, in the same order
+        as the turns of the conversations.
+
+        Raises:
+            ValueError: If any of the traces do not have a timestamp.
+        """
+        missing = np.count_nonzero(self._timestamps == _NO_TIMESTAMP)
+        if missing:
+            raise ValueError(
+                f"{missing:,} traces in {self.filename} do not have a timestamp"
+            )
+        session_numbers = np.repeat(
+            np.arange(len(self.session_ids), dtype=np.int64),
+            np.diff(self._session_starts),
+        )
+        return self._timestamps, session_numbers
+
+    def sample_text_inputs(self, count: int) -> list[str]:
+        """Read the text_input of up to `count` traces, spread evenly across the traces that have one."""
+        lines = np.flatnonzero(self._input_lengths == _NO_LENGTH)
+        if len(lines) > count:
+            lines = lines[np.linspace(0, len(lines) - 1, count, dtype=np.int64)]
+        return [
+            MooncakeTrace.model_validate_json(self._read_line(offset)).text_input  # type: ignore[misc]
+            for offset in self._line_offsets[lines].tolist()
+        ]
+
+    def token_lengths(
+        self, text_tokens_per_char: float
+    ) -> list[ConversationTokenLengths]:
+        """Get the token lengths of each session from the input_length and output_length of its traces, without
+        reading the traces. The input tokens of traces with a text_input are estimated from its length in characters.
+        """
+        if not self.session_ids:
+            return []
+        input_tokens = np.where(
+            self._input_lengths == _NO_LENGTH,
+            np.rint(self._text_lengths * text_tokens_per_char).astype(np.int64),
+            self._input_lengths,
+        )
+        starts = self._session_starts[:-1]
+        session_input_tokens = np.add.reduceat(input_tokens, starts)
+        session_output_tokens = np.add.reduceat(self._output_lengths, starts)
+        # The output tokens of a session are only known when every trace has an output_length
+        missing_output = np.add.reduceat(self._output_lengths == _NO_LENGTH, starts)
+        return [
+            ConversationTokenLengths(
+                conversation_id=session_id,
+                input_tokens=session_input,
+                output_tokens=None if missing else session_output,
+                turns=turns,
+            )
+            for session_id, session_input, session_output, missing, turns in zip(
+                self.session_ids,
+                session_input_tokens.tolist(),
+                session_output_tokens.tolist(),
+                missing_output.tolist(),
+                np.diff(self._session_starts).tolist(),
+                strict=True,
+            )
+        ]
+
+    def close(self) -> None:
+        """Unmap and close the trace file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
 
 @implements_protocol(CustomDatasetLoaderProtocol)
 @CustomDatasetFactory.register(CustomDatasetType.MOONCAKE_TRACE)
@@ -77,15 +233,83 @@ class MooncakeTraceDatasetLoader(BaseFileLoader):
                 session_id = trace_data.session_id or self.session_id_generator.next()
                 data[session_id].append(trace_data)
 
+        self._log_skipped_traces()
+        self.debug(lambda: f"Loaded {len(data):,} traces from {self.filename}")
+
+        return data
+
+    def build_index(self) -> MooncakeTraceIndex:
+        """Index the line offsets of the trace file by session, without validating the traces or generating their prompts.
+
+        Returns:
+            A line-offset index of the trace file, which reads the traces of each session on demand.
+        """
+        session_numbers: dict[str, int] = {}
+        line_sessions = array("q")
+        line_offsets = array("q")
+        timestamps = array("q")
+        input_lengths = array("q")
+        output_lengths = array("q")
+        text_lengths = array("q")
+
+        with open(self.filename, "rb") as f:
+            offset = 0
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue  # Skip empty lines
+
+                record = orjson.loads(line)
+                timestamp = record.get("timestamp")
+                if timestamp is not None and not self._timestamp_within_offsets(
+                    timestamp
+                ):
+                    self._skipped_traces += 1
+                    continue  # Skip traces before or after the fixed schedule offset
+
+                session_id = (
+                    record.get("session_id") or self.session_id_generator.next()
+                )
+                line_sessions.append(
+                    session_numbers.setdefault(session_id, len(session_numbers))
+                )
+                line_offsets.append(line_offset)
+                timestamps.append(_NO_TIMESTAMP if timestamp is None else timestamp)
+                # The text_input is used as the prompt instead of the input_length when both are set
+                if (text_input := record.get("text_input")) is not None:
+                    input_lengths.append(_NO_LENGTH)
+                    text_lengths.append(len(text_input))
+                else:
+                    input_lengths.append(record.get("input_length") or 0)
+                    text_lengths.append(0)
+                output_length = record.get("output_length")
+                output_lengths.append(
+                    _NO_LENGTH if output_length is None else output_length
+                )
+
+        self._log_skipped_traces()
+        index = MooncakeTraceIndex(
+            self.filename,
+            session_numbers,
+            line_sessions,
+            line_offsets,
+            timestamps,
+            input_lengths,
+            output_lengths,
+            text_lengths,
+        )
+        self.debug(
+            lambda: f"Indexed {index.num_traces:,} traces in {len(index):,} sessions from {self.filename}"
+        )
+        return index
+
+    def _log_skipped_traces(self) -> None:
         if self._skipped_traces > 0:
             self.info(
                 f"Skipped {self._skipped_traces:,} traces because they were "
                 f"before the start offset of {self._start_offset} or "
                 f"after the end offset of {self._end_offset}"
             )
-        self.debug(lambda: f"Loaded {len(data):,} traces from {self.filename}")
-
-        return data
 
     def _timestamp_within_offsets(self, timestamp: int) -> bool:
         return (self._start_offset is None or timestamp >= self._start_offset) and (
@@ -103,27 +327,99 @@ class MooncakeTraceDatasetLoader(BaseFileLoader):
         Returns:
             A list of conversations.
         """
-        conversations = []
-        for session_id, traces in data.items():
-            conversation = Conversation(session_id=session_id)
-            for trace in traces:
-                # Handle both text_input and input_length formats
-                if trace.text_input is not None:
-                    prompt = trace.text_input
-                else:
-                    prompt = self.prompt_generator.generate(
-                        mean=trace.input_length,
-                        stddev=0,
-                        hash_ids=trace.hash_ids
-                        or [],  # Use empty list if hash_ids is None
-                    )
-
-                turn = Turn(
-                    timestamp=trace.timestamp,
-                    delay=trace.delay,
-                    texts=[Text(name="text", contents=[prompt])],
-                    max_tokens=trace.output_length,
+        return [
+            self.convert_session(session_id, traces)
+            for session_id, traces in data.items()
+        ]
+
+    def convert_session(
+        self, session_id: str, traces: list[MooncakeTrace]
+    ) -> Conversation:
+        """Convert the Mooncake trace data of a single session to a conversation object.
+
+        Args:
+            session_id: The session ID of the conversation.
+            traces: The Mooncake trace data of the session, one per turn.
+
+        Returns:
+            A conversation with a turn for each trace.
+        """
+        conversation = Conversation(session_id=session_id)
+        for trace in traces:
+            # Handle both text_input and input_length formats
+            if trace.text_input is not None:
+                prompt = trace.text_input
+            else:
+                prompt = self.prompt_generator.generate(
+                    mean=trace.input_length,
+                    stddev=0,
+                    hash_ids=trace.hash_ids or [],  # Use empty list if hash_ids is None
                 )
-                conversation.turns.append(turn)
-            conversations.append(conversation)
-        return conversations
+
+            turn = Turn(
+                timestamp=trace.timestamp,
+                delay=trace.delay,
+                texts=[Text(name="text", contents=[prompt])],
+                max_tokens=trace.output_length,
+            )
+            conversation.turns.append(turn)
+        return conversation
+
+
+class LazyMooncakeTraceDataset(Mapping[str, Conversation]):
+    """A read-only mapping of session ID to conversation, backed by a Mooncake trace index.
+
+    The conversation of a session is created from its traces when it is requested, and the most recently
+    used conversations are kept in a bounded LRU cache. A conversation that was evicted from the cache is
+    created again the next time it is requested, with new synthetic prompts of the same lengths, unless its
+    traces have hash_ids or text_input.
+    """
+
+    def __init__(
+        self,
+        index: MooncakeTraceIndex,
+        create_conversation: Callable[[str, list[MooncakeTrace]], Conversation],
+        cache_size: int,
+    ) -> None:
+        self.index = index
+        self.cache_size = cache_size
+        self._create_conversation = create_conversation
+        self._cache: OrderedDict[str, Conversation] = OrderedDict()
+
+    def __getitem__(self, session_id: str) -> Conversation:
+        if (conversation := self._cache.get(session_id)) is not None:
+            self._cache.move_to_end(session_id)
+            return conversation
+
+        conversation = self._create_conversation(
+            session_id, self.index.read_session(session_id)
+        )
+        self._cache[session_id] = conversation
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return conversation
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.session_ids)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self.index
+
+    def timing_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the timestamp of every turn, and the index of its session in the session IDs, from the index,
+        without creating the conversations."""
+        return self.index.timing_arrays()
+
+    def token_lengths(
+        self, text_tokens_per_char: float
+    ) -> list[ConversationTokenLengths]:
+        """Get the token lengths of every session from the index, without creating the conversations."""
+        return self.index.token_lengths(text_tokens_per_char)
+
+    def close(self) -> None:
+        """Close the trace file of the index."""
+        self._cache.clear()
+        self.index.close()
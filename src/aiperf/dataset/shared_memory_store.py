@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Shared-memory dataset store, used to share conversations between the DatasetManager and workers without IPC."""
+
+import struct
+import sys
+from collections.abc import Iterable
+from multiprocessing.shared_memory import SharedMemory
+
+import orjson
+from typing_extensions import Self
+
+from aiperf.common.exceptions import NotFoundError
+from aiperf.common.models import Conversation
+
+_HEADER = struct.Struct("<Q")
+
+
+class SharedMemoryDatasetStore:
+    """A read-only store of conversations in a shared-memory segment, indexed by session ID.
+
+    The DatasetManager writes all conversations into the segment once with :meth:`create`, and
+    workers on the same host attach to it by name with :meth:`attach`, so that conversations
+    (including any large base64 encoded media) are read directly from shared memory instead
+    of being serialized into every conversation response message.
+
+    Segment layout:
+        [index length: uint64][index: JSON {session_id: [offset, length]}][conversations: JSON...]
+
+    Offsets in the index are relative to the start of the conversation data.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        buffer = shm.buf
+        (index_length,) = _HEADER.unpack_from(buffer, 0)
+        self._data_start = _HEADER.size + index_length
+        self._index: dict[str, list[int]] = orjson.loads(
+            buffer[_HEADER.size : self._data_start]
+        )
+
+    @classmethod
+    def create(cls, conversations: Iterable[Conversation]) -> Self:
+        """Serialize the conversations into a new shared-memory segment. The caller owns the segment,
+        and must call :meth:`close` to release it once it is no longer needed."""
+        index: dict[str, list[int]] = {}
+        parts: list[bytes] = []
+        offset = 0
+        for conversation in conversations:
+            data = orjson.dumps(conversation.model_dump(mode="json", exclude_none=True))
+            index[conversation.session_id] = [offset, len(data)]
+            parts.append(data)
+            offset += len(data)
+
+        index_bytes = orjson.dumps(index)
+        size = _HEADER.size + len(index_bytes) + offset
+        shm = SharedMemory(create=True, size=size)
+        buffer = shm.buf
+        _HEADER.pack_into(buffer, 0, len(index_bytes))
+        position = _HEADER.size
+        for part in (index_bytes, *parts):
+            buffer[position : position + len(part)] = part
+            position += len(part)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        """Attach to an existing shared-memory segment created by another process.
+
+        Raises:
+            FileNotFoundError: If the segment does not exist, such as when running on a different host.
+        """
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=False)
+        else:
+            # NOTE: Before Python 3.13, attaching also registers the segment with the resource tracker.
+            # Services are spawned by the same parent process and share its resource tracker, so this is
+            # a no-op, and the segment is only unlinked by its owner (or the tracker if the owner crashes).
+            shm = SharedMemory(name=name)
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared-memory segment, used by other processes to attach to it."""
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        """The size of the shared-memory segment in bytes."""
+        return self._shm.size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._index
+
+    def get_conversation(self, session_id: str) -> Conversation:
+        """Read a conversation from shared memory. The JSON is parsed directly from the shared buffer.
+
+        Raises:
+            NotFoundError: If the conversation is not in the store.
+        """
+        try:
+            offset, length = self._index[session_id]
+        except KeyError as e:
+            raise NotFoundError(
+                f"Conversation {session_id} not found in the shared-memory dataset."
+            ) from e
+        start = self._data_start + offset
+        return Conversation.model_validate(
+            orjson.loads(self._shm.buf[start : start + length])
+        )
+
+    def close(self) -> None:
+        """Detach from the segment, and remove it if this process created it."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
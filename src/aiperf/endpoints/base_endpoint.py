@@ -80,7 +80,7 @@ class BaseEndpoint(AIPerfLoggerMixin, ABC):
         """
         return [
             parsed
-            for response in record.responses
+            for response in record.iter_responses()
             if (parsed := self.parse_response(response))
         ]
 
@@ -8,6 +8,9 @@ __ignore__ = []
 ## ⚠️        This file is auto-generated by mkinit                 ⚠️ ##
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
+from aiperf.exporters.adaptive_concurrency_json_exporter import (
+    AdaptiveConcurrencyJsonExporter,
+)
 from aiperf.exporters.console_error_exporter import (
     ConsoleErrorExporter,
 )
@@ -47,6 +50,15 @@ from aiperf.exporters.metrics_csv_exporter import (
 from aiperf.exporters.metrics_json_exporter import (
     MetricsJsonExporter,
 )
+from aiperf.exporters.stage_metrics_csv_exporter import (
+    StageMetricsCsvExporter,
+)
+from aiperf.exporters.stage_metrics_json_exporter import (
+    StageMetricsJsonExporter,
+)
+from aiperf.exporters.throughput_search_json_exporter import (
+    ThroughputSearchJsonExporter,
+)
 from aiperf.exporters.timeslice_metrics_csv_exporter import (
     TimesliceMetricsCsvExporter,
 )
@@ -55,6 +67,7 @@ from aiperf.exporters.timeslice_metrics_json_exporter import (
 )
 
 __all__ = [
+    "AdaptiveConcurrencyJsonExporter",
     "ConsoleErrorExporter",
     "ConsoleExperimentalMetricsExporter",
     "ConsoleInternalMetricsExporter",
@@ -67,6 +80,9 @@ __all__ = [
     "MetricsBaseExporter",
     "MetricsCsvExporter",
     "MetricsJsonExporter",
+    "StageMetricsCsvExporter",
+    "StageMetricsJsonExporter",
+    "ThroughputSearchJsonExporter",
     "TimesliceMetricsCsvExporter",
     "TimesliceMetricsJsonExporter",
     "convert_all_metrics_to_display_units",
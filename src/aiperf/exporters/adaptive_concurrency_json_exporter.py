@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import DataExporterType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.factories import DataExporterFactory
+from aiperf.common.models.export_models import (
+    AdaptiveConcurrencyExportData,
+    AdaptiveConcurrencyPoint,
+)
+from aiperf.common.protocols import DataExporterProtocol
+from aiperf.exporters.exporter_config import ExporterConfig, FileExportInfo
+from aiperf.exporters.metrics_base_exporter import MetricsBaseExporter
+
+
+@DataExporterFactory.register(DataExporterType.ADAPTIVE_JSON)
+@implements_protocol(DataExporterProtocol)
+class AdaptiveConcurrencyJsonExporter(MetricsBaseExporter):
+    """Exports the concurrency trajectory of the adaptive concurrency controller to a single JSON file.
+
+    Creates one JSON file containing the samples taken by the controller, in the format:
+    {
+        "metric_tag": "time_to_first_token",
+        "percentile": 90.0,
+        "target": 500.0,
+        "unit": "ms",
+        "final_concurrency": 24,
+        "trajectory": [
+            {"elapsed_sec": 2.0, "concurrency": 1, "request_count": 12, "metric_value": 80.5, "target_met": true},
+            ...
+        ],
+        "input_config": {...}
+    }
+    """
+
+    def __init__(self, exporter_config: ExporterConfig, **kwargs) -> None:
+        super().__init__(exporter_config, **kwargs)
+        self.debug(
+            lambda: f"Initializing AdaptiveConcurrencyJsonExporter with config: {exporter_config}"
+        )
+
+        if not self._results.adaptive_results:
+            raise DataExporterDisabled(
+                "AdaptiveConcurrencyJsonExporter disabled: no adaptive concurrency results found"
+            )
+
+        self._file_path = (
+            exporter_config.user_config.output.profile_export_adaptive_json_file
+        )
+
+    def get_export_info(self) -> FileExportInfo:
+        return FileExportInfo(
+            export_type="Adaptive Concurrency JSON Export",
+            file_path=self._file_path,
+        )
+
+    def _generate_content(self) -> str:
+        """Generate single JSON with the concurrency trajectory of the adaptive concurrency controller.
+
+        Uses instance data member self._results.adaptive_results.
+
+        Returns:
+            str: JSON content with the adaptive concurrency results
+        """
+        adaptive_results = self._results.adaptive_results
+        start_ns = self._results.start_ns or 0
+
+        trajectory = [
+            AdaptiveConcurrencyPoint(
+                elapsed_sec=(sample.timestamp_ns - start_ns) / NANOS_PER_SECOND,
+                concurrency=sample.concurrency,
+                request_count=sample.request_count,
+                metric_value=sample.metric_value,
+                target_met=sample.target_met,
+            )
+            for sample in adaptive_results.samples
+        ]
+        export_data = AdaptiveConcurrencyExportData(
+            metric_tag=adaptive_results.metric_tag,
+            percentile=adaptive_results.percentile,
+            target=adaptive_results.target,
+            unit=adaptive_results.unit,
+            final_concurrency=trajectory[-1].concurrency if trajectory else None,
+            trajectory=trajectory,
+            input_config=self._user_config,
+        )
+
+        return export_data.model_dump_json(
+            indent=2, exclude_unset=True, exclude_none=True
+        )
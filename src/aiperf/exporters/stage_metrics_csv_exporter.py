@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import csv
+import io
+import numbers
+from decimal import Decimal
+
+from aiperf.common.constants import STAT_KEYS
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import DataExporterType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.factories import DataExporterFactory
+from aiperf.common.protocols import DataExporterProtocol
+from aiperf.exporters.exporter_config import ExporterConfig, FileExportInfo
+from aiperf.exporters.metrics_base_exporter import MetricsBaseExporter
+
+
+@DataExporterFactory.register(DataExporterType.STAGE_CSV)
+@implements_protocol(DataExporterProtocol)
+class StageMetricsCsvExporter(MetricsBaseExporter):
+    """Exports the metrics of all load stages to a single CSV file in tidy/long format.
+
+    Creates one CSV file with all load stages in a tidy data format:
+        Stage,Stage Name,Metric,Unit,Stat,Value
+        0,warmup,Request Latency,ms,avg,45.2
+        0,warmup,Request Latency,ms,min,12.1
+        1,peak,Request Latency,ms,avg,48.5
+        ...
+
+    The stage name defaults to the stage index when the stage is not named.
+    System metrics (with single values) use stat='avg'.
+    """
+
+    def __init__(self, exporter_config: ExporterConfig, **kwargs) -> None:
+        super().__init__(exporter_config, **kwargs)
+        self.debug(
+            lambda: f"Initializing StageMetricsCsvExporter with config: {exporter_config}"
+        )
+
+        if not self._results.stage_metric_results:
+            raise DataExporterDisabled(
+                "StageMetricsCsvExporter disabled: no stage metric results found"
+            )
+
+        self._file_path = (
+            exporter_config.user_config.output.profile_export_stages_csv_file
+        )
+        self._load_stages = exporter_config.user_config.loadgen.load_stages or []
+
+        self.debug(
+            lambda: f"Initialized StageMetricsCsvExporter: file={self._file_path}"
+        )
+
+    def get_export_info(self) -> FileExportInfo:
+        return FileExportInfo(
+            export_type="Stage CSV Export",
+            file_path=self._file_path,
+        )
+
+    def _generate_content(self) -> str:
+        """Generate tidy/long format CSV content from all load stages.
+
+        Uses instance data member self._results.stage_metric_results.
+
+        Returns:
+            str: Complete CSV content in tidy format
+        """
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        writer.writerow(["Stage", "Stage Name", "Metric", "Unit", "Stat", "Value"])
+
+        # Process each stage in sorted order
+        for stage_index in sorted(self._results.stage_metric_results.keys()):
+            stage_name = self._stage_name(stage_index)
+
+            # Convert to display units and filter exportable metrics
+            prepared_metrics = self._prepare_metrics(
+                self._results.stage_metric_results[stage_index]
+            )
+
+            # Write rows for each metric
+            for tag, metric in sorted(prepared_metrics.items()):
+                metric_name = metric.header or tag
+                unit = metric.unit or ""
+
+                # Write a row for each stat that has a value
+                for stat in STAT_KEYS:
+                    value = getattr(metric, stat, None)
+                    if value is not None:
+                        writer.writerow(
+                            [
+                                stage_index,
+                                stage_name,
+                                metric_name,
+                                unit,
+                                stat,
+                                self._format_number(value),
+                            ]
+                        )
+
+        return buf.getvalue()
+
+    def _stage_name(self, stage_index: int) -> str:
+        """Get the name of a load stage, defaulting to its index."""
+        if stage_index < len(self._load_stages) and self._load_stages[stage_index].name:
+            return self._load_stages[stage_index].name  # type: ignore
+        return str(stage_index)
+
+    def _format_number(self, value) -> str:
+        """Format a number for CSV output."""
+        if value is None:
+            return ""
+        # Handle bools explicitly (bool is a subclass of int)
+        if isinstance(value, bool):
+            return str(value)
+        # Integers (covers built-in int and other Integral implementations)
+        if isinstance(value, numbers.Integral):
+            return f"{int(value)}"
+        # Real numbers (covers built-in float and many Real implementations) and Decimal
+        if isinstance(value, numbers.Real | Decimal):
+            return f"{float(value):.2f}"
+
+        return str(value)
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import DataExporterType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.factories import DataExporterFactory
+from aiperf.common.models.export_models import (
+    StageCollectionExportData,
+    StageData,
+)
+from aiperf.common.protocols import DataExporterProtocol
+from aiperf.exporters.exporter_config import ExporterConfig, FileExportInfo
+from aiperf.exporters.metrics_json_exporter import MetricsJsonExporter
+
+
+@DataExporterFactory.register(DataExporterType.STAGE_JSON)
+@implements_protocol(DataExporterProtocol)
+class StageMetricsJsonExporter(MetricsJsonExporter):
+    """Exports the metrics of all load stages to a single JSON file.
+
+    Creates one JSON file containing an array of all load stages in the format:
+    {
+        "stages": [
+            {"stage_index": 0, "stage_name": "...", "stage_config": {...}, "metric_1": {...}},
+            {"stage_index": 1, "stage_name": "...", "stage_config": {...}, "metric_1": {...}}
+        ],
+        "input_config": {...}
+    }
+    """
+
+    def __init__(self, exporter_config: ExporterConfig, **kwargs) -> None:
+        super().__init__(exporter_config, **kwargs)
+        self.debug(
+            lambda: f"Initializing StageMetricsJsonExporter with config: {exporter_config}"
+        )
+
+        if not self._results.stage_metric_results:
+            raise DataExporterDisabled(
+                "StageMetricsJsonExporter disabled: no stage metric results found"
+            )
+
+        # Override file path for stage-specific output
+        self._file_path = (
+            exporter_config.user_config.output.profile_export_stages_json_file
+        )
+        self._load_stages = exporter_config.user_config.loadgen.load_stages or []
+
+        self.debug(
+            lambda: f"Initialized StageMetricsJsonExporter: file={self._file_path}"
+        )
+
+    def get_export_info(self) -> FileExportInfo:
+        return FileExportInfo(
+            export_type="Stage JSON Export",
+            file_path=self._file_path,
+        )
+
+    def _generate_content(self) -> str:
+        """Generate single JSON with all load stages in an array.
+
+        Uses instance data member self._results.stage_metric_results.
+
+        Returns:
+            str: JSON content with all load stages
+        """
+        stages_list = []
+
+        for stage_index in sorted(self._results.stage_metric_results.keys()):
+            metric_results = self._results.stage_metric_results[stage_index]
+
+            # Reuse base class helper to prepare metrics
+            prepared_json_metrics = self._prepare_metrics_for_json(metric_results)
+
+            # Create stage object with its configuration and dynamic metrics
+            stage = StageData(stage_index=stage_index)
+            if stage_index < len(self._load_stages):
+                stage.stage_name = self._load_stages[stage_index].name
+                stage.stage_config = self._load_stages[stage_index]
+            for tag, json_result in prepared_json_metrics.items():
+                setattr(stage, tag, json_result)
+
+            stages_list.append(stage)
+
+        # Create collection with metadata
+        export_data = StageCollectionExportData(
+            stages=stages_list,
+            input_config=self._user_config,
+        )
+
+        return export_data.model_dump_json(indent=2, exclude_unset=True)
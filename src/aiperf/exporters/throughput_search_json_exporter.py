@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import DataExporterType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.factories import DataExporterFactory
+from aiperf.common.models import SearchProbeResult
+from aiperf.common.models.export_models import (
+    SearchProbeData,
+    ThroughputSearchExportData,
+)
+from aiperf.common.protocols import DataExporterProtocol
+from aiperf.exporters.exporter_config import ExporterConfig, FileExportInfo
+from aiperf.exporters.metrics_json_exporter import MetricsJsonExporter
+
+
+@DataExporterFactory.register(DataExporterType.SEARCH_JSON)
+@implements_protocol(DataExporterProtocol)
+class ThroughputSearchJsonExporter(MetricsJsonExporter):
+    """Exports the results of the throughput search to a single JSON file.
+
+    Creates one JSON file containing the latency-vs-throughput curve, as an array of the probes
+    sorted by load with the metrics of each probe, and the knee of the curve in the format:
+    {
+        "search_mode": "concurrency",
+        "slo_attainment_target": 99.0,
+        "knee": {"stage_index": 2, "load": 24, "slo_attainment": 99.5, "passed": true, "metric_1": {...}},
+        "probes": [
+            {"stage_index": 0, "load": 1, "slo_attainment": 100.0, "passed": true, "metric_1": {...}},
+            ...
+        ],
+        "input_config": {...}
+    }
+    """
+
+    def __init__(self, exporter_config: ExporterConfig, **kwargs) -> None:
+        super().__init__(exporter_config, **kwargs)
+        self.debug(
+            lambda: f"Initializing ThroughputSearchJsonExporter with config: {exporter_config}"
+        )
+
+        if not self._results.search_results:
+            raise DataExporterDisabled(
+                "ThroughputSearchJsonExporter disabled: no throughput search results found"
+            )
+
+        # Override file path for search-specific output
+        self._file_path = (
+            exporter_config.user_config.output.profile_export_search_json_file
+        )
+
+        self.debug(
+            lambda: f"Initialized ThroughputSearchJsonExporter: file={self._file_path}"
+        )
+
+    def get_export_info(self) -> FileExportInfo:
+        return FileExportInfo(
+            export_type="Throughput Search JSON Export",
+            file_path=self._file_path,
+        )
+
+    def _create_probe_data(self, probe: SearchProbeResult) -> SearchProbeData:
+        """Create the export data of a probe, including the metrics of its load stage.
+
+        The request counts and throughput of the probe are exported as part of its metrics.
+        """
+        probe_data = SearchProbeData(
+            **probe.model_dump(
+                include=set(SearchProbeData.model_fields), exclude_none=True
+            )
+        )
+        stage_metric_results = self._results.stage_metric_results or {}
+        metric_results = stage_metric_results.get(probe.stage_index, [])
+
+        # Reuse base class helper to prepare metrics
+        prepared_json_metrics = self._prepare_metrics_for_json(metric_results)
+        for tag, json_result in prepared_json_metrics.items():
+            setattr(probe_data, tag, json_result)
+        return probe_data
+
+    def _generate_content(self) -> str:
+        """Generate single JSON with the knee and all of the probes of the throughput search.
+
+        Uses instance data members self._results.search_results and self._results.stage_metric_results.
+
+        Returns:
+            str: JSON content with the throughput search results
+        """
+        search_results = self._results.search_results
+
+        export_data = ThroughputSearchExportData(
+            search_mode=search_results.search_mode,
+            slo_attainment_target=search_results.slo_attainment_target,
+            knee=self._create_probe_data(search_results.knee)
+            if search_results.knee
+            else None,
+            probes=[self._create_probe_data(probe) for probe in search_results.probes],
+            input_config=self._user_config,
+        )
+
+        return export_data.model_dump_json(indent=2, exclude_unset=True)
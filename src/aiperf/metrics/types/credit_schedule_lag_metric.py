@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.enums import MetricFlags, MetricTimeUnit
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import ParsedResponseRecord
+from aiperf.metrics.base_record_metric import BaseRecordMetric
+from aiperf.metrics.metric_dicts import MetricRecordDict
+
+
+class CreditScheduleLagMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating Credit Schedule Lag metrics from records.
+
+    It exposes how late the timing strategy issued the credit of each request compared to its scheduled arrival
+    time, such as when the timing manager could not keep up with the target request rate, or was waiting for a
+    concurrency slot. It is only available for the request rate modes that follow an arrival schedule.
+
+    Formula:
+        Credit Schedule Lag = Credit Issued Time - Credit Scheduled Arrival Time
+    """
+
+    tag = "credit_schedule_lag"
+    header = "Credit Schedule Lag"
+    short_header = "Sched Lag"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """
+        This method extracts the credit schedule lag from the record and returns it.
+
+        Raises:
+            NoMetricValue: If the record does not include a credit schedule lag.
+        """
+        if record.request.schedule_lag_ns is None:
+            raise NoMetricValue("Credit Schedule Lag is not included in the record.")
+
+        return record.request.schedule_lag_ns
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.enums import MetricFlags, MetricTimeUnit
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import HttpTraceTimings, ParsedResponseRecord
+from aiperf.metrics.base_record_metric import BaseRecordMetric
+from aiperf.metrics.metric_dicts import MetricRecordDict
+
+
+def _get_http_trace(record: ParsedResponseRecord) -> HttpTraceTimings:
+    """Get the HTTP trace timings of the record, or raise NoMetricValue if they were not captured."""
+    if record.request.http_trace is None:
+        raise NoMetricValue("HTTP trace timings are not included in the record.")
+    return record.request.http_trace
+
+
+def _duration(start_ns: int | None, end_ns: int | None, name: str) -> int:
+    """Get the duration between two trace timestamps, or raise NoMetricValue if either is missing."""
+    if start_ns is None or end_ns is None:
+        raise NoMetricValue(f"{name} timestamps are not included in the HTTP trace.")
+    if end_ns < start_ns:
+        raise ValueError(f"{name} end timestamp is before its start timestamp.")
+    return end_ns - start_ns
+
+
+class HttpConnectionWaitMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating the time a request spent waiting for a free connection in the
+    HTTP client's connection pool. This will be non-zero when the number of in-flight requests exceeds
+    the connection limit (AIPERF_HTTP_CONNECTION_LIMIT), and is client-side time that is included in
+    the request latency and TTFT.
+
+    Formula:
+        HTTP Connection Wait = Connection Queued End - Connection Queued Start (0 if the request was not queued)
+    """
+
+    tag = "http_connection_wait"
+    header = "HTTP Connection Wait"
+    short_header = "Conn Wait"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the connection pool queue timestamps and calculates the wait time."""
+        trace = _get_http_trace(record)
+        if trace.connection_queued_start_perf_ns is None:
+            return 0
+        return _duration(
+            trace.connection_queued_start_perf_ns,
+            trace.connection_queued_end_perf_ns,
+            "Connection queue",
+        )
+
+
+class HttpDNSLookupMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating the DNS resolution time of a request. This is only available for
+    requests that opened a new connection and did not hit the DNS cache.
+
+    Formula:
+        HTTP DNS Lookup = DNS Resolve End - DNS Resolve Start
+    """
+
+    tag = "http_dns_lookup"
+    header = "HTTP DNS Lookup"
+    short_header = "DNS"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the DNS resolution timestamps and calculates the lookup time."""
+        trace = _get_http_trace(record)
+        return _duration(
+            trace.dns_resolve_start_perf_ns, trace.dns_resolve_end_perf_ns, "DNS"
+        )
+
+
+class HttpConnectMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating the time it took to open a new connection, excluding DNS resolution.
+    This includes the TCP connect and the TLS handshake (for https), which the HTTP client does not report
+    separately. This is only available for requests that opened a new connection, rather than reusing a
+    keep-alive connection.
+
+    Formula:
+        HTTP Connect = (Connection Create End - Connection Create Start) - HTTP DNS Lookup
+    """
+
+    tag = "http_connect"
+    header = "HTTP Connect (TCP + TLS)"
+    short_header = "Connect"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the connection create timestamps and calculates the connect time."""
+        trace = _get_http_trace(record)
+        connect_ns = _duration(
+            trace.connection_create_start_perf_ns,
+            trace.connection_create_end_perf_ns,
+            "Connection create",
+        )
+        # DNS resolution happens as part of creating the connection
+        if (
+            trace.dns_resolve_start_perf_ns is not None
+            and trace.dns_resolve_end_perf_ns is not None
+        ):
+            connect_ns -= (
+                trace.dns_resolve_end_perf_ns - trace.dns_resolve_start_perf_ns
+            )
+        return max(connect_ns, 0)
+
+
+class HttpRequestSendMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating the time it took to write the request body to the connection,
+    after the request headers were sent. This is mostly relevant for large payloads, such as
+    requests with images, audio, or very long prompts.
+
+    Formula:
+        HTTP Request Send = Request Body Sent - Request Headers Sent
+    """
+
+    tag = "http_request_send"
+    header = "HTTP Request Send"
+    short_header = "Req Send"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the request send timestamps and calculates the send time."""
+        trace = _get_http_trace(record)
+        return _duration(
+            trace.request_headers_sent_perf_ns,
+            trace.request_sent_perf_ns,
+            "Request send",
+        )
+
+
+class HttpTimeToFirstByteMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating the time from when the request was completely sent, to when the
+    first bytes of the response (the status line and headers) were received. Unlike TTFT, this excludes
+    all client-side time, such as the connection pool wait and connection setup, so it is the closest
+    measure of the server latency.
+
+    Note that many servers send the response headers of a streaming response as soon as the request is
+    accepted, before the first token is ready. In these cases, this measures the server's time to accept
+    the request, rather than its time to first token.
+
+    Formula:
+        HTTP Time to First Byte = Response Start - Request Sent
+    """
+
+    tag = "http_time_to_first_byte"
+    header = "HTTP Time to First Byte"
+    short_header = "TTFB"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the request sent and response start timestamps, and calculates the time to first byte."""
+        trace = _get_http_trace(record)
+        return _duration(
+            trace.request_sent_perf_ns,
+            trace.response_start_perf_ns,
+            "Time to first byte",
+        )
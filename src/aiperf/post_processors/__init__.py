@@ -24,6 +24,9 @@ from aiperf.post_processors.raw_record_writer_processor import (
 from aiperf.post_processors.record_export_results_processor import (
     RecordExportResultsProcessor,
 )
+from aiperf.post_processors.stage_metric_results_processor import (
+    StageMetricResultsProcessor,
+)
 from aiperf.post_processors.telemetry_export_results_processor import (
     TelemetryExportResultsProcessor,
 )
@@ -41,6 +44,7 @@ __all__ = [
     "RawRecordAggregator",
     "RawRecordWriterProcessor",
     "RecordExportResultsProcessor",
+    "StageMetricResultsProcessor",
     "TelemetryExportResultsProcessor",
     "TelemetryResultsProcessor",
     "TimesliceMetricResultsProcessor",
@@ -75,6 +75,15 @@ class MetricResultsProcessor(BaseMetricsProcessor):
         instances_map = await self.get_instances_map(request_start_ns)
         results_dict = await self.get_results(request_start_ns)
 
+        self._process_metrics(record_data, instances_map, results_dict)
+
+    def _process_metrics(
+        self,
+        record_data: MetricRecordsData,
+        instances_map: dict[MetricTagT, BaseMetric],
+        results_dict: MetricResultsDict,
+    ) -> None:
+        """Add the metrics of a record to the given results dict, using the given aggregate metric instances."""
         for tag, value in record_data.metrics.items():
             try:
                 metric_type = self._tags_to_types[tag]
@@ -5,6 +5,7 @@
 import contextlib
 
 import aiofiles
+import orjson
 
 from aiperf.common.config import UserConfig
 from aiperf.common.config.config_defaults import OutputDefaults
@@ -92,12 +93,17 @@ class RawRecordWriterProcessor(BufferedJSONLWriterMixin[RawRecordInfo]):
     ) -> RawRecordInfo:
         """Build the export record for a single record."""
 
-        payload = self._endpoint.format_payload(
-            RequestInfo(
-                model_endpoint=self._model_endpoint,
-                turns=record.request.turns,
+        turns = record.request.turns
+        if turns and len(turns) == 1 and turns[0].rendered_payload is not None:
+            # Reuse the exact request body that the worker sent
+            payload = orjson.loads(turns[0].rendered_payload)
+        else:
+            payload = self._endpoint.format_payload(
+                RequestInfo(
+                    model_endpoint=self._model_endpoint,
+                    turns=turns,
+                )
             )
-        )
         return RawRecordInfo(
             metadata=metadata,
             start_perf_ns=record.request.start_perf_ns,
@@ -105,7 +111,7 @@ class RawRecordWriterProcessor(BufferedJSONLWriterMixin[RawRecordInfo]):
             request_headers=record.request.request_headers,
             response_headers=None,
             status=record.request.status,
-            responses=record.request.responses,
+            responses=list(record.request.iter_responses()),
             error=record.request.error,
         )
 
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from collections import defaultdict
+from typing import Any
+
+from aiperf.common.config import UserConfig
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import ResultsProcessorType
+from aiperf.common.exceptions import NoMetricValue, PostProcessorDisabled
+from aiperf.common.factories import ResultsProcessorFactory
+from aiperf.common.messages.inference_messages import MetricRecordsData
+from aiperf.common.models import MetricResult
+from aiperf.common.protocols import ResultsProcessorProtocol
+from aiperf.common.types import MetricTagT
+from aiperf.metrics.base_metric import BaseMetric
+from aiperf.metrics.metric_dicts import MetricResultsDict
+from aiperf.metrics.metric_registry import MetricRegistry
+from aiperf.post_processors.metric_results_processor import MetricResultsProcessor
+
+
+@implements_protocol(ResultsProcessorProtocol)
+@ResultsProcessorFactory.register(ResultsProcessorType.STAGE)
+class StageMetricResultsProcessor(MetricResultsProcessor):
+    """Processor for metric results of each load stage.
+
+    Groups metrics by the index of the load stage that issued the credit of each request.
+    The probes of the throughput search are load stages as well.
+    """
+
+    def __init__(self, user_config: UserConfig, **kwargs: Any):
+        super().__init__(user_config=user_config, **kwargs)
+
+        if (
+            not self.user_config.loadgen.load_stages
+            and self.user_config.loadgen.search_mode is None
+        ):
+            raise PostProcessorDisabled(
+                "StageMetricResultsProcessor requires load_stages or search_mode to be set"
+            )
+
+        # Set up aggregate metric object default initialization for each stage
+        self._stage_instances_maps: dict[int, dict[MetricTagT, BaseMetric]] = (
+            defaultdict(
+                lambda: {
+                    tag: MetricRegistry.get_class(tag)()
+                    for tag in MetricRegistry.all_tags()
+                }
+            )
+        )
+
+        # Use instance variable with defaultdict for auto-vivification
+        self._stage_results: dict[int, MetricResultsDict] = defaultdict(
+            MetricResultsDict
+        )
+
+    async def process_result(self, record_data: MetricRecordsData) -> None:
+        """Process a result from the metric record processor into the results of its load stage."""
+        stage_index = record_data.metadata.stage_index
+        if stage_index is None:
+            self.debug(
+                lambda: f"Skipping record without a load stage: {record_data.metadata.x_request_id}"
+            )
+            return
+
+        self._process_metrics(
+            record_data,
+            self._stage_instances_maps[stage_index],
+            self._stage_results[stage_index],
+        )
+
+    async def update_derived_metrics(self) -> None:
+        for stage_results in self._stage_results.values():
+            self._update_stage_derived_metrics(stage_results)
+
+    def _update_stage_derived_metrics(self, stage_results: MetricResultsDict) -> None:
+        """Computes the values for the derived metrics of a single load stage."""
+        for tag, derive_func in self.derive_funcs.items():
+            try:
+                stage_results[tag] = derive_func(stage_results)
+            except NoMetricValue as e:
+                self.debug(f"No metric value for derived metric '{tag}': {e!r}")
+            except Exception as e:
+                self.warning(f"Error deriving metric '{tag}': {e!r}")
+
+    async def summarize_stage(self, stage_index: int) -> list[MetricResult]:
+        """Summarize the results of a single load stage, such as while the following stages are still running."""
+        stage_results = self._stage_results.get(stage_index)
+        if stage_results is None:
+            return []
+
+        self._update_stage_derived_metrics(stage_results)
+        return [
+            self._create_metric_result(tag, values)
+            for tag, values in stage_results.items()
+        ]
+
+    async def summarize(self) -> dict[int, list[MetricResult]]:
+        """Summarize the results of each load stage, keyed by the stage index.
+
+        This will compute the values for the derived metrics, and then create the MetricResult objects for each metric.
+        """
+        await self.update_derived_metrics()
+
+        return {
+            stage_index: [
+                self._create_metric_result(tag, values)
+                for tag, values in self._stage_results[stage_index].items()
+            ]
+            for stage_index in sorted(self._stage_results.keys())
+        }
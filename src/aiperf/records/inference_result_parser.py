@@ -111,7 +111,7 @@ class InferenceResultParser(CommunicationMixin):
             try:
                 record = await self.process_valid_record(request_record)
                 self.debug(
-                    lambda: f"Received {len(record.request.responses)} responses, input_token_count: {record.input_token_count}, "
+                    lambda: f"Received {record.request.response_count} responses, input_token_count: {record.input_token_count}, "
                     f"output_token_count: {record.output_token_count}, reasoning_token_count: {record.reasoning_token_count}"
                 )
                 return record
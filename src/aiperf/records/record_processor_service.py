@@ -138,8 +138,8 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
         request_end_ns = compute_time_ns(
             start_time_ns,
             start_perf_ns,
-            record.responses[-1].perf_ns
-            if record.responses
+            record.response_perf_ns[-1]
+            if record.response_count
             else record.end_perf_ns or record.start_perf_ns,
         )
         request_ack_ns = compute_time_ns(
@@ -163,6 +163,7 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
             worker_id=worker_id,
             was_cancelled=record.was_cancelled,
             cancellation_time_ns=cancellation_time_ns,
+            stage_index=record.stage_index,
         )
 
     @on_pull_message(MessageType.INFERENCE_RESULTS)
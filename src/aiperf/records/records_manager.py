@@ -3,9 +3,11 @@
 import asyncio
 import copy
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.constants import NANOS_PER_SECOND
@@ -17,6 +19,7 @@ from aiperf.common.enums import (
     CreditPhase,
     GPUTelemetryMode,
     MessageType,
+    MetricFlags,
     ResultsProcessorType,
     ServiceType,
 )
@@ -25,10 +28,12 @@ from aiperf.common.exceptions import FactoryCreationError, PostProcessorDisabled
 from aiperf.common.factories import ResultsProcessorFactory, ServiceFactory
 from aiperf.common.hooks import background_task, on_command, on_message, on_pull_message
 from aiperf.common.messages import (
+    AdaptiveWindowMetricCommand,
     AllRecordsReceivedMessage,
     CreditPhaseCompleteMessage,
     CreditPhaseStartMessage,
     MetricRecordsMessage,
+    OutputTokenStatsCommand,
     ProcessRecordsCommand,
     ProcessRecordsResultMessage,
     ProcessTelemetryResultMessage,
@@ -36,6 +41,7 @@ from aiperf.common.messages import (
     RealtimeMetricsMessage,
     RealtimeTelemetryMetricsMessage,
     RecordsProcessingStatsMessage,
+    SearchProbeResultCommand,
     StartRealtimeTelemetryCommand,
     TelemetryRecordsMessage,
 )
@@ -44,11 +50,16 @@ from aiperf.common.messages.credit_messages import CreditPhaseSendingCompleteMes
 from aiperf.common.messages.inference_messages import MetricRecordsData
 from aiperf.common.mixins import PullClientMixin
 from aiperf.common.models import (
+    AdaptiveConcurrencyResults,
+    AdaptiveConcurrencySample,
     ErrorDetails,
     ErrorDetailsCount,
+    OutputTokenStats,
     ProcessingStats,
     ProcessRecordsResult,
     ProfileResults,
+    SearchProbeResult,
+    ThroughputSearchResults,
 )
 from aiperf.common.models.record_models import MetricResult
 from aiperf.common.models.telemetry_models import (
@@ -62,6 +73,13 @@ from aiperf.common.protocols import (
     ServiceProtocol,
     TelemetryResultsProcessorProtocol,
 )
+from aiperf.metrics.metric_registry import MetricRegistry
+from aiperf.metrics.types.output_sequence_length_metric import (
+    OutputSequenceLengthMetric,
+)
+from aiperf.post_processors.stage_metric_results_processor import (
+    StageMetricResultsProcessor,
+)
 from aiperf.records.phase_completion import PhaseCompletionChecker
 
 
@@ -139,6 +157,19 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         self._metric_results_processors: list[ResultsProcessorProtocol] = []
         self._telemetry_results_processors: list[TelemetryResultsProcessorProtocol] = []
         self._telemetry_accumulator: TelemetryResultsProcessorProtocol | None = None
+        self._stage_results_processor: StageMetricResultsProcessor | None = None
+
+        # The number of records received for each stage, which the throughput search waits on for each probe
+        self._stage_record_counts: dict[int, int] = defaultdict(int)
+        self._stage_records_condition = asyncio.Condition()
+        self._search_probe_results: list[SearchProbeResult] = []
+
+        # The (start_ns, end_ns, value) of the adaptive metric of the most recent requests, in the order they completed
+        self._adaptive_window: deque[tuple[int, int, float]] = deque()
+        self._adaptive_samples: list[AdaptiveConcurrencySample] = []
+
+        # The output tokens of the requests so far, which the token rate strategy uses to estimate the output tokens
+        self._output_token_stats = OutputTokenStats()
 
         for results_processor_type in ResultsProcessorFactory.get_all_class_types():
             try:
@@ -159,6 +190,10 @@ class RecordsManager(PullClientMixin, BaseComponentService):
                 else:
                     self._metric_results_processors.append(results_processor)
 
+                    # Store the per-stage processor separately to route its results
+                    if results_processor_type == ResultsProcessorType.STAGE:
+                        self._stage_results_processor = results_processor  # type: ignore[assignment]
+
                 self.debug(
                     f"Created results processor: {results_processor_type}: {results_processor.__class__.__name__}"
                 )
@@ -218,6 +253,28 @@ class RecordsManager(PullClientMixin, BaseComponentService):
                         self.error_summary.get(record_data.error, 0) + 1
                     )
 
+        if (
+            self.user_config.loadgen.adaptive_target is not None
+            and record_data.valid
+            and should_include_request
+        ):
+            self._add_to_adaptive_window(record_data)
+
+        if (
+            self.user_config.loadgen.token_rate_feedback
+            and record_data.valid
+            and should_include_request
+        ):
+            self._add_to_output_token_stats(record_data)
+
+        if (
+            self.user_config.loadgen.search_mode is not None
+            and record_data.metadata.stage_index is not None
+        ):
+            async with self._stage_records_condition:
+                self._stage_record_counts[record_data.metadata.stage_index] += 1
+                self._stage_records_condition.notify_all()
+
         await self._check_if_all_records_received()
 
     @on_pull_message(MessageType.TELEMETRY_RECORDS)
@@ -427,6 +484,186 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         self.debug(lambda: f"Received process records command: {message}")
         return await self._process_results(cancelled=message.cancelled)
 
+    @on_command(CommandType.SEARCH_PROBE_RESULT)
+    async def _on_search_probe_result_command(
+        self, message: SearchProbeResultCommand
+    ) -> SearchProbeResult:
+        """Handle the search probe result command by waiting for the records of the probe, and then computing
+        the SLO attainment of the probe from its metric results."""
+        self.debug(lambda: f"Received search probe result command: {message}")
+        if self._stage_results_processor is None:
+            raise self._service_error(
+                "Search probe results require the stage metric results processor"
+            )
+
+        async with self._stage_records_condition:
+            try:
+                await asyncio.wait_for(
+                    self._stage_records_condition.wait_for(
+                        lambda: self._stage_record_counts[message.stage_index]
+                        >= message.expected_records
+                    ),
+                    timeout=Environment.RECORD.SEARCH_PROBE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                self.warning(
+                    f"Timed out waiting for the records of search probe {message.stage_index}, received "
+                    f"{self._stage_record_counts[message.stage_index]} of {message.expected_records}"
+                )
+
+        metric_results = await self._stage_results_processor.summarize_stage(
+            message.stage_index
+        )
+        probe_result = self._create_search_probe_result(message, metric_results)
+        self._search_probe_results.append(probe_result)
+        return probe_result
+
+    def _create_search_probe_result(
+        self, message: SearchProbeResultCommand, metric_results: list[MetricResult]
+    ) -> SearchProbeResult:
+        """Create the result of a search probe from its metric results.
+
+        The SLO attainment is the percentage of the requests of the probe that met all of the goodput SLOs,
+        where failed requests count as not meeting them.
+        """
+        values = {result.tag: result.avg for result in metric_results}
+        request_count = int(values.get("request_count") or 0)
+        error_request_count = int(values.get("error_request_count") or 0)
+        good_request_count = int(values.get("good_request_count") or 0)
+        total_requests = request_count + error_request_count
+        slo_attainment = (
+            100.0 * good_request_count / total_requests if total_requests else 0.0
+        )
+        slo_attainment_target = self.user_config.loadgen.search_slo_attainment
+        return SearchProbeResult(
+            stage_index=message.stage_index,
+            load=message.load,
+            concurrency=message.concurrency,
+            request_rate=message.request_rate,
+            request_count=request_count,
+            error_request_count=error_request_count,
+            good_request_count=good_request_count,
+            slo_attainment=slo_attainment,
+            request_throughput=values.get("request_throughput"),
+            passed=total_requests > 0 and slo_attainment >= slo_attainment_target,
+        )
+
+    def _create_search_results(self) -> ThroughputSearchResults | None:
+        """Create the results of the throughput search from the results of its probes, if a search was run."""
+        if self.user_config.loadgen.search_mode is None:
+            return None
+
+        probes = sorted(self._search_probe_results, key=lambda probe: probe.load)
+        passed_probes = [probe for probe in probes if probe.passed]
+        search_results = ThroughputSearchResults(
+            search_mode=self.user_config.loadgen.search_mode,
+            slo_attainment_target=self.user_config.loadgen.search_slo_attainment,
+            probes=probes,
+            knee=passed_probes[-1] if passed_probes else None,
+        )
+        if search_results.knee is None:
+            self.warning(
+                "Throughput search did not find a load that meets the goodput SLOs"
+            )
+        else:
+            self.notice(
+                f"Throughput search found a maximum {search_results.search_mode} of "
+                f"{search_results.knee.load:g} that meets the goodput SLOs, with a request throughput of "
+                f"{search_results.knee.request_throughput or 0:.2f} requests/sec"
+            )
+        return search_results
+
+    def _add_to_adaptive_window(self, record_data: MetricRecordsData) -> None:
+        """Add the value of the adaptive metric of a request to the sliding window, if the request has one."""
+        value = record_data.metrics.get(self.user_config.loadgen.adaptive_metric)
+        if isinstance(value, int | float):
+            self._adaptive_window.append(
+                (
+                    record_data.metadata.request_start_ns,
+                    record_data.metadata.request_end_ns,
+                    value,
+                )
+            )
+
+    @on_command(CommandType.ADAPTIVE_WINDOW_METRIC)
+    async def _on_adaptive_window_metric_command(
+        self, message: AdaptiveWindowMetricCommand
+    ) -> AdaptiveConcurrencySample:
+        """Handle the adaptive window metric command by sampling the metric over the sliding window, and
+        recording the sample in the concurrency trajectory."""
+        self.debug(lambda: f"Received adaptive window metric command: {message}")
+        sample = self._sample_adaptive_window(message.concurrency, message.since_ns)
+        self._adaptive_samples.append(sample)
+        return sample
+
+    def _sample_adaptive_window(
+        self, concurrency: int, since_ns: int
+    ) -> AdaptiveConcurrencySample:
+        """Compute the percentile of the adaptive metric over the requests that completed within the window, and
+        started after the last change of the concurrency, in the display unit of the metric."""
+        loadgen = self.user_config.loadgen
+        now_ns = time.time_ns()
+        window_start_ns = now_ns - int(loadgen.adaptive_window * NANOS_PER_SECOND)
+        # Drop the requests that completed before the window. Requests can complete slightly out of order,
+        # so the remaining values are filtered by their end time as well.
+        while self._adaptive_window and self._adaptive_window[0][1] < window_start_ns:
+            self._adaptive_window.popleft()
+        values = [
+            value
+            for start_ns, end_ns, value in self._adaptive_window
+            if start_ns >= since_ns and end_ns >= window_start_ns
+        ]
+
+        sample = AdaptiveConcurrencySample(
+            timestamp_ns=now_ns, concurrency=concurrency, request_count=len(values)
+        )
+        if len(values) < Environment.RECORD.ADAPTIVE_MIN_SAMPLES:
+            return sample
+
+        metric_cls = MetricRegistry.get_class(loadgen.adaptive_metric)
+        metric_value = float(np.percentile(values, loadgen.adaptive_percentile))
+        display_unit = metric_cls.display_unit
+        if display_unit is not None and display_unit != metric_cls.unit:
+            metric_value = metric_cls.unit.convert_to(display_unit, metric_value)
+        target = float(loadgen.adaptive_target)  # type: ignore[arg-type]
+        sample.metric_value = metric_value
+        sample.target_met = (
+            metric_value >= target
+            if metric_cls.has_flags(MetricFlags.LARGER_IS_BETTER)
+            else metric_value <= target
+        )
+        return sample
+
+    def _create_adaptive_results(self) -> AdaptiveConcurrencyResults | None:
+        """Create the concurrency trajectory of the adaptive concurrency controller, if it was used."""
+        loadgen = self.user_config.loadgen
+        if loadgen.adaptive_target is None:
+            return None
+
+        metric_cls = MetricRegistry.get_class(loadgen.adaptive_metric)
+        return AdaptiveConcurrencyResults(
+            metric_tag=loadgen.adaptive_metric,
+            percentile=loadgen.adaptive_percentile,
+            target=loadgen.adaptive_target,
+            unit=str(metric_cls.display_unit or metric_cls.unit),
+            samples=self._adaptive_samples,
+        )
+
+    def _add_to_output_token_stats(self, record_data: MetricRecordsData) -> None:
+        """Add the output sequence length of a request to the output token stats, if the request has one."""
+        output_tokens = record_data.metrics.get(OutputSequenceLengthMetric.tag)
+        if isinstance(output_tokens, int | float):
+            self._output_token_stats.request_count += 1
+            self._output_token_stats.output_tokens += int(output_tokens)
+
+    @on_command(CommandType.OUTPUT_TOKEN_STATS)
+    async def _on_output_token_stats_command(
+        self, message: OutputTokenStatsCommand
+    ) -> OutputTokenStats:
+        """Handle the output token stats command by returning a copy of the output token stats so far."""
+        self.debug(lambda: f"Received output token stats command: {message}")
+        return self._output_token_stats.model_copy()
+
     @on_command(CommandType.PROFILE_CANCEL)
     async def _on_profile_cancel_command(
         self, message: ProfileCancelCommand
@@ -592,11 +829,17 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         )
 
         records_results, timeslice_metric_results, error_results = [], {}, []
-        for result in results:
+        stage_metric_results = {}
+        for results_processor, result in zip(
+            self._metric_results_processors, results, strict=True
+        ):
             if isinstance(result, list):
                 records_results.extend(result)
             elif isinstance(result, dict):
-                timeslice_metric_results = result
+                if results_processor is self._stage_results_processor:
+                    stage_metric_results = result
+                else:
+                    timeslice_metric_results = result
             elif isinstance(result, ErrorDetails):
                 error_results.append(result)
             elif isinstance(result, BaseException):
@@ -606,6 +849,9 @@ class RecordsManager(PullClientMixin, BaseComponentService):
             results=ProfileResults(
                 records=records_results,
                 timeslice_metric_results=timeslice_metric_results,
+                stage_metric_results=stage_metric_results,
+                search_results=self._create_search_results(),
+                adaptive_results=self._create_adaptive_results(),
                 completed=len(records_results),
                 start_ns=self.start_time_ns or time.time_ns(),
                 end_ns=self.end_time_ns or time.time_ns(),
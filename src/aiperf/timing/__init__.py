@@ -8,6 +8,9 @@ __ignore__ = ["main"]
 ## ⚠️        This file is auto-generated by mkinit                 ⚠️ ##
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
+from aiperf.timing.adaptive_concurrency_strategy import (
+    AdaptiveConcurrencyStrategy,
+)
 from aiperf.timing.config import (
     TimingManagerConfig,
 )
@@ -20,6 +23,10 @@ from aiperf.timing.credit_manager import (
     CreditPhaseMessagesMixin,
     CreditPhaseMessagesRequirements,
 )
+from aiperf.timing.credit_scheduler import (
+    AsyncioCreditScheduler,
+    HybridSpinCreditScheduler,
+)
 from aiperf.timing.fixed_schedule_strategy import (
     FixedScheduleStrategy,
 )
@@ -27,16 +34,31 @@ from aiperf.timing.request_cancellation_strategy import (
     RequestCancellationStrategy,
 )
 from aiperf.timing.request_rate_strategy import (
+    BaseTimeVaryingRateGenerator,
     ConcurrencyBurstRateGenerator,
     ConstantRateGenerator,
+    GammaRateGenerator,
     PoissonRateGenerator,
+    RampRateGenerator,
     RequestRateStrategy,
+    SinusoidalRateGenerator,
+    StepRateGenerator,
+)
+from aiperf.timing.throughput_search_strategy import (
+    ThroughputSearchStrategy,
 )
 from aiperf.timing.timing_manager import (
     TimingManager,
 )
+from aiperf.timing.token_rate_strategy import (
+    TokenBucket,
+    TokenRateStrategy,
+)
 
 __all__ = [
+    "AdaptiveConcurrencyStrategy",
+    "AsyncioCreditScheduler",
+    "BaseTimeVaryingRateGenerator",
     "ConcurrencyBurstRateGenerator",
     "ConstantRateGenerator",
     "CreditIssuingStrategy",
@@ -45,9 +67,17 @@ __all__ = [
     "CreditPhaseMessagesMixin",
     "CreditPhaseMessagesRequirements",
     "FixedScheduleStrategy",
+    "GammaRateGenerator",
+    "HybridSpinCreditScheduler",
     "PoissonRateGenerator",
+    "RampRateGenerator",
     "RequestCancellationStrategy",
     "RequestRateStrategy",
+    "SinusoidalRateGenerator",
+    "StepRateGenerator",
+    "ThroughputSearchStrategy",
     "TimingManager",
     "TimingManagerConfig",
+    "TokenBucket",
+    "TokenRateStrategy",
 ]
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+
+from aiperf.common.enums import CreditPhase, RequestRateMode, TimingMode
+from aiperf.common.models import CreditPhaseStats
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.credit_issuing_strategy import (
+    CreditIssuingStrategyFactory,
+    CreditManagerProtocol,
+)
+from aiperf.timing.request_rate_strategy import RequestRateStrategy
+
+
+@CreditIssuingStrategyFactory.register(TimingMode.ADAPTIVE_CONCURRENCY)
+class AdaptiveConcurrencyStrategy(RequestRateStrategy):
+    """
+    Strategy for adjusting the concurrency during the profiling phase, to hold a latency percentile at a target.
+
+    Credits are sent as soon as possible up to the current concurrency, as in the concurrency burst mode. Alongside,
+    a control loop asks the RecordsManager every interval for the percentile of the adaptive metric over a sliding
+    window of the most recent requests, and adjusts the concurrency with additive increase and multiplicative
+    decrease (AIMD): the concurrency is increased by a fixed step while the target is met, and multiplied by a factor
+    below 1 once it is exceeded. The concurrency converges to, and then oscillates just below, the highest concurrency
+    at which the target is met, which is the saturation point of the server.
+    """
+
+    def __init__(
+        self, config: TimingManagerConfig, credit_manager: CreditManagerProtocol
+    ):
+        super().__init__(config=config, credit_manager=credit_manager)
+        # Requests started before the last change of the concurrency are excluded from the window
+        self._last_adjustment_ns = time.time_ns()
+
+    def _initial_load_config(self) -> TimingManagerConfig:
+        """Start at the initial concurrency, which is also used by the warmup phase, sending credits as soon as possible."""
+        return self.config.model_copy(
+            update={
+                "concurrency": self.config.concurrency
+                or self.config.adaptive_min_concurrency,
+                "request_rate": None,
+                "request_rate_mode": RequestRateMode.CONCURRENCY_BURST,
+            }
+        )
+
+    async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
+        """Execute the phase, adjusting the concurrency in the background during the profiling phase."""
+        if phase_stats.type != CreditPhase.PROFILING:
+            await super()._execute_single_phase(phase_stats)
+            return
+
+        self._last_adjustment_ns = time.time_ns()
+        control_task = self.execute_async(self._control_loop(phase_stats))
+        try:
+            await super()._execute_single_phase(phase_stats)
+        finally:
+            control_task.cancel()
+
+    async def _control_loop(self, phase_stats: CreditPhaseStats) -> None:
+        """Adjust the concurrency every interval, for as long as the profiling phase is sending credits."""
+        self.info(
+            f"Starting adaptive concurrency control at concurrency={self._concurrency}, "
+            f"targeting {self.config.adaptive_metric}={self.config.adaptive_target:g}"
+        )
+        while phase_stats.should_send():
+            await asyncio.sleep(self.config.adaptive_interval)
+            try:
+                await self._adjust_concurrency()
+            except Exception as e:
+                self.error(f"Error adjusting the adaptive concurrency: {e!r}")
+
+    async def _adjust_concurrency(self) -> None:
+        """Sample the metric over the sliding window, and adjust the concurrency based on whether it met the target."""
+        sample = await self.credit_manager.get_adaptive_window_sample(
+            concurrency=self._concurrency,  # type: ignore[arg-type]
+            since_ns=self._last_adjustment_ns,
+        )
+        if sample is None or sample.target_met is None:
+            # Not enough requests have completed at the current concurrency to make a decision
+            return
+
+        concurrency = self._next_concurrency(sample.target_met)
+        if concurrency == self._concurrency:
+            return
+        self.info(
+            f"Adjusting concurrency from {self._concurrency} to {concurrency}: "
+            f"{self.config.adaptive_metric}={sample.metric_value:g} over {sample.request_count} requests "
+            f"{'met' if sample.target_met else 'exceeded'} the target of {self.config.adaptive_target:g}"
+        )
+        await self._resize_concurrency(concurrency)
+        self._last_adjustment_ns = time.time_ns()
+
+    def _next_concurrency(self, target_met: bool) -> int:
+        """Get the next concurrency using additive increase and multiplicative decrease, within the bounds."""
+        concurrency: int = self._concurrency  # type: ignore[assignment]
+        if target_met:
+            return min(
+                concurrency + self.config.adaptive_increase,
+                self.config.adaptive_max_concurrency or concurrency,
+            )
+        # Always decrease by at least 1, so that small concurrencies can still back off
+        decreased = min(
+            int(concurrency * self.config.adaptive_decrease), concurrency - 1
+        )
+        return max(decreased, self.config.adaptive_min_concurrency)
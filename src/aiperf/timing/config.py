@@ -5,9 +5,17 @@ from aiperf.common.config import (
     ConversationDefaults,
     InputDefaults,
     LoadGeneratorDefaults,
+    LoadStageConfig,
     UserConfig,
 )
-from aiperf.common.enums import RequestRateMode, TimingMode
+from aiperf.common.enums import (
+    CreditSchedulerType,
+    DatasetSamplingStrategy,
+    RequestRateMode,
+    ThroughputSearchMode,
+    TimingMode,
+    TokenRateType,
+)
 from aiperf.common.models import AIPerfBaseModel
 
 
@@ -18,6 +26,43 @@ class TimingManagerConfig(AIPerfBaseModel):
     concurrency: int | None = LoadGeneratorDefaults.CONCURRENCY
     request_rate: float | None = LoadGeneratorDefaults.REQUEST_RATE
     request_rate_mode: RequestRateMode = LoadGeneratorDefaults.REQUEST_RATE_MODE
+    request_rate_end: float | None = LoadGeneratorDefaults.REQUEST_RATE_END
+    request_rate_ramp_duration: float | None = (
+        LoadGeneratorDefaults.REQUEST_RATE_RAMP_DURATION
+    )
+    request_rate_step: float | None = LoadGeneratorDefaults.REQUEST_RATE_STEP
+    request_rate_step_duration: float | None = (
+        LoadGeneratorDefaults.REQUEST_RATE_STEP_DURATION
+    )
+    request_rate_amplitude: float | None = LoadGeneratorDefaults.REQUEST_RATE_AMPLITUDE
+    request_rate_period: float | None = LoadGeneratorDefaults.REQUEST_RATE_PERIOD
+    request_rate_cv: float | None = LoadGeneratorDefaults.REQUEST_RATE_CV
+    load_stages: list[LoadStageConfig] | None = LoadGeneratorDefaults.LOAD_STAGES
+    search_mode: ThroughputSearchMode | None = LoadGeneratorDefaults.SEARCH_MODE
+    search_min: float = LoadGeneratorDefaults.SEARCH_MIN
+    search_max: float | None = LoadGeneratorDefaults.SEARCH_MAX
+    search_probe_duration: float = LoadGeneratorDefaults.SEARCH_PROBE_DURATION
+    search_max_probes: int = LoadGeneratorDefaults.SEARCH_MAX_PROBES
+    search_slo_attainment: float = LoadGeneratorDefaults.SEARCH_SLO_ATTAINMENT
+    adaptive_target: float | None = LoadGeneratorDefaults.ADAPTIVE_TARGET
+    adaptive_metric: str = LoadGeneratorDefaults.ADAPTIVE_METRIC
+    adaptive_interval: float = LoadGeneratorDefaults.ADAPTIVE_INTERVAL
+    adaptive_min_concurrency: int = LoadGeneratorDefaults.ADAPTIVE_MIN_CONCURRENCY
+    adaptive_max_concurrency: int | None = (
+        LoadGeneratorDefaults.ADAPTIVE_MAX_CONCURRENCY
+    )
+    adaptive_increase: int = LoadGeneratorDefaults.ADAPTIVE_INCREASE
+    adaptive_decrease: float = LoadGeneratorDefaults.ADAPTIVE_DECREASE
+    tokens_per_minute: float | None = LoadGeneratorDefaults.TOKENS_PER_MINUTE
+    token_rate_type: TokenRateType = LoadGeneratorDefaults.TOKEN_RATE_TYPE
+    token_rate_burst: float | None = LoadGeneratorDefaults.TOKEN_RATE_BURST
+    token_rate_feedback: bool = LoadGeneratorDefaults.TOKEN_RATE_FEEDBACK
+    credit_scheduler: CreditSchedulerType | None = (
+        LoadGeneratorDefaults.CREDIT_SCHEDULER
+    )
+    dataset_sampling_strategy: DatasetSamplingStrategy = (
+        InputDefaults.DATASET_SAMPLING_STRATEGY
+    )
     request_count: int = LoadGeneratorDefaults.REQUEST_COUNT
     warmup_request_count: int = LoadGeneratorDefaults.WARMUP_REQUEST_COUNT
     benchmark_duration: float | None = LoadGeneratorDefaults.BENCHMARK_DURATION
@@ -39,6 +84,33 @@ class TimingManagerConfig(AIPerfBaseModel):
             concurrency=user_config.loadgen.concurrency,
             request_rate=user_config.loadgen.request_rate,
             request_rate_mode=user_config.loadgen.request_rate_mode,
+            request_rate_end=user_config.loadgen.request_rate_end,
+            request_rate_ramp_duration=user_config.loadgen.request_rate_ramp_duration,
+            request_rate_step=user_config.loadgen.request_rate_step,
+            request_rate_step_duration=user_config.loadgen.request_rate_step_duration,
+            request_rate_amplitude=user_config.loadgen.request_rate_amplitude,
+            request_rate_period=user_config.loadgen.request_rate_period,
+            request_rate_cv=user_config.loadgen.request_rate_cv,
+            load_stages=user_config.loadgen.load_stages,
+            search_mode=user_config.loadgen.search_mode,
+            search_min=user_config.loadgen.search_min,
+            search_max=user_config.loadgen.search_max,
+            search_probe_duration=user_config.loadgen.search_probe_duration,
+            search_max_probes=user_config.loadgen.search_max_probes,
+            search_slo_attainment=user_config.loadgen.search_slo_attainment,
+            adaptive_target=user_config.loadgen.adaptive_target,
+            adaptive_metric=user_config.loadgen.adaptive_metric,
+            adaptive_interval=user_config.loadgen.adaptive_interval,
+            adaptive_min_concurrency=user_config.loadgen.adaptive_min_concurrency,
+            adaptive_max_concurrency=user_config.loadgen.adaptive_max_concurrency,
+            adaptive_increase=user_config.loadgen.adaptive_increase,
+            adaptive_decrease=user_config.loadgen.adaptive_decrease,
+            tokens_per_minute=user_config.loadgen.tokens_per_minute,
+            token_rate_type=user_config.loadgen.token_rate_type,
+            token_rate_burst=user_config.loadgen.token_rate_burst,
+            token_rate_feedback=user_config.loadgen.token_rate_feedback,
+            credit_scheduler=user_config.loadgen.credit_scheduler,
+            dataset_sampling_strategy=user_config.input.dataset_sampling_strategy,
             request_count=user_config.get_effective_request_count(),
             warmup_request_count=user_config.loadgen.warmup_request_count,
             benchmark_duration=user_config.loadgen.benchmark_duration,
@@ -9,10 +9,11 @@ from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase, TimingMode
 from aiperf.common.environment import Environment
 from aiperf.common.exceptions import ConfigurationError
-from aiperf.common.factories import AIPerfFactory
-from aiperf.common.messages import CreditReturnMessage
+from aiperf.common.factories import AIPerfFactory, CreditSchedulerFactory
+from aiperf.common.messages import CreditDropMessage, CreditReturnMessage
 from aiperf.common.mixins import TaskManagerMixin
-from aiperf.common.models import CreditPhaseConfig, CreditPhaseStats
+from aiperf.common.models import CreditPhaseConfig, CreditPhaseStats, NextTurnCredit
+from aiperf.common.protocols import CreditSchedulerProtocol
 from aiperf.timing.config import TimingManagerConfig
 from aiperf.timing.credit_manager import CreditManagerProtocol
 from aiperf.timing.request_cancellation_strategy import RequestCancellationStrategy
@@ -32,6 +33,22 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
 
         self.cancellation_strategy = RequestCancellationStrategy(config)
 
+        # Used by the subclasses to wait for the scheduled time of each credit
+        self.credit_scheduler: CreditSchedulerProtocol = (
+            CreditSchedulerFactory.create_instance(
+                config.credit_scheduler or Environment.TIMING.SCHEDULER
+            )
+        )
+        # How far ahead of their scheduled time credits are issued to the workers
+        self.credit_lead_ns = int(
+            Environment.TIMING.CREDIT_LEAD_TIME * NANOS_PER_SECOND
+        )
+        # Subclasses that support it send credits in batches when the batch size is greater than 1
+        self.credit_drop_batch_size = Environment.TIMING.CREDIT_DROP_BATCH_SIZE
+        self.credit_drop_batch_window_ns = int(
+            Environment.TIMING.CREDIT_DROP_BATCH_WINDOW * NANOS_PER_SECOND
+        )
+
         # This event is set when all phases are complete
         self.all_phases_complete_event = asyncio.Event()
 
@@ -68,7 +85,28 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
 
     def _setup_profiling_phase_config(self) -> None:
         """Setup the profiling phase. This can be overridden in subclasses to modify the profiling phase."""
-        if self.config.benchmark_duration is not None:
+        if self.config.load_stages:
+            # The load stages run back-to-back within a single profiling phase. The
+            # stages are either all count-based or all duration-based.
+            stages = self.config.load_stages
+            self.debug(f"Setting up profiling phase for {len(stages)} load stages")
+            if stages[0].duration is not None:
+                self.ordered_phase_configs.append(
+                    CreditPhaseConfig(
+                        type=CreditPhase.PROFILING,
+                        expected_duration_sec=sum(stage.duration for stage in stages),
+                    )
+                )
+            else:
+                self.ordered_phase_configs.append(
+                    CreditPhaseConfig(
+                        type=CreditPhase.PROFILING,
+                        total_expected_requests=sum(
+                            stage.request_count for stage in stages
+                        ),
+                    )
+                )
+        elif self.config.benchmark_duration is not None:
             self.debug(
                 f"Setting up duration-based profiling phase: expected_duration_sec={self.config.benchmark_duration}"
             )
@@ -279,6 +317,34 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
 
             self.phase_stats.pop(phase_stats.type)
 
+    def _target_credit_drop_ns(
+        self, scheduled_perf_ns: int, ahead_of_time: bool = False
+    ) -> int | None:
+        """Get the wall clock time that the worker should send a credit at, from its scheduled perf_counter_ns time.
+
+        Returns None if credits are not issued ahead of time, meaning that the credit should be sent as soon as possible.
+        Credits sent ahead of time in a batch always have a target, even if the lead time is disabled.
+        """
+        if not self.credit_lead_ns and not ahead_of_time:
+            return None
+        return time.time_ns() + scheduled_perf_ns - time.perf_counter_ns()
+
+    def _create_credit_drop(
+        self, phase_stats: CreditPhaseStats, **kwargs
+    ) -> CreditDropMessage:
+        """Create the credit drop of the next credit of the phase for a batch, and count it as sent."""
+        credit = CreditDropMessage(
+            service_id=self.credit_manager.service_id,
+            phase=phase_stats.type,
+            credit_num=phase_stats.sent,
+            should_cancel=self.cancellation_strategy.should_cancel_request(),
+            cancel_after_ns=self.cancellation_strategy.get_cancellation_delay_ns(),
+            **kwargs,
+        )
+        # NOTE: This is incremented here, as the credit_num is used up above, and needs the current value.
+        phase_stats.sent += 1
+        return credit
+
     @abstractmethod
     async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
         """Execute a single phase. Should not return until the phase sending is complete. Must be implemented in subclasses."""
@@ -287,6 +353,7 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
     async def stop(self) -> None:
         """Stop the credit issuing strategy."""
         await self.cancel_all_tasks()
+        self.credit_scheduler.close()
 
     async def _on_credit_return(self, message: CreditReturnMessage) -> None:
         """This is called by the credit manager when a credit is returned. It can be
@@ -298,8 +365,18 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
             return
 
         phase_stats = self.phase_stats[message.phase]
-        phase_stats.completed += 1
         phase_stats.requests_sent += message.requests_sent
+        if message.next_turn is not None and self._should_send_next_turn(phase_stats):
+            # The conversation continues with its next turn, so its credit is still in flight
+            self.execute_async(
+                self._send_next_turn(phase_stats, message.next_turn, message.service_id)
+            )
+            return
+        await self._complete_credit(phase_stats)
+
+    async def _complete_credit(self, phase_stats: CreditPhaseStats) -> None:
+        """Count a credit of a phase as completed, and complete the phase once all of its credits have completed."""
+        phase_stats.completed += 1
 
         # Check if this phase is complete
         is_phase_complete = False
@@ -315,26 +392,69 @@ class CreditIssuingStrategy(TaskManagerMixin, ABC):
                 is_phase_complete = phase_stats.in_flight == 0
 
         if is_phase_complete:
-            phase_stats.end_ns = time.time_ns()
-            self.notice(f"Phase completed: {phase_stats}")
+            await self._complete_phase(phase_stats)
 
-            self.execute_async(
-                self.credit_manager.publish_phase_complete(
-                    message.phase,
-                    phase_stats.completed,
-                    phase_stats.end_ns,
-                    phase_stats.requests_sent,
-                )
+    def _should_send_next_turn(self, phase_stats: CreditPhaseStats) -> bool:
+        """Whether the conversations of a phase are continued with their next turn. The conversations of a
+        duration-based phase are not continued once the phase has stopped sending new credits."""
+        return phase_stats.type in self.phase_stats and (
+            not phase_stats.is_time_based or phase_stats.should_send()
+        )
+
+    async def _send_next_turn(
+        self, phase_stats: CreditPhaseStats, next_turn: NextTurnCredit, worker_id: str
+    ) -> None:
+        """Send the next turn of a conversation as its own credit, once its turn delay has elapsed, to the worker
+        that keeps the history of its session."""
+        if next_turn.delay_ns > 0:
+            await asyncio.sleep(next_turn.delay_ns / NANOS_PER_SECOND)
+        if not await self._acquire_next_turn_slot(phase_stats):
+            return
+        await self.credit_manager.drop_turn_credit(
+            phase_stats.type,
+            next_turn,
+            worker_id,
+            should_cancel=self.cancellation_strategy.should_cancel_request(),
+            cancel_after_ns=self.cancellation_strategy.get_cancellation_delay_ns(),
+        )
+
+    async def _acquire_next_turn_slot(self, phase_stats: CreditPhaseStats) -> bool:
+        """Check whether the next turn of a conversation is still sent after its turn delay. This can be overridden
+        in subclasses to wait for a free concurrency slot first.
+
+        Returns:
+            True if the next turn should be sent. Otherwise, the conversation ends, and its credit is completed.
+        """
+        if phase_stats.type not in self.phase_stats:
+            # The phase was force-completed during the turn delay, so the rest of the conversation is not sent
+            return False
+        if not self._should_send_next_turn(phase_stats):
+            await self._complete_credit(phase_stats)
+            return False
+        return True
+
+    async def _complete_phase(self, phase_stats: CreditPhaseStats) -> None:
+        """Complete a phase once all of its credits have been returned."""
+        phase_stats.end_ns = time.time_ns()
+        self.notice(f"Phase completed: {phase_stats}")
+
+        self.execute_async(
+            self.credit_manager.publish_phase_complete(
+                phase_stats.type,
+                phase_stats.completed,
+                phase_stats.end_ns,
+                phase_stats.requests_sent,
             )
+        )
 
-            self.phase_complete_event.set()
+        self.phase_complete_event.set()
 
-            if phase_stats.type == CreditPhase.PROFILING:
-                await self.credit_manager.publish_credits_complete()
-                self.all_phases_complete_event.set()
+        if phase_stats.type == CreditPhase.PROFILING:
+            await self.credit_manager.publish_credits_complete()
+            self.all_phases_complete_event.set()
 
-            # We don't need to keep track of the phase stats anymore
-            self.phase_stats.pop(message.phase)
+        # We don't need to keep track of the phase stats anymore
+        self.phase_stats.pop(phase_stats.type)
 
     async def _progress_report_loop(self) -> None:
         """Report the progress at a fixed interval."""
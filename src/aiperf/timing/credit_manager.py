@@ -5,13 +5,21 @@ from typing import Protocol, runtime_checkable
 
 from aiperf.common.enums import CreditPhase
 from aiperf.common.messages import (
+    CreditDropMessage,
     CreditPhaseCompleteMessage,
     CreditPhaseProgressMessage,
     CreditPhaseSendingCompleteMessage,
     CreditPhaseStartMessage,
     CreditsCompleteMessage,
+    DatasetTimingResponse,
 )
 from aiperf.common.mixins import MessageBusClientMixin
+from aiperf.common.models import (
+    AdaptiveConcurrencySample,
+    NextTurnCredit,
+    OutputTokenStats,
+    SearchProbeResult,
+)
 from aiperf.common.protocols import AIPerfLoggerProtocol, PubClientProtocol
 
 
@@ -23,6 +31,8 @@ class CreditManagerProtocol(PubClientProtocol, Protocol):
     in a decoupled way.
     """
 
+    service_id: str
+
     async def drop_credit(
         self,
         credit_phase: CreditPhase,
@@ -32,8 +42,22 @@ class CreditManagerProtocol(PubClientProtocol, Protocol):
         *,
         should_cancel: bool = False,
         cancel_after_ns: int = 0,
+        schedule_lag_ns: int | None = None,
+        stage_index: int | None = None,
     ) -> None: ...
 
+    async def drop_turn_credit(
+        self,
+        credit_phase: CreditPhase,
+        next_turn: NextTurnCredit,
+        worker_id: str,
+        *,
+        should_cancel: bool = False,
+        cancel_after_ns: int = 0,
+    ) -> None: ...
+
+    async def drop_credit_batch(self, credits: list[CreditDropMessage]) -> None: ...
+
     async def publish_progress(
         self, phase: CreditPhase, sent: int, completed: int
     ) -> None: ...
@@ -61,6 +85,25 @@ class CreditManagerProtocol(PubClientProtocol, Protocol):
         timeout_triggered: bool = False,
     ) -> None: ...
 
+    async def get_search_probe_result(
+        self,
+        stage_index: int,
+        load: float,
+        concurrency: int | None,
+        request_rate: float | None,
+        expected_records: int,
+    ) -> SearchProbeResult | None: ...
+
+    async def get_adaptive_window_sample(
+        self, concurrency: int, since_ns: int
+    ) -> AdaptiveConcurrencySample | None: ...
+
+    async def get_output_token_stats(self) -> OutputTokenStats | None: ...
+
+    async def get_dataset_timing_chunk(
+        self, offset: int, limit: int
+    ) -> DatasetTimingResponse: ...
+
 
 @runtime_checkable
 class CreditPhaseMessagesRequirements(AIPerfLoggerProtocol, Protocol):
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import CreditSchedulerType
+from aiperf.common.environment import Environment
+from aiperf.common.factories import CreditSchedulerFactory
+from aiperf.common.protocols import CreditSchedulerProtocol
+
+
+@implements_protocol(CreditSchedulerProtocol)
+@CreditSchedulerFactory.register(CreditSchedulerType.ASYNCIO)
+class AsyncioCreditScheduler:
+    """Waits for the scheduled time of a credit using asyncio timers on the event loop."""
+
+    async def wait_until(self, target_perf_ns: int) -> None:
+        wait_ns = target_perf_ns - time.perf_counter_ns()
+        if wait_ns > 0:
+            await asyncio.sleep(wait_ns / NANOS_PER_SECOND)
+
+    def close(self) -> None:
+        pass
+
+
+@implements_protocol(CreditSchedulerProtocol)
+@CreditSchedulerFactory.register(CreditSchedulerType.HYBRID_SPIN)
+class HybridSpinCreditScheduler:
+    """Waits for the scheduled time of a credit on a dedicated thread, using a coarse sleep followed by a spin-wait.
+
+    The thread sleeps until `spin_window` seconds before the scheduled time, and then spins on the performance
+    counter until the scheduled time is reached, before handing control back to the event loop to send the credit.
+    This avoids the granularity of the asyncio timers. The spin gives up the GIL between checks, so that the event
+    loop still runs while it spins, but it still competes with the event loop for the CPU and the GIL, which slows
+    down the processing of credit returns in the meantime, especially on hosts with few cores. Each wait is also a
+    round trip through the thread, so the time it takes the event loop to wake up is still added to the send time.
+    """
+
+    def __init__(self, spin_window: float | None = None) -> None:
+        spin_window = (
+            Environment.TIMING.SPIN_WINDOW if spin_window is None else spin_window
+        )
+        self.spin_window_ns = int(spin_window * NANOS_PER_SECOND)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="credit-scheduler"
+        )
+
+    async def wait_until(self, target_perf_ns: int) -> None:
+        if target_perf_ns <= time.perf_counter_ns():
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._sleep_then_spin, target_perf_ns
+        )
+
+    def _sleep_then_spin(self, target_perf_ns: int) -> None:
+        """Sleep until the start of the spin window, then spin until the target time. Runs on the scheduler thread."""
+        sleep_ns = target_perf_ns - self.spin_window_ns - time.perf_counter_ns()
+        if sleep_ns > 0:
+            time.sleep(sleep_ns / NANOS_PER_SECOND)
+        while time.perf_counter_ns() < target_perf_ns:
+            # Give up the GIL between checks, so the event loop thread keeps running while this thread spins
+            time.sleep(0)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,12 +1,13 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import asyncio
 import time
-from collections import defaultdict
+from collections.abc import AsyncIterator
 
-from aiperf.common.constants import MILLIS_PER_SECOND
+from aiperf.common.constants import NANOS_PER_MILLIS, NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase, TimingMode
+from aiperf.common.environment import Environment
+from aiperf.common.messages import CreditDropMessage, DatasetTimingResponse
 from aiperf.common.models import CreditPhaseConfig, CreditPhaseStats
 from aiperf.timing.config import TimingManagerConfig
 from aiperf.timing.credit_issuing_strategy import (
@@ -20,42 +21,44 @@ from aiperf.timing.credit_manager import CreditManagerProtocol
 class FixedScheduleStrategy(CreditIssuingStrategy):
     """
     Class for fixed schedule credit issuing strategy.
+
+    The schedule is received from the DatasetManager in chunks sorted by timestamp, starting with the first chunk
+    passed to the constructor. Each chunk is packed as arrays of timestamps and conversation indices, which are read
+    as they are. The next chunk is fetched in the background while the credits of the current chunk are
+    sent, so that only a sliding window of the schedule is held in memory, regardless of its length.
     """
 
     def __init__(
         self,
         config: TimingManagerConfig,
         credit_manager: CreditManagerProtocol,
-        schedule: list[tuple[int, str]],
+        schedule: DatasetTimingResponse,
     ):
         # NOTE: This all needs to be set before the super call, because the base class will call
         # _setup_profiling_phase_config() which uses it to set the total expected requests.
-        self._schedule: list[tuple[int, str]] = schedule
-        self._num_requests = len(self._schedule)
+        # The schedule is the first chunk of the full schedule, along with the total count of the full schedule.
+        self._first_chunk = schedule
+        self._num_requests = schedule.total_count
+        self._chunk_size = Environment.TIMING.FIXED_SCHEDULE_CHUNK_SIZE
         self._auto_offset_timestamps = config.auto_offset_timestamps
         self._start_offset = config.fixed_schedule_start_offset
         self._end_offset = config.fixed_schedule_end_offset
         super().__init__(config=config, credit_manager=credit_manager)
 
-    def _create_timestamp_groups(self) -> None:
+    def _setup_schedule_zero(self) -> None:
         """
-        Create a dictionary of timestamp groups, and filter the schedule to only include the requested subset.
+        Validate the schedule, and define the zero reference point of its timestamps.
         """
-        if not self._schedule or self._num_requests == 0:
+        first_timestamps, _ = self._first_chunk.timing_arrays()
+        if len(first_timestamps) == 0 or self._num_requests == 0:
             raise ValueError(
                 "No schedule loaded, unable to setup fixed schedule strategy"
             )
-        # Group the schedule by timestamp
-        self._timestamp_groups = defaultdict(list)
-        for timestamp, conversation_id in self._schedule:
-            self._timestamp_groups[timestamp].append(conversation_id)
-
-        # Sort the timestamps, so we can drop credits in order
-        self._sorted_timestamp_keys = sorted(self._timestamp_groups.keys())
 
-        # Define the zero reference point for the schedule
+        # Define the zero reference point for the schedule. The chunks are sorted, so the first timestamp of the
+        # first chunk is the earliest timestamp of the schedule.
         if self._auto_offset_timestamps:
-            self._schedule_zero_ms = self._sorted_timestamp_keys[0]
+            self._schedule_zero_ms = int(first_timestamps[0])
         elif self._start_offset is not None:
             self._schedule_zero_ms = self._start_offset
         else:
@@ -67,7 +70,7 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
 
         Overrides the base implementation to set the total expected requests based on the number of requests in the schedule.
         """
-        self._create_timestamp_groups()
+        self._setup_schedule_zero()
 
         self.ordered_phase_configs.append(
             CreditPhaseConfig(
@@ -76,31 +79,96 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
             )
         )
 
-    def _perf_counter_ms(self) -> float:
-        return time.perf_counter() * MILLIS_PER_SECOND
+    async def _iter_schedule_chunks(
+        self,
+    ) -> AsyncIterator[DatasetTimingResponse]:
+        """Yield the chunks of the schedule in order, fetching the next chunk in the background while the
+        current chunk is being sent.
+
+        Raises:
+            ValueError: If the schedule ends before the total number of requests.
+        """
+        chunk = self._first_chunk
+        offset = len(chunk.timing_arrays()[0])
+        while True:
+            next_chunk_task = (
+                self.execute_async(
+                    self.credit_manager.get_dataset_timing_chunk(
+                        offset, self._chunk_size
+                    )
+                )
+                if offset < self._num_requests
+                else None
+            )
+            yield chunk
+            if next_chunk_task is None:
+                return
+
+            chunk = await next_chunk_task
+            chunk_size = len(chunk.timing_arrays()[0])
+            if chunk_size == 0:
+                raise ValueError(
+                    f"The fixed schedule ended after {offset:,} of {self._num_requests:,} requests"
+                )
+            offset += chunk_size
 
     async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
-        # This is used as a reference point for the wait duration calculation
-        start_time_ms = self._perf_counter_ms()
+        # This is used as a reference point for the scheduled time of each timestamp. When credits are issued
+        # ahead of time, the schedule starts after the lead time, so that the first credits can be issued ahead as well.
+        start_perf_ns = time.perf_counter_ns() + self.credit_lead_ns
+        previous_timestamp: int | None = None
+        credit_drop_ns: int | None = None
+        # When credits are sent in batches, the pending batch, and the scheduled time its window ends at
+        batch: list[CreditDropMessage] = []
+        batch_end_perf_ns = 0
 
         # Drop credits in order of the schedule
-        for timestamp in self._sorted_timestamp_keys:
-            # Lookup/cache the conversation IDs now, so that way they are ready to go
-            conversation_ids = self._timestamp_groups[timestamp]
-
-            # Calculate the wait duration for this timestamp
-            # (timestamp - schedule_zero_ms) is the offset of the conversation(s) from the start of the schedule
-            # (self._perf_counter_ms() - start_time_ms) is how much time has passed since we started dropping credits
-            wait_duration_ms = (timestamp - self._schedule_zero_ms) - (
-                self._perf_counter_ms() - start_time_ms
-            )
-            wait_duration_sec = wait_duration_ms / MILLIS_PER_SECOND
+        async for chunk in self._iter_schedule_chunks():
+            timestamps, conversation_indices = chunk.timing_arrays()
+            for timestamp, conversation_index in zip(
+                timestamps.tolist(), conversation_indices.tolist(), strict=True
+            ):
+                conversation_id = chunk.conversation_ids[conversation_index]
+                if timestamp != previous_timestamp:
+                    # (timestamp - schedule_zero_ms) is the offset of the conversation(s) from the start of the
+                    # schedule. The conversations with the same timestamp are sent right after each other.
+                    scheduled_perf_ns = start_perf_ns + int(
+                        (timestamp - self._schedule_zero_ms) * NANOS_PER_MILLIS
+                    )
+                    if batch and scheduled_perf_ns > batch_end_perf_ns:
+                        await self.credit_manager.drop_credit_batch(batch)
+                        batch = []
+
+                    if batch:
+                        # Within the window of the pending batch, so the credit is sent ahead of its scheduled time
+                        credit_drop_ns = self._target_credit_drop_ns(
+                            scheduled_perf_ns, ahead_of_time=True
+                        )
+                    else:
+                        # Wait until the scheduled time for this timestamp, minus the lead time if credits are
+                        # issued ahead of time.
+                        await self.credit_scheduler.wait_until(
+                            scheduled_perf_ns - self.credit_lead_ns
+                        )
+                        credit_drop_ns = self._target_credit_drop_ns(scheduled_perf_ns)
+                        batch_end_perf_ns = (
+                            scheduled_perf_ns + self.credit_drop_batch_window_ns
+                        )
+                    previous_timestamp = timestamp
+
+                if self.credit_drop_batch_size > 1:
+                    batch.append(
+                        self._create_credit_drop(
+                            phase_stats,
+                            conversation_id=conversation_id,
+                            credit_drop_ns=credit_drop_ns,
+                        )
+                    )
+                    if len(batch) >= self.credit_drop_batch_size:
+                        await self.credit_manager.drop_credit_batch(batch)
+                        batch = []
+                    continue
 
-            if wait_duration_sec > 0:
-                await asyncio.sleep(wait_duration_sec)
-
-            # Drop credits asynchronously for all conversations at this timestamp
-            for conversation_id in conversation_ids:
                 should_cancel = self.cancellation_strategy.should_cancel_request()
                 cancel_after_ns = self.cancellation_strategy.get_cancellation_delay_ns()
 
@@ -108,15 +176,20 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
                     credit_phase=CreditPhase.PROFILING,
                     credit_num=phase_stats.sent,
                     conversation_id=conversation_id,
-                    # We already waited, so it can be sent ASAP
-                    credit_drop_ns=None,
+                    # None if we already waited, so it can be sent ASAP
+                    credit_drop_ns=credit_drop_ns,
                     should_cancel=should_cancel,
                     cancel_after_ns=cancel_after_ns,
                 )
                 # NOTE: This is incremented here, as the credit_num is used up above, and needs the current value.
                 phase_stats.sent += 1
 
-        duration_sec = (self._perf_counter_ms() - start_time_ms) / MILLIS_PER_SECOND
+            # Do not hold the pending batch while waiting for the next chunk of the schedule
+            if batch:
+                await self.credit_manager.drop_credit_batch(batch)
+                batch = []
+
+        duration_sec = (time.perf_counter_ns() - start_perf_ns) / NANOS_PER_SECOND
         self.info(
             f"Sent all {self._num_requests:,} fixed schedule requests in {duration_sec:,.2f}s. Waiting for responses..."
         )
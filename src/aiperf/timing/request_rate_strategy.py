@@ -2,11 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+
+import numpy as np
 
 from aiperf.common import random_generator as rng
+from aiperf.common.config import LoadStageConfig
+from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.decorators import implements_protocol
-from aiperf.common.enums import TimingMode
+from aiperf.common.enums import CreditPhase, TimingMode
 from aiperf.common.enums.timing_enums import RequestRateMode
+from aiperf.common.environment import Environment
 from aiperf.common.factories import RequestRateGeneratorFactory
 from aiperf.common.messages import CreditReturnMessage
 from aiperf.common.models import CreditPhaseStats
@@ -24,45 +33,208 @@ class RequestRateStrategy(CreditIssuingStrategy):
     """
     Strategy for issuing credits based on a specified request rate. Optionally, a max concurrency limit can be specified.
 
-    Supports three modes:
+    Supports the following modes:
     - CONSTANT: Issues credits at a constant rate with fixed intervals
     - POISSON: Issues credits using a Poisson process with exponentially distributed intervals
     - CONCURRENCY_BURST: Issues credits as soon as possible, up to a max concurrency limit. Only allowed when a request rate is not specified.
+    - RAMP, STEP, SINUSOIDAL: Issues credits using a Poisson process whose rate changes over the course of the phase
+    - GAMMA: Issues credits with gamma distributed intervals, to generate bursty traffic
+
+    For all modes except CONCURRENCY_BURST, credits are scheduled against an absolute timeline that starts with the phase,
+    so that the overhead of the loop and the inaccuracy of the timers do not accumulate over the phase.
     """
 
     def __init__(
         self, config: TimingManagerConfig, credit_manager: CreditManagerProtocol
     ):
         super().__init__(config=config, credit_manager=credit_manager)
-        self._request_rate_generator = RequestRateGeneratorFactory.create_instance(
-            config
+        # Each load stage runs with its own copy of the config
+        self._stage_configs = [
+            self._create_stage_config(stage) for stage in config.load_stages or []
+        ]
+        initial_config = self._initial_load_config()
+        self._request_rate_generator = self._create_request_rate_generator(
+            initial_config
         )
         # If the user has provided a concurrency, use a semaphore to limit the maximum number of concurrent requests
+        self._concurrency = initial_config.concurrency
         self._semaphore: asyncio.Semaphore | None = (
-            asyncio.Semaphore(value=config.concurrency) if config.concurrency else None
+            asyncio.Semaphore(value=self._concurrency) if self._concurrency else None
+        )
+        # The number of returning credits that do not release the semaphore, as they were sent without holding it
+        self._semaphore_debt = 0
+        # Concurrency burst mode sends credits as soon as possible, so there is no schedule to follow
+        self._use_arrival_schedule = (
+            initial_config.request_rate_mode != RequestRateMode.CONCURRENCY_BURST
+        )
+        self._arrival_schedule_chunk_size = (
+            Environment.TIMING.ARRIVAL_SCHEDULE_CHUNK_SIZE
+        )
+
+    def _initial_load_config(self) -> TimingManagerConfig:
+        """Get the config of the load that the strategy starts with, which is also used by the warmup phase.
+        This is the load of the first stage if load stages are configured. This can be overridden in subclasses."""
+        return self._stage_configs[0] if self._stage_configs else self.config
+
+    def _create_request_rate_generator(
+        self, config: TimingManagerConfig
+    ) -> RequestRateGeneratorProtocol | None:
+        """Create the request rate generator for the request rate mode of the config. This can be overridden in
+        subclasses that pace the credits by other means, to return None."""
+        return RequestRateGeneratorFactory.create_instance(config)
+
+    def _create_stage_config(self, stage: LoadStageConfig) -> TimingManagerConfig:
+        """Create the timing config of a single load stage from the top-level config."""
+        return self.config.model_copy(
+            update={
+                "concurrency": stage.concurrency,
+                "request_rate": stage.request_rate,
+                "request_rate_mode": stage.request_rate_mode,
+                "request_rate_end": stage.request_rate_end,
+                "request_rate_ramp_duration": stage.request_rate_ramp_duration,
+                "request_rate_step": stage.request_rate_step,
+                "request_rate_step_duration": stage.request_rate_step_duration,
+                "request_rate_amplitude": stage.request_rate_amplitude,
+                "request_rate_period": stage.request_rate_period,
+                "request_rate_cv": stage.request_rate_cv,
+                "request_count": stage.request_count,
+                "benchmark_duration": stage.duration,
+                "load_stages": None,
+            }
         )
 
     async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
-        """Execute credit drops based on the request rate generator, optionally with a max concurrency limit."""
+        """Execute credit drops based on the request rate generator, optionally with a max concurrency limit.
+
+        If load stages are configured, the profiling phase runs each of them in order.
+        """
+        if phase_stats.type == CreditPhase.PROFILING and self._stage_configs:
+            await self._execute_load_stages(phase_stats)
+        else:
+            await self._send_credits(phase_stats, phase_stats.should_send)
+
+    async def _execute_load_stages(self, phase_stats: CreditPhaseStats) -> None:
+        """Execute the load stages back-to-back within the phase.
+
+        Each stage ends once its cumulative request count has been sent, or its cumulative duration has elapsed since
+        the start of the phase, so that a stage starting late does not shift the end of the following stages.
+        """
+        stage_end_count = 0
+        stage_end_ns = phase_stats.start_ns or time.time_ns()
+        for stage_index, (stage, stage_config) in enumerate(
+            zip(self.config.load_stages or [], self._stage_configs, strict=True)
+        ):
+            if not phase_stats.should_send():
+                break
+            await self._apply_stage_config(stage_config, phase_stats.in_flight)
+            self.info(
+                f"Starting load stage {stage.name or stage_index}: concurrency={stage.concurrency}, "
+                f"request_rate={stage.request_rate}, request_rate_mode={stage.request_rate_mode}, "
+                f"request_count={stage.request_count}, duration={stage.duration}"
+            )
+
+            if stage.request_count is not None:
+                stage_end_count += stage.request_count
+
+                def should_send(end_count: int = stage_end_count) -> bool:
+                    return phase_stats.should_send() and phase_stats.sent < end_count
+            else:
+                stage_end_ns += int(stage.duration * NANOS_PER_SECOND)  # type: ignore
+
+                def should_send(end_ns: int = stage_end_ns) -> bool:
+                    return phase_stats.should_send() and time.time_ns() < end_ns
 
-        loop_count = 0
-        while phase_stats.should_send():
-            loop_count += 1
+            await self._send_credits(phase_stats, should_send, stage_index=stage_index)
 
+    async def _apply_stage_config(
+        self, stage_config: TimingManagerConfig, in_flight: int
+    ) -> None:
+        """Switch the request rate generator and the concurrency limit to those of the next load stage."""
+        self._request_rate_generator = self._create_request_rate_generator(stage_config)
+        self._use_arrival_schedule = (
+            stage_config.request_rate_mode != RequestRateMode.CONCURRENCY_BURST
+        )
+        await self._apply_concurrency(stage_config.concurrency, in_flight)
+
+    async def _apply_concurrency(self, concurrency: int | None, in_flight: int) -> None:
+        """Apply the concurrency limit of a load stage, which may differ from the previous stage in whether it
+        limits the concurrency at all.
+
+        A stage without a concurrency drops the semaphore, so the credits still in flight from the previous stage
+        release nothing when they return. A stage that limits the concurrency after one that did not creates a new
+        semaphore, whose permits are only released once the credits in flight beyond the new limit have returned.
+        """
+        if concurrency is None:
+            self._semaphore = None
+            self._semaphore_debt = 0
+        elif self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(value=max(0, concurrency - in_flight))
+            self._semaphore_debt = max(0, in_flight - concurrency)
+        else:
+            await self._resize_concurrency(concurrency)
+        self._concurrency = concurrency
+
+    async def _resize_concurrency(self, concurrency: int | None) -> None:
+        """Resize the concurrency semaphore by the difference in concurrency. Shrinking it waits for enough in-flight
+        requests to return, so that the new concurrency limit is never exceeded."""
+        if self._semaphore is None or concurrency == self._concurrency:
+            return
+
+        delta = concurrency - self._concurrency  # type: ignore[operator]
+        for _ in range(delta):
+            self._semaphore.release()
+        for _ in range(-delta):
+            await self._semaphore.acquire()
+        self._concurrency = concurrency
+
+    async def _send_credits(
+        self,
+        phase_stats: CreditPhaseStats,
+        should_send: Callable[[], bool],
+        stage_index: int | None = None,
+    ) -> None:
+        """Send credits for as long as `should_send` returns True.
+
+        The arrival time of each credit is an offset from the start of the call, instead of an interval from when
+        the previous credit was sent. If the strategy falls behind the schedule, such as while waiting for the
+        concurrency semaphore, the late credits are sent back to back until it catches up.
+        """
+        if self.credit_drop_batch_size > 1:
+            await self._send_credit_batches(phase_stats, should_send, stage_index)
+            return
+
+        arrival_offsets_ns = self._arrival_offsets_ns()
+        # When credits are issued ahead of time, the schedule starts after the lead time, so that the first credit
+        # can be issued ahead of time as well.
+        start_perf_ns = time.perf_counter_ns() + self.credit_lead_ns
+        scheduled_perf_ns = start_perf_ns
+
+        while should_send():
             # Ensure we have an available credit before dropping
             if self._semaphore:
                 await self._semaphore.acquire()
                 if self.is_trace_enabled:
                     self.trace(f"Acquired credit drop semaphore: {self._semaphore!r}")
-                if not phase_stats.should_send():
-                    # Check one last time to see if we should still send a credit in case the
-                    # time-based phase expired while we were waiting for the semaphore.
+
+            schedule_lag_ns = None
+            credit_drop_ns = None
+            if self._use_arrival_schedule:
+                # Issue the credit ahead of its scheduled time if enabled, and have the worker wait for it
+                issue_perf_ns = scheduled_perf_ns - self.credit_lead_ns
+                await self.credit_scheduler.wait_until(issue_perf_ns)
+                schedule_lag_ns = max(0, time.perf_counter_ns() - issue_perf_ns)
+                credit_drop_ns = self._target_credit_drop_ns(scheduled_perf_ns)
+
+            if not should_send():
+                # Check one last time to see if we should still send a credit in case the
+                # time-based phase expired while we were waiting for the semaphore or the arrival time.
+                if self._semaphore:
                     self._semaphore.release()
                     if self.is_trace_enabled:
                         self.trace(
                             f"Released semaphore after should_send returned False: {self._semaphore!r}"
                         )
-                    break
+                break
 
             should_cancel = self.cancellation_strategy.should_cancel_request()
             cancel_after_ns = self.cancellation_strategy.get_cancellation_delay_ns()
@@ -72,17 +244,110 @@ class RequestRateStrategy(CreditIssuingStrategy):
                 credit_num=phase_stats.sent,
                 should_cancel=should_cancel,
                 cancel_after_ns=cancel_after_ns,
+                credit_drop_ns=credit_drop_ns,
+                schedule_lag_ns=schedule_lag_ns,
+                stage_index=stage_index,
             )
             # NOTE: This is incremented here, as the credit_num is used up above, and needs the current value.
             phase_stats.sent += 1
-            # Check if we should break out of the loop before we sleep for the next interval.
+            # Check if we should break out of the loop before we wait for the next arrival time.
             # This is to ensure we don't sleep for any unnecessary time, which could cause race conditions.
-            if not phase_stats.should_send():
+            if not should_send():
+                break
+
+            if self._use_arrival_schedule:
+                scheduled_perf_ns = start_perf_ns + next(arrival_offsets_ns)
+
+    async def _send_credit_batches(
+        self,
+        phase_stats: CreditPhaseStats,
+        should_send: Callable[[], bool],
+        stage_index: int | None = None,
+    ) -> None:
+        """Send credits in batches of up to `credit_drop_batch_size` credits, for as long as `should_send` returns True.
+
+        A batch starts with the next credit, which is issued at its scheduled time as if it were sent on its own.
+        The credits scheduled within the batch window after it are added to the batch ahead of time, each with its
+        own scheduled time as its target, and the workers send each of them at that time. Without an arrival schedule,
+        the batch is filled with as many credits as are due. Only the first credit of a batch waits for the concurrency
+        semaphore, so that a batch is never held back waiting for a free slot.
+        """
+        arrival_offsets_ns = self._arrival_offsets_ns()
+        start_perf_ns = time.perf_counter_ns() + self.credit_lead_ns
+        scheduled_perf_ns = start_perf_ns
+
+        while should_send():
+            if self._semaphore:
+                await self._semaphore.acquire()
+
+            schedule_lag_ns = None
+            credit_drop_ns = None
+            if self._use_arrival_schedule:
+                issue_perf_ns = scheduled_perf_ns - self.credit_lead_ns
+                await self.credit_scheduler.wait_until(issue_perf_ns)
+                schedule_lag_ns = max(0, time.perf_counter_ns() - issue_perf_ns)
+                credit_drop_ns = self._target_credit_drop_ns(scheduled_perf_ns)
+            batch_end_perf_ns = scheduled_perf_ns + self.credit_drop_batch_window_ns
+
+            if not should_send():
+                if self._semaphore:
+                    self._semaphore.release()
                 break
 
-            next_interval = self._request_rate_generator.next_interval()
-            if next_interval > 0:
-                await asyncio.sleep(next_interval)
+            batch = [
+                self._create_credit_drop(
+                    phase_stats,
+                    credit_drop_ns=credit_drop_ns,
+                    schedule_lag_ns=schedule_lag_ns,
+                    stage_index=stage_index,
+                )
+            ]
+            if self._use_arrival_schedule:
+                scheduled_perf_ns = start_perf_ns + next(arrival_offsets_ns)
+
+            while len(batch) < self.credit_drop_batch_size and should_send():
+                if self._use_arrival_schedule and scheduled_perf_ns > batch_end_perf_ns:
+                    break
+                if self._semaphore:
+                    if self._semaphore.locked():
+                        break
+                    await self._semaphore.acquire()
+
+                schedule_lag_ns = None
+                credit_drop_ns = None
+                if self._use_arrival_schedule:
+                    issue_perf_ns = scheduled_perf_ns - self.credit_lead_ns
+                    schedule_lag_ns = max(0, time.perf_counter_ns() - issue_perf_ns)
+                    credit_drop_ns = self._target_credit_drop_ns(
+                        scheduled_perf_ns, ahead_of_time=True
+                    )
+                batch.append(
+                    self._create_credit_drop(
+                        phase_stats,
+                        credit_drop_ns=credit_drop_ns,
+                        schedule_lag_ns=schedule_lag_ns,
+                        stage_index=stage_index,
+                    )
+                )
+                if self._use_arrival_schedule:
+                    scheduled_perf_ns = start_perf_ns + next(arrival_offsets_ns)
+
+            await self.credit_manager.drop_credit_batch(batch)
+
+    def _arrival_offsets_ns(self) -> Iterator[int]:
+        """Generate the arrival offsets of the credits after the first one, in nanoseconds from the start of the phase.
+
+        The intervals are drawn from the request rate generator in chunks, to avoid the per-credit cost of the draw.
+        """
+        offset_sec = 0.0
+        while True:
+            offsets_sec = offset_sec + np.cumsum(
+                self._request_rate_generator.next_intervals(  # type: ignore[union-attr]
+                    self._arrival_schedule_chunk_size
+                )
+            )
+            yield from np.rint(offsets_sec * NANOS_PER_SECOND).astype(np.int64).tolist()
+            offset_sec = float(offsets_sec[-1])
 
     async def _on_credit_return(self, message: CreditReturnMessage) -> None:
         """Process a credit return message. If concurrency is enabled, release the semaphore to allow another credit to be issued."""
@@ -90,11 +355,25 @@ class RequestRateStrategy(CreditIssuingStrategy):
         # Release the semaphore to allow another credit to be issued,
         # then call the superclass to handle the credit return like normal
         if self._semaphore:
-            self._semaphore.release()
+            if self._semaphore_debt > 0:
+                self._semaphore_debt -= 1
+            else:
+                self._semaphore.release()
             if self.is_trace_enabled:
                 self.trace(f"Credit return released semaphore: {self._semaphore!r}")
         await super()._on_credit_return(message)
 
+    async def _acquire_next_turn_slot(self, phase_stats: CreditPhaseStats) -> bool:
+        """Wait for a free concurrency slot before the next turn of a conversation is sent, as the slot of the
+        conversation was released during its turn delay."""
+        if self._semaphore:
+            await self._semaphore.acquire()
+        if not await super()._acquire_next_turn_slot(phase_stats):
+            if self._semaphore:
+                self._semaphore.release()
+            return False
+        return True
+
 
 @implements_protocol(RequestRateGeneratorProtocol)
 @RequestRateGeneratorFactory.register(RequestRateMode.POISSON)
@@ -129,6 +408,21 @@ class PoissonRateGenerator:
         """
         return self._rng.expovariate(self._request_rate)
 
+    def next_intervals(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` inter-arrival times for a Poisson process.
+
+        Seeded runs draw the intervals one at a time with expovariate, so that they produce the same arrival times
+        as `next_interval` for the same seed. Otherwise, the intervals are generated in a single vectorized draw.
+        """
+        if self._rng.seed is not None:
+            return np.fromiter(
+                (self._rng.expovariate(self._request_rate) for _ in range(count)),
+                dtype=np.float64,
+                count=count,
+            )
+        return self._rng.exponential(1.0 / self._request_rate, count)
+
 
 @implements_protocol(RequestRateGeneratorProtocol)
 @RequestRateGeneratorFactory.register(RequestRateMode.CONSTANT)
@@ -152,6 +446,12 @@ class ConstantRateGenerator:
         """
         return self._period
 
+    def next_intervals(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` inter-arrival times for a constant rate.
+        """
+        return np.full(count, self._period)
+
 
 @implements_protocol(RequestRateGeneratorProtocol)
 @RequestRateGeneratorFactory.register(RequestRateMode.CONCURRENCY_BURST)
@@ -177,3 +477,188 @@ class ConcurrencyBurstRateGenerator:
         This will always return 0, as the requests should be issued as soon as possible.
         """
         return 0
+
+    def next_intervals(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` inter-arrival times for a concurrency-burst rate, which are all 0.
+        """
+        return np.zeros(count)
+
+
+class BaseTimeVaryingRateGenerator(ABC):
+    """
+    Base class for generators of a poisson process whose request rate changes over the course of the phase.
+
+    The generator keeps track of the arrival time of the previous request, and draws the next inter-arrival time
+    from an exponential distribution at the request rate of that time. This is accurate as long as the request rate
+    does not change much within a single inter-arrival time.
+    """
+
+    def __init__(self, config: TimingManagerConfig, rng_identifier: str) -> None:
+        if config.request_rate is None or config.request_rate <= 0:
+            raise ValueError(
+                f"Request rate {config.request_rate} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        self._rng = rng.derive(rng_identifier)
+        self._request_rate: float = config.request_rate
+        self._elapsed_sec: float = 0.0
+
+    @abstractmethod
+    def rate_at(self, elapsed_sec: float) -> float:
+        """Get the request rate at the given time in seconds from the start of the phase."""
+        ...
+
+    def next_interval(self) -> float:
+        """
+        Generate the next inter-arrival time at the request rate of the previous arrival time.
+        """
+        interval = self._rng.exponential() / self.rate_at(self._elapsed_sec)
+        self._elapsed_sec += interval
+        return interval
+
+    def next_intervals(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` inter-arrival times. The unit exponential draws are vectorized, but each interval
+        depends on the arrival time of the previous one, so they are scaled one at a time.
+        """
+        intervals = self._rng.exponential(1.0, count)
+        for i, unit_interval in enumerate(intervals.tolist()):
+            intervals[i] = unit_interval / self.rate_at(self._elapsed_sec)
+            self._elapsed_sec += intervals[i]
+        return intervals
+
+
+@implements_protocol(RequestRateGeneratorProtocol)
+@RequestRateGeneratorFactory.register(RequestRateMode.RAMP)
+class RampRateGenerator(BaseTimeVaryingRateGenerator):
+    """
+    Generator for a poisson process whose rate increases (or decreases) linearly from the request rate to the end
+    request rate over the ramp duration, and then stays at the end request rate.
+
+    The ramp duration defaults to the benchmark duration.
+    """
+
+    def __init__(self, config: TimingManagerConfig) -> None:
+        super().__init__(config, "timing.request.ramp_interval")
+        if config.request_rate_end is None or config.request_rate_end <= 0:
+            raise ValueError(
+                f"End request rate {config.request_rate_end} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        ramp_duration = config.request_rate_ramp_duration or config.benchmark_duration
+        if ramp_duration is None:
+            raise ValueError(
+                f"Ramp duration or benchmark duration must be set for {config.request_rate_mode!r}"
+            )
+        self._ramp_duration: float = ramp_duration
+        self._request_rate_end: float = config.request_rate_end
+
+    def rate_at(self, elapsed_sec: float) -> float:
+        progress = min(elapsed_sec / self._ramp_duration, 1.0)
+        return (
+            self._request_rate
+            + (self._request_rate_end - self._request_rate) * progress
+        )
+
+
+@implements_protocol(RequestRateGeneratorProtocol)
+@RequestRateGeneratorFactory.register(RequestRateMode.STEP)
+class StepRateGenerator(BaseTimeVaryingRateGenerator):
+    """
+    Generator for a poisson process whose rate increases by the rate step every step duration, starting at the
+    request rate. The rate stops increasing once it reaches the end request rate, if set.
+    """
+
+    def __init__(self, config: TimingManagerConfig) -> None:
+        super().__init__(config, "timing.request.step_interval")
+        if config.request_rate_step is None or config.request_rate_step <= 0:
+            raise ValueError(
+                f"Request rate step {config.request_rate_step} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        if (
+            config.request_rate_step_duration is None
+            or config.request_rate_step_duration <= 0
+        ):
+            raise ValueError(
+                f"Step duration {config.request_rate_step_duration} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        self._request_rate_step: float = config.request_rate_step
+        self._step_duration: float = config.request_rate_step_duration
+        self._request_rate_end: float = config.request_rate_end or math.inf
+
+    def rate_at(self, elapsed_sec: float) -> float:
+        step = math.floor(elapsed_sec / self._step_duration)
+        return min(
+            self._request_rate + step * self._request_rate_step, self._request_rate_end
+        )
+
+
+@implements_protocol(RequestRateGeneratorProtocol)
+@RequestRateGeneratorFactory.register(RequestRateMode.SINUSOIDAL)
+class SinusoidalRateGenerator(BaseTimeVaryingRateGenerator):
+    """
+    Generator for a poisson process whose rate follows a sinusoid around the request rate, such as to model
+    diurnal traffic in a compressed amount of time.
+
+    rate(t) = request_rate + amplitude * sin(2π * t / period)
+    """
+
+    def __init__(self, config: TimingManagerConfig) -> None:
+        super().__init__(config, "timing.request.sinusoidal_interval")
+        if (
+            config.request_rate_amplitude is None
+            or not 0 <= config.request_rate_amplitude < config.request_rate
+        ):
+            raise ValueError(
+                f"Amplitude {config.request_rate_amplitude} must be set, and between 0 and the request rate "
+                f"{config.request_rate} (exclusive) for {config.request_rate_mode!r}"
+            )
+        if config.request_rate_period is None or config.request_rate_period <= 0:
+            raise ValueError(
+                f"Period {config.request_rate_period} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        self._amplitude: float = config.request_rate_amplitude
+        self._angular_frequency: float = 2 * math.pi / config.request_rate_period
+
+    def rate_at(self, elapsed_sec: float) -> float:
+        return self._request_rate + self._amplitude * math.sin(
+            self._angular_frequency * elapsed_sec
+        )
+
+
+@implements_protocol(RequestRateGeneratorProtocol)
+@RequestRateGeneratorFactory.register(RequestRateMode.GAMMA)
+class GammaRateGenerator:
+    """
+    Generator for a renewal process with gamma distributed inter-arrival times.
+
+    The mean inter-arrival time is 1 / request_rate, and the coefficient of variation (CV) controls the burstiness:
+    a CV of 1 is a poisson process, a CV greater than 1 is burstier, and a CV less than 1 is more regular.
+    The gamma distribution has a shape of 1 / CV² and a scale of CV² / request_rate.
+
+    Uses the global RandomGenerator for reproducibility.
+    """
+
+    def __init__(self, config: TimingManagerConfig) -> None:
+        if config.request_rate is None or config.request_rate <= 0:
+            raise ValueError(
+                f"Request rate {config.request_rate} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        if config.request_rate_cv is None or config.request_rate_cv <= 0:
+            raise ValueError(
+                f"Coefficient of variation {config.request_rate_cv} must be set and greater than 0 for {config.request_rate_mode!r}"
+            )
+        self._rng = rng.derive("timing.request.gamma_interval")
+        self._shape: float = 1.0 / config.request_rate_cv**2
+        self._scale: float = config.request_rate_cv**2 / config.request_rate
+
+    def next_interval(self) -> float:
+        """
+        Generate the next gamma distributed inter-arrival time.
+        """
+        return float(self._rng.gamma(self._shape, self._scale))
+
+    def next_intervals(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` gamma distributed inter-arrival times, in a single vectorized draw.
+        """
+        return self._rng.gamma(self._shape, self._scale, count)
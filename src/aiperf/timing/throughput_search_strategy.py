@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+
+from aiperf.common.config import LoadStageConfig
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.enums import CreditPhase, ThroughputSearchMode, TimingMode
+from aiperf.common.messages import CreditReturnMessage
+from aiperf.common.models import (
+    CreditPhaseConfig,
+    CreditPhaseStats,
+    SearchProbeResult,
+)
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.credit_issuing_strategy import (
+    CreditIssuingStrategyFactory,
+    CreditManagerProtocol,
+)
+from aiperf.timing.request_rate_strategy import RequestRateStrategy
+
+
+@CreditIssuingStrategyFactory.register(TimingMode.THROUGHPUT_SEARCH)
+class ThroughputSearchStrategy(RequestRateStrategy):
+    """
+    Strategy for searching for the highest load at which the goodput SLOs are met.
+
+    The profiling phase runs a series of short probes back-to-back, each at a single concurrency or request rate,
+    depending on the search mode. The services and the connections stay warm between the probes. After each probe
+    has sent its credits and its in-flight requests have returned, the RecordsManager computes the SLO attainment
+    of the requests of the probe, which decides whether the probe passed.
+
+    The search probes the minimum load, then the maximum load, and then bisects between the highest passing load
+    and the lowest failing load, until the loads converge or the maximum number of probes is reached.
+    """
+
+    def __init__(
+        self, config: TimingManagerConfig, credit_manager: CreditManagerProtocol
+    ):
+        super().__init__(config=config, credit_manager=credit_manager)
+        # Set when there are no more in-flight credits in the profiling phase, which means that a probe has drained
+        self._probe_drained_event = asyncio.Event()
+        self.probe_results: list[SearchProbeResult] = []
+
+    def _initial_load_config(self) -> TimingManagerConfig:
+        """Start with the load of the first probe, which is also used by the warmup phase."""
+        return self._create_stage_config(self._probe_stage(self.config.search_min))
+
+    def _setup_profiling_phase_config(self) -> None:
+        """Setup a time-based profiling phase, whose duration is an upper bound of the duration of the search."""
+        expected_duration_sec = self.config.search_max_probes * (
+            self.config.search_probe_duration + self.config.benchmark_grace_period
+        )
+        self.debug(
+            f"Setting up throughput search profiling phase: expected_duration_sec={expected_duration_sec}"
+        )
+        self.ordered_phase_configs.append(
+            CreditPhaseConfig(
+                type=CreditPhase.PROFILING,
+                expected_duration_sec=expected_duration_sec,
+            )
+        )
+
+    def _probe_stage(self, load: float) -> LoadStageConfig:
+        """Create the load stage of a probe at the given load."""
+        if self.config.search_mode == ThroughputSearchMode.CONCURRENCY:
+            return LoadStageConfig(
+                name=f"concurrency{int(load)}",
+                concurrency=int(load),
+                duration=self.config.search_probe_duration,
+            )
+        return LoadStageConfig(
+            name=f"request_rate{load:g}",
+            concurrency=self.config.concurrency,
+            request_rate=load,
+            request_rate_mode=self.config.request_rate_mode,
+            request_rate_cv=self.config.request_rate_cv,
+            duration=self.config.search_probe_duration,
+        )
+
+    def _next_probe_load(
+        self, highest_passed: float | None, lowest_failed: float | None
+    ) -> float | None:
+        """Get the load of the next probe from the highest passing and lowest failing loads so far,
+        or None if the search is complete."""
+        if highest_passed is None and lowest_failed is None:
+            return self.config.search_min
+        if highest_passed is None:
+            # Even the minimum load failed the SLOs
+            return None
+        if lowest_failed is None:
+            # The maximum load is only probed once the minimum load has passed
+            if highest_passed >= self.config.search_max:  # type: ignore[operator]
+                return None
+            return self.config.search_max
+        if self.config.search_mode == ThroughputSearchMode.CONCURRENCY:
+            if lowest_failed - highest_passed <= 1:
+                return None
+            return float((highest_passed + lowest_failed) // 2)
+        return (highest_passed + lowest_failed) / 2
+
+    async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
+        """Execute the warmup phase at the initial load, or the throughput search in the profiling phase."""
+        if phase_stats.type != CreditPhase.PROFILING:
+            await super()._execute_single_phase(phase_stats)
+            return
+
+        highest_passed: float | None = None
+        lowest_failed: float | None = None
+        for probe_index in range(self.config.search_max_probes):
+            load = self._next_probe_load(highest_passed, lowest_failed)
+            if load is None or not phase_stats.should_send():
+                break
+
+            result = await self._run_probe(phase_stats, probe_index, load)
+            if result is None:
+                self.warning("Stopping the throughput search, as a probe failed")
+                break
+            self.probe_results.append(result)
+            if result.passed:
+                highest_passed = load
+            else:
+                lowest_failed = load
+
+        self.notice(
+            f"Throughput search completed after {len(self.probe_results)} probes: highest passing "
+            f"{self.config.search_mode}={highest_passed}, lowest failing {self.config.search_mode}={lowest_failed}"
+        )
+
+    async def _run_probe(
+        self, phase_stats: CreditPhaseStats, probe_index: int, load: float
+    ) -> SearchProbeResult | None:
+        """Run a single probe at the given load, and get its result once its requests have returned."""
+        stage = self._probe_stage(load)
+        await self._apply_stage_config(
+            self._create_stage_config(stage), phase_stats.in_flight
+        )
+        self.info(
+            f"Starting search probe {probe_index}: concurrency={stage.concurrency}, "
+            f"request_rate={stage.request_rate}, duration={stage.duration}"
+        )
+
+        # Credits dropped in this probe, as the late returns of a previous probe carry its stage index instead
+        credits_sent = phase_stats.sent
+        probe_duration_ns = int(self.config.search_probe_duration * NANOS_PER_SECOND)
+        probe_end_ns = time.time_ns() + probe_duration_ns
+
+        def should_send() -> bool:
+            return phase_stats.should_send() and time.time_ns() < probe_end_ns
+
+        await self._send_credits(phase_stats, should_send, stage_index=probe_index)
+        await self._wait_for_probe_drain(phase_stats)
+
+        result = await self.credit_manager.get_search_probe_result(
+            stage_index=probe_index,
+            load=load,
+            concurrency=stage.concurrency,
+            request_rate=stage.request_rate,
+            expected_records=phase_stats.sent - credits_sent,
+        )
+        if result is not None:
+            self.info(
+                f"Search probe {probe_index} {'passed' if result.passed else 'failed'}: "
+                f"SLO attainment {result.slo_attainment:.2f}% of {result.request_count + result.error_request_count} "
+                f"requests at {self.config.search_mode}={load:g}"
+            )
+        return result
+
+    async def _wait_for_probe_drain(self, phase_stats: CreditPhaseStats) -> None:
+        """Wait up to the grace period for the in-flight credits of a probe to be returned."""
+        self._probe_drained_event.clear()
+        if phase_stats.in_flight == 0:
+            return
+        try:
+            await asyncio.wait_for(
+                self._probe_drained_event.wait(),
+                timeout=self.config.benchmark_grace_period,
+            )
+        except asyncio.TimeoutError:
+            self.warning(
+                f"Grace period of {self.config.benchmark_grace_period}s elapsed with {phase_stats.in_flight} "
+                "in-flight requests, which are not included in the result of the search probe"
+            )
+
+    async def _wait_for_phase_completion(self, phase_stats: CreditPhaseStats) -> None:
+        """Complete the profiling phase as soon as the search is complete.
+
+        The search usually ends well before the upper bound of the phase duration, and each probe has already waited
+        for its in-flight credits, so there is no need to wait any longer.
+        """
+        if phase_stats.type != CreditPhase.PROFILING:
+            await super()._wait_for_phase_completion(phase_stats)
+        elif phase_stats.in_flight == 0:
+            await self._complete_phase(phase_stats)
+        else:
+            await self._force_phase_completion(phase_stats, grace_period_timeout=True)
+
+    async def _on_credit_return(self, message: CreditReturnMessage) -> None:
+        """Process a credit return message, and signal the end of a probe once it has no more in-flight credits."""
+        await super()._on_credit_return(message)
+        phase_stats = self.phase_stats.get(message.phase)
+        if (
+            message.phase == CreditPhase.PROFILING
+            and phase_stats is not None
+            and phase_stats.in_flight == 0
+        ):
+            self._probe_drained_event.set()
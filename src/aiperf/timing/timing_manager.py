@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
@@ -12,24 +13,44 @@ from aiperf.common.enums import (
     MessageType,
     ServiceType,
 )
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import InvalidStateError
 from aiperf.common.factories import ServiceFactory
 from aiperf.common.hooks import (
     on_command,
+    on_message,
     on_pull_message,
     on_stop,
 )
 from aiperf.common.messages import (
+    AdaptiveWindowMetricCommand,
+    AdaptiveWindowMetricResponse,
     CommandAcknowledgedResponse,
     CommandMessage,
+    CreditDropBatchMessage,
     CreditDropMessage,
+    CreditReturnBatchMessage,
     CreditReturnMessage,
     DatasetTimingRequest,
     DatasetTimingResponse,
+    DatasetTokenLengthsRequest,
+    DatasetTokenLengthsResponse,
+    OutputTokenStatsCommand,
+    OutputTokenStatsResponse,
     ProfileCancelCommand,
     ProfileConfigureCommand,
+    SearchProbeResultCommand,
+    SearchProbeResultResponse,
+    TurnCreditDropMessage,
+    WorkerHealthMessage,
 )
 from aiperf.common.mixins import PullClientMixin
+from aiperf.common.models import (
+    AdaptiveConcurrencySample,
+    NextTurnCredit,
+    OutputTokenStats,
+    SearchProbeResult,
+)
 from aiperf.common.protocols import (
     PushClientProtocol,
     RequestClientProtocol,
@@ -84,6 +105,16 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
 
         self._credit_issuing_strategy: CreditIssuingStrategy | None = None
 
+        # The workers that have reported their health, which the batches of credit drops are split across
+        self._worker_ids: set[str] = set()
+
+        # The next turn credits are published to the worker that keeps their session, without a delivery guarantee,
+        # so they are tracked until they are returned, and count as returned once TURN_CREDIT_TIMEOUT has elapsed.
+        # Keyed by credit drop ID, with the task that expires the credit.
+        self._pending_turn_credits: dict[str, asyncio.Task] = {}
+        # The credit drop IDs of the turn credits that expired, whose late returns are ignored
+        self._expired_turn_credits: set[str] = set()
+
     @on_command(CommandType.PROFILE_CONFIGURE)
     async def _profile_configure_command(
         self, message: ProfileConfigureCommand
@@ -92,16 +123,19 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
         self.debug(f"Configuring credit issuing strategy for {self.service_id}")
 
         if self.config.timing_mode == TimingMode.FIXED_SCHEDULE:
-            # This will block until the dataset is ready and the timing response is received
+            # This will block until the dataset is ready and the first chunk of the schedule is received.
+            # The rest of the schedule is fetched by the strategy one chunk at a time while it sends credits.
             dataset_timing_response: DatasetTimingResponse = (
                 await self.dataset_request_client.request(
                     message=DatasetTimingRequest(
                         service_id=self.service_id,
+                        limit=Environment.TIMING.FIXED_SCHEDULE_CHUNK_SIZE,
                     ),
                 )
             )
             self.debug(
-                lambda: f"Received dataset timing response: {dataset_timing_response}"
+                lambda: f"Received the first {len(dataset_timing_response.timing_arrays()[0]):,} of "
+                f"{dataset_timing_response.total_count:,} fixed schedule entries"
             )
             self.info("Using fixed schedule strategy")
             self._credit_issuing_strategy = (
@@ -109,7 +143,28 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
                     TimingMode.FIXED_SCHEDULE,
                     config=self.config,
                     credit_manager=self,
-                    schedule=dataset_timing_response.timing_data,
+                    schedule=dataset_timing_response,
+                )
+            )
+        elif self.config.timing_mode == TimingMode.TOKEN_RATE:
+            # This will block until the dataset is ready and its tokens have been counted
+            dataset_token_lengths_response: DatasetTokenLengthsResponse = (
+                await self.dataset_request_client.request(
+                    message=DatasetTokenLengthsRequest(
+                        service_id=self.service_id,
+                    ),
+                )
+            )
+            self.debug(
+                lambda: f"Received token lengths of {len(dataset_token_lengths_response.token_lengths)} conversations"
+            )
+            self.info("Using token rate strategy")
+            self._credit_issuing_strategy = (
+                CreditIssuingStrategyFactory.create_instance(
+                    TimingMode.TOKEN_RATE,
+                    config=self.config,
+                    credit_manager=self,
+                    token_lengths=dataset_token_lengths_response.token_lengths,
                 )
             )
         else:
@@ -164,11 +219,40 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
             await self._credit_issuing_strategy.stop()
         await self.cancel_all_tasks()
 
+    @on_message(MessageType.WORKER_HEALTH)
+    async def _on_worker_health(self, message: WorkerHealthMessage) -> None:
+        """Keep track of the workers, to split the batches of credit drops across them."""
+        self._worker_ids.add(message.service_id)
+
     @on_pull_message(MessageType.CREDIT_RETURN)
     async def _on_credit_return(self, message: CreditReturnMessage) -> None:
         """Handle the credit return message."""
         if self.is_debug_enabled:
             self.debug(f"Timing manager received credit return message: {message}")
+        await self._handle_credit_return(message)
+
+    @on_pull_message(MessageType.CREDIT_RETURN_BATCH)
+    async def _on_credit_return_batch(self, message: CreditReturnBatchMessage) -> None:
+        """Handle a batch of credit returns. Each credit return is handled individually and in order,
+        so that the strategy semaphore and phase completion are updated exactly as if they were sent one by one."""
+        if self.is_debug_enabled:
+            self.debug(
+                f"Timing manager received {len(message.credit_returns)} credit returns from {message.service_id}"
+            )
+        for credit_return in message.credit_returns:
+            await self._handle_credit_return(credit_return)
+
+    async def _handle_credit_return(self, message: CreditReturnMessage) -> None:
+        """Pass a credit return to the credit issuing strategy, unless it is the late return of an expired turn credit,
+        which the strategy has already handled."""
+        if expire_task := self._pending_turn_credits.pop(message.credit_drop_id, None):
+            expire_task.cancel()
+        elif message.credit_drop_id in self._expired_turn_credits:
+            self._expired_turn_credits.discard(message.credit_drop_id)
+            self.warning(
+                f"Ignoring the late return of expired turn credit {message.credit_drop_id} from {message.service_id}"
+            )
+            return
         if self._credit_issuing_strategy:
             await self._credit_issuing_strategy._on_credit_return(message)
 
@@ -181,8 +265,10 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
         credit_drop_ns: int | None = None,
         should_cancel: bool = False,
         cancel_after_ns: int = 0,
+        schedule_lag_ns: int | None = None,
+        stage_index: int | None = None,
     ) -> None:
-        """Drop a credit."""
+        """Drop a single credit."""
         self.execute_async(
             self.credit_drop_push_client.push(
                 message=CreditDropMessage(
@@ -193,10 +279,161 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
                     conversation_id=conversation_id,
                     should_cancel=should_cancel,
                     cancel_after_ns=cancel_after_ns,
+                    schedule_lag_ns=schedule_lag_ns,
+                    stage_index=stage_index,
                 ),
             )
         )
 
+    async def drop_turn_credit(
+        self,
+        credit_phase: CreditPhase,
+        next_turn: NextTurnCredit,
+        worker_id: str,
+        *,
+        should_cancel: bool = False,
+        cancel_after_ns: int = 0,
+    ) -> None:
+        """Drop the credit of the next turn of a conversation to the worker that keeps the history of its session.
+
+        The credit is tracked until it is returned, and counts as returned once TURN_CREDIT_TIMEOUT has elapsed.
+        """
+        message = TurnCreditDropMessage(
+            service_id=self.service_id,
+            target_service_id=worker_id,
+            phase=credit_phase,
+            credit_num=next_turn.credit_num,
+            conversation_id=next_turn.conversation_id,
+            should_cancel=should_cancel,
+            cancel_after_ns=cancel_after_ns,
+            stage_index=next_turn.stage_index,
+            turn_index=next_turn.turn_index,
+            session_id=next_turn.session_id,
+        )
+        self._pending_turn_credits[message.request_id] = self.execute_async(
+            self._expire_turn_credit(message)
+        )
+        self.execute_async(self.publish(message))
+
+    async def _expire_turn_credit(self, message: TurnCreditDropMessage) -> None:
+        """Return a turn credit to the credit issuing strategy if the worker has not returned it in time."""
+        await asyncio.sleep(Environment.TIMING.TURN_CREDIT_TIMEOUT)
+        self._pending_turn_credits.pop(message.request_id, None)
+        self._expired_turn_credits.add(message.request_id)
+        self.warning(
+            f"Turn {message.turn_index} of session {message.session_id} was not returned by "
+            f"{message.target_service_id} within {Environment.TIMING.TURN_CREDIT_TIMEOUT}s, counting it as completed"
+        )
+        if self._credit_issuing_strategy:
+            await self._credit_issuing_strategy._on_credit_return(
+                CreditReturnMessage(
+                    service_id=message.target_service_id,
+                    phase=message.phase,
+                    credit_drop_id=message.request_id,
+                    requests_sent=0,
+                )
+            )
+
+    async def drop_credit_batch(self, credits: list[CreditDropMessage]) -> None:
+        """Drop a batch of credits built by the credit issuing strategy, each with its own target time.
+
+        The push socket sends each message to the next worker in turn, so the batch is split across the workers
+        that have reported their health, to avoid sending a whole batch to a single worker. The credits are
+        interleaved, so that each worker receives credits from across the time range of the batch.
+        """
+        num_splits = max(1, min(len(credits), len(self._worker_ids)))
+        for i in range(num_splits):
+            split = credits[i::num_splits]
+            self.execute_async(
+                self.credit_drop_push_client.push(
+                    message=split[0]
+                    if len(split) == 1
+                    else CreditDropBatchMessage(
+                        service_id=self.service_id,
+                        credits=split,
+                    ),
+                )
+            )
+
+    async def get_search_probe_result(
+        self,
+        stage_index: int,
+        load: float,
+        concurrency: int | None,
+        request_rate: float | None,
+        expected_records: int,
+    ) -> SearchProbeResult | None:
+        """Get the result of a throughput search probe from the RecordsManager, once it has processed the
+        expected number of records of the probe. Returns None if the result could not be retrieved."""
+        response = await self.send_command_and_wait_for_response(
+            SearchProbeResultCommand(
+                service_id=self.service_id,
+                stage_index=stage_index,
+                load=load,
+                concurrency=concurrency,
+                request_rate=request_rate,
+                expected_records=expected_records,
+                target_service_type=ServiceType.RECORDS_MANAGER,
+            ),
+            # The RecordsManager waits for the records of the probe before it responds
+            timeout=Environment.RECORD.SEARCH_PROBE_TIMEOUT
+            + Environment.SERVICE.COMMAND_RESPONSE_TIMEOUT,
+        )
+        if not isinstance(response, SearchProbeResultResponse) or response.data is None:
+            self.error(
+                f"Failed to get the result of search probe {stage_index}: {response}"
+            )
+            return None
+        return response.data
+
+    async def get_adaptive_window_sample(
+        self, concurrency: int, since_ns: int
+    ) -> AdaptiveConcurrencySample | None:
+        """Sample the metric of the adaptive concurrency controller over its sliding window from the RecordsManager.
+        Returns None if the sample could not be retrieved."""
+        response = await self.send_command_and_wait_for_response(
+            AdaptiveWindowMetricCommand(
+                service_id=self.service_id,
+                concurrency=concurrency,
+                since_ns=since_ns,
+                target_service_type=ServiceType.RECORDS_MANAGER,
+            ),
+        )
+        if (
+            not isinstance(response, AdaptiveWindowMetricResponse)
+            or response.data is None
+        ):
+            self.error(f"Failed to sample the adaptive concurrency window: {response}")
+            return None
+        return response.data
+
+    async def get_output_token_stats(self) -> OutputTokenStats | None:
+        """Get the output tokens of the requests of the profiling phase so far from the RecordsManager.
+        Returns None if the stats could not be retrieved."""
+        response = await self.send_command_and_wait_for_response(
+            OutputTokenStatsCommand(
+                service_id=self.service_id,
+                target_service_type=ServiceType.RECORDS_MANAGER,
+            ),
+        )
+        if not isinstance(response, OutputTokenStatsResponse) or response.data is None:
+            self.error(f"Failed to get the output token stats: {response}")
+            return None
+        return response.data
+
+    async def get_dataset_timing_chunk(
+        self, offset: int, limit: int
+    ) -> DatasetTimingResponse:
+        """Get a chunk of the fixed schedule from the DatasetManager, sorted by timestamp."""
+        response: DatasetTimingResponse = await self.dataset_request_client.request(
+            message=DatasetTimingRequest(
+                service_id=self.service_id,
+                offset=offset,
+                limit=limit,
+            ),
+        )
+        return response
+
 
 def main() -> None:
     """Main entry point for the timing manager."""
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import math
+import time
+
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.enums import CreditPhase, RequestRateMode, TimingMode, TokenRateType
+from aiperf.common.environment import Environment
+from aiperf.common.factories import DatasetSamplingStrategyFactory
+from aiperf.common.models import ConversationTokenLengths, CreditPhaseStats
+from aiperf.common.protocols import (
+    DatasetSamplingStrategyProtocol,
+    RequestRateGeneratorProtocol,
+)
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.credit_issuing_strategy import (
+    CreditIssuingStrategyFactory,
+    CreditManagerProtocol,
+)
+from aiperf.timing.request_rate_strategy import RequestRateStrategy
+
+_SECONDS_PER_MINUTE = 60
+
+
+class TokenBucket:
+    """
+    A token bucket that refills at a constant rate in tokens per second, up to its capacity.
+
+    Each request reserves its tokens up front, and is admitted once the bucket holds them. A request larger than the
+    capacity is admitted once the bucket is full. The reservation can leave the bucket in debt, which delays the
+    requests after it, so that the long-run token rate never exceeds the refill rate.
+    """
+
+    def __init__(self, rate: float, capacity: float, start_perf_ns: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_perf_ns = start_perf_ns
+
+    def reserve(self, tokens: float, now_perf_ns: int) -> int:
+        """Reserve the tokens of a request, and return the perf_counter_ns time at which it is admitted."""
+        elapsed_sec = (now_perf_ns - self._last_perf_ns) / NANOS_PER_SECOND
+        self._tokens = min(self.capacity, self._tokens + elapsed_sec * self.rate)
+        self._last_perf_ns = now_perf_ns
+
+        shortfall = min(tokens, self.capacity) - self._tokens
+        self._tokens -= tokens
+        if shortfall <= 0:
+            return now_perf_ns
+        return now_perf_ns + math.ceil(shortfall / self.rate * NANOS_PER_SECOND)
+
+
+@CreditIssuingStrategyFactory.register(TimingMode.TOKEN_RATE)
+class TokenRateStrategy(RequestRateStrategy):
+    """
+    Strategy for issuing credits to meet a target token throughput, such as the tokens per minute budget of a provider.
+
+    The strategy samples the conversation of each credit itself, so that it knows its token count, and charges it
+    against a token bucket that refills at the target rate. Each credit is sent once the bucket holds its tokens.
+    Depending on the token rate type, the token count is either the input tokens of the conversation, or its input
+    tokens plus its estimated output tokens. The output tokens are estimated from the max_tokens of each turn, or
+    when feedback is enabled, from the mean output sequence length measured so far in the profiling phase.
+
+    An optional max concurrency limit is applied on top of the token rate, as in the request rate strategy.
+    """
+
+    def __init__(
+        self,
+        config: TimingManagerConfig,
+        credit_manager: CreditManagerProtocol,
+        token_lengths: list[ConversationTokenLengths],
+    ):
+        if not token_lengths:
+            raise ValueError(
+                "No token lengths loaded, unable to setup token rate strategy"
+            )
+        self._token_lengths = {
+            lengths.conversation_id: lengths for lengths in token_lengths
+        }
+        self._dataset_sampler: DatasetSamplingStrategyProtocol = (
+            DatasetSamplingStrategyFactory.create_instance(
+                config.dataset_sampling_strategy,
+                conversation_ids=list(self._token_lengths),
+            )
+        )
+        self._tokens_per_sec = config.tokens_per_minute / _SECONDS_PER_MINUTE  # type: ignore[operator]
+        # Defaults to one second of tokens, so that the requests of each second can be sent in a burst
+        self._bucket_capacity = config.token_rate_burst or self._tokens_per_sec
+        # The mean output sequence length measured so far in the profiling phase, if feedback is enabled
+        self._mean_output_tokens: float | None = None
+        super().__init__(config=config, credit_manager=credit_manager)
+
+        if (
+            config.token_rate_type == TokenRateType.TOTAL
+            and not config.token_rate_feedback
+            and any(lengths.output_tokens is None for lengths in token_lengths)
+        ):
+            self.warning(
+                "Some conversations do not set max_tokens for every turn, so their output tokens are not counted "
+                "against the token rate. Set --output-tokens-mean or --token-rate-feedback to estimate them."
+            )
+
+    def _initial_load_config(self) -> TimingManagerConfig:
+        """The credits are paced by the token bucket instead of a request rate, optionally limited by the concurrency."""
+        return self.config.model_copy(
+            update={
+                "request_rate": None,
+                "request_rate_mode": RequestRateMode.CONCURRENCY_BURST,
+            }
+        )
+
+    def _create_request_rate_generator(
+        self, config: TimingManagerConfig
+    ) -> RequestRateGeneratorProtocol | None:
+        """The credits are paced by the token bucket, so there is no request rate generator."""
+        return None
+
+    async def _execute_single_phase(self, phase_stats: CreditPhaseStats) -> None:
+        """Execute the phase, updating the estimate of the output tokens in the background during the profiling
+        phase if feedback is enabled."""
+        if (
+            phase_stats.type != CreditPhase.PROFILING
+            or not self.config.token_rate_feedback
+        ):
+            await self._send_token_credits(phase_stats)
+            return
+
+        feedback_task = self.execute_async(self._feedback_loop(phase_stats))
+        try:
+            await self._send_token_credits(phase_stats)
+        finally:
+            feedback_task.cancel()
+
+    async def _feedback_loop(self, phase_stats: CreditPhaseStats) -> None:
+        """Update the estimate of the output tokens every interval, for as long as the phase is sending credits."""
+        while phase_stats.should_send():
+            await asyncio.sleep(Environment.TIMING.TOKEN_RATE_FEEDBACK_INTERVAL)
+            try:
+                await self._update_output_token_estimate()
+            except Exception as e:
+                self.error(f"Error updating the output token estimate: {e!r}")
+
+    async def _update_output_token_estimate(self) -> None:
+        """Estimate the output tokens of each request from the mean output sequence length measured so far."""
+        stats = await self.credit_manager.get_output_token_stats()
+        if stats is None or stats.mean_output_tokens is None:
+            # No requests have completed yet, so keep the estimate from the max_tokens of each turn
+            return
+        self._mean_output_tokens = stats.mean_output_tokens
+        self.debug(
+            lambda: f"Estimating {self._mean_output_tokens:.1f} output tokens per request from "
+            f"{stats.request_count} completed requests"
+        )
+
+    def _credit_tokens(self, lengths: ConversationTokenLengths) -> float:
+        """Get the number of tokens that a conversation is charged against the token bucket."""
+        if self.config.token_rate_type == TokenRateType.INPUT:
+            return lengths.input_tokens
+        if self._mean_output_tokens is not None:
+            output_tokens = self._mean_output_tokens * lengths.turns
+        else:
+            output_tokens = lengths.output_tokens or 0
+        return lengths.input_tokens + output_tokens
+
+    async def _send_token_credits(self, phase_stats: CreditPhaseStats) -> None:
+        """Send credits for as long as the phase should send, each once the token bucket holds its tokens.
+
+        The tokens of a credit are only reserved once it has acquired the concurrency semaphore, so that a credit
+        waiting for a free slot does not hold back the tokens of the credits after it.
+        """
+        start_perf_ns = time.perf_counter_ns()
+        bucket = TokenBucket(
+            rate=self._tokens_per_sec,
+            capacity=self._bucket_capacity,
+            start_perf_ns=start_perf_ns,
+        )
+        tokens_sent = 0.0
+
+        while phase_stats.should_send():
+            if self._semaphore:
+                await self._semaphore.acquire()
+                if self.is_trace_enabled:
+                    self.trace(f"Acquired credit drop semaphore: {self._semaphore!r}")
+
+            conversation_id = self._dataset_sampler.next_conversation_id()
+            tokens = self._credit_tokens(self._token_lengths[conversation_id])
+            # When credits are issued ahead of time, the credit is admitted no earlier than the lead time from now,
+            # so that it can be issued ahead of time as well, and the worker waits for it
+            now_perf_ns = time.perf_counter_ns()
+            admit_perf_ns = max(
+                bucket.reserve(tokens, now_perf_ns), now_perf_ns + self.credit_lead_ns
+            )
+            await self.credit_scheduler.wait_until(admit_perf_ns - self.credit_lead_ns)
+            credit_drop_ns = self._target_credit_drop_ns(admit_perf_ns)
+
+            if not phase_stats.should_send():
+                # Check one last time in case the time-based phase expired while we were waiting for the tokens
+                if self._semaphore:
+                    self._semaphore.release()
+                break
+
+            await self.credit_manager.drop_credit(
+                credit_phase=phase_stats.type,
+                credit_num=phase_stats.sent,
+                conversation_id=conversation_id,
+                credit_drop_ns=credit_drop_ns,
+                should_cancel=self.cancellation_strategy.should_cancel_request(),
+                cancel_after_ns=self.cancellation_strategy.get_cancellation_delay_ns(),
+            )
+            # NOTE: This is incremented here, as the credit_num is used up above, and needs the current value.
+            phase_stats.sent += 1
+            tokens_sent += tokens
+
+        duration_sec = (time.perf_counter_ns() - start_perf_ns) / NANOS_PER_SECOND
+        self.info(
+            f"Sent {phase_stats.sent:,} {phase_stats.type} credits with {tokens_sent:,.0f} {self.config.token_rate_type} "
+            f"tokens in {duration_sec:,.2f}s "
+            f"({tokens_sent / max(duration_sec, 1e-9) * _SECONDS_PER_MINUTE:,.0f} tokens/min)"
+        )
@@ -11,19 +11,33 @@ __ignore__ = []
 from aiperf.transports.aiohttp_client import (
     AioHttpClient,
     create_tcp_connector,
+    create_trace_config,
 )
 from aiperf.transports.aiohttp_transport import (
     AioHttpTransport,
 )
 from aiperf.transports.base_transports import (
+    BaseHTTPTransport,
     BaseTransport,
 )
 from aiperf.transports.http_defaults import (
     AioHttpDefaults,
     SocketDefaults,
 )
+from aiperf.transports.raw_http_client import (
+    RawHttpClient,
+    RawHttpConnection,
+    RawHttpDisconnectedError,
+    RawHttpProtocolError,
+    RawHttpResponse,
+)
+from aiperf.transports.raw_http_transport import (
+    RawHttpTransport,
+)
 from aiperf.transports.sse_utils import (
     AsyncSSEStreamReader,
+    SSEEvent,
+    SSEStreamParser,
 )
 
 __all__ = [
@@ -31,7 +45,17 @@ __all__ = [
     "AioHttpDefaults",
     "AioHttpTransport",
     "AsyncSSEStreamReader",
+    "BaseHTTPTransport",
     "BaseTransport",
+    "RawHttpClient",
+    "RawHttpConnection",
+    "RawHttpDisconnectedError",
+    "RawHttpProtocolError",
+    "RawHttpResponse",
+    "RawHttpTransport",
+    "SSEEvent",
+    "SSEStreamParser",
     "SocketDefaults",
     "create_tcp_connector",
+    "create_trace_config",
 ]
@@ -1,20 +1,28 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import socket
 import time
+from types import SimpleNamespace
 from typing import Any
 
 import aiohttp
 
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import SSEResponseError
 from aiperf.common.mixins import AIPerfLoggerMixin
 from aiperf.common.models import (
     ErrorDetails,
+    HttpTraceTimings,
     RequestRecord,
     TextResponse,
 )
 from aiperf.transports.http_defaults import AioHttpDefaults, SocketDefaults
-from aiperf.transports.sse_utils import AsyncSSEStreamReader
+from aiperf.transports.sse_utils import (
+    AsyncSSEStreamReader,
+    SSEEvent,
+    add_sse_events_to_record,
+)
 
 
 class AioHttpClient(AIPerfLoggerMixin):
@@ -34,13 +42,61 @@ class AioHttpClient(AIPerfLoggerMixin):
         super().__init__(**kwargs)
         self.tcp_connector = create_tcp_connector(**tcp_kwargs or {})
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.trace_timings = Environment.HTTP.TRACE_TIMINGS
+        # NOTE: The session is created lazily, as it must be created inside a running event loop.
+        self.session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the long-lived ClientSession, creating it on first use.
+
+        The session is shared by all requests made through this client, so that the
+        per-request cost is limited to building the request itself. Headers are passed
+        per-request, and cookies are never persisted between requests.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self.tcp_connector,
+                timeout=self.timeout,
+                skip_auto_headers=AioHttpDefaults.SKIP_AUTO_HEADERS,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                connector_owner=False,
+                trace_configs=[create_trace_config()] if self.trace_timings else None,
+            )
+        return self.session
 
     async def close(self) -> None:
         """Close the client."""
+        if self.session:
+            await self.session.close()
+            self.session = None
         if self.tcp_connector:
             await self.tcp_connector.close()
             self.tcp_connector = None
 
+    async def prewarm_connections(
+        self, url: str, num_connections: int
+    ) -> list[BaseException]:
+        """Open num_connections keep-alive connections to the server, and leave them in the connection pool.
+
+        The connections are opened concurrently with lightweight HEAD requests, which forces a separate
+        connection (including any TLS handshake) per request, and validates that the server is responding.
+        Any HTTP status is accepted, as only the connection itself is being validated.
+
+        Returns:
+            The exceptions for each connection that could not be opened.
+        """
+        session = self._get_session()
+
+        async def _open_connection() -> None:
+            async with session.head(url, allow_redirects=False) as response:
+                await response.read()
+
+        results = await asyncio.gather(
+            *[_open_connection() for _ in range(num_connections)],
+            return_exceptions=True,
+        )
+        return [result for result in results if isinstance(result, BaseException)]
+
     async def _request(
         self,
         method: str,
@@ -67,55 +123,53 @@ class AioHttpClient(AIPerfLoggerMixin):
             start_perf_ns=time.perf_counter_ns(),
         )
 
+        if self.trace_timings:
+            record.http_trace = HttpTraceTimings()
+            kwargs["trace_request_ctx"] = record.http_trace
+
         try:
             # Make raw HTTP request with precise timing using aiohttp
-            async with aiohttp.ClientSession(
-                connector=self.tcp_connector,
-                timeout=self.timeout,
-                headers=headers,
-                skip_auto_headers=[
-                    *list(headers.keys()),
-                    "User-Agent",
-                    "Accept-Encoding",
-                ],
-                connector_owner=False,
-            ) as session:
-                record.start_perf_ns = time.perf_counter_ns()
-                async with session.request(
-                    method, url, data=data, headers=headers, **kwargs
-                ) as response:
-                    record.status = response.status
-                    # Check for HTTP errors
-                    if response.status != 200:
-                        error_text = await response.text()
-                        record.error = ErrorDetails(
-                            code=response.status,
-                            type=response.reason,
-                            message=error_text,
-                        )
-                        return record
-
-                    record.recv_start_perf_ns = time.perf_counter_ns()
-
-                    if (
-                        method == "POST"
-                        and response.content_type == "text/event-stream"
-                    ):
-                        # Parse SSE stream with optimal performance
-                        async for message in AsyncSSEStreamReader(response.content):
-                            AsyncSSEStreamReader.inspect_message_for_error(message)
-                            record.responses.append(message)
-                    else:
-                        raw_response = await response.text()
-                        record.end_perf_ns = time.perf_counter_ns()
-                        record.responses.append(
-                            TextResponse(
-                                perf_ns=record.end_perf_ns,
-                                content_type=response.content_type,
-                                text=raw_response,
-                            )
-                        )
+            session = self._get_session()
+            record.start_perf_ns = time.perf_counter_ns()
+            async with session.request(
+                method, url, data=data, headers=headers, **kwargs
+            ) as response:
+                record.status = response.status
+                # Check for HTTP errors
+                if response.status != 200:
+                    error_text = await response.text()
+                    record.error = ErrorDetails(
+                        code=response.status,
+                        type=response.reason,
+                        message=error_text,
+                    )
+                    return record
+
+                record.recv_start_perf_ns = time.perf_counter_ns()
+
+                if method == "POST" and response.content_type == "text/event-stream":
+                    # Parse SSE stream with optimal performance. Only lightweight event tuples are created
+                    # while receiving, and they are stored in the record once the stream is complete.
+                    events: list[SSEEvent] = []
+                    try:
+                        async for event in AsyncSSEStreamReader(
+                            response.content
+                        ).iter_events():
+                            AsyncSSEStreamReader.inspect_event_for_error(event)
+                            events.append(event)
+                    finally:
+                        add_sse_events_to_record(record, events)
+                else:
+                    raw_response = await response.text()
                     record.end_perf_ns = time.perf_counter_ns()
+                    record.responses.append(
+                        TextResponse(
+                            perf_ns=record.end_perf_ns,
+                            content_type=response.content_type,
+                            text=raw_response,
+                        )
+                    )
+                record.end_perf_ns = time.perf_counter_ns()
         except SSEResponseError as e:
             record.end_perf_ns = time.perf_counter_ns()
             self.error(f"Error in SSE response: {e!r}")
@@ -168,3 +222,39 @@ def create_tcp_connector(**kwargs) -> aiohttp.TCPConnector:
     return aiohttp.TCPConnector(
         **default_kwargs,
     )
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Create a TraceConfig that records the connection level timestamps of each request.
+
+    The timestamps are written to the HttpTraceTimings object passed to the request as
+    its trace_request_ctx. Requests without one (such as pre-warm requests) are ignored.
+    """
+
+    def _set_timestamp(field: str):
+        async def _on_event(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            if ctx.trace_request_ctx is not None:
+                setattr(ctx.trace_request_ctx, field, time.perf_counter_ns())
+
+        return _on_event
+
+    trace_config = aiohttp.TraceConfig()
+    for signal, field in (
+        (trace_config.on_request_start, "request_start_perf_ns"),
+        (trace_config.on_connection_queued_start, "connection_queued_start_perf_ns"),
+        (trace_config.on_connection_queued_end, "connection_queued_end_perf_ns"),
+        (trace_config.on_connection_create_start, "connection_create_start_perf_ns"),
+        (trace_config.on_connection_create_end, "connection_create_end_perf_ns"),
+        (trace_config.on_connection_reuseconn, "connection_reused_perf_ns"),
+        (trace_config.on_dns_resolvehost_start, "dns_resolve_start_perf_ns"),
+        (trace_config.on_dns_resolvehost_end, "dns_resolve_end_perf_ns"),
+        (trace_config.on_request_headers_sent, "request_headers_sent_perf_ns"),
+        # NOTE: This fires for every chunk of the body, so the last chunk wins.
+        (trace_config.on_request_chunk_sent, "request_body_sent_perf_ns"),
+        # NOTE: aiohttp ends the request once the response status line and headers are received.
+        (trace_config.on_request_end, "response_start_perf_ns"),
+    ):
+        signal.append(_set_timestamp(field))
+    return trace_config
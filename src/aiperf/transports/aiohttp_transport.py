@@ -13,17 +13,22 @@ from aiperf.common.enums import TransportType
 from aiperf.common.exceptions import NotInitializedError
 from aiperf.common.factories import TransportFactory
 from aiperf.common.hooks import on_init, on_stop
-from aiperf.common.models import ErrorDetails, RequestInfo, RequestRecord
+from aiperf.common.models import (
+    ErrorDetails,
+    RequestInfo,
+    RequestRecord,
+)
 from aiperf.transports.aiohttp_client import AioHttpClient
-from aiperf.transports.base_transports import BaseTransport, TransportMetadata
+from aiperf.transports.base_transports import BaseHTTPTransport, TransportMetadata
 
 
 @TransportFactory.register(TransportType.HTTP)
-class AioHttpTransport(BaseTransport):
+class AioHttpTransport(BaseHTTPTransport):
     """HTTP/1.1 transport implementation using aiohttp.
 
     Provides high-performance async HTTP client with:
     - Connection pooling and TCP optimization
+    - A long-lived client session, with per-request headers only
     - SSE (Server-Sent Events) streaming support
     - Automatic error handling and timing
     - Custom TCP connector configuration
@@ -40,7 +45,7 @@ class AioHttpTransport(BaseTransport):
         """
         super().__init__(**kwargs)
         self.tcp_kwargs = tcp_kwargs
-        self.aiohttp_client = None
+        self.aiohttp_client: AioHttpClient | None = None
 
     @on_init
     async def _init_aiohttp_client(self) -> None:
@@ -64,75 +69,19 @@ class AioHttpTransport(BaseTransport):
             url_schemes=["http", "https"],
         )
 
-    def get_transport_headers(self, request_info: RequestInfo) -> dict[str, str]:
-        """Build HTTP-specific headers based on streaming mode.
-
-        Args:
-            request_info: Request context with endpoint configuration
-
-        Returns:
-            HTTP headers (Content-Type and Accept)
-        """
-        accept = (
-            "text/event-stream"
-            if request_info.model_endpoint.endpoint.streaming
-            else "application/json"
-        )
-        return {"Content-Type": "application/json", "Accept": accept}
-
-    def get_url(self, request_info: RequestInfo) -> str:
-        """Build HTTP URL from base_url and endpoint path.
-
-        Constructs the full URL by combining the base URL with the endpoint path
-        from metadata or custom endpoint. Adds http:// scheme if missing.
-
-        Args:
-            request_info: Request context with model endpoint info
-
-        Returns:
-            Complete HTTP URL with scheme and endpoint path
-        """
-        endpoint_info = request_info.model_endpoint.endpoint
-
-        # Start with base URL
-        base_url = endpoint_info.base_url.rstrip("/")
-
-        # Determine the endpoint path
-        if endpoint_info.custom_endpoint:
-            # Use custom endpoint path if provided
-            path = endpoint_info.custom_endpoint.lstrip("/")
-            url = f"{base_url}/{path}"
-        else:
-            # Get endpoint path from endpoint metadata
-            from aiperf.common.factories import EndpointFactory
-
-            endpoint_metadata = EndpointFactory.get_metadata(endpoint_info.type)
-            endpoint_path = endpoint_metadata.endpoint_path
-            if (
-                self.model_endpoint.endpoint.streaming
-                and endpoint_metadata.streaming_path is not None
-            ):
-                endpoint_path = endpoint_metadata.streaming_path
-            if not endpoint_path:
-                # No endpoint path, just use base URL
-                url = base_url
-
-            else:
-                path = endpoint_path.lstrip("/")
-                # Handle /v1 base URL with v1/ path prefix to avoid duplication
-                if base_url.endswith("/v1") and path.startswith("v1/"):
-                    path = path.removeprefix("v1/")
-                url = f"{base_url}/{path}"
-        return url if url.startswith("http") else f"http://{url}"
+    @property
+    def http_client(self) -> AioHttpClient | None:
+        """The underlying AioHttpClient, or None if the transport is not initialized."""
+        return self.aiohttp_client
 
     async def send_request(
-        self, request_info: RequestInfo, payload: dict[str, Any]
+        self, request_info: RequestInfo, payload: dict[str, Any] | str
     ) -> RequestRecord:
         """Send HTTP POST request with JSON payload.
 
         Args:
             request_info: Request context and metadata
-            payload: JSON-serializable request payload
+            payload: JSON-serializable request payload, or an already serialized JSON string
 
         Returns:
             Request record with responses, timing, and any errors
@@ -149,7 +98,11 @@ class AioHttpTransport(BaseTransport):
             headers = self.build_headers(request_info)
 
             # Serialize with orjson for performance
-            json_str = orjson.dumps(payload).decode("utf-8")
+            json_str = (
+                payload
+                if isinstance(payload, str)
+                else orjson.dumps(payload).decode("utf-8")
+            )
 
             record = await self.aiohttp_client.post_request(url, json_str, headers)
             record.request_headers = headers
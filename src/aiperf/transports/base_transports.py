@@ -3,11 +3,19 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from typing import Protocol
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from aiperf.common.exceptions import NotInitializedError
 from aiperf.common.mixins import AIPerfLifecycleMixin
-from aiperf.common.models import RequestInfo, RequestRecord, TransportMetadata
+from aiperf.common.models import (
+    ConnectionPrewarmStats,
+    RequestInfo,
+    RequestRecord,
+    TransportMetadata,
+)
 from aiperf.common.models.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.types import RequestInputT
 
@@ -113,6 +121,20 @@ class BaseTransport(AIPerfLifecycleMixin, ABC):
         """
         ...
 
+    async def prewarm_connections(self, num_connections: int) -> ConnectionPrewarmStats:
+        """Open and validate keep-alive connections to the server ahead of time, so that the
+        first requests do not pay for connection setup inside their measured latency.
+
+        Transports that do not pool connections have nothing to pre-warm, which is the default.
+
+        Args:
+            num_connections: Number of connections to open
+
+        Returns:
+            Stats for how many connections were opened, failed, and how long it took
+        """
+        return ConnectionPrewarmStats()
+
     @abstractmethod
     async def send_request(
         self, request_info: RequestInfo, payload: RequestInputT
@@ -127,3 +149,110 @@ class BaseTransport(AIPerfLifecycleMixin, ABC):
             Record containing responses, timing, and any errors
         """
         ...
+
+
+class PrewarmableHTTPClient(Protocol):
+    """An HTTP client which can open keep-alive connections to a URL ahead of time."""
+
+    async def prewarm_connections(
+        self, url: str, num_connections: int
+    ) -> list[BaseException]: ...
+
+
+class BaseHTTPTransport(BaseTransport, ABC):
+    """Base class for HTTP transport implementations.
+
+    Provides the HTTP-specific URL construction, headers and connection pre-warming
+    that are shared by all HTTP client implementations.
+    """
+
+    @property
+    @abstractmethod
+    def http_client(self) -> PrewarmableHTTPClient | None:
+        """The underlying HTTP client, or None if the transport is not initialized."""
+        ...
+
+    async def prewarm_connections(self, num_connections: int) -> ConnectionPrewarmStats:
+        """Open and validate keep-alive connections to the endpoint URL ahead of time.
+
+        Args:
+            num_connections: Number of connections to open
+
+        Returns:
+            Stats for how many connections were opened, failed, and how long it took
+        """
+        client = self.http_client
+        if client is None:
+            raise NotInitializedError(
+                f"{self.__class__.__name__} not initialized. Call initialize() before prewarm_connections()."
+            )
+
+        url = self.build_url(RequestInfo(model_endpoint=self.model_endpoint, turns=[]))
+        start_perf_ns = time.perf_counter_ns()
+        errors = await client.prewarm_connections(url, num_connections)
+        return ConnectionPrewarmStats.from_errors(
+            requested=num_connections,
+            errors=errors,
+            duration_ns=time.perf_counter_ns() - start_perf_ns,
+        )
+
+    def get_transport_headers(self, request_info: RequestInfo) -> dict[str, str]:
+        """Build HTTP-specific headers based on streaming mode.
+
+        Args:
+            request_info: Request context with endpoint configuration
+
+        Returns:
+            HTTP headers (Content-Type and Accept)
+        """
+        accept = (
+            "text/event-stream"
+            if request_info.model_endpoint.endpoint.streaming
+            else "application/json"
+        )
+        return {"Content-Type": "application/json", "Accept": accept}
+
+    def get_url(self, request_info: RequestInfo) -> str:
+        """Build HTTP URL from base_url and endpoint path.
+
+        Constructs the full URL by combining the base URL with the endpoint path
+        from metadata or custom endpoint. Adds http:// scheme if missing.
+
+        Args:
+            request_info: Request context with model endpoint info
+
+        Returns:
+            Complete HTTP URL with scheme and endpoint path
+        """
+        endpoint_info = request_info.model_endpoint.endpoint
+
+        # Start with base URL
+        base_url = endpoint_info.base_url.rstrip("/")
+
+        # Determine the endpoint path
+        if endpoint_info.custom_endpoint:
+            # Use custom endpoint path if provided
+            path = endpoint_info.custom_endpoint.lstrip("/")
+            url = f"{base_url}/{path}"
+        else:
+            # Get endpoint path from endpoint metadata
+            from aiperf.common.factories import EndpointFactory
+
+            endpoint_metadata = EndpointFactory.get_metadata(endpoint_info.type)
+            endpoint_path = endpoint_metadata.endpoint_path
+            if (
+                self.model_endpoint.endpoint.streaming
+                and endpoint_metadata.streaming_path is not None
+            ):
+                endpoint_path = endpoint_metadata.streaming_path
+            if not endpoint_path:
+                # No endpoint path, just use base URL
+                url = base_url
+
+            else:
+                path = endpoint_path.lstrip("/")
+                # Handle /v1 base URL with v1/ path prefix to avoid duplication
+                if base_url.endswith("/v1") and path.startswith("v1/"):
+                    path = path.removeprefix("v1/")
+                url = f"{base_url}/{path}"
+        return url if url.startswith("http") else f"http://{url}"
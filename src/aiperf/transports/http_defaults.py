@@ -75,6 +75,10 @@ class AioHttpDefaults:
     KEEPALIVE_TIMEOUT = Environment.HTTP.KEEPALIVE_TIMEOUT  # Keepalive timeout
     HAPPY_EYEBALLS_DELAY = None  # Happy eyeballs delay (None = disabled)
     SOCKET_FAMILY = socket.AF_INET  # Family of the socket (IPv4)
+    SKIP_AUTO_HEADERS = (
+        "User-Agent",
+        "Accept-Encoding",
+    )  # Headers aiohttp should not add automatically (sent explicitly per-request instead)
 
     @classmethod
     def get_default_kwargs(cls) -> dict[str, Any]:
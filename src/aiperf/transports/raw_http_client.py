@@ -0,0 +1,586 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import socket
+import ssl
+import time
+from collections import deque
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiperf.common.environment import Environment
+from aiperf.common.exceptions import SSEResponseError
+from aiperf.common.mixins import AIPerfLoggerMixin
+from aiperf.common.models import (
+    ErrorDetails,
+    RequestRecord,
+    TextResponse,
+)
+from aiperf.transports.http_defaults import SocketDefaults
+from aiperf.transports.sse_utils import (
+    AsyncSSEStreamReader,
+    SSEEvent,
+    SSEStreamParser,
+    add_sse_events_to_record,
+)
+
+_CRLF = b"\r\n"
+_HEADERS_END = b"\r\n\r\n"
+# Headers written by the client itself, which replace any caller headers of the same name
+_GENERATED_HEADERS = frozenset({"host", "content-length"})
+
+
+class RawHttpProtocolError(Exception):
+    """Raised when the server sends a response that cannot be parsed as HTTP/1.1."""
+
+
+class RawHttpDisconnectedError(ConnectionError):
+    """Raised when the server closes the connection before the response is complete."""
+
+
+class RawHttpResponse:
+    """The parsed response of a single request made over a RawHttpConnection."""
+
+    __slots__ = (
+        "status",
+        "reason",
+        "headers",
+        "content_type",
+        "recv_start_perf_ns",
+        "end_perf_ns",
+        "body",
+        "events",
+        "error",
+    )
+
+    def __init__(self) -> None:
+        self.status: int = 0
+        self.reason: str = ""
+        self.headers: dict[str, str] = {}
+        self.content_type: str = ""
+        self.recv_start_perf_ns: int | None = None
+        self.end_perf_ns: int | None = None
+        self.body = bytearray()
+        self.events: list[SSEEvent] = []
+        self.error: SSEResponseError | None = None
+
+    @property
+    def text(self) -> str:
+        """Decode the (non-SSE) response body."""
+        return self.body.decode("utf-8", errors="replace")
+
+
+class RawHttpConnection(asyncio.Protocol):
+    """A single keep-alive HTTP/1.1 connection which parses the response inside data_received.
+
+    The response is parsed incrementally as bytes arrive, without any intermediate stream readers:
+        - The status line and headers are parsed once the header block is complete.
+        - The body is de-chunked (Transfer-Encoding: chunked), length-delimited (Content-Length),
+          or read until the connection is closed.
+        - For text/event-stream responses, the body is split into SSE messages as soon as each
+          message delimiter arrives. Every message completed within a single read is stamped
+          with the perf_counter_ns taken at the start of that read.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self.transport: asyncio.Transport | None = None
+        self.closed = False
+        self.idle_since: float = time.monotonic()
+        self._waiter: asyncio.Future[RawHttpResponse] | None = None
+        self._response: RawHttpResponse | None = None
+        self._buffer = bytearray()
+        self._sse_parser = SSEStreamParser()
+        self._received_any = False
+        self._reset_body_state()
+
+    def _reset_body_state(self) -> None:
+        self._headers_done = False
+        self._is_sse = False
+        self._chunked = False
+        self._chunk_remaining = 0
+        self._chunk_trailers = False
+        self._content_remaining: int | None = None
+        self._keep_alive = True
+
+    # asyncio.Protocol callbacks
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.closed = True
+        if self._waiter is None or self._waiter.done():
+            return
+        # Servers without Content-Length or chunked encoding signal the end of the body by closing
+        if self._headers_done and not self._chunked and self._content_remaining is None:
+            self._finish(time.perf_counter_ns())
+            return
+        self._waiter.set_exception(
+            exc
+            or RawHttpDisconnectedError(
+                "Server disconnected before the response was complete"
+            )
+        )
+
+    def data_received(self, data: bytes) -> None:
+        # Capture the timestamp as soon as the read arrives, for accurate TTFT and ICL measurements
+        perf_ns = time.perf_counter_ns()
+        if self._waiter is None or self._waiter.done():
+            # Unsolicited data on an idle connection, the connection can no longer be trusted
+            self.close()
+            return
+        self._received_any = True
+        try:
+            self._buffer += data
+            if not self._headers_done and not self._parse_headers(perf_ns):
+                return
+            self._parse_body(perf_ns)
+            if self._response.error is not None:  # type: ignore[union-attr]
+                self.close()
+        except Exception as e:
+            self._waiter.set_exception(e)
+            self.close()
+
+    # Request handling
+
+    def send_request(self, request: bytes) -> asyncio.Future[RawHttpResponse]:
+        """Write the request bytes and return a future that resolves with the full response."""
+        if self.closed or self.transport is None:
+            raise RawHttpDisconnectedError("Connection is closed")
+        self._response = RawHttpResponse()
+        self._buffer.clear()
+        self._sse_parser = SSEStreamParser()
+        self._received_any = False
+        self._reset_body_state()
+        self._waiter = self._loop.create_future()
+        self.transport.write(request)
+        return self._waiter
+
+    @property
+    def received_any(self) -> bool:
+        """Whether any bytes of the current response have been received."""
+        return self._received_any
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the connection can be returned to the pool for another request."""
+        return not self.closed and self._keep_alive
+
+    def close(self) -> None:
+        self.closed = True
+        if self.transport is not None:
+            self.transport.close()
+
+    # Parsing
+
+    def _parse_headers(self, perf_ns: int) -> bool:
+        """Parse the status line and headers. Returns True once the header block is complete."""
+        while True:
+            end = self._buffer.find(_HEADERS_END)
+            if end == -1:
+                return False
+
+            lines = bytes(self._buffer[:end]).decode("latin-1").split("\r\n")
+            del self._buffer[: end + len(_HEADERS_END)]
+
+            parts = lines[0].split(" ", 2)
+            if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+                raise RawHttpProtocolError(f"Invalid HTTP status line: {lines[0]!r}")
+            status = int(parts[1])
+            if 100 <= status < 200:
+                # Skip informational responses (e.g. 100 Continue), the real response follows
+                continue
+
+            response = self._response
+            response.status = status  # type: ignore[union-attr]
+            response.reason = parts[2] if len(parts) > 2 else ""  # type: ignore[union-attr]
+            headers = response.headers  # type: ignore[union-attr]
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            response.content_type = (  # type: ignore[union-attr]
+                headers.get("content-type", "").split(";", 1)[0].strip().lower()
+            )
+            response.recv_start_perf_ns = perf_ns  # type: ignore[union-attr]
+
+            self._keep_alive = (
+                parts[0] != "HTTP/1.0"
+                and headers.get("connection", "").lower() != "close"
+            )
+            self._is_sse = status == 200 and (
+                response.content_type == "text/event-stream"  # type: ignore[union-attr]
+            )
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                self._chunked = True
+            elif "content-length" in headers:
+                self._content_remaining = int(headers["content-length"])
+            elif status in (204, 304):
+                self._content_remaining = 0
+            else:
+                # Body is delimited by the connection closing
+                self._keep_alive = False
+            self._headers_done = True
+            return True
+
+    def _parse_body(self, perf_ns: int) -> None:
+        if self._chunked:
+            self._parse_chunked(perf_ns)
+        elif self._content_remaining is not None:
+            data = self._buffer[: self._content_remaining]
+            del self._buffer[: len(data)]
+            self._content_remaining -= len(data)
+            self._on_body(data, perf_ns)
+            if self._content_remaining == 0:
+                self._finish(perf_ns)
+        else:
+            self._on_body(self._buffer, perf_ns)
+            self._buffer.clear()
+
+    def _parse_chunked(self, perf_ns: int) -> None:
+        buffer = self._buffer
+        while buffer:
+            if self._chunk_trailers:
+                # Consume optional trailers up until the final empty line
+                if buffer.startswith(_CRLF):
+                    del buffer[:2]
+                    self._finish(perf_ns)
+                    return
+                end = buffer.find(_HEADERS_END)
+                if end == -1:
+                    return
+                del buffer[: end + len(_HEADERS_END)]
+                self._finish(perf_ns)
+                return
+
+            if self._chunk_remaining == 0:
+                end = buffer.find(_CRLF)
+                if end == -1:
+                    return
+                size_line = bytes(buffer[:end]).split(b";", 1)[0].strip()
+                del buffer[: end + 2]
+                if not size_line:
+                    # The CRLF that terminates the previous chunk's data
+                    continue
+                size = int(size_line, 16)
+                if size == 0:
+                    self._chunk_trailers = True
+                    continue
+                self._chunk_remaining = size
+
+            data = buffer[: self._chunk_remaining]
+            del buffer[: len(data)]
+            self._chunk_remaining -= len(data)
+            self._on_body(data, perf_ns)
+
+    def _on_body(self, data: bytes | bytearray, perf_ns: int) -> None:
+        if not data or self._waiter.done():  # type: ignore[union-attr]
+            # The response has already been ended by an error event in the stream
+            return
+        if not self._is_sse:
+            self._response.body += data  # type: ignore[union-attr]
+            return
+
+        for event in self._sse_parser.feed(data, perf_ns):
+            if not self._on_sse_event(event, perf_ns):
+                return
+
+    def _on_sse_event(self, event: SSEEvent, perf_ns: int) -> bool:
+        """Add the event to the response. Returns False if the stream contained an error and was ended."""
+        try:
+            AsyncSSEStreamReader.inspect_event_for_error(event)
+        except SSEResponseError as e:
+            # Stop reading the stream, but keep the events received so far (as the aiohttp client does). The
+            # rest of the stream is never read, so the connection cannot be reused.
+            self._response.error = e  # type: ignore[union-attr]
+            self._keep_alive = False
+            self._response.end_perf_ns = perf_ns  # type: ignore[union-attr]
+            self._waiter.set_result(self._response)  # type: ignore[union-attr]
+            return False
+        self._response.events.append(event)  # type: ignore[union-attr]
+        return True
+
+    def _finish(self, perf_ns: int) -> None:
+        if self._waiter.done():  # type: ignore[union-attr]
+            return
+        # Some servers don't send the final delimiter
+        if (
+            self._is_sse
+            and (event := self._sse_parser.flush(perf_ns))
+            and not self._on_sse_event(event, perf_ns)
+        ):
+            return
+        self._response.end_perf_ns = perf_ns  # type: ignore[union-attr]
+        self._waiter.set_result(self._response)  # type: ignore[union-attr]
+        self.idle_since = time.monotonic()
+
+
+class RawHttpClient(AIPerfLoggerMixin):
+    """A lean HTTP/1.1 client built directly on asyncio protocols, optimized for measuring streaming responses.
+
+    Compared to AioHttpClient, there are no intermediate stream readers or session objects: each connection
+    is an asyncio.Protocol that de-chunks and splits SSE messages as bytes arrive, and idle keep-alive
+    connections are kept in a simple per-host pool.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        limit: int | None = None,
+        keepalive_timeout: float | None = None,
+        ttl_dns_cache: float | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the RawHttpClient."""
+        super().__init__(**kwargs)
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout or Environment.HTTP.KEEPALIVE_TIMEOUT
+        self._limit = limit or Environment.HTTP.CONNECTION_LIMIT
+        self._semaphore: asyncio.Semaphore | None = None
+        self.ttl_dns_cache = ttl_dns_cache or Environment.HTTP.TTL_DNS_CACHE
+        self._idle: dict[tuple[str, int, bool], deque[RawHttpConnection]] = {}
+        # (host, port) -> (address info, monotonic expiry time)
+        self._addr_cache: dict[tuple[str, int], tuple[tuple, float]] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+        self._closed = False
+
+    async def close(self) -> None:
+        """Close the client and all idle connections."""
+        self._closed = True
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+    async def _resolve(self, host: str, port: int) -> tuple:
+        """Resolve the host to a socket address, caching the result for ttl_dns_cache seconds."""
+        key = (host, port)
+        now = time.monotonic()
+        cached = self._addr_cache.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, family=socket.AF_INET, type=socket.SOCK_STREAM
+        )
+        if not infos:
+            raise OSError(f"Unable to resolve host {host}:{port}")
+        self._addr_cache[key] = (infos[0], now + self.ttl_dns_cache)
+        return infos[0]
+
+    async def _connect(self, host: str, port: int, use_ssl: bool) -> RawHttpConnection:
+        """Open a new connection, applying the same socket options as the aiohttp transport."""
+        loop = asyncio.get_running_loop()
+        family, sock_type, proto, _, addr = await self._resolve(host, port)
+        sock = socket.socket(family=family, type=sock_type, proto=proto)
+        try:
+            SocketDefaults.apply_to_socket(sock)
+            sock.setblocking(False)
+            await loop.sock_connect(sock, addr)
+            if use_ssl and self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            _, connection = await loop.create_connection(
+                lambda: RawHttpConnection(loop),
+                sock=sock,
+                ssl=self._ssl_context if use_ssl else None,
+                server_hostname=host if use_ssl else None,
+            )
+        except BaseException:
+            sock.close()
+            raise
+        return connection
+
+    async def _acquire(
+        self, host: str, port: int, use_ssl: bool
+    ) -> tuple[RawHttpConnection, bool]:
+        """Get an idle keep-alive connection from the pool, or open a new one.
+
+        Returns:
+            The connection, and whether it was reused from the pool.
+        """
+        idle = self._idle.get((host, port, use_ssl))
+        now = time.monotonic()
+        while idle:
+            connection = idle.pop()
+            if connection.closed:
+                continue
+            if now - connection.idle_since > self.keepalive_timeout:
+                connection.close()
+                continue
+            return connection, True
+        return await self._connect(host, port, use_ssl), False
+
+    def _release(
+        self, key: tuple[str, int, bool], connection: RawHttpConnection
+    ) -> None:
+        """Return a connection to the pool if it can be reused, otherwise close it."""
+        if connection.reusable and not self._closed:
+            self._idle.setdefault(key, deque()).append(connection)
+        else:
+            connection.close()
+
+    @staticmethod
+    def _build_request(
+        method: str, target: str, host: str, headers: dict[str, str], body: bytes
+    ) -> bytes:
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+        lines.extend(
+            f"{name}: {value}"
+            for name, value in headers.items()
+            if name.lower() not in _GENERATED_HEADERS
+        )
+        lines.append(f"Content-Length: {len(body)}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + body
+
+    @staticmethod
+    def _pool_key(url: str) -> tuple[str, int, bool]:
+        """Get the (host, port, use_ssl) connection pool key for a URL."""
+        parsed = urlsplit(url)
+        use_ssl = parsed.scheme == "https"
+        return (
+            parsed.hostname or "localhost",
+            parsed.port or (443 if use_ssl else 80),
+            use_ssl,
+        )
+
+    async def prewarm_connections(
+        self, url: str, num_connections: int
+    ) -> list[BaseException]:
+        """Open num_connections keep-alive connections to the server, and add them to the idle connection pool.
+
+        Returns:
+            The exceptions for each connection that could not be opened.
+        """
+        key = self._pool_key(url)
+        results = await asyncio.gather(
+            *[self._connect(*key) for _ in range(num_connections)],
+            return_exceptions=True,
+        )
+        errors: list[BaseException] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                self._release(key, result)
+        return errors
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+        record: RequestRecord,
+    ) -> RawHttpResponse:
+        parsed = urlsplit(url)
+        key = host, port, use_ssl = self._pool_key(url)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        request = self._build_request(method, target, parsed.netloc, headers, body)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._limit)
+
+        # Stamped before waiting for a connection, as in the aiohttp client, so that the pool wait and the
+        # TCP/TLS connect are included in the latency
+        record.start_perf_ns = time.perf_counter_ns()
+        async with self._semaphore:
+            # Retry once if a pooled keep-alive connection was closed by the server while idle
+            for attempt in range(2):
+                connection, reused = await self._acquire(host, port, use_ssl)
+                try:
+                    response = await connection.send_request(request)
+                except RawHttpDisconnectedError:
+                    connection.close()
+                    if reused and attempt == 0 and not connection.received_any:
+                        self.debug(
+                            "Pooled connection was closed by the server, retrying"
+                        )
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                self._release(key, connection)
+                return response
+        raise RawHttpDisconnectedError("Unable to send request")  # pragma: no cover
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: str | None = None,
+    ) -> RequestRecord:
+        """Send a request and convert the response into a RequestRecord."""
+        self.debug(lambda: f"Sending {method} request to {url}")
+
+        record: RequestRecord = RequestRecord(
+            start_perf_ns=time.perf_counter_ns(),
+        )
+        body = data.encode("utf-8") if data else b""
+        response: RawHttpResponse | None = None
+
+        try:
+            send = self._send(method, url, headers, body, record)
+            response = (
+                await asyncio.wait_for(send, timeout=self.timeout)
+                if self.timeout
+                else await send
+            )
+            record.status = response.status
+            if response.status != 200:
+                record.error = ErrorDetails(
+                    code=response.status,
+                    type=response.reason,
+                    message=response.text,
+                )
+                return record
+
+            record.recv_start_perf_ns = response.recv_start_perf_ns
+            if response.events:
+                add_sse_events_to_record(record, response.events)
+            if response.error is not None:
+                raise response.error
+            elif response.content_type != "text/event-stream":
+                record.responses.append(
+                    TextResponse(
+                        perf_ns=response.end_perf_ns,  # type: ignore[arg-type]
+                        content_type=response.content_type,
+                        text=response.text,
+                    )
+                )
+            record.end_perf_ns = time.perf_counter_ns()
+        except SSEResponseError as e:
+            record.end_perf_ns = time.perf_counter_ns()
+            self.error(f"Error in SSE response: {e!r}")
+            record.error = ErrorDetails.from_exception(e)
+        except Exception as e:
+            record.end_perf_ns = time.perf_counter_ns()
+            self.error(f"Error in raw HTTP request: {e!r}")
+            record.error = ErrorDetails.from_exception(e)
+
+        return record
+
+    async def post_request(
+        self,
+        url: str,
+        payload: str,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Send a streaming or non-streaming POST request to the specified URL with the given payload and headers.
+
+        If the response is an SSE stream, the response will be parsed into a list of SSE messages.
+        Otherwise, the response will be parsed into a TextResponse object.
+        """
+        return await self._request("POST", url, headers, data=payload)
+
+    async def get_request(
+        self, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> RequestRecord:
+        """Send a GET request to the specified URL with the given headers.
+
+        The response will be parsed into a TextResponse object.
+        """
+        return await self._request("GET", url, headers)
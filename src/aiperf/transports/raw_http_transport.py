@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import orjson
+
+from aiperf.common.enums import TransportType
+from aiperf.common.exceptions import NotInitializedError
+from aiperf.common.factories import TransportFactory
+from aiperf.common.hooks import on_init, on_stop
+from aiperf.common.models import (
+    ErrorDetails,
+    RequestInfo,
+    RequestRecord,
+)
+from aiperf.transports.base_transports import BaseHTTPTransport, TransportMetadata
+from aiperf.transports.raw_http_client import RawHttpClient
+
+
+@TransportFactory.register(TransportType.RAW_HTTP)
+class RawHttpTransport(BaseHTTPTransport):
+    """HTTP/1.1 transport implementation using raw asyncio protocols.
+
+    A lower-overhead alternative to the aiohttp transport for high-concurrency streaming runs:
+    - Responses are parsed directly inside the protocol's data_received callback
+    - SSE messages are split and timestamped as each read arrives
+    - Simple per-host keep-alive connection pooling
+    - Same socket options, URL construction and headers as the aiohttp transport
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.raw_http_client: RawHttpClient | None = None
+
+    @on_init
+    async def _init_raw_http_client(self) -> None:
+        """Initialize the RawHttpClient."""
+        self.raw_http_client = RawHttpClient(
+            timeout=self.model_endpoint.endpoint.timeout
+        )
+
+    @on_stop
+    async def _close_raw_http_client(self) -> None:
+        """Cleanup hook to close all pooled connections on stop."""
+        if self.raw_http_client:
+            await self.raw_http_client.close()
+            self.raw_http_client = None
+
+    @classmethod
+    def metadata(cls) -> TransportMetadata:
+        """Return raw HTTP transport metadata."""
+        return TransportMetadata(
+            transport_type=TransportType.RAW_HTTP,
+            url_schemes=["http", "https"],
+        )
+
+    @property
+    def http_client(self) -> RawHttpClient | None:
+        """The underlying RawHttpClient, or None if the transport is not initialized."""
+        return self.raw_http_client
+
+    async def send_request(
+        self, request_info: RequestInfo, payload: dict[str, Any] | str
+    ) -> RequestRecord:
+        """Send HTTP POST request with JSON payload.
+
+        Args:
+            request_info: Request context and metadata
+            payload: JSON-serializable request payload, or an already serialized JSON string
+
+        Returns:
+            Request record with responses, timing, and any errors
+        """
+        if self.raw_http_client is None:
+            raise NotInitializedError(
+                "RawHttpTransport not initialized. Call initialize() before send_request()."
+            )
+
+        start_perf_ns = time.perf_counter_ns()
+        headers = None
+        try:
+            url = self.build_url(request_info)
+            headers = self.build_headers(request_info)
+
+            json_str = (
+                payload
+                if isinstance(payload, str)
+                else orjson.dumps(payload).decode("utf-8")
+            )
+
+            record = await self.raw_http_client.post_request(url, json_str, headers)
+            record.request_headers = headers
+
+        except Exception as e:
+            record = RequestRecord(
+                request_headers=headers or request_info.endpoint_headers,
+                start_perf_ns=start_perf_ns,
+                end_perf_ns=time.perf_counter_ns(),
+                error=ErrorDetails.from_exception(e),
+            )
+            self.exception(f"Raw HTTP request failed: {e!r}")
+
+        return record
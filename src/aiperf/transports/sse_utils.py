@@ -4,14 +4,122 @@
 
 import time
 from collections.abc import AsyncIterator
+from typing import NamedTuple
 
 from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.enums.sse_enums import SSEEventType, SSEFieldType
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import SSEResponseError
-from aiperf.common.models import SSEMessage
+from aiperf.common.models import RawResponseBuffer, RequestRecord, SSEMessage
 
 _logger = AIPerfLogger(__name__)
 
+_LF = 0x0A
+_CR = 0x0D
+
+
+class SSEEvent(NamedTuple):
+    """A single raw SSE message and the timestamp of the chunk it arrived in.
+
+    This is a compact, allocation-light representation of an SSE message. It is only converted
+    into a full SSEMessage model when needed, via to_message().
+    """
+
+    perf_ns: int
+    raw: bytes
+
+    def to_message(self) -> SSEMessage:
+        """Parse the raw bytes into an SSEMessage."""
+        return SSEMessage.parse(
+            self.raw.decode("utf-8", errors="replace"), self.perf_ns
+        )
+
+    @property
+    def may_be_error(self) -> bool:
+        """Cheap pre-check for whether this event could be an error event, without parsing it."""
+        return b"error" in self.raw
+
+
+def add_sse_events_to_record(record: RequestRecord, events: list[SSEEvent]) -> None:
+    """Store the received SSE events in the record.
+
+    If AIPERF_RECORD_RAW_RESPONSE_BUFFER is enabled, the events are stored as a single RawResponseBuffer,
+    which is decoded on demand by the record processors. Otherwise they are parsed into SSEMessages.
+    """
+    if Environment.RECORD.RAW_RESPONSE_BUFFER:
+        record.raw_responses = RawResponseBuffer.from_chunks(
+            events, content_type="text/event-stream"
+        )
+    else:
+        record.responses.extend(event.to_message() for event in events)
+
+
+class SSEStreamParser:
+    """Incremental parser that splits a stream of bytes into SSE messages.
+
+    Messages are delimited by a blank line. Both the spec-compliant "\r\n\r\n" and the lenient "\n\n"
+    delimiters are supported, and may be mixed within a single stream.
+
+    The parser keeps the position it has already scanned up to, so each byte is only scanned once
+    no matter how small the chunks are. Consumed bytes are trimmed from the buffer once per chunk
+    instead of once per message.
+    """
+
+    __slots__ = ("_buffer", "_scan_pos")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._scan_pos = 0
+
+    def feed(self, chunk: bytes, perf_ns: int) -> list[SSEEvent]:
+        """Add a chunk of bytes and return any SSE messages it completed, all stamped with perf_ns."""
+        buffer = self._buffer
+        buffer += chunk
+        size = len(buffer)
+        events: list[SSEEvent] = []
+        start = 0
+        pos = self._scan_pos
+
+        while (newline := buffer.find(b"\n", pos)) != -1:
+            # A message ends at a line feed immediately followed by a blank line ("\n" or "\r\n")
+            if newline + 1 >= size:
+                pos = newline
+                break
+            next_byte = buffer[newline + 1]
+            if next_byte == _LF:
+                end = newline + 2
+            elif next_byte == _CR:
+                if newline + 2 >= size:
+                    pos = newline
+                    break
+                if buffer[newline + 2] != _LF:
+                    pos = newline + 1
+                    continue
+                end = newline + 3
+            else:
+                pos = newline + 1
+                continue
+
+            if raw := bytes(buffer[start:newline]).strip():
+                events.append(SSEEvent(perf_ns, raw))
+            elif _logger.is_debug_enabled:
+                _logger.debug(f"Skipping empty SSE message at chunk {perf_ns}")
+            start = pos = end
+        else:
+            pos = size
+
+        if start:
+            del buffer[:start]
+        self._scan_pos = pos - start
+        return events
+
+    def flush(self, perf_ns: int) -> SSEEvent | None:
+        """Return any remaining buffered data as a final message, for servers that don't send the final delimiter."""
+        raw = bytes(self._buffer).strip()
+        self._buffer.clear()
+        self._scan_pos = 0
+        return SSEEvent(perf_ns, raw) if raw else None
+
 
 class AsyncSSEStreamReader:
     """Parse Server-Sent Events (SSE) stream with per-message timestamps.
@@ -35,9 +143,9 @@ class AsyncSSEStreamReader:
 
     Parsing Strategy:
         1. Read response in chunks
-        2. Accumulate chunks in buffer until delimiter found (\r\n\r\n or \n\n)
-        3. Parse complete message using SSEMessage.parse()
-        4. Timestamp message at arrival time
+        2. Feed chunks to an SSEStreamParser, which scans each byte only once for a delimiter (\r\n\r\n or \n\n)
+        3. Timestamp message at arrival time, as a lightweight SSEEvent tuple
+        4. Parse complete message using SSEMessage.parse() (or defer it by using iter_events())
         5. Repeat until stream ends
 
     Args:
@@ -51,7 +159,7 @@ class AsyncSSEStreamReader:
                 - value: Value of the field
 
     Memory Efficiency:
-        The buffer is trimmed after each message is parsed, keeping memory usage
+        The buffer is trimmed after each chunk is parsed, keeping memory usage
         bounded even for very long SSE streams. Peak memory is approximately:
             buffer_size + chunk_size ≈ typical_message_size + async_iter chunk size
 
@@ -77,6 +185,15 @@ class AsyncSSEStreamReader:
             messages.append(message)
         return messages
 
+    @staticmethod
+    def inspect_event_for_error(event: SSEEvent):
+        """Check if the raw event contains an error event packet and raise an SSEResponseError if so.
+
+        Only events that could possibly be errors are parsed into an SSEMessage.
+        """
+        if event.may_be_error:
+            AsyncSSEStreamReader.inspect_message_for_error(event.to_message())
+
     @staticmethod
     def inspect_message_for_error(message: SSEMessage):
         """Check if the message contains an error event packet and raise an SSEResponseError if so.
@@ -105,61 +222,31 @@ class AsyncSSEStreamReader:
                 f"Error occurred in SSE response: {error_message}", error_code=502
             )
 
-    async def __aiter__(self) -> AsyncIterator[SSEMessage]:
-        """Iterate over the SSE stream in a performant manner and yield parsed SSE messages as they arrive."""
+    async def iter_events(self) -> AsyncIterator[SSEEvent]:
+        """Iterate over the SSE stream and yield lightweight SSEEvent tuples as they arrive.
 
-        # Use bytearray for efficient buffer operations (mutable, no copy overhead)
-        buffer = bytearray()
+        Unlike __aiter__, no pydantic models are created, so callers can defer the conversion
+        to SSEMessage objects (see SSEEvent.to_message) until after the stream is complete.
+        """
+        parser = SSEStreamParser()
 
         # Stream response body incrementally from the async iterator
         async for chunk in self._async_iter:
             # Capture timestamp immediately when chunk arrives
             # This will provide us with the most accurate TTFT and ICL measurements
             chunk_perf_ns = time.perf_counter_ns()
-
-            # bytearray is mutable, no copy overhead, so we can append the chunk to the buffer in-place.
-            buffer += chunk
-
-            # Parse complete messages from buffer.
-            # SSE spec requires "\r\n\r\n" (CRLF CRLF) but we support both "\r\n\r\n" and "\n\n"
-            # for compatibility with lenient servers.
-            while True:
-                # Try to find "\r\n\r\n" first (spec-compliant delimiter)
-                delimiter_index = buffer.find(b"\r\n\r\n")
-                delimiter_length = 4
-
-                if delimiter_index == -1:
-                    # Fall back to "\n\n" for lenient servers
-                    delimiter_index = buffer.find(b"\n\n")
-                    delimiter_length = 2
-
-                if delimiter_index == -1:
-                    # No complete message found, wait for more data
-                    break
-
-                # Extract message bytes up to delimiter
-                message_bytes = bytes(buffer[:delimiter_index])
-                # Remove processed message + delimiter from buffer in-place
-                del buffer[: delimiter_index + delimiter_length]
-
-                raw_message = message_bytes.decode("utf-8", errors="replace").strip()
-                if not raw_message:
-                    _logger.debug(
-                        f"Skipping empty SSE message at chunk {chunk_perf_ns}"
-                    )
-                    continue
-
-                yield SSEMessage.parse(raw_message, chunk_perf_ns)
-
-                if _logger.is_debug_enabled:
-                    _logger.debug(f"Parsed SSE message: {raw_message}...")
+            for event in parser.feed(chunk, chunk_perf_ns):
+                yield event
 
         # Handle any remaining data in buffer after stream ends
         # Some servers don't send final delimiter
-        if buffer_remaining := buffer.strip():
-            final_perf_ns = time.perf_counter_ns()
-            raw_message = buffer_remaining.decode("utf-8", errors="replace")
-            yield SSEMessage.parse(raw_message, final_perf_ns)
+        if event := parser.flush(time.perf_counter_ns()):
+            yield event
+
+    async def __aiter__(self) -> AsyncIterator[SSEMessage]:
+        """Iterate over the SSE stream in a performant manner and yield parsed SSE messages as they arrive."""
+        async for event in self.iter_events():
+            yield event.to_message()
 
             if _logger.is_debug_enabled:
-                _logger.debug(f"Parsed final SSE message: {raw_message}...")
+                _logger.debug(f"Parsed SSE message: {event.raw!r}...")
@@ -3,9 +3,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from aiperf.common.factories import EndpointFactory, TransportFactory
 from aiperf.common.mixins import AIPerfLifecycleMixin
-from aiperf.common.models import ModelEndpointInfo, RequestInfo, RequestRecord
+from aiperf.common.models import (
+    ConnectionPrewarmStats,
+    ModelEndpointInfo,
+    RequestInfo,
+    RequestRecord,
+)
 
 
 class InferenceClient(AIPerfLifecycleMixin):
@@ -36,23 +43,53 @@ class InferenceClient(AIPerfLifecycleMixin):
         )
         self.attach_child_lifecycle(self.transport)
 
-    async def send_request(self, request_info: RequestInfo) -> RequestRecord:
-        """Send request via transport.
+    def prepare_request(self, request_info: RequestInfo) -> Any:
+        """Prepare a request to be sent, so it can be done ahead of time.
 
-        Handles the complete request lifecycle:
         1. Populates endpoint headers and params on request_info
-        2. Formats the payload using the endpoint
-        3. Sends the request via the transport
+        2. Formats the payload using the endpoint, unless it was pre-rendered by the DatasetManager
 
         Args:
             request_info: The request information.
 
         Returns:
-            RequestRecord containing the response data and metadata.
+            The payload to pass to send_request.
         """
         request_info.endpoint_headers = self.endpoint.get_endpoint_headers(request_info)
         request_info.endpoint_params = self.endpoint.get_endpoint_params(request_info)
-        formatted_payload = self.endpoint.format_payload(request_info)
-        return await self.transport.send_request(
-            request_info, payload=formatted_payload
-        )
+        turns = request_info.turns
+        if len(turns) == 1 and turns[0].rendered_payload is not None:
+            # The first turn of a conversation is sent as-is, without any history
+            return turns[0].rendered_payload
+        return self.endpoint.format_payload(request_info)
+
+    async def send_request(
+        self, request_info: RequestInfo, payload: Any | None = None
+    ) -> RequestRecord:
+        """Send request via transport.
+
+        Handles the complete request lifecycle:
+        1. Prepares the request (see prepare_request), unless the payload is provided
+        2. Sends the request via the transport
+
+        Args:
+            request_info: The request information.
+            payload: The payload returned by prepare_request, if the request was already prepared.
+
+        Returns:
+            RequestRecord containing the response data and metadata.
+        """
+        if payload is None:
+            payload = self.prepare_request(request_info)
+        return await self.transport.send_request(request_info, payload=payload)
+
+    async def prewarm_connections(self, num_connections: int) -> ConnectionPrewarmStats:
+        """Open and validate keep-alive connections via the transport ahead of time.
+
+        Args:
+            num_connections: The number of connections to open.
+
+        Returns:
+            ConnectionPrewarmStats with the number of opened and failed connections.
+        """
+        return await self.transport.prewarm_connections(num_connections)
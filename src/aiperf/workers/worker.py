@@ -5,11 +5,17 @@
 import asyncio
 import time
 import uuid
+from collections import OrderedDict, deque
 from collections.abc import Awaitable
+from typing import NoReturn
 
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
-from aiperf.common.constants import MILLIS_PER_SECOND, NANOS_PER_SECOND
+from aiperf.common.constants import (
+    MILLIS_PER_SECOND,
+    NANOS_PER_MILLIS,
+    NANOS_PER_SECOND,
+)
 from aiperf.common.enums import (
     CommAddress,
     CommandType,
@@ -18,24 +24,46 @@ from aiperf.common.enums import (
     ServiceType,
 )
 from aiperf.common.environment import Environment
-from aiperf.common.exceptions import NotInitializedError
+from aiperf.common.exceptions import (
+    InvalidStateError,
+    NotFoundError,
+    NotInitializedError,
+)
 from aiperf.common.factories import ServiceFactory
-from aiperf.common.hooks import background_task, on_command, on_pull_message
+from aiperf.common.hooks import (
+    background_task,
+    on_command,
+    on_message,
+    on_pull_message,
+    on_stop,
+)
 from aiperf.common.messages import (
     CommandAcknowledgedResponse,
+    ConversationBatchRequestMessage,
+    ConversationBatchResponseMessage,
+    ConversationIdRequestMessage,
+    ConversationIdResponseMessage,
     ConversationRequestMessage,
     ConversationResponseMessage,
+    CreditDropBatchMessage,
     CreditDropMessage,
+    CreditPhaseCompleteMessage,
+    CreditReturnBatchMessage,
     CreditReturnMessage,
+    DatasetConfiguredNotification,
     ErrorMessage,
     InferenceResultsMessage,
     ProfileCancelCommand,
+    ProfileConfigureCommand,
+    TurnCreditDropMessage,
     WorkerHealthMessage,
 )
 from aiperf.common.mixins import ProcessHealthMixin, PullClientMixin
 from aiperf.common.models import (
+    ConnectionPrewarmStats,
     Conversation,
     ErrorDetails,
+    NextTurnCredit,
     RequestRecord,
     Text,
     Turn,
@@ -44,6 +72,7 @@ from aiperf.common.models import (
 from aiperf.common.models.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.models.record_models import RequestInfo
 from aiperf.common.protocols import PushClientProtocol, RequestClientProtocol
+from aiperf.dataset.shared_memory_store import SharedMemoryDatasetStore
 from aiperf.workers.inference_client import InferenceClient
 
 
@@ -77,12 +106,22 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         self.health_check_interval = Environment.WORKER.HEALTH_CHECK_INTERVAL
 
         self.task_stats: WorkerTaskStats = WorkerTaskStats()
+        # Whether each turn of a multi-turn conversation is issued as its own credit by the timing manager
+        self.per_turn_credits = self.user_config.loadgen.per_turn_credits
+        # session ID -> the credit phase, conversation and turns so far of each session that continues with its next
+        # turn, when each turn is issued as its own credit. The timing manager sends the next turn to this worker.
+        self._sessions: dict[str, tuple[CreditPhase, Conversation, list[Turn]]] = {}
 
         self.credit_return_push_client: PushClientProtocol = (
             self.comms.create_push_client(
                 CommAddress.CREDIT_RETURN,
             )
         )
+        # Credit returns are coalesced over a short window when the window is greater than 0
+        self.credit_return_batch_size = Environment.WORKER.CREDIT_RETURN_BATCH_SIZE
+        self.credit_return_batch_window = Environment.WORKER.CREDIT_RETURN_BATCH_WINDOW
+        self._pending_credit_returns: list[CreditReturnMessage] = []
+        self._credit_return_flush_handle: asyncio.TimerHandle | None = None
         self.inference_results_push_client: PushClientProtocol = (
             self.comms.create_push_client(
                 CommAddress.RAW_INFERENCE_PROXY_FRONTEND,
@@ -94,6 +133,18 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             )
         )
 
+        # Conversations prefetched from the DatasetManager for credits without a conversation ID
+        self.conversation_prefetch_size = Environment.WORKER.CONVERSATION_PREFETCH_SIZE
+        self._prefetched_conversations: deque[Conversation] = deque()
+        self._prefetch_task: asyncio.Task[ErrorDetails | None] | None = None
+        # The credit phase the prefetch buffer was filled for
+        self._prefetch_phase: CreditPhase | None = None
+        # Conversations requested by ID, such as from a fixed schedule
+        self.conversation_cache_size = Environment.WORKER.CONVERSATION_CACHE_SIZE
+        self._conversation_cache: OrderedDict[str, Conversation] = OrderedDict()
+        # Shared-memory dataset, if enabled in the DatasetManager and available on this host
+        self._shared_memory_store: SharedMemoryDatasetStore | None = None
+
         self.model_endpoint = ModelEndpointInfo.from_user_config(self.user_config)
 
         self.inference_client: InferenceClient = InferenceClient(
@@ -115,6 +166,30 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         except Exception as e:
             self.error(f"Error processing credit drop: {e!r}")
 
+    @on_message(lambda self: [f"{MessageType.TURN_CREDIT_DROP}.{self.service_id}"])
+    async def _turn_credit_drop_callback(self, message: TurnCreditDropMessage) -> None:
+        """Handle the credit of the next turn of a session that this worker keeps the history of."""
+        await self._credit_drop_callback(message)
+
+    @on_message(MessageType.CREDIT_PHASE_COMPLETE)
+    async def _on_credit_phase_complete(
+        self, message: CreditPhaseCompleteMessage
+    ) -> None:
+        """Discard the sessions of a completed credit phase, whose next turns will not be sent."""
+        for session_id, (phase, _, _) in list(self._sessions.items()):
+            if phase == message.phase:
+                del self._sessions[session_id]
+
+    @on_pull_message(MessageType.CREDIT_DROP_BATCH)
+    async def _credit_drop_batch_callback(
+        self, message: CreditDropBatchMessage
+    ) -> None:
+        """Handle a batch of credit drops from the timing manager. The credits are processed concurrently,
+        and each one is returned individually once it has been processed."""
+        await asyncio.gather(
+            *(self._credit_drop_callback(credit) for credit in message.credits)
+        )
+
     @background_task(
         immediate=False,
         interval=lambda self: self.health_check_interval,
@@ -130,6 +205,67 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             task_stats=self.task_stats,
         )
 
+    @on_command(CommandType.PROFILE_CONFIGURE)
+    async def _profile_configure_command(
+        self, message: ProfileConfigureCommand
+    ) -> ConnectionPrewarmStats | None:
+        """Pre-warm the connection pool while the profile is being configured.
+
+        The system controller waits for every service to finish configuring before sending PROFILE_START,
+        so the connections are guaranteed to be open before the first credit is dropped.
+        """
+        num_connections = Environment.HTTP.PREWARM_CONNECTIONS
+        if num_connections <= 0:
+            return None
+
+        stats = await self.inference_client.prewarm_connections(num_connections)
+        self.info(
+            f"Pre-warmed {stats.opened}/{stats.requested} connections "
+            f"in {stats.duration_ns / NANOS_PER_SECOND:.3f} seconds ({stats.failed} failed)"
+        )
+        for error in stats.errors:
+            self.warning(f"Failed to pre-warm connection: {error}")
+        return stats
+
+    @on_message(MessageType.DATASET_CONFIGURED_NOTIFICATION)
+    async def _on_dataset_configured(
+        self, message: DatasetConfiguredNotification
+    ) -> None:
+        """Attach to the shared-memory dataset, if the DatasetManager created one."""
+        self._close_shared_memory_store()
+        if message.shared_memory_name is None:
+            return
+        try:
+            self._shared_memory_store = SharedMemoryDatasetStore.attach(
+                message.shared_memory_name
+            )
+        except OSError as e:
+            # The segment is only available on the same host as the DatasetManager
+            self.warning(
+                f"Unable to attach to the shared-memory dataset {message.shared_memory_name}, "
+                f"conversations will be requested from the dataset manager instead: {e!r}"
+            )
+            return
+        self.debug(
+            lambda: f"Attached to shared-memory dataset {message.shared_memory_name} "
+            f"with {len(self._shared_memory_store)} conversations"
+        )
+
+    @on_stop
+    async def _flush_pending_credit_returns(self) -> None:
+        """Send any credit returns that are still pending when the worker stops."""
+        self._flush_credit_returns()
+
+    @on_stop
+    async def _detach_shared_memory_store(self) -> None:
+        """Detach from the shared-memory dataset when the worker stops."""
+        self._close_shared_memory_store()
+
+    def _close_shared_memory_store(self) -> None:
+        if self._shared_memory_store is not None:
+            self._shared_memory_store.close()
+            self._shared_memory_store = None
+
     @on_command(CommandType.PROFILE_CANCEL)
     async def _handle_profile_cancel_command(
         self, message: ProfileCancelCommand
@@ -154,7 +290,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             service_id=self.service_id,
             phase=message.phase,
             credit_drop_id=message.request_id,
-            delayed_ns=None,  # TODO: set this properly (from record if available?)
+            delayed_ns=None,  # Set from the record of the first turn, if the credit was sent late
             requests_sent=0,
         )
 
@@ -167,8 +303,40 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             # Need to return the credit here to ensure it is always returned
             if self.is_trace_enabled:
                 self.trace(f"Returning credit {return_message}")
+            await self._return_credit(return_message)
+
+    async def _return_credit(self, return_message: CreditReturnMessage) -> None:
+        """Return a credit to the timing manager, or add it to the pending batch if credit return coalescing is enabled."""
+        if self.credit_return_batch_window <= 0:
             # NOTE: Do not do this execute_async, as we want to give the credit back as soon as possible.
             await self.credit_return_push_client.push(return_message)
+            return
+
+        self._pending_credit_returns.append(return_message)
+        if len(self._pending_credit_returns) >= self.credit_return_batch_size:
+            self._flush_credit_returns()
+        elif self._credit_return_flush_handle is None:
+            self._credit_return_flush_handle = asyncio.get_running_loop().call_later(
+                self.credit_return_batch_window, self._flush_credit_returns
+            )
+
+    def _flush_credit_returns(self) -> None:
+        """Send all of the pending credit returns to the timing manager in a single batch message."""
+        if self._credit_return_flush_handle:
+            self._credit_return_flush_handle.cancel()
+            self._credit_return_flush_handle = None
+        if not self._pending_credit_returns:
+            return
+
+        credit_returns, self._pending_credit_returns = self._pending_credit_returns, []
+        self.execute_async(
+            self.credit_return_push_client.push(
+                CreditReturnBatchMessage(
+                    service_id=self.service_id,
+                    credit_returns=credit_returns,
+                )
+            )
+        )
 
     async def _execute_single_credit_internal(
         self, message: CreditDropMessage, return_message: CreditReturnMessage
@@ -190,24 +358,46 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         - --conversation-turn-delay-mean: Average delay between turns (milliseconds)
         - --conversation-turn-delay-stddev: Standard deviation of delay (milliseconds)
         - --conversation-turn-delay-ratio: Ratio to scale delays
+
+        If each turn is issued as its own credit, only the turn of the credit is sent, after the turns of its session
+        so far, which this worker keeps by session ID. The next turn is returned with the credit, and the timing
+        manager issues it to this worker once its turn delay has elapsed, so the concurrency slot is not held during
+        the delay.
         """
         drop_perf_ns = time.perf_counter_ns()  # The time the credit was received
 
         if not self.inference_client:
             raise NotInitializedError("Inference server client not initialized.")
 
-        conversation = await self._retrieve_conversation_response(
-            service_id=self.service_id,
-            conversation_id=message.conversation_id,
-            phase=message.phase,
-        )
+        session_id = message.session_id or message.request_id
+        if message.session_id is not None:
+            if message.session_id not in self._sessions:
+                raise InvalidStateError(
+                    f"Received turn {message.turn_index} of unknown session {message.session_id}"
+                )
+            _, conversation, turn_list = self._sessions.pop(message.session_id)
+        else:
+            conversation = await self._retrieve_conversation_response(
+                service_id=self.service_id,
+                conversation_id=message.conversation_id,
+                phase=message.phase,
+            )
+            turn_list = []
 
-        turn_list = []
-        for turn_index in range(len(conversation.turns)):
+        if self.per_turn_credits:
+            turn_indices = range(message.turn_index, message.turn_index + 1)
+        else:
+            turn_indices = range(len(conversation.turns))
+        for turn_index in turn_indices:
             # Apply turn delay BEFORE sending the turn (simulating user thinking time)
-            # Skip delay for the first turn
+            # Skip delay for the first turn, and for a turn issued as its own credit, which was already delayed
             turn = conversation.turns[turn_index]
-            if turn_index > 0 and turn.delay is not None and turn.delay > 0:
+            if (
+                turn_index > 0
+                and not self.per_turn_credits
+                and turn.delay is not None
+                and turn.delay > 0
+            ):
                 delay_seconds = (
                     turn.delay / MILLIS_PER_SECOND
                 )  # Convert milliseconds to seconds
@@ -226,8 +416,12 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
                 credit_phase=message.phase,
                 should_cancel=message.should_cancel,
                 cancel_after_ns=message.cancel_after_ns,
+                schedule_lag_ns=message.schedule_lag_ns,
+                stage_index=message.stage_index,
                 x_request_id=str(uuid.uuid4()),
-                x_correlation_id=message.request_id,  # CreditDropMessage request_id is the X-Correlation-ID header
+                # The X-Correlation-ID header is the request_id of the first credit of the session, which is shared
+                # by all of its turns, including the turns issued as their own credits
+                x_correlation_id=session_id,
                 conversation_id=message.conversation_id,
                 turn_index=turn_index,
                 turns=turn_list,
@@ -237,12 +431,31 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             record = await self._build_response_record(
                 request_info=request_info,
                 drop_perf_ns=drop_perf_ns,
+                # Only the first turn is sent at the time of the credit, the rest follow the turn delays
+                credit_drop_ns=message.credit_drop_ns
+                if turn_index == message.turn_index
+                else None,
             )
+            if turn_index == message.turn_index and record.delayed:
+                return_message.delayed_ns = record.delayed_ns
             await self._send_inference_result_message(record)
 
             if resp_turn := await self._process_response(record):
                 turn_list.append(resp_turn)
 
+        next_turn_index = message.turn_index + 1
+        if self.per_turn_credits and next_turn_index < len(conversation.turns):
+            next_turn_delay = max(conversation.turns[next_turn_index].delay or 0, 0)
+            self._sessions[session_id] = (message.phase, conversation, turn_list)
+            return_message.next_turn = NextTurnCredit(
+                conversation_id=conversation.session_id,
+                session_id=session_id,
+                turn_index=next_turn_index,
+                credit_num=message.credit_num,
+                delay_ns=int(next_turn_delay * NANOS_PER_MILLIS),
+                stage_index=message.stage_index,
+            )
+
     async def _retrieve_conversation_response(
         self,
         *,
@@ -253,7 +466,25 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         """Retrieve the conversation from the dataset manager. If a conversation
         cannot be retrieved, an error message will be sent to the
         inference results client and an Exception is raised.
+
+        If the worker is attached to the shared-memory dataset, conversations are read from it directly.
+        Otherwise, conversations without an ID are served from the prefetch buffer if it is enabled,
+        and conversations requested by ID are served from the local LRU cache when possible.
         """
+        if self._shared_memory_store is not None:
+            return await self._read_shared_memory_conversation(
+                service_id=service_id, conversation_id=conversation_id, phase=phase
+            )
+
+        if conversation_id is None:
+            if self.conversation_prefetch_size > 0:
+                return await self._next_prefetched_conversation(phase)
+        elif (
+            conversation := self._conversation_cache.get(conversation_id)
+        ) is not None:
+            self._conversation_cache.move_to_end(conversation_id)
+            return conversation
+
         # retrieve the prompt from the dataset
         conversation_response: ConversationResponseMessage = (
             await self.conversation_request_client.request(
@@ -269,31 +500,150 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
 
         # Check for error in conversation response
         if isinstance(conversation_response, ErrorMessage):
-            await self._send_inference_result_message(
-                RequestRecord(
-                    request_headers=None,
-                    model_name=self.model_endpoint.primary_model_name,
-                    conversation_id=conversation_id,
-                    turn_index=0,
-                    turns=None,
-                    timestamp_ns=time.time_ns(),
-                    start_perf_ns=time.perf_counter_ns(),
-                    end_perf_ns=time.perf_counter_ns(),
-                    error=conversation_response.error,
+            await self._send_conversation_error(
+                conversation_id, conversation_response.error
+            )
+
+        conversation = conversation_response.conversation
+        if conversation_id is not None and self.conversation_cache_size > 0:
+            self._conversation_cache[conversation_id] = conversation
+            if len(self._conversation_cache) > self.conversation_cache_size:
+                self._conversation_cache.popitem(last=False)
+        return conversation
+
+    async def _read_shared_memory_conversation(
+        self,
+        *,
+        service_id: str,
+        conversation_id: str | None,
+        phase: CreditPhase,
+    ) -> Conversation:
+        """Read a conversation from the shared-memory dataset. If no conversation ID is given, only
+        the ID of the next conversation is requested from the dataset manager."""
+        if conversation_id is None:
+            id_response: ConversationIdResponseMessage = (
+                await self.conversation_request_client.request(
+                    ConversationIdRequestMessage(
+                        service_id=service_id, credit_phase=phase
+                    )
                 )
             )
-            raise ValueError("Failed to retrieve conversation response")
+            if isinstance(id_response, ErrorMessage):
+                await self._send_conversation_error(None, id_response.error)
+            conversation_id = id_response.conversation_id
+
+        try:
+            return self._shared_memory_store.get_conversation(conversation_id)
+        except NotFoundError as e:
+            await self._send_conversation_error(
+                conversation_id, ErrorDetails.from_exception(e)
+            )
 
-        return conversation_response.conversation
+    async def _send_conversation_error(
+        self, conversation_id: str | None, error: ErrorDetails
+    ) -> NoReturn:
+        """Send an error record for a conversation that could not be retrieved, and raise an exception."""
+        await self._send_inference_result_message(
+            RequestRecord(
+                request_headers=None,
+                model_name=self.model_endpoint.primary_model_name,
+                conversation_id=conversation_id,
+                turn_index=0,
+                turns=None,
+                timestamp_ns=time.time_ns(),
+                start_perf_ns=time.perf_counter_ns(),
+                end_perf_ns=time.perf_counter_ns(),
+                error=error,
+            )
+        )
+        raise ValueError("Failed to retrieve conversation response")
+
+    async def _next_prefetched_conversation(self, phase: CreditPhase) -> Conversation:
+        """Get the next conversation from the prefetch buffer, waiting for it to be filled if it is empty.
+
+        Once the buffer is half empty, it is refilled in the background, so that credits do not
+        have to wait for a round trip to the DatasetManager.
+        """
+        if phase != self._prefetch_phase:
+            self._reset_prefetched_conversations(phase)
+
+        while not self._prefetched_conversations:
+            if self._prefetch_task is None:
+                self._prefetch_task = self.execute_async(
+                    self._prefetch_conversations(phase)
+                )
+            # NOTE: The refill is shared by all waiting credits, so it must not be cancelled along with one of
+            # them. asyncio.wait neither cancels the refill, nor raises if the refill itself was cancelled.
+            prefetch_task = self._prefetch_task
+            await asyncio.wait([prefetch_task])
+            if phase != self._prefetch_phase:
+                raise InvalidStateError(
+                    f"The credit phase changed from {phase} to {self._prefetch_phase} while prefetching conversations"
+                )
+            if prefetch_task.cancelled():
+                raise asyncio.CancelledError()
+            if (error := prefetch_task.result()) is not None:
+                await self._send_conversation_error(None, error)
+
+        conversation = self._prefetched_conversations.popleft()
+        if (
+            self._prefetch_task is None
+            and len(self._prefetched_conversations)
+            <= self.conversation_prefetch_size // 2
+        ):
+            self._prefetch_task = self.execute_async(
+                self._prefetch_conversations(phase)
+            )
+        return conversation
+
+    def _reset_prefetched_conversations(self, phase: CreditPhase) -> None:
+        """Discard the conversations prefetched for the previous credit phase, and cancel its in-flight refill,
+        so that conversations are never used outside of the phase they were requested for."""
+        self._prefetched_conversations.clear()
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+        self._prefetch_phase = phase
+
+    async def _prefetch_conversations(self, phase: CreditPhase) -> ErrorDetails | None:
+        """Request a batch of conversations from the DatasetManager and add them to the prefetch buffer.
+
+        Returns:
+            The error details if the batch could not be retrieved, otherwise None.
+        """
+        try:
+            response: ConversationBatchResponseMessage = (
+                await self.conversation_request_client.request(
+                    ConversationBatchRequestMessage(
+                        service_id=self.service_id,
+                        count=self.conversation_prefetch_size,
+                        credit_phase=phase,
+                    )
+                )
+            )
+            if isinstance(response, ErrorMessage):
+                self.warning(f"Failed to prefetch conversations: {response.error}")
+                return response.error
+            if phase == self._prefetch_phase:
+                self._prefetched_conversations.extend(response.conversations)
+            return None
+        except Exception as e:
+            self.warning(f"Failed to prefetch conversations: {e!r}")
+            return ErrorDetails.from_exception(e)
+        finally:
+            # A refill for a previous phase must not clear the refill of the current phase
+            if self._prefetch_task is asyncio.current_task():
+                self._prefetch_task = None
 
     async def _build_response_record(
         self,
         *,
         request_info: RequestInfo,
         drop_perf_ns: int,
+        credit_drop_ns: int | None = None,
     ) -> RequestRecord:
         """Build a RequestRecord from an inference API call for the given turn."""
-        record = await self._call_inference_api_internal(request_info, drop_perf_ns)
+        record = await self._call_inference_api_internal(request_info, credit_drop_ns)
         record.model_name = (
             request_info.turns[request_info.turn_index].model
             or self.model_endpoint.primary_model_name
@@ -305,9 +655,11 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         record.x_request_id = request_info.x_request_id
         record.x_correlation_id = request_info.x_correlation_id
         record.credit_num = request_info.credit_num
-        # If this is the first turn, calculate the credit drop latency
+        record.stage_index = request_info.stage_index
+        # If this is the first turn, calculate the credit drop latency and keep the schedule lag of the credit
         if request_info.turn_index == 0:
             record.credit_drop_latency = record.start_perf_ns - drop_perf_ns
+            record.schedule_lag_ns = request_info.schedule_lag_ns
         # Preserve headers set by transport; only use endpoint headers if not set
         if record.request_headers is None:
             record.request_headers = request_info.endpoint_headers
@@ -328,9 +680,13 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
     async def _call_inference_api_internal(
         self,
         request_info: RequestInfo,  # NOTE: RequestInfo is used to pass the request info to the inference client
-        credit_drop_ns: int,
+        credit_drop_ns: int | None = None,
     ) -> RequestRecord:
-        """Make a single call to the inference API. Will return an error record if the call fails."""
+        """Make a single call to the inference API. Will return an error record if the call fails.
+
+        If credit_drop_ns is in the future, the request is prepared ahead of time, and sent once it is due.
+        If the request is sent after credit_drop_ns, the delay is recorded in the delayed_ns of the record.
+        """
         if self.is_trace_enabled:
             self.trace(
                 f"Calling inference API for turn: {request_info.turns[request_info.turn_index]}"
@@ -338,21 +694,23 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         pre_send_perf_ns = None
         timestamp_ns = None
         try:
-            # NOTE: Current implementation of the TimingManager bypasses this, it is for future use.
-            # Wait for the credit drop time if it is in the future.
-            # Note that we check this after we have retrieved the data from the dataset, to ensure
-            # that we are fully ready to go.
+            # Wait for the credit drop time if it is in the future. The TimingManager sets this when
+            # credits are issued ahead of time (AIPERF_TIMING_CREDIT_LEAD_TIME) or in batches.
+            # Note that we check this after we have retrieved the data from the dataset, and we prepare
+            # the request before waiting, to ensure that we are fully ready to go.
             delayed_ns = None
-            drop_ns = credit_drop_ns
-            now_ns = time.time_ns()
-            if drop_ns and drop_ns > now_ns:
-                if self.is_trace_enabled:
-                    self.trace(
-                        f"Waiting for credit drop expected time: {(drop_ns - now_ns) / NANOS_PER_SECOND:.2f} s"
-                    )
-                await asyncio.sleep((drop_ns - now_ns) / NANOS_PER_SECOND)
-            elif drop_ns and drop_ns < now_ns:
-                delayed_ns = now_ns - drop_ns
+            payload = None
+            if credit_drop_ns:
+                if credit_drop_ns > time.time_ns():
+                    payload = self.inference_client.prepare_request(request_info)
+                    wait_ns = credit_drop_ns - time.time_ns()
+                    if wait_ns > 0:
+                        if self.is_trace_enabled:
+                            self.trace(
+                                f"Waiting for credit drop expected time: {wait_ns / NANOS_PER_SECOND:.6f} s"
+                            )
+                        await asyncio.sleep(wait_ns / NANOS_PER_SECOND)
+                delayed_ns = max(0, time.time_ns() - credit_drop_ns) or None
 
             # Save the current perf_ns before sending the request so it can be used to calculate
             # the start_perf_ns of the request in case of an exception.
@@ -361,6 +719,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
 
             send_coroutine = self.inference_client.send_request(
                 request_info=request_info,
+                payload=payload,
             )
 
             maybe_result: RequestRecord | None = await self._send_with_optional_cancel(
@@ -11,6 +11,10 @@ __ignore__ = []
 from aiperf.zmq.dealer_request_client import (
     ZMQDealerRequestClient,
 )
+from aiperf.zmq.message_codec import (
+    JSONMessageCodec,
+    MsgpackMessageCodec,
+)
 from aiperf.zmq.pub_client import (
     ZMQPubClient,
 )
@@ -57,6 +61,8 @@ __all__ = [
     "BaseZMQClient",
     "BaseZMQCommunication",
     "BaseZMQProxy",
+    "JSONMessageCodec",
+    "MsgpackMessageCodec",
     "ProxyEndType",
     "ProxySocketClient",
     "TOPIC_DELIMITER",
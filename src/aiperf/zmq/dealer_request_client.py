@@ -73,7 +73,7 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
                 message_bytes = await self.socket.recv()
                 if self.is_trace_enabled:
                     self.trace(f"Received response: {message_bytes}")
-                response_message = Message.from_json(message_bytes)
+                response_message = self.codec.decode(message_bytes)
 
                 # Call the callback if it exists
                 if response_message.request_id in self.request_callbacks:
@@ -114,11 +114,11 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
 
         self.request_callbacks[message.request_id] = callback
 
-        request_json_bytes = message.to_json_bytes()
-        self.trace(lambda msg=request_json_bytes: f"Sending request: {msg}")
+        request_bytes = self.codec.encode(message)
+        self.trace(lambda msg=request_bytes: f"Sending request: {msg}")
 
         try:
-            await self.socket.send(request_json_bytes)
+            await self.socket.send(request_bytes)
 
         except Exception as e:
             raise CommunicationError(
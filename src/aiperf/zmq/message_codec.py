@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import struct
+from typing import Any
+
+import msgpack
+from pydantic_core import to_jsonable_python
+
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import MessageCodecType
+from aiperf.common.environment import Environment
+from aiperf.common.factories import MessageCodecFactory
+from aiperf.common.messages import Message
+from aiperf.common.protocols import MessageCodecProtocol
+
+_FRAME_REF_EXT_CODE = 1
+"""The msgpack extension type code for a reference to a byte field sent as a separate frame."""
+
+_FRAME_INDEX = struct.Struct("<I")
+
+
+@implements_protocol(MessageCodecProtocol)
+@MessageCodecFactory.register(MessageCodecType.JSON)
+class JSONMessageCodec:
+    """Encodes messages as JSON. Every message is sent as a single frame, and can be read as-is when debugging."""
+
+    def encode(self, message: Message) -> bytes:
+        return message.to_json_bytes()
+
+    def decode(self, data: bytes) -> Message:
+        return Message.from_json(data)
+
+    def encode_multipart(self, message: Message) -> list[bytes]:
+        return [message.to_json_bytes()]
+
+    def decode_multipart(self, frames: list[bytes]) -> Message:
+        return Message.from_json(frames[0])
+
+
+@implements_protocol(MessageCodecProtocol)
+@MessageCodecFactory.register(MessageCodecType.MSGPACK)
+class MsgpackMessageCodec:
+    """Encodes messages as msgpack.
+
+    Messages are dumped in python mode, so byte fields (such as raw response buffers) are stored as raw
+    binary instead of base64 strings, and the encoding skips the intermediate JSON conversion. Values that
+    msgpack does not support natively (paths, datetimes, sets, etc.) are converted the same way as for JSON.
+
+    Decoding only replaces the JSON parse with a msgpack unpack. The unpacked message is still validated
+    by pydantic, the same as with the JSON codec.
+
+    When encoding into multiple frames, byte fields of at least `multipart_threshold` bytes are replaced
+    with a reference, and sent as separate frames after the message body, without being copied into it.
+    """
+
+    def __init__(self, multipart_threshold: int | None = None) -> None:
+        self.multipart_threshold = (
+            Environment.ZMQ.MSGPACK_MULTIPART_THRESHOLD
+            if multipart_threshold is None
+            else multipart_threshold
+        )
+
+    def encode(self, message: Message) -> bytes:
+        return msgpack.packb(
+            message.model_dump(exclude_none=True), default=to_jsonable_python
+        )
+
+    def decode(self, data: bytes) -> Message:
+        return Message.from_json(msgpack.unpackb(data, strict_map_key=False))
+
+    def encode_multipart(self, message: Message) -> list[bytes]:
+        data = message.model_dump(exclude_none=True)
+        frames: list[bytes] = [b""]
+        if self.multipart_threshold > 0:
+            self._extract_frames(data, frames)
+        frames[0] = msgpack.packb(data, default=to_jsonable_python)
+        return frames
+
+    def decode_multipart(self, frames: list[bytes]) -> Message:
+        if len(frames) == 1:
+            return self.decode(frames[0])
+
+        def ext_hook(code: int, data: bytes) -> Any:
+            if code == _FRAME_REF_EXT_CODE:
+                return frames[_FRAME_INDEX.unpack(data)[0]]
+            return msgpack.ExtType(code, data)
+
+        return Message.from_json(
+            msgpack.unpackb(frames[0], ext_hook=ext_hook, strict_map_key=False)
+        )
+
+    def _extract_frames(self, value: dict | list, frames: list[bytes]) -> None:
+        """Replace large byte fields in the dumped message with frame references, in place."""
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        for key, item in items:
+            if isinstance(item, dict | list):
+                self._extract_frames(item, frames)
+            elif isinstance(item, bytes) and len(item) >= self.multipart_threshold:
+                value[key] = msgpack.ExtType(
+                    _FRAME_REF_EXT_CODE, _FRAME_INDEX.pack(len(frames))
+                )
+                frames.append(item)
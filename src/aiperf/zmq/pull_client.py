@@ -95,13 +95,10 @@ class ZMQPullClient(BaseZMQClient):
                 # logic to properly load balance the requests.
                 await self.semaphore.acquire()
 
-                message_json_bytes = await self.socket.recv()
+                frames = await self.socket.recv_multipart()
                 if self.is_trace_enabled:
-                    self.trace(
-                        f"Received message from pull socket: {message_json_bytes}"
-                    )
-                # Use AUTO-LOOKUP approach (no prefix) - optimal for large messages
-                self.execute_async(self._process_message(message_json_bytes))
+                    self.trace(f"Received message from pull socket: {frames}")
+                self.execute_async(self._process_message(frames))
 
             except zmq.Again:
                 self.debug("Pull client receiver task timed out")
@@ -121,7 +118,7 @@ class ZMQPullClient(BaseZMQClient):
         """Wait for all tasks to complete."""
         await self.cancel_all_tasks()
 
-    async def _process_message(self, message_json_bytes: bytes) -> None:
+    async def _process_message(self, frames: list[bytes]) -> None:
         """Process a message from the pull socket.
 
         This method is called by the background task when a message is received from
@@ -129,9 +126,7 @@ class ZMQPullClient(BaseZMQClient):
         callback function.
         """
         try:
-            # Use AUTO-LOOKUP: parse JSON to dict, extract type, validate
-            # This is 40-60% faster for large messages (>2KB)
-            message = Message.from_json(message_json_bytes)
+            message = self.codec.decode_multipart(frames)
 
             # Call callbacks with Message object
             if message.message_type in self._pull_callbacks:
@@ -83,10 +83,14 @@ class ZMQPushClient(BaseZMQClient):
             max_retries = Environment.ZMQ.PUSH_MAX_RETRIES
 
         try:
-            data_json_bytes = message.to_json_bytes()
-            await self.socket.send(data_json_bytes)
+            frames = self.codec.encode_multipart(message)
+            if len(frames) == 1:
+                await self.socket.send(frames[0])
+            else:
+                # Large byte fields are sent as separate frames without copying them
+                await self.socket.send_multipart(frames, copy=False)
             if self.is_trace_enabled:
-                self.trace(f"Pushed json data: {data_json_bytes}")
+                self.trace(f"Pushed data: {frames}")
         except (asyncio.CancelledError, zmq.ContextTerminated):
             self.debug("Push client cancelled or context terminated")
             return
@@ -162,7 +162,7 @@ class ZMQRouterReplyClient(BaseZMQClient):
 
             # Send the response back to the client.
             await self.socket.send_multipart(
-                [*routing_envelope, response.to_json_bytes()]
+                [*routing_envelope, self.codec.encode(response)]
             )
         except Exception as e:
             self.exception(
@@ -186,7 +186,7 @@ class ZMQRouterReplyClient(BaseZMQClient):
                     data = await self.socket.recv_multipart()
                     self.trace(lambda msg=data: f"Received request: {msg}")
 
-                    request = Message.from_json(data[-1])
+                    request = self.codec.decode(data[-1])
                     if not request.request_id:
                         self.exception(f"Request ID is missing from request: {data}")
                         continue
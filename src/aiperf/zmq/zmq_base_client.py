@@ -5,9 +5,12 @@ import uuid
 
 import zmq.asyncio
 
+from aiperf.common.enums import MessageCodecType
 from aiperf.common.exceptions import InitializationError, NotInitializedError
+from aiperf.common.factories import MessageCodecFactory
 from aiperf.common.hooks import on_init, on_stop
 from aiperf.common.mixins import AIPerfLifecycleMixin
+from aiperf.common.protocols import MessageCodecProtocol
 from aiperf.zmq.zmq_defaults import ZMQSocketDefaults
 
 ################################################################################
@@ -30,6 +33,7 @@ class BaseZMQClient(AIPerfLifecycleMixin):
         bind: bool,
         socket_ops: dict | None = None,
         client_id: str | None = None,
+        message_codec: MessageCodecType | str = MessageCodecType.JSON,
         **kwargs,
     ) -> None:
         """
@@ -40,6 +44,7 @@ class BaseZMQClient(AIPerfLifecycleMixin):
             bind (bool): Whether to BIND or CONNECT the socket.
             socket_type (SocketType): The type of ZMQ socket (eg. PUB, SUB, ROUTER, DEALER, etc.).
             socket_ops (dict, optional): Additional socket options to set.
+            message_codec (MessageCodecType, optional): The codec used to encode and decode messages.
         """
         self.context: zmq.asyncio.Context = zmq.asyncio.Context.instance()
         self.socket_type: zmq.SocketType = socket_type
@@ -47,6 +52,9 @@ class BaseZMQClient(AIPerfLifecycleMixin):
         self.address: str = address
         self.bind: bool = bind
         self.socket_ops: dict = socket_ops or {}
+        self.codec: MessageCodecProtocol = MessageCodecFactory.create_instance(
+            message_codec
+        )
         self.client_id: str = (
             client_id
             or f"{self.socket_type.name.lower()}_client_{uuid.uuid4().hex[:8]}"
@@ -16,6 +16,7 @@ from aiperf.common.enums import (
     CommClientType,
     CommunicationBackend,
     LifecycleState,
+    MessageCodecType,
 )
 from aiperf.common.exceptions import InvalidStateError
 from aiperf.common.factories import CommunicationClientFactory, CommunicationFactory
@@ -36,16 +37,20 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
     def __init__(
         self,
         config: BaseZMQCommunicationConfig,
+        message_codec: MessageCodecType | str = MessageCodecType.JSON,
     ) -> None:
         super().__init__()
         self.config = config
+        self.message_codec = message_codec
 
         self.context = zmq.asyncio.Context.instance()
         self._clients_cache: dict[
             tuple[CommClientType, CommAddressType, bool], CommunicationClientProtocol
         ] = {}
 
-        self.debug(f"ZMQ communication using protocol: {type(self.config).__name__}")
+        self.debug(
+            f"ZMQ communication using protocol: {type(self.config).__name__}, message codec: {self.message_codec}"
+        )
 
     def get_address(self, address_type: CommAddressType) -> str:
         """Get the actual address based on the address type from the config."""
@@ -88,6 +93,7 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
             bind=bind,
             socket_ops=socket_ops,
             max_pull_concurrency=max_pull_concurrency,
+            message_codec=self.message_codec,
             **kwargs,
         )
 
@@ -101,13 +107,18 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
 class ZMQTCPCommunication(BaseZMQCommunication):
     """ZeroMQ-based implementation of the Communication interface using TCP transport."""
 
-    def __init__(self, config: ZMQTCPConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: ZMQTCPConfig | None = None,
+        message_codec: MessageCodecType | str = MessageCodecType.JSON,
+    ) -> None:
         """Initialize ZMQ TCP communication.
 
         Args:
             config: ZMQTCPTransportConfig object with configuration parameters
+            message_codec: The codec used by the clients to encode and decode messages
         """
-        super().__init__(config or ZMQTCPConfig())
+        super().__init__(config or ZMQTCPConfig(), message_codec)
 
 
 @CommunicationFactory.register(CommunicationBackend.ZMQ_IPC)
@@ -115,13 +126,18 @@ class ZMQTCPCommunication(BaseZMQCommunication):
 class ZMQIPCCommunication(BaseZMQCommunication):
     """ZeroMQ-based implementation of the Communication interface using IPC transport."""
 
-    def __init__(self, config: ZMQIPCConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: ZMQIPCConfig | None = None,
+        message_codec: MessageCodecType | str = MessageCodecType.JSON,
+    ) -> None:
         """Initialize ZMQ IPC communication.
 
         Args:
             config: ZMQIPCConfig object with configuration parameters
+            message_codec: The codec used by the clients to encode and decode messages
         """
-        super().__init__(config or ZMQIPCConfig())
+        super().__init__(config or ZMQIPCConfig(), message_codec)
         # call after super init so that way self.config is set
         self._setup_ipc_directory()
 
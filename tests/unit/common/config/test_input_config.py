@@ -86,6 +86,16 @@ def test_input_config_goodput_success():
     assert cfg.goodput == {"request_latency": 250.0, "inter_token_latency": 10.0}
 
 
+@pytest.mark.parametrize("mode", ["python", "json"])
+def test_input_config_goodput_dump_validates_again(mode):
+    cfg = InputConfig(goodput="request_latency:250 inter_token_latency:10")
+
+    dumped = cfg.model_dump(mode=mode)
+
+    assert dumped["goodput"] == "request_latency:250.0 inter_token_latency:10.0"
+    assert InputConfig.model_validate(dumped).goodput == cfg.goodput
+
+
 def test_input_config_goodput_validation_raises_error():
     with pytest.raises(ValidationError):
         InputConfig(goodput=123)  # not a string
@@ -559,3 +559,325 @@ def test_multi_turn_request_count_conflict():
                 request_count=100,
             ),
         )
+
+
+@pytest.mark.parametrize(
+    "slice_duration,expected_slice_duration",
+    [
+        (None, 30.0),
+        (5.0, 5.0),
+    ],
+)
+def test_step_request_rate_mode_defaults_slice_duration(
+    slice_duration, expected_slice_duration
+):
+    """Test that the step request rate mode reports metrics per step, unless a slice duration is set."""
+    from aiperf.common.enums.timing_enums import RequestRateMode
+
+    config = UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="test",
+        ),
+        loadgen=LoadGeneratorConfig(
+            request_rate=10.0,
+            request_rate_mode=RequestRateMode.STEP,
+            request_rate_step=10.0,
+            request_rate_step_duration=30.0,
+        ),
+        output=OutputConfig(slice_duration=slice_duration),
+    )
+
+    assert config.output.slice_duration == expected_slice_duration
+
+
+def _load_stages_config(load_stages, **loadgen_kwargs) -> UserConfig:
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="test",
+        ),
+        loadgen=LoadGeneratorConfig(load_stages=load_stages, **loadgen_kwargs),
+    )
+
+
+def test_load_stages_from_json_string_and_file(tmp_path):
+    """Test that load stages are parsed from a JSON string or the path to a JSON file."""
+    from aiperf.common.enums.timing_enums import RequestRateMode
+
+    stages_json = (
+        '[{"concurrency": 4, "request_count": 10}, '
+        '{"request_rate": 5, "request_count": 20}]'
+    )
+    stages_file = tmp_path / "stages.json"
+    stages_file.write_text(stages_json)
+
+    for load_stages in (stages_json, str(stages_file)):
+        config = _load_stages_config(load_stages)
+
+        stages = config.loadgen.load_stages
+        assert [stage.request_rate_mode for stage in stages] == [
+            RequestRateMode.CONCURRENCY_BURST,
+            RequestRateMode.POISSON,
+        ]
+        assert config.timing_mode == TimingMode.REQUEST_RATE
+        assert config.get_effective_request_count() == 30
+        assert config.loadgen.load_stages_duration is None
+
+
+def test_load_stages_duration_allows_grace_period():
+    """Test that duration-based load stages are treated as duration-based benchmarking."""
+    config = _load_stages_config(
+        [{"request_rate": 5, "duration": 30}, {"request_rate": 10, "duration": 60}],
+        benchmark_grace_period=10,
+    )
+
+    assert config.loadgen.load_stages_duration == 90
+    assert config.loadgen.load_stages_request_count is None
+
+
+@pytest.mark.parametrize(
+    "load_stages,loadgen_kwargs,match",
+    [
+        ([], {}, "non-empty list"),
+        ("[not json", {}, "must be a JSON list"),
+        ([{"concurrency": 4}], {}, "exactly one of 'request_count' or 'duration'"),
+        ([{"request_count": 10}], {}, "must set a 'concurrency', a 'request_rate'"),
+        (
+            [
+                {
+                    "request_rate": 5,
+                    "request_rate_mode": "concurrency_burst",
+                    "duration": 5,
+                }
+            ],
+            {},
+            "cannot be .* when a request rate is specified",
+        ),
+        (
+            [{"concurrency": 4, "request_count": 10}],
+            {"concurrency": 2},
+            "--concurrency",
+        ),
+        (
+            [
+                {"concurrency": 4, "request_count": 10},
+                {"concurrency": 4, "duration": 5},
+            ],
+            {},
+            "cannot be mixed",
+        ),
+    ],
+)
+def test_invalid_load_stages(load_stages, loadgen_kwargs, match):
+    """Test that invalid load stages, or load stages combined with conflicting options, raise a validation error."""
+    with pytest.raises(ValueError, match=match):
+        _load_stages_config(load_stages, **loadgen_kwargs)
+
+
+def _search_config(goodput="request_latency:250", **loadgen_kwargs) -> UserConfig:
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="test",
+        ),
+        input=InputConfig(goodput=goodput),
+        loadgen=LoadGeneratorConfig(**loadgen_kwargs),
+    )
+
+
+@pytest.mark.parametrize(
+    "loadgen_kwargs,expected_stimulus",
+    [
+        ({"search_mode": "concurrency", "search_max": 64}, "search_concurrency"),
+        (
+            {"search_mode": "request_rate", "search_max": 50.5, "concurrency": 100},
+            "search_request_rate",
+        ),
+    ],
+)
+def test_throughput_search_timing_mode(loadgen_kwargs, expected_stimulus):
+    """Test that a search mode selects the throughput search timing mode, without changing the load defaults."""
+    config = _search_config(benchmark_grace_period=5, **loadgen_kwargs)
+
+    assert config.timing_mode == TimingMode.THROUGHPUT_SEARCH
+    assert config._get_artifact_stimulus() == expected_stimulus
+    assert "request_rate_mode" not in config.loadgen.model_fields_set
+    assert config.loadgen.search_min == 1
+    assert config.loadgen.search_slo_attainment == 99.0
+
+
+@pytest.mark.parametrize(
+    "goodput,loadgen_kwargs,match",
+    [
+        (None, {"search_mode": "concurrency", "search_max": 8}, "requires --goodput"),
+        (
+            "request_latency:250",
+            {"search_mode": "concurrency"},
+            "requires --search-max",
+        ),
+        (
+            "request_latency:250",
+            {"search_mode": "concurrency", "search_min": 8, "search_max": 8},
+            "must be greater than --search-min",
+        ),
+        (
+            "request_latency:250",
+            {"search_mode": "concurrency", "search_max": 8.5},
+            "must be whole numbers",
+        ),
+        (
+            "request_latency:250",
+            {"search_mode": "concurrency", "search_max": 8, "concurrency": 4},
+            "--concurrency",
+        ),
+        (
+            "request_latency:250",
+            {"search_mode": "request_rate", "search_max": 8, "request_rate": 4},
+            "--request-rate",
+        ),
+        (
+            "request_latency:250",
+            {"search_mode": "request_rate", "search_max": 8, "request_count": 100},
+            "--request-count",
+        ),
+        (
+            "request_latency:250",
+            {
+                "search_mode": "request_rate",
+                "search_max": 8,
+                "request_rate_mode": "ramp",
+            },
+            "only supports the constant, poisson and gamma",
+        ),
+    ],
+)
+def test_invalid_throughput_search(goodput, loadgen_kwargs, match):
+    """Test that an invalid search, or a search combined with conflicting options, raises a validation error."""
+    with pytest.raises(ValueError, match=match):
+        _search_config(goodput=goodput, **loadgen_kwargs)
+
+
+def _adaptive_config(**loadgen_kwargs) -> UserConfig:
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="test",
+        ),
+        loadgen=LoadGeneratorConfig(adaptive_target=500, **loadgen_kwargs),
+    )
+
+
+@pytest.mark.parametrize(
+    "loadgen_kwargs,expected_concurrency",
+    [
+        ({"adaptive_max_concurrency": 64}, 1),
+        ({"adaptive_min_concurrency": 4, "adaptive_max_concurrency": 64}, 4),
+        ({"adaptive_max_concurrency": 64, "concurrency": 16}, 16),
+    ],
+)
+def test_adaptive_concurrency_timing_mode(loadgen_kwargs, expected_concurrency):
+    """Test that an adaptive target selects the adaptive concurrency timing mode, starting at the initial concurrency."""
+    from aiperf.common.enums.timing_enums import RequestRateMode
+
+    config = _adaptive_config(**loadgen_kwargs)
+
+    assert config.timing_mode == TimingMode.ADAPTIVE_CONCURRENCY
+    assert config.loadgen.concurrency == expected_concurrency
+    assert config.loadgen.request_rate_mode == RequestRateMode.CONCURRENCY_BURST
+    assert config._get_artifact_stimulus() == "adaptive_time_to_first_token500"
+
+
+@pytest.mark.parametrize("mode", ["python", "json"])
+@pytest.mark.parametrize(
+    "dump_kwargs",
+    [{"exclude_unset": True}, {"exclude_unset": True, "exclude_none": True}],
+)
+def test_adaptive_concurrency_config_validates_again(mode, dump_kwargs):
+    """Test that an adaptive config validates again once dumped, as the exporters do, even though the timing mode
+    validator sets its request rate mode."""
+    config = _adaptive_config(adaptive_max_concurrency=64)
+
+    revalidated = UserConfig.model_validate(config.model_dump(mode=mode, **dump_kwargs))
+
+    assert revalidated.timing_mode == TimingMode.ADAPTIVE_CONCURRENCY
+    assert revalidated.loadgen == config.loadgen
+    assert UserConfig.model_validate(config).loadgen == config.loadgen
+
+
+@pytest.mark.parametrize(
+    "loadgen_kwargs,match",
+    [
+        ({}, "requires --adaptive-max-concurrency"),
+        (
+            {"adaptive_min_concurrency": 8, "adaptive_max_concurrency": 8},
+            "must be greater than --adaptive-min-concurrency",
+        ),
+        (
+            {"adaptive_max_concurrency": 8, "concurrency": 16},
+            "--concurrency must be between",
+        ),
+        ({"adaptive_max_concurrency": 8, "request_rate": 10}, "--request-rate"),
+        (
+            {"adaptive_max_concurrency": 8, "adaptive_metric": "unknown_metric"},
+            "Unknown metric tag in --adaptive-metric",
+        ),
+        (
+            {"adaptive_max_concurrency": 8, "adaptive_metric": "request_throughput"},
+            "is not a per-request metric",
+        ),
+    ],
+)
+def test_invalid_adaptive_concurrency(loadgen_kwargs, match):
+    """Test that an invalid adaptive concurrency config, or one combined with conflicting options, raises a validation error."""
+    with pytest.raises(ValueError, match=match):
+        _adaptive_config(**loadgen_kwargs)
+
+
+def _token_rate_config(**loadgen_kwargs) -> UserConfig:
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="test",
+        ),
+        loadgen=LoadGeneratorConfig(tokens_per_minute=90000, **loadgen_kwargs),
+    )
+
+
+@pytest.mark.parametrize(
+    "loadgen_kwargs,expected_stimulus",
+    [
+        ({}, "tpm90000_input"),
+        ({"concurrency": 16}, "tpm90000_input"),
+        (
+            {"token_rate_type": "total", "token_rate_feedback": True},
+            "tpm90000_total",
+        ),
+    ],
+)
+def test_token_rate_timing_mode(loadgen_kwargs, expected_stimulus):
+    """Test that a token rate selects the token rate timing mode, leaving the concurrency limit optional."""
+    config = _token_rate_config(**loadgen_kwargs)
+
+    assert config.timing_mode == TimingMode.TOKEN_RATE
+    assert config.loadgen.concurrency == loadgen_kwargs.get("concurrency")
+    assert config._get_artifact_stimulus() == expected_stimulus
+
+
+@pytest.mark.parametrize(
+    "loadgen_kwargs,match",
+    [
+        ({"request_rate": 10}, "cannot be used with --request-rate"),
+        ({"request_rate_mode": "poisson"}, "cannot be used with --request-rate-mode"),
+        ({"token_rate_feedback": True}, "requires --token-rate-type total"),
+    ],
+)
+def test_invalid_token_rate(loadgen_kwargs, match):
+    """Test that a token rate combined with conflicting options raises a validation error."""
+    with pytest.raises(ValueError, match=match):
+        _token_rate_config(**loadgen_kwargs)
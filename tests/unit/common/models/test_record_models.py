@@ -1,7 +1,17 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from aiperf.common.models import MetricResult, ProfileResults
+import pytest
+
+from aiperf.common.messages import InferenceResultsMessage, Message
+from aiperf.common.models import (
+    MetricResult,
+    ProfileResults,
+    RawResponseBuffer,
+    RequestRecord,
+    SSEMessage,
+    TextResponse,
+)
 
 
 class TestProfileResults:
@@ -113,3 +123,76 @@ class TestProfileResults:
         for i in range(3):
             assert i in profile_results.timeslice_metric_results
             assert len(profile_results.timeslice_metric_results[i]) == 2
+
+
+class TestRawResponseBuffer:
+    """Test cases for the RawResponseBuffer model and its use in RequestRecord."""
+
+    @pytest.fixture
+    def buffer(self) -> RawResponseBuffer:
+        return RawResponseBuffer.from_chunks(
+            [
+                (100, b'data: {"text": "Hello"}'),
+                (200, b'data: {"text": "W\xc3\xb6rld"}'),
+                (300, b"data: [DONE]"),
+            ],
+            content_type="text/event-stream",
+        )
+
+    def test_from_chunks_builds_index(self, buffer: RawResponseBuffer):
+        assert len(buffer) == 3
+        assert buffer.offsets == [0, 23, 47]
+        assert buffer.lengths == [23, 24, 12]
+        assert buffer.perf_ns == [100, 200, 300]
+        assert buffer.get_bytes(1) == b'data: {"text": "W\xc3\xb6rld"}'
+
+    def test_decode_on_demand(self, buffer: RawResponseBuffer):
+        assert buffer.get_text(0) == '{"text": "Hello"}'
+        assert buffer.get_json(1) == {"text": "Wörld"}
+        assert buffer.get_json(2) is None
+        message = buffer.get_response(2)
+        assert isinstance(message, SSEMessage)
+        assert message.perf_ns == 300
+
+    def test_non_sse_content_type_decodes_to_text_response(self):
+        buffer = RawResponseBuffer.from_chunks(
+            [(100, b'{"ok": true}')], content_type="application/json"
+        )
+        response = buffer.get_response(0)
+        assert isinstance(response, TextResponse)
+        assert response.get_json() == {"ok": True}
+
+    def test_round_trip_through_zmq_message(self, buffer: RawResponseBuffer):
+        record = RequestRecord(start_perf_ns=50, raw_responses=buffer)
+        message = InferenceResultsMessage(service_id="worker", record=record)
+
+        parsed = Message.from_json(message.to_json_bytes())
+
+        assert parsed.record.raw_responses == buffer
+        assert parsed.record.responses == []
+
+    def test_request_record_uses_raw_responses(self, buffer: RawResponseBuffer):
+        record = RequestRecord(
+            start_perf_ns=50, recv_start_perf_ns=90, raw_responses=buffer
+        )
+
+        assert record.valid
+        assert record.response_count == 3
+        assert record.response_perf_ns == [100, 200, 300]
+        assert record.time_to_first_response_ns == 50
+        assert record.token_latency_ns(0) == 10
+        assert record.inter_token_latency_ns == 100
+        assert [r.get_text() for r in record.iter_responses()] == [
+            '{"text": "Hello"}',
+            '{"text": "Wörld"}',
+            "[DONE]",
+        ]
+
+    def test_request_record_without_responses_is_invalid(self):
+        record = RequestRecord(
+            start_perf_ns=50,
+            raw_responses=RawResponseBuffer(content_type="text/event-stream"),
+        )
+        assert not record.valid
+        record.create_error_from_invalid()
+        assert record.has_error
@@ -1,12 +1,13 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from pytest import param
 
-from aiperf.common.environment import _ServiceSettings
+from aiperf.common.environment import _DatasetSettings, _ServiceSettings
 
 
 class TestServiceSettingsUvloopWindows:
@@ -52,3 +53,32 @@ class TestServiceSettingsUvloopWindows:
         settings = _ServiceSettings(DISABLE_UVLOOP=manual_setting)
 
         assert settings.DISABLE_UVLOOP is expected_result
+
+
+class TestDatasetSettingsCacheDirs:
+    """Test suite for the default directories of the on-disk dataset caches."""
+
+    def test_cache_dirs_under_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test that the caches default to the aiperf directory in $XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        settings = _DatasetSettings()
+
+        cache_dirs = {settings.CONVERSATION_CACHE_DIR, settings.CORPUS_CACHE_DIR}
+        assert cache_dirs == {
+            tmp_path / "aiperf" / "conversations",
+            tmp_path / "aiperf" / "corpus",
+        }
+
+    def test_cache_dirs_under_home_cache(self, tmp_path, monkeypatch):
+        """Test that the caches default to ~/.cache/aiperf when $XDG_CACHE_HOME is not set."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        settings = _DatasetSettings()
+
+        cache_dirs = {settings.CONVERSATION_CACHE_DIR, settings.CORPUS_CACHE_DIR}
+        assert cache_dirs == {
+            tmp_path / ".cache" / "aiperf" / "conversations",
+            tmp_path / ".cache" / "aiperf" / "corpus",
+        }
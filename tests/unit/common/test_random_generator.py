@@ -344,5 +344,55 @@ class TestDocumentationAndEdgeCases:
         assert all(0.0 <= val < 1.0 for val in batch)
 
 
+class TestStreamReseeding:
+    """Test reseeding generators for independent streams, such as the conversations of a dataset."""
+
+    def test_stream_is_independent_of_previous_draws(self):
+        """Test that a stream produces the same sequence, no matter how many values were drawn before it."""
+        rng1 = RandomGenerator(seed=42, _internal=True)
+        rng2 = RandomGenerator(seed=42, _internal=True)
+        for _ in range(10):
+            rng2.random()
+        rng2.reseed_stream(1)
+        rng2.normal()
+
+        rng1.reseed_stream(3)
+        rng2.reseed_stream(3)
+
+        assert [rng1.random() for _ in range(5)] == [rng2.random() for _ in range(5)]
+        assert rng1.normal() == rng2.normal()
+        assert rng1.seed == rng2.seed != 42
+
+    def test_different_streams_produce_different_values(self):
+        rng1 = RandomGenerator(seed=42, _internal=True)
+        rng2 = RandomGenerator(seed=42, _internal=True)
+        rng1.reseed_stream(0)
+        rng2.reseed_stream(1)
+
+        assert rng1.random() != rng2.random()
+
+    def test_non_deterministic_generator_is_unchanged(self):
+        rng_no_seed = RandomGenerator(seed=None, _internal=True)
+        rng_no_seed.reseed_stream(1)
+
+        assert rng_no_seed.seed is None
+
+    def test_reseed_streams_of_components(self):
+        """Test that every RandomGenerator attribute of the components is reseeded, and None components are skipped."""
+
+        class Component:
+            def __init__(self, seed: int):
+                self._rng = RandomGenerator(seed=seed, _internal=True)
+                self.name = "component"
+
+        component1, component2 = Component(1), Component(2)
+        rng.reseed_streams(5, component1, None, component2)
+
+        expected1 = RandomGenerator(seed=1, _internal=True)
+        expected1.reseed_stream(5)
+        assert component1._rng.seed == expected1.seed
+        assert component2._rng.seed not in (2, expected1.seed)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
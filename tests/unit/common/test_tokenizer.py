@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import tokenizers
+from tokenizers.models import WordLevel
+from transformers import PreTrainedTokenizerFast
 
 from aiperf.common.exceptions import NotInitializedError
 from aiperf.common.tokenizer import Tokenizer
@@ -39,3 +42,27 @@ class TestTokenizer:
             revision="11c5a3d5811f50298f278a704980280950aedb10",
         )
         assert tokenizer._tokenizer is not None
+
+    def test_identity(self, mock_tokenizer_cls):
+        assert Tokenizer().identity is None
+
+        tokenizer = mock_tokenizer_cls.from_pretrained("gpt2")
+        tokenizer._tokenizer.backend_tokenizer = None
+        assert tokenizer.identity is None
+
+    def test_identity_of_serialized_tokenizer(self):
+        def fast_tokenizer(vocab: dict[str, int]) -> Tokenizer:
+            tokenizer = Tokenizer()
+            tokenizer._tokenizer = PreTrainedTokenizerFast(
+                tokenizer_object=tokenizers.Tokenizer(
+                    WordLevel(vocab, unk_token="[UNK]")
+                )
+            )
+            return tokenizer
+
+        vocab = {"[UNK]": 0, "hello": 1, "world": 2}
+        identity = fast_tokenizer(vocab).identity
+
+        assert len(identity) == 64
+        assert fast_tokenizer(vocab).identity == identity
+        assert fast_tokenizer({**vocab, "again": 3}).identity != identity
@@ -20,6 +20,7 @@ from aiperf.common import random_generator as rng
 from aiperf.common.aiperf_logger import _TRACE
 from aiperf.common.config import EndpointConfig, ServiceConfig, UserConfig
 from aiperf.common.enums import CommunicationBackend, ServiceRunType
+from aiperf.common.environment import Environment
 from aiperf.common.messages import Message
 from aiperf.common.models import (
     Conversation,
@@ -108,6 +109,26 @@ def no_sleep(monkeypatch) -> None:
     monkeypatch.setattr(asyncio, "sleep", fast_sleep)
 
 
+@pytest.fixture(autouse=True)
+def isolate_dataset_caches(tmp_path, monkeypatch) -> None:
+    """
+    Disable the corpus cache, and point the on-disk dataset caches at the temporary
+    directory of each test.
+
+    This prevents tests from writing cached corpora or conversations into the working tree.
+    Tests of the corpus cache enable it explicitly.
+    """
+    monkeypatch.setattr(Environment.DATASET, "CORPUS_CACHE", False)
+    monkeypatch.setattr(
+        Environment.DATASET, "CORPUS_CACHE_DIR", tmp_path / "cache" / "corpus"
+    )
+    monkeypatch.setattr(
+        Environment.DATASET,
+        "CONVERSATION_CACHE_DIR",
+        tmp_path / "cache" / "conversations",
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def load_aiperf_modules() -> None:
     """Load all AIPerf modules for testing.
@@ -3,11 +3,12 @@
 
 import asyncio
 from multiprocessing import Process
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from aiperf.common.enums import ServiceType
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import AIPerfError
 from aiperf.controller.multiprocess_service_manager import (
     MultiProcessRunInfo,
@@ -164,3 +165,34 @@ class TestMultiProcessServiceManager:
         await service_manager.wait_for_all_services_registration(
             stop_event=stop_event, timeout_seconds=10
         )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "service_type,parallel_generation,expected_daemon",
+        [
+            (ServiceType.DATASET_MANAGER, False, True),
+            (ServiceType.DATASET_MANAGER, True, False),
+            (ServiceType.TIMING_MANAGER, True, True),
+        ],
+    )
+    async def test_dataset_manager_not_daemon_with_parallel_generation(
+        self,
+        service_manager: MultiProcessServiceManager,
+        monkeypatch: pytest.MonkeyPatch,
+        service_type: ServiceType,
+        parallel_generation: bool,
+        expected_daemon: bool,
+    ):
+        """Test that the DatasetManager is not run as a daemon process when it generates the dataset in a pool of
+        processes, as daemon processes cannot have children."""
+        monkeypatch.setattr(
+            Environment.DATASET, "PARALLEL_GENERATION", parallel_generation
+        )
+
+        with patch(
+            "aiperf.controller.multiprocess_service_manager.Process",
+            return_value=MagicMock(spec=Process),
+        ) as mock_process:
+            await service_manager.run_service(service_type)
+
+        assert mock_process.call_args.kwargs["daemon"] is expected_daemon
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import multiprocessing
 from unittest.mock import patch
 
 import pytest
@@ -22,10 +23,27 @@ from aiperf.common.config import (
     TurnDelayConfig,
     UserConfig,
 )
+from aiperf.common.environment import Environment
 from aiperf.common.models import Audio, Conversation, Image, Text, Turn
 from aiperf.dataset.composer.synthetic import SyntheticDatasetComposer
 
 
+class InProcessExecutor:
+    """Runs the initializer and the tasks of a process pool in the current process, in order."""
+
+    def __init__(self, max_workers, initializer, initargs):
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def map(self, fn, *iterables, chunksize=1):
+        return list(map(fn, *iterables))
+
+
 class TestSyntheticDatasetComposer:
     # ============================================================================
     # Initialization Tests
@@ -641,6 +659,103 @@ class TestSyntheticDatasetComposer:
                 assert turn1.audios[0].contents == turn2.audios[0].contents
                 assert turn1.delay == turn2.delay
 
+    def test_conversation_independent_of_previous_conversations(
+        self, multimodal_config, mock_tokenizer
+    ):
+        """Test that each conversation only depends on its index, and not on the conversations generated before it."""
+        multimodal_config.input.conversation.num_dataset_entries = 3
+        multimodal_config.input.conversation.turn = TurnConfig(mean=2, stddev=2)
+
+        rng.reset()
+        rng.init(42)
+        composer = SyntheticDatasetComposer(multimodal_config, mock_tokenizer)
+        conversations = composer.create_dataset()
+
+        conversation = composer._create_indexed_conversation(
+            2, conversations[2].session_id
+        )
+        assert conversation.model_dump() == conversations[2].model_dump()
+
+    @pytest.mark.parametrize("num_workers", [1, 2, 3])
+    @pytest.mark.parametrize("model_selection_strategy", ["random", "round_robin"])
+    def test_parallel_generation_matches_serial_generation(
+        self,
+        multimodal_config,
+        mock_tokenizer,
+        monkeypatch,
+        model_selection_strategy,
+        num_workers,
+    ):
+        """Test that generating the conversations with parallel generation produces the same dataset as without it.
+
+        The mock tokenizer cannot be pickled, so the process pool runs its workers in the current process, each
+        with a composer created by the initializer of the pool."""
+        multimodal_config.input.random_seed = 42
+        multimodal_config.input.conversation.num_dataset_entries = 4
+        multimodal_config.input.conversation.turn = TurnConfig(
+            mean=2, stddev=2, delay=TurnDelayConfig(mean=1500, stddev=2)
+        )
+        multimodal_config.endpoint.model_selection_strategy = model_selection_strategy
+        multimodal_config.endpoint.model_names = ["test-model-1", "test-model-2"]
+
+        monkeypatch.setattr(Environment.DATASET, "PARALLEL_GENERATION", False)
+        rng.reset()
+        rng.init(42)
+        serial = SyntheticDatasetComposer(
+            multimodal_config, mock_tokenizer
+        ).create_dataset()
+
+        monkeypatch.setattr(Environment.DATASET, "PARALLEL_GENERATION", True)
+        monkeypatch.setattr(Environment.DATASET, "GENERATION_WORKERS", num_workers)
+        monkeypatch.setattr(
+            "aiperf.dataset.composer.synthetic.ProcessPoolExecutor", InProcessExecutor
+        )
+        rng.reset()
+        rng.init(42)
+        parallel = SyntheticDatasetComposer(
+            multimodal_config, mock_tokenizer
+        ).create_dataset()
+
+        assert [conversation.model_dump() for conversation in parallel] == [
+            conversation.model_dump() for conversation in serial
+        ]
+
+    def test_parallel_generation_in_daemon_process_falls_back_to_serial(
+        self, multimodal_config, mock_tokenizer, monkeypatch
+    ):
+        """Test that parallel generation in a daemon process, such as a service process, generates the same dataset
+        serially, as daemon processes cannot start a process pool."""
+        multimodal_config.input.random_seed = 42
+        multimodal_config.input.conversation.num_dataset_entries = 4
+        multimodal_config.input.conversation.turn = TurnConfig(mean=2, stddev=2)
+
+        monkeypatch.setattr(Environment.DATASET, "PARALLEL_GENERATION", False)
+        rng.reset()
+        rng.init(42)
+        serial = SyntheticDatasetComposer(
+            multimodal_config, mock_tokenizer
+        ).create_dataset()
+
+        monkeypatch.setattr(Environment.DATASET, "PARALLEL_GENERATION", True)
+        monkeypatch.setattr(Environment.DATASET, "GENERATION_WORKERS", 2)
+        rng.reset()
+        rng.init(42)
+        composer = SyntheticDatasetComposer(multimodal_config, mock_tokenizer)
+
+        # The mock tokenizer cannot be pickled, so the daemon process is forked with the composer
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        process = context.Process(
+            target=_create_dataset_in_process, args=(composer, results), daemon=True
+        )
+        process.start()
+        # The results are read before joining, as the process waits for them to be read before exiting
+        dataset = results.get(timeout=60)
+        process.join(timeout=60)
+
+        assert process.exitcode == 0
+        assert dataset == [conversation.model_dump() for conversation in serial]
+
     # ============================================================================
     # Model Selection Strategy Tests
     # ============================================================================
@@ -702,3 +817,14 @@ class TestSyntheticDatasetComposer:
         for conversation in conversations:
             for turn in conversation.turns:
                 assert turn.max_tokens is None
+
+
+def _create_dataset_in_process(composer, results) -> None:
+    """Create the dataset of the composer, and put the dumped conversations in the results queue."""
+    try:
+        results.put(
+            [conversation.model_dump() for conversation in composer.create_dataset()]
+        )
+    except BaseException as e:
+        results.put(repr(e))
+        raise
@@ -10,9 +10,11 @@ including edge cases, error conditions, and integration scenarios.
 
 from unittest.mock import mock_open, patch
 
+import numpy as np
 import pytest
 
 from aiperf.common.config import PrefixPromptConfig, PromptConfig
+from aiperf.common.environment import Environment
 from aiperf.common.exceptions import (
     ConfigurationError,
     InvalidStateError,
@@ -329,7 +331,7 @@ class TestPromptGeneratorComprehensive:
             tokens = generator._sample_tokens(3)
 
             assert len(tokens) == 3
-            assert all(isinstance(t, int) for t in tokens)
+            assert tokens.dtype == np.int32
 
     def test_sample_tokens_wrap_around(self, basic_config):
         """Test _sample_tokens when it needs to wrap around the corpus."""
@@ -342,12 +344,12 @@ class TestPromptGeneratorComprehensive:
             generator._corpus_rng, "randrange", return_value=corpus_size - 2
         ):
             tokens = generator._sample_tokens(5)
-            expected_tokens = (
-                generator._tokenized_corpus[corpus_size - 2 : corpus_size]
-                + generator._tokenized_corpus[:3]
-            )
+            expected_tokens = [
+                *generator._tokenized_corpus[corpus_size - 2 : corpus_size],
+                *generator._tokenized_corpus[:3],
+            ]
             assert len(tokens) == 5
-            assert tokens == expected_tokens
+            assert tokens.tolist() == expected_tokens
 
     def test_sample_tokens_exact_corpus_size(self, basic_config):
         """Test _sample_tokens when requesting exactly corpus size."""
@@ -359,7 +361,9 @@ class TestPromptGeneratorComprehensive:
             tokens = generator._sample_tokens(corpus_size)
 
             assert len(tokens) == corpus_size
-            assert tokens == generator._tokenized_corpus
+            assert np.array_equal(tokens, generator._tokenized_corpus)
+            # The sample is a view of the corpus, not a copy
+            assert np.shares_memory(tokens, generator._tokenized_corpus)
 
     @patch("aiperf.common.mixins.aiperf_logger_mixin.AIPerfLoggerMixin.warning")
     def test_sample_tokens_longer_than_corpus_with_warning(
@@ -382,7 +386,7 @@ class TestPromptGeneratorComprehensive:
         """Test _sample_tokens with empty corpus."""
         tokenizer, config = basic_config
         generator = PromptGenerator(config, tokenizer)
-        generator._tokenized_corpus = []
+        generator._tokenized_corpus = np.array([], dtype=np.int32)
         generator._corpus_size = 0
 
         with pytest.raises(NotInitializedError):
@@ -439,8 +443,8 @@ class TestPromptGeneratorComprehensive:
 
         assert generator._tokenized_corpus is not None
         assert generator._corpus_size > 0
-        assert isinstance(generator._tokenized_corpus, list)
-        assert all(isinstance(token, int) for token in generator._tokenized_corpus)
+        assert isinstance(generator._tokenized_corpus, np.ndarray)
+        assert generator._tokenized_corpus.dtype == np.int32
 
     # ============================================================================
     # _create_prefix_prompt_pool Method Tests
@@ -471,3 +475,90 @@ class TestPromptGeneratorComprehensive:
 
         assert len(generator._prefix_prompts) == 5
         assert all(prompt == "" for prompt in generator._prefix_prompts)
+
+
+class TestPromptGeneratorCorpusCache:
+    """Tests for the on-disk cache of the tokenized corpus."""
+
+    @pytest.fixture
+    def corpus_cache_dir(self, tmp_path, monkeypatch):
+        corpus_file = tmp_path / "corpus.txt"
+        corpus_file.write_text(MOCK_CORPUS_CONTENT)
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(
+            "aiperf.dataset.generator.prompt.DEFAULT_CORPUS_FILE", str(corpus_file)
+        )
+        monkeypatch.setattr(Environment.DATASET, "CORPUS_CACHE", True)
+        monkeypatch.setattr(Environment.DATASET, "CORPUS_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    @pytest.fixture
+    def named_tokenizer(self, mock_tokenizer_cls):
+        tokenizer = mock_tokenizer_cls.from_pretrained("gpt2")
+        tokenizer._tokenizer.backend_tokenizer.to_str.return_value = '{"model": {}}'
+        return tokenizer
+
+    @pytest.fixture
+    def config(self):
+        return PromptConfig(prefix_prompt=PrefixPromptConfig(pool_size=0, length=0))
+
+    def test_corpus_is_cached_and_memory_mapped(
+        self, corpus_cache_dir, named_tokenizer, config
+    ):
+        generator = PromptGenerator(config, named_tokenizer)
+        assert len(list(corpus_cache_dir.glob("*.npy"))) == 1
+        assert named_tokenizer.encode.called
+
+        named_tokenizer.encode.reset_mock()
+        cached_generator = PromptGenerator(config, named_tokenizer)
+
+        assert not named_tokenizer.encode.called
+        assert isinstance(cached_generator._tokenized_corpus, np.memmap)
+        assert np.array_equal(
+            cached_generator._tokenized_corpus, generator._tokenized_corpus
+        )
+
+    def test_corrupted_cache_is_retokenized(
+        self, corpus_cache_dir, named_tokenizer, config
+    ):
+        generator = PromptGenerator(config, named_tokenizer)
+        [cache_file] = corpus_cache_dir.glob("*.npy")
+        cache_file.write_bytes(b"not a corpus")
+
+        cached_generator = PromptGenerator(config, named_tokenizer)
+
+        assert np.array_equal(
+            cached_generator._tokenized_corpus, generator._tokenized_corpus
+        )
+        assert np.array_equal(np.load(cache_file), generator._tokenized_corpus)
+
+    def test_corpus_is_not_cached_without_tokenizer_identity(
+        self, corpus_cache_dir, mock_tokenizer_cls, config
+    ):
+        tokenizer = mock_tokenizer_cls.from_pretrained("gpt2")
+        tokenizer._tokenizer.backend_tokenizer = None
+        PromptGenerator(config, tokenizer)
+
+        assert not corpus_cache_dir.exists()
+
+    def test_corpus_is_not_cached_when_disabled(
+        self, corpus_cache_dir, named_tokenizer, config, monkeypatch
+    ):
+        monkeypatch.setattr(Environment.DATASET, "CORPUS_CACHE", False)
+        PromptGenerator(config, named_tokenizer)
+
+        assert not corpus_cache_dir.exists()
+
+    def test_changed_tokenizer_is_not_loaded_from_cache(
+        self, corpus_cache_dir, mock_tokenizer_cls, named_tokenizer, config
+    ):
+        PromptGenerator(config, named_tokenizer)
+
+        changed_tokenizer = mock_tokenizer_cls.from_pretrained("gpt2")
+        changed_tokenizer._tokenizer.backend_tokenizer.to_str.return_value = (
+            '{"model": {"vocab": {}}}'
+        )
+        PromptGenerator(config, changed_tokenizer)
+
+        assert changed_tokenizer.encode.called
+        assert len(list(corpus_cache_dir.glob("*.npy"))) == 2
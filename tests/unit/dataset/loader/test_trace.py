@@ -7,7 +7,12 @@ import pytest
 
 from aiperf.common.config import EndpointConfig, InputConfig, UserConfig
 from aiperf.common.enums import CustomDatasetType
-from aiperf.dataset import MooncakeTrace, MooncakeTraceDatasetLoader
+from aiperf.common.models import Conversation
+from aiperf.dataset import (
+    LazyMooncakeTraceDataset,
+    MooncakeTrace,
+    MooncakeTraceDatasetLoader,
+)
 
 
 class TestMooncakeTrace:
@@ -475,3 +480,144 @@ class TestMooncakeTraceDatasetLoader:
 
         assert traces[0][0].delay == 500
         assert traces[1][0].delay == 1000
+
+
+class TestLazyMooncakeTraceDataset:
+    """Tests for the line-offset index and the lazy dataset of a Mooncake trace file."""
+
+    @pytest.fixture
+    def mock_prompt_generator(self):
+        """Create a mock prompt generator for testing."""
+        generator = Mock()
+        generator.generate.return_value = "Generated prompt text"
+        return generator
+
+    def build_index(self, filename, prompt_generator, **input_kwargs):
+        loader = MooncakeTraceDatasetLoader(
+            filename=filename,
+            user_config=UserConfig(
+                endpoint=EndpointConfig(model_names=["test-model"]),
+                input=InputConfig(**input_kwargs),
+            ),
+            prompt_generator=prompt_generator,
+        )
+        return loader.build_index()
+
+    def test_build_index_groups_sessions(
+        self, create_jsonl_file, mock_prompt_generator
+    ):
+        """Test that the traces of each session are read back in order, with the sessions in order of first appearance."""
+        content = [
+            '{"session_id": "b", "input_length": 100, "hash_ids": [1], "timestamp": 1000}',
+            '{"session_id": "a", "text_input": "Hello", "timestamp": 1500}',
+            '',
+            '{"session_id": "b", "input_length": 200, "hash_ids": [2], "timestamp": 2000}',
+            '{"session_id": "a", "text_input": "World", "timestamp": 2500}',
+        ]  # fmt: skip
+        index = self.build_index(create_jsonl_file(content), mock_prompt_generator)
+
+        assert index.session_ids == ["b", "a"]
+        assert index.num_traces == 4
+        assert "a" in index and "c" not in index
+        assert [trace.input_length for trace in index.read_session("b")] == [100, 200]
+        assert [trace.text_input for trace in index.read_session("a")] == [
+            "Hello",
+            "World",
+        ]
+        timestamps, session_numbers = index.timing_arrays()
+        assert timestamps.tolist() == [1000, 2000, 1500, 2500]
+        assert session_numbers.tolist() == [0, 0, 1, 1]
+        with pytest.raises(KeyError):
+            index.read_session("c")
+        index.close()
+
+    def test_build_index_with_offset_filtering(
+        self, create_jsonl_file, mock_prompt_generator
+    ):
+        """Test that the traces outside of the fixed schedule offsets are not indexed."""
+        content = [
+            '{"input_length": 100, "hash_ids": [123], "timestamp": 1000}',
+            '{"input_length": 150, "hash_ids": [456], "timestamp": 2000}',
+            '{"input_length": 200, "hash_ids": [789], "timestamp": 3000}',
+        ]  # fmt: skip
+        index = self.build_index(
+            create_jsonl_file(content),
+            mock_prompt_generator,
+            fixed_schedule_start_offset=1500,
+            fixed_schedule_end_offset=2500,
+        )
+
+        assert len(index) == 1
+        assert index.timing_arrays()[0].tolist() == [2000]
+        index.close()
+
+    def test_timing_arrays_without_timestamps_raises(
+        self, create_jsonl_file, mock_prompt_generator
+    ):
+        content = [
+            '{"session_id": "abc", "input_length": 100, "timestamp": 1000}',
+            '{"session_id": "abc", "input_length": 100, "delay": 500}',
+        ]
+        index = self.build_index(create_jsonl_file(content), mock_prompt_generator)
+
+        with pytest.raises(ValueError, match="1 traces .* do not have a timestamp"):
+            index.timing_arrays()
+        index.close()
+
+    def test_conversations_are_created_on_demand_and_cached(
+        self, create_jsonl_file, mock_prompt_generator
+    ):
+        """Test that each conversation is created when requested, and evicted from the cache once it is full."""
+        content = [
+            f'{{"session_id": "s{i}", "input_length": 100, "hash_ids": [{i}], "timestamp": {i}}}'
+            for i in range(3)
+        ]
+        index = self.build_index(create_jsonl_file(content), mock_prompt_generator)
+        create_conversation = Mock(
+            side_effect=lambda session_id, traces: Conversation(session_id=session_id)
+        )
+        dataset = LazyMooncakeTraceDataset(index, create_conversation, cache_size=2)
+
+        assert len(dataset) == 3
+        assert list(dataset) == ["s0", "s1", "s2"]
+        assert "s1" in dataset and "s3" not in dataset
+        create_conversation.assert_not_called()
+
+        assert dataset["s0"].session_id == "s0"
+        assert dataset["s1"].session_id == "s1"
+        assert dataset["s0"].session_id == "s0"
+        assert create_conversation.call_count == 2
+
+        # s1 is the least recently used conversation, so it is evicted and created again
+        assert dataset["s2"].session_id == "s2"
+        assert dataset["s0"].session_id == "s0"
+        assert create_conversation.call_count == 3
+        assert dataset["s1"].session_id == "s1"
+        assert create_conversation.call_count == 4
+        assert [
+            call.args[1][0].hash_ids for call in create_conversation.call_args_list
+        ] == [[0], [1], [2], [1]]
+        dataset.close()
+
+    def test_token_lengths_from_index(self, create_jsonl_file, mock_prompt_generator):
+        """Test that the token lengths of each session are read from the index, without creating the conversations."""
+        content = [
+            '{"session_id": "a", "input_length": 100, "output_length": 10, "timestamp": 1000}',
+            '{"session_id": "b", "text_input": "Hello world", "output_length": 5, "timestamp": 1500}',
+            '{"session_id": "a", "input_length": 200, "output_length": 20, "timestamp": 2000}',
+            '{"session_id": "b", "input_length": 50, "timestamp": 2500}',
+        ]  # fmt: skip
+        index = self.build_index(create_jsonl_file(content), mock_prompt_generator)
+        create_conversation = Mock()
+        dataset = LazyMooncakeTraceDataset(index, create_conversation, cache_size=2)
+
+        assert index.sample_text_inputs(10) == ["Hello world"]
+        token_lengths = dataset.token_lengths(text_tokens_per_char=0.5)
+
+        assert [
+            (lengths.conversation_id, lengths.input_tokens, lengths.output_tokens)
+            for lengths in token_lengths
+        ] == [("a", 300, 30), ("b", 56, None)]
+        assert [lengths.turns for lengths in token_lengths] == [2, 2]
+        create_conversation.assert_not_called()
+        dataset.close()
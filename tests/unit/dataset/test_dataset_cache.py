@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.common.config import UserConfig
+from aiperf.common.models import Conversation, Text, Turn
+from aiperf.dataset.dataset_cache import DatasetCache, dataset_cache_key
+
+
+def _conversation(session_id: str, num_turns: int = 1) -> Conversation:
+    return Conversation(
+        session_id=session_id,
+        turns=[
+            Turn(
+                texts=[Text(contents=[f"{session_id} prompt {i} ✓"])],
+                max_tokens=10 * (i + 1),
+                delay=100 if i > 0 else None,
+            )
+            for i in range(num_turns)
+        ],
+    )
+
+
+@pytest.fixture
+def seeded_config(user_config: UserConfig) -> UserConfig:
+    user_config.input.random_seed = 42
+    return user_config
+
+
+class TestDatasetCacheKey:
+    def test_key_is_stable(self, seeded_config):
+        assert dataset_cache_key(seeded_config) == dataset_cache_key(
+            seeded_config.model_copy(deep=True)
+        )
+
+    def test_key_changes_with_seed(self, seeded_config):
+        other_config = seeded_config.model_copy(deep=True)
+        other_config.input.random_seed = 43
+
+        assert dataset_cache_key(seeded_config) != dataset_cache_key(other_config)
+
+    def test_key_changes_with_tokenizer(self, seeded_config):
+        other_config = seeded_config.model_copy(deep=True)
+        other_config.tokenizer.name = "other-tokenizer"
+
+        assert dataset_cache_key(seeded_config) != dataset_cache_key(other_config)
+
+    def test_key_changes_with_input_file(self, seeded_config, tmp_path):
+        input_file = tmp_path / "inputs.jsonl"
+        input_file.write_text('{"text": "hello"}\n')
+        seeded_config.input.file = input_file
+        key = dataset_cache_key(seeded_config)
+
+        input_file.write_text('{"text": "hello world"}\n')
+
+        assert dataset_cache_key(seeded_config) != key
+
+
+class TestDatasetCache:
+    def test_round_trip(self, tmp_path):
+        conversations = [_conversation(f"session_{i}", i + 1) for i in range(3)]
+        DatasetCache(tmp_path, "key").save(conversations)
+
+        assert DatasetCache(tmp_path, "key").load() == conversations
+        assert list(tmp_path.iterdir()) == [tmp_path / "key.dataset"]
+
+    def test_missing_entry(self, tmp_path):
+        assert DatasetCache(tmp_path, "missing").load() is None
+
+    def test_corrupted_entry(self, tmp_path):
+        cache = DatasetCache(tmp_path, "key")
+        cache.path.write_bytes(b"not a dataset")
+
+        with pytest.raises(ValueError, match="Corrupted dataset cache entry"):
+            cache.load()
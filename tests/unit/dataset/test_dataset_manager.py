@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import orjson
 import pytest
 
 from aiperf.common.config import EndpointConfig, InputConfig, ServiceConfig, UserConfig
 from aiperf.common.enums import CustomDatasetType
+from aiperf.common.environment import Environment
+from aiperf.common.exceptions import ServiceError
+from aiperf.common.messages import (
+    ConversationBatchRequestMessage,
+    ConversationIdRequestMessage,
+    DatasetTimingRequest,
+    DatasetTimingResponse,
+    DatasetTokenLengthsRequest,
+)
 from aiperf.common.messages.command_messages import ProfileConfigureCommand
+from aiperf.common.models import Conversation, ModelEndpointInfo, Text, Turn
 from aiperf.dataset.dataset_manager import DatasetManager
 from aiperf.dataset.dataset_samplers import SequentialSampler
 
@@ -220,3 +231,240 @@ class TestDatasetManagerSequentialIteration:
 
         finally:
             Path(filename).unlink(missing_ok=True)
+
+
+class TestDatasetManagerPrerenderPayloads:
+    """Test pre-rendering the request payloads of the first turn of each conversation."""
+
+    def test_prerender_payloads_first_turn_only(self, populated_dataset_manager):
+        model_endpoint = ModelEndpointInfo.from_user_config(
+            populated_dataset_manager.user_config
+        )
+        populated_dataset_manager._prerender_payloads(model_endpoint)
+
+        for conversation in populated_dataset_manager.dataset.values():
+            first_turn, *later_turns = conversation.turns
+            payload = orjson.loads(first_turn.rendered_payload)
+            assert payload["model"] == "test-model"
+            assert payload["messages"][0]["content"] == first_turn.texts[0].contents[0]
+            assert all(turn.rendered_payload is None for turn in later_turns)
+
+    async def test_inputs_json_unchanged_by_prerender(
+        self, populated_dataset_manager, capture_file_writes
+    ):
+        await populated_dataset_manager._generate_inputs_json_file()
+        expected = capture_file_writes.written_content
+
+        populated_dataset_manager._prerender_payloads(
+            ModelEndpointInfo.from_user_config(populated_dataset_manager.user_config)
+        )
+        await populated_dataset_manager._generate_inputs_json_file()
+
+        assert capture_file_writes.written_content == expected
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test_configure_dataset_prerender_setting(
+        self, populated_dataset_manager, sample_conversations, enabled
+    ):
+        populated_dataset_manager.publish = AsyncMock()
+        with (
+            patch.object(Environment.DATASET, "PRERENDER_PAYLOADS", enabled),
+            patch.object(
+                populated_dataset_manager,
+                "_load_synthetic_dataset",
+                return_value=list(sample_conversations.values()),
+            ),
+        ):
+            await populated_dataset_manager._configure_dataset()
+
+        first_turns = [
+            conversation.turns[0]
+            for conversation in populated_dataset_manager.dataset.values()
+        ]
+        assert all(
+            (turn.rendered_payload is not None) == enabled for turn in first_turns
+        )
+
+
+class TestDatasetManagerConversationBatch:
+    """Test handing out batches of conversations for worker prefetching."""
+
+    async def test_batch_follows_sampler_order(self, populated_dataset_manager):
+        populated_dataset_manager._dataset_sampler = SequentialSampler(
+            conversation_ids=list(populated_dataset_manager.dataset.keys())
+        )
+        populated_dataset_manager.dataset_configured.set()
+
+        response = await populated_dataset_manager._handle_conversation_batch_request(
+            ConversationBatchRequestMessage(service_id="worker", count=3)
+        )
+
+        assert [c.session_id for c in response.conversations] == [
+            "session_1",
+            "session_2",
+            "session_1",
+        ]
+
+    async def test_batch_requires_sampler(self, populated_dataset_manager):
+        populated_dataset_manager.dataset_configured.set()
+
+        with pytest.raises(Exception, match="sampler is not configured"):
+            await populated_dataset_manager._handle_conversation_batch_request(
+                ConversationBatchRequestMessage(service_id="worker", count=1)
+            )
+
+
+class TestDatasetManagerSharedMemory:
+    """Test serving conversations from the shared-memory dataset store."""
+
+    async def test_conversation_id_follows_sampler_order(
+        self, populated_dataset_manager
+    ):
+        populated_dataset_manager._dataset_sampler = SequentialSampler(
+            conversation_ids=list(populated_dataset_manager.dataset.keys())
+        )
+        populated_dataset_manager.dataset_configured.set()
+
+        conversation_ids = [
+            (
+                await populated_dataset_manager._handle_conversation_id_request(
+                    ConversationIdRequestMessage(service_id="worker")
+                )
+            ).conversation_id
+            for _ in range(3)
+        ]
+
+        assert conversation_ids == ["session_1", "session_2", "session_1"]
+
+    def test_create_shared_memory_store(self, populated_dataset_manager):
+        populated_dataset_manager._create_shared_memory_store()
+        store = populated_dataset_manager._shared_memory_store
+        try:
+            assert len(store) == len(populated_dataset_manager.dataset)
+            for session_id, conversation in populated_dataset_manager.dataset.items():
+                assert store.get_conversation(session_id) == conversation
+        finally:
+            populated_dataset_manager._release_shared_memory_store()
+
+        assert populated_dataset_manager._shared_memory_store is None
+
+
+class TestDatasetManagerTokenLengths:
+    """Test counting the tokens of each conversation for the token rate strategy."""
+
+    async def test_token_lengths(self, populated_dataset_manager):
+        populated_dataset_manager.tokenizer = Mock()
+        populated_dataset_manager.tokenizer.encode.side_effect = str.split
+        populated_dataset_manager.dataset_configured.set()
+
+        response = (
+            await populated_dataset_manager._handle_dataset_token_lengths_request(
+                DatasetTokenLengthsRequest(service_id="timing_manager")
+            )
+        )
+
+        token_lengths = {
+            lengths.conversation_id: lengths for lengths in response.token_lengths
+        }
+        # The output tokens are only known when every turn sets max_tokens
+        assert token_lengths["session_1"].input_tokens == 7
+        assert token_lengths["session_1"].output_tokens is None
+        assert token_lengths["session_1"].turns == 2
+        assert token_lengths["session_2"].input_tokens == 3
+        assert token_lengths["session_2"].output_tokens == 100
+        assert token_lengths["session_2"].turns == 1
+
+    async def test_token_lengths_of_large_dataset_are_estimated(
+        self, populated_dataset_manager, monkeypatch
+    ):
+        """Test that only a sample of a large dataset is tokenized, and the rest is estimated from its length."""
+        monkeypatch.setattr(Environment.DATASET, "TOKEN_LENGTHS_SAMPLE_SIZE", 2)
+        populated_dataset_manager.dataset = {
+            f"session_{i}": Conversation(
+                session_id=f"session_{i}",
+                turns=[Turn(texts=[Text(contents=["abcd" * (i + 1)])])],
+            )
+            for i in range(6)
+        }
+        populated_dataset_manager.tokenizer = Mock()
+        # One token per 2 characters
+        populated_dataset_manager.tokenizer.encode.side_effect = lambda text: (
+            [0] * (len(text) // 2)
+        )
+        populated_dataset_manager.dataset_configured.set()
+
+        response = (
+            await populated_dataset_manager._handle_dataset_token_lengths_request(
+                DatasetTokenLengthsRequest(service_id="timing_manager")
+            )
+        )
+
+        assert populated_dataset_manager.tokenizer.encode.call_count == 2
+        assert [lengths.input_tokens for lengths in response.token_lengths] == [
+            2 * (i + 1) for i in range(6)
+        ]
+
+
+class TestDatasetManagerTiming:
+    """Test serving the fixed schedule to the timing manager in chunks sorted by timestamp."""
+
+    @pytest.fixture
+    def timed_dataset_manager(self, populated_dataset_manager):
+        populated_dataset_manager.dataset = {
+            "session_1": Conversation(
+                session_id="session_1",
+                turns=[Turn(timestamp=300), Turn(timestamp=100)],
+            ),
+            "session_2": Conversation(
+                session_id="session_2",
+                turns=[Turn(timestamp=200), Turn(timestamp=100)],
+            ),
+        }
+        populated_dataset_manager._session_ids_cache = ["session_1", "session_2"]
+        populated_dataset_manager.dataset_configured.set()
+        return populated_dataset_manager
+
+    @pytest.mark.parametrize(
+        "offset,limit,expected",
+        [
+            (0, None, [(100, "session_1"), (100, "session_2"), (200, "session_2"), (300, "session_1")]),
+            (0, 3, [(100, "session_1"), (100, "session_2"), (200, "session_2")]),
+            (3, 3, [(300, "session_1")]),
+            (4, 3, []),
+        ],
+    )  # fmt: skip
+    async def test_timing_chunks(self, timed_dataset_manager, offset, limit, expected):
+        response = await timed_dataset_manager._handle_dataset_timing_request(
+            DatasetTimingRequest(
+                service_id="timing_manager", offset=offset, limit=limit
+            )
+        )
+
+        timestamps, conversation_indices = response.timing_arrays()
+        assert [
+            (timestamp, response.conversation_ids[index])
+            for timestamp, index in zip(
+                timestamps.tolist(), conversation_indices.tolist(), strict=True
+            )
+        ] == expected
+        assert len(response.conversation_ids) == len(set(response.conversation_ids))
+        assert response.total_count == 4
+
+    async def test_timing_chunk_round_trips_as_json(self, timed_dataset_manager):
+        response = await timed_dataset_manager._handle_dataset_timing_request(
+            DatasetTimingRequest(service_id="timing_manager")
+        )
+
+        decoded = DatasetTimingResponse.from_json(response.to_json_bytes())
+
+        assert decoded.timestamps == response.timestamps
+        assert decoded.conversation_indices == response.conversation_indices
+        assert decoded.conversation_ids == response.conversation_ids
+
+    async def test_timing_without_timestamps_raises(self, timed_dataset_manager):
+        timed_dataset_manager.dataset["session_2"].turns.append(Turn())
+
+        with pytest.raises(ServiceError, match="1 turns do not have a timestamp"):
+            await timed_dataset_manager._handle_dataset_timing_request(
+                DatasetTimingRequest(service_id="timing_manager")
+            )
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+
+import pytest
+
+from aiperf.common.exceptions import NotFoundError
+from aiperf.common.models import Conversation, Image, Text, Turn
+from aiperf.dataset.shared_memory_store import SharedMemoryDatasetStore
+
+
+def _conversation(session_id: str, num_turns: int = 1) -> Conversation:
+    return Conversation(
+        session_id=session_id,
+        turns=[
+            Turn(
+                texts=[Text(contents=[f"{session_id} prompt {i} ✓"])],
+                images=[Image(contents=["data:image/png;base64,AAAA"])],
+                max_tokens=10 * (i + 1),
+                delay=100 if i > 0 else None,
+            )
+            for i in range(num_turns)
+        ],
+    )
+
+
+def _read_in_child(name: str, session_id: str, queue: multiprocessing.Queue) -> None:
+    store = SharedMemoryDatasetStore.attach(name)
+    queue.put(store.get_conversation(session_id).model_dump_json())
+    store.close()
+
+
+@pytest.fixture
+def conversations() -> list[Conversation]:
+    return [_conversation(f"session_{i}", num_turns=i + 1) for i in range(5)]
+
+
+@pytest.fixture
+def store(conversations):
+    store = SharedMemoryDatasetStore.create(conversations)
+    yield store
+    store.close()
+
+
+class TestSharedMemoryDatasetStore:
+    def test_round_trip(self, store, conversations):
+        assert len(store) == len(conversations)
+        for conversation in conversations:
+            assert conversation.session_id in store
+            assert store.get_conversation(conversation.session_id) == conversation
+
+    def test_attach_reads_same_conversations(self, store, conversations):
+        attached = SharedMemoryDatasetStore.attach(store.name)
+        try:
+            assert len(attached) == len(conversations)
+            assert attached.get_conversation("session_3") == conversations[3]
+        finally:
+            attached.close()
+
+        # Closing an attached store must not remove the segment
+        assert store.get_conversation("session_3") == conversations[3]
+
+    def test_attach_from_another_process(self, store, conversations):
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(
+            target=_read_in_child, args=(store.name, "session_4", queue)
+        )
+        process.start()
+        result = queue.get(timeout=30)
+        process.join(timeout=30)
+
+        assert Conversation.model_validate_json(result) == conversations[4]
+
+    def test_missing_conversation(self, store):
+        assert "missing" not in store
+        with pytest.raises(NotFoundError, match="missing not found"):
+            store.get_conversation("missing")
+
+    def test_empty_dataset(self):
+        store = SharedMemoryDatasetStore.create([])
+        try:
+            assert len(store) == 0
+        finally:
+            store.close()
+
+    def test_close_unlinks_segment(self, conversations):
+        store = SharedMemoryDatasetStore.create(conversations)
+        name = store.name
+        store.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemoryDatasetStore.attach(name)
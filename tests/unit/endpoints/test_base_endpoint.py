@@ -4,7 +4,12 @@
 import pytest
 
 from aiperf.common.enums import EndpointType
-from aiperf.common.models import ParsedResponse, TextResponse, TextResponseData
+from aiperf.common.models import (
+    ParsedResponse,
+    RawResponseBuffer,
+    TextResponse,
+    TextResponseData,
+)
 from aiperf.common.models.metadata import EndpointMetadata
 from aiperf.common.models.record_models import RequestInfo, RequestRecord
 from aiperf.common.protocols import InferenceServerResponse
@@ -216,6 +221,27 @@ class TestBaseEndpoint:
         results = endpoint.extract_response_data(record)
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_extract_response_data_raw_response_buffer(self, endpoint):
+        """Test extract_response_data decodes responses stored in a RawResponseBuffer."""
+        record = RequestRecord(
+            raw_responses=RawResponseBuffer.from_chunks(
+                [
+                    (100, b'data: {"text": "Hello"}'),
+                    (200, b"data: {}"),
+                    (300, b'data: {"text": "World"}'),
+                ],
+                content_type="text/event-stream",
+            ),
+            start_perf_ns=50,
+            end_perf_ns=300,
+        )
+
+        results = endpoint.extract_response_data(record)
+
+        assert [result.data.text for result in results] == ["Hello", "World"]
+        assert [result.perf_ns for result in results] == [100, 300]
+
     @pytest.mark.asyncio
     async def test_format_payload_called(self, endpoint, model_endpoint):
         """Test that format_payload is implemented and callable."""
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for AdaptiveConcurrencyJsonExporter."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    LoadGeneratorConfig,
+    ServiceConfig,
+    UserConfig,
+)
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.enums import EndpointType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.models import AdaptiveConcurrencyResults, AdaptiveConcurrencySample
+from aiperf.common.models.export_models import AdaptiveConcurrencyExportData
+from aiperf.exporters.adaptive_concurrency_json_exporter import (
+    AdaptiveConcurrencyJsonExporter,
+)
+from aiperf.exporters.exporter_config import ExporterConfig
+
+START_NS = 1_000 * NANOS_PER_SECOND
+
+
+@pytest.fixture
+def mock_user_config():
+    """Create mock UserConfig with an adaptive concurrency target for testing."""
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="custom_endpoint",
+        ),
+        loadgen=LoadGeneratorConfig(adaptive_target=500, adaptive_max_concurrency=32),
+    )
+
+
+class MockResults:
+    def __init__(self, adaptive_results):
+        self.adaptive_results = adaptive_results
+        self.records = []
+        self.start_ns = START_NS
+        self.end_ns = None
+        self.has_results = adaptive_results is not None
+        self.was_cancelled = False
+        self.error_summary = []
+
+
+def _create_exporter(user_config: UserConfig, results: MockResults, temp_dir: str):
+    user_config.output.artifact_directory = Path(temp_dir)
+    return AdaptiveConcurrencyJsonExporter(
+        ExporterConfig(
+            results=results,
+            user_config=user_config,
+            service_config=ServiceConfig(),
+            telemetry_results=None,
+        )
+    )
+
+
+class TestAdaptiveConcurrencyJsonExporter:
+    """Tests for AdaptiveConcurrencyJsonExporter."""
+
+    def test_disabled_without_adaptive_results(self, mock_user_config):
+        """Verify raises DataExporterDisabled when the adaptive controller was not used."""
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            pytest.raises(DataExporterDisabled, match="no adaptive concurrency"),
+        ):
+            _create_exporter(mock_user_config, MockResults(None), temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_export_trajectory(self, mock_user_config):
+        """Verify the samples are exported as a trajectory relative to the start of the benchmark."""
+        samples = [
+            AdaptiveConcurrencySample(
+                timestamp_ns=START_NS + 2 * NANOS_PER_SECOND, concurrency=1
+            ),
+            AdaptiveConcurrencySample(
+                timestamp_ns=START_NS + 4 * NANOS_PER_SECOND,
+                concurrency=1,
+                request_count=20,
+                metric_value=120.0,
+                target_met=True,
+            ),
+            AdaptiveConcurrencySample(
+                timestamp_ns=START_NS + 6 * NANOS_PER_SECOND,
+                concurrency=2,
+                request_count=30,
+                metric_value=650.0,
+                target_met=False,
+            ),
+        ]
+        results = MockResults(
+            AdaptiveConcurrencyResults(
+                metric_tag="time_to_first_token",
+                percentile=90.0,
+                target=500.0,
+                unit="ms",
+                samples=samples,
+            )
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+            assert exporter._file_path.name.endswith("_adaptive.json")
+
+            await exporter.export()
+            content = exporter._file_path.read_text()
+
+        data = json.loads(content)
+        assert data["metric_tag"] == "time_to_first_token"
+        assert data["target"] == 500.0
+        assert data["final_concurrency"] == 2
+        assert [point["elapsed_sec"] for point in data["trajectory"]] == [2.0, 4.0, 6.0]
+        assert [point.get("target_met") for point in data["trajectory"]] == [
+            None,
+            True,
+            False,
+        ]
+        assert data["trajectory"][2]["metric_value"] == 650.0
+        AdaptiveConcurrencyExportData.model_validate(data)
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for StageMetricsCsvExporter."""
+
+import csv
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    LoadGeneratorConfig,
+    LoadStageConfig,
+    ServiceConfig,
+    UserConfig,
+)
+from aiperf.common.enums import EndpointType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.models import MetricResult
+from aiperf.exporters.exporter_config import ExporterConfig
+from aiperf.exporters.stage_metrics_csv_exporter import StageMetricsCsvExporter
+
+
+@pytest.fixture
+def mock_user_config():
+    """Create mock UserConfig with two load stages for testing."""
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="custom_endpoint",
+        ),
+        loadgen=LoadGeneratorConfig(
+            load_stages=[
+                LoadStageConfig(name="low", concurrency=1, request_count=10),
+                LoadStageConfig(concurrency=8, request_count=10),
+            ]
+        ),
+    )
+
+
+class MockResults:
+    def __init__(self, stage_metric_results):
+        self.stage_metric_results = stage_metric_results
+        self.timeslice_metric_results = None
+        self.records = []
+        self.start_ns = None
+        self.end_ns = None
+        self.has_results = bool(stage_metric_results)
+        self.was_cancelled = False
+        self.error_summary = []
+
+
+def _create_exporter(user_config: UserConfig, results: MockResults, temp_dir: str):
+    user_config.output.artifact_directory = Path(temp_dir)
+    return StageMetricsCsvExporter(
+        ExporterConfig(
+            results=results,
+            user_config=user_config,
+            service_config=ServiceConfig(),
+            telemetry_results=None,
+        )
+    )
+
+
+class TestStageMetricsCsvExporter:
+    """Tests for StageMetricsCsvExporter."""
+
+    def test_disabled_without_stage_data(self, mock_user_config):
+        """Verify raises DataExporterDisabled when no stage data."""
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            pytest.raises(DataExporterDisabled, match="no stage metric results"),
+        ):
+            _create_exporter(mock_user_config, MockResults(None), temp_dir)
+
+    def test_uses_stages_filename(self, mock_user_config):
+        """Verify the file path uses the _stages.csv suffix."""
+        results = MockResults({0: [MetricResult(tag="m", header="M", unit="ms")]})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            assert exporter._file_path.name.endswith("_stages.csv")
+            assert exporter._file_path.parent == Path(temp_dir)
+            assert exporter.get_export_info().export_type == "Stage CSV Export"
+
+    def test_generate_content_creates_tidy_format_per_stage(self, mock_user_config):
+        """Verify each stage is written with its index and name, in stage order."""
+        results = MockResults(
+            {
+                1: [MetricResult(tag="latency", header="Latency", unit="ms", avg=9.0)],
+                0: [MetricResult(tag="latency", header="Latency", unit="ms", avg=4.5)],
+            }
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            import aiperf.exporters.metrics_base_exporter as mbe
+
+            def mock_convert(metrics, reg):
+                return {m.tag: m for m in metrics}
+
+            with (
+                patch.object(mbe, "convert_all_metrics_to_display_units", mock_convert),
+                patch.object(exporter, "_should_export", return_value=True),
+            ):
+                content = exporter._generate_content()
+
+        rows = list(csv.reader(content.strip().split("\n")))
+        assert rows == [
+            ["Stage", "Stage Name", "Metric", "Unit", "Stat", "Value"],
+            ["0", "low", "Latency", "ms", "avg", "4.50"],
+            ["1", "1", "Latency", "ms", "avg", "9.00"],
+        ]
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for StageMetricsJsonExporter."""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    LoadGeneratorConfig,
+    LoadStageConfig,
+    ServiceConfig,
+    UserConfig,
+)
+from aiperf.common.enums import EndpointType
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.models import MetricResult
+from aiperf.common.models.export_models import StageCollectionExportData
+from aiperf.exporters.exporter_config import ExporterConfig
+from aiperf.exporters.stage_metrics_json_exporter import StageMetricsJsonExporter
+
+
+@pytest.fixture
+def mock_user_config():
+    """Create mock UserConfig with two load stages for testing."""
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="custom_endpoint",
+        ),
+        loadgen=LoadGeneratorConfig(
+            load_stages=[
+                LoadStageConfig(name="low", request_rate=5.0, duration=30),
+                LoadStageConfig(name="high", request_rate=50.0, duration=30),
+            ]
+        ),
+    )
+
+
+class MockResults:
+    def __init__(self, stage_metric_results):
+        self.stage_metric_results = stage_metric_results
+        self.timeslice_metric_results = None
+        self.records = []
+        self.start_ns = None
+        self.end_ns = None
+        self.has_results = bool(stage_metric_results)
+        self.was_cancelled = False
+        self.error_summary = []
+
+
+def _create_exporter(user_config: UserConfig, results: MockResults, temp_dir: str):
+    user_config.output.artifact_directory = Path(temp_dir)
+    return StageMetricsJsonExporter(
+        ExporterConfig(
+            results=results,
+            user_config=user_config,
+            service_config=ServiceConfig(),
+            telemetry_results=None,
+        )
+    )
+
+
+class TestStageMetricsJsonExporter:
+    """Tests for StageMetricsJsonExporter."""
+
+    def test_disabled_without_stage_data(self, mock_user_config):
+        """Verify raises DataExporterDisabled when no stage data."""
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            pytest.raises(DataExporterDisabled, match="no stage metric results"),
+        ):
+            _create_exporter(mock_user_config, MockResults({}), temp_dir)
+
+    def test_uses_stages_filename(self, mock_user_config):
+        """Verify the file path uses the _stages.json suffix."""
+        results = MockResults({0: [MetricResult(tag="m", header="M", unit="ms")]})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            assert exporter._file_path.name.endswith("_stages.json")
+            assert exporter.get_export_info().export_type == "Stage JSON Export"
+
+    @pytest.mark.asyncio
+    async def test_export_includes_stage_config_and_metrics(self, mock_user_config):
+        """Verify each stage has its index, name, config and metrics."""
+        results = MockResults(
+            {
+                i: [MetricResult(tag="latency", header="Latency", unit="ms", avg=i)]
+                for i in range(2)
+            }
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            import aiperf.exporters.metrics_base_exporter as mbe
+
+            def mock_convert(metrics, reg):
+                return {m.tag: m for m in metrics}
+
+            with (
+                patch.object(mbe, "convert_all_metrics_to_display_units", mock_convert),
+                patch.object(exporter, "_should_export", return_value=True),
+            ):
+                await exporter.export()
+
+            content = exporter._file_path.read_text()
+
+        data = json.loads(content)
+        assert [stage["stage_index"] for stage in data["stages"]] == [0, 1]
+        assert [stage["stage_name"] for stage in data["stages"]] == ["low", "high"]
+        assert data["stages"][1]["stage_config"]["request_rate"] == 50.0
+        assert data["stages"][1]["latency"]["avg"] == 1
+        StageCollectionExportData.model_validate(data)
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for ThroughputSearchJsonExporter."""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    InputConfig,
+    LoadGeneratorConfig,
+    ServiceConfig,
+    UserConfig,
+)
+from aiperf.common.enums import EndpointType, ThroughputSearchMode
+from aiperf.common.exceptions import DataExporterDisabled
+from aiperf.common.models import (
+    MetricResult,
+    SearchProbeResult,
+    ThroughputSearchResults,
+)
+from aiperf.common.models.export_models import ThroughputSearchExportData
+from aiperf.exporters.exporter_config import ExporterConfig
+from aiperf.exporters.throughput_search_json_exporter import (
+    ThroughputSearchJsonExporter,
+)
+
+
+@pytest.fixture
+def mock_user_config():
+    """Create mock UserConfig with a concurrency search for testing."""
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            custom_endpoint="custom_endpoint",
+        ),
+        input=InputConfig(goodput="request_latency:250"),
+        loadgen=LoadGeneratorConfig(search_mode="concurrency", search_max=32),
+    )
+
+
+def _probe(stage_index: int, load: float, passed: bool) -> SearchProbeResult:
+    return SearchProbeResult(
+        stage_index=stage_index,
+        load=load,
+        concurrency=int(load),
+        request_count=100,
+        good_request_count=100 if passed else 50,
+        slo_attainment=100.0 if passed else 50.0,
+        passed=passed,
+    )
+
+
+class MockResults:
+    def __init__(self, search_results, stage_metric_results=None):
+        self.search_results = search_results
+        self.stage_metric_results = stage_metric_results
+        self.timeslice_metric_results = None
+        self.records = []
+        self.start_ns = None
+        self.end_ns = None
+        self.has_results = search_results is not None
+        self.was_cancelled = False
+        self.error_summary = []
+
+
+def _create_exporter(user_config: UserConfig, results: MockResults, temp_dir: str):
+    user_config.output.artifact_directory = Path(temp_dir)
+    return ThroughputSearchJsonExporter(
+        ExporterConfig(
+            results=results,
+            user_config=user_config,
+            service_config=ServiceConfig(),
+            telemetry_results=None,
+        )
+    )
+
+
+class TestThroughputSearchJsonExporter:
+    """Tests for ThroughputSearchJsonExporter."""
+
+    def test_disabled_without_search_results(self, mock_user_config):
+        """Verify raises DataExporterDisabled when no search was run."""
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            pytest.raises(DataExporterDisabled, match="no throughput search results"),
+        ):
+            _create_exporter(mock_user_config, MockResults(None), temp_dir)
+
+    def test_uses_search_filename(self, mock_user_config):
+        """Verify the file path uses the _search.json suffix."""
+        results = MockResults(
+            ThroughputSearchResults(
+                search_mode=ThroughputSearchMode.CONCURRENCY, slo_attainment_target=99.0
+            )
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            assert exporter._file_path.name.endswith("_search.json")
+            assert (
+                exporter.get_export_info().export_type
+                == "Throughput Search JSON Export"
+            )
+
+    @pytest.mark.asyncio
+    async def test_export_includes_knee_and_probe_metrics(self, mock_user_config):
+        """Verify the probes are exported with their metrics, along with the knee."""
+        probes = [_probe(0, 1, True), _probe(2, 16, True), _probe(1, 32, False)]
+        results = MockResults(
+            ThroughputSearchResults(
+                search_mode=ThroughputSearchMode.CONCURRENCY,
+                slo_attainment_target=99.0,
+                probes=probes,
+                knee=probes[1],
+            ),
+            stage_metric_results={
+                probe.stage_index: [
+                    MetricResult(
+                        tag="request_latency",
+                        header="Request Latency",
+                        unit="ms",
+                        avg=10.0 * probe.load,
+                    )
+                ]
+                for probe in probes
+            },
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = _create_exporter(mock_user_config, results, temp_dir)
+
+            import aiperf.exporters.metrics_base_exporter as mbe
+
+            def mock_convert(metrics, reg):
+                return {m.tag: m for m in metrics}
+
+            with (
+                patch.object(mbe, "convert_all_metrics_to_display_units", mock_convert),
+                patch.object(exporter, "_should_export", return_value=True),
+            ):
+                await exporter.export()
+
+            content = exporter._file_path.read_text()
+
+        data = json.loads(content)
+        assert data["search_mode"] == "concurrency"
+        assert data["slo_attainment_target"] == 99.0
+        assert [probe["load"] for probe in data["probes"]] == [1, 16, 32]
+        assert [probe["passed"] for probe in data["probes"]] == [True, True, False]
+        assert data["probes"][2]["request_latency"]["avg"] == 320.0
+        assert data["knee"]["load"] == 16
+        assert data["knee"]["stage_index"] == 2
+        assert data["knee"]["request_latency"]["avg"] == 160.0
+        ThroughputSearchExportData.model_validate(data)
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.metrics.metric_dicts import MetricRecordDict
+from aiperf.metrics.types.credit_schedule_lag_metric import CreditScheduleLagMetric
+from tests.unit.metrics.conftest import create_record, run_simple_metrics_pipeline
+
+
+class TestCreditScheduleLagMetric:
+    def test_schedule_lag(self):
+        """Test that the schedule lag is taken from each record"""
+        records = [create_record(), create_record(), create_record()]
+        for record, schedule_lag_ns in zip(records, [0, 1_500, 30_000], strict=True):
+            record.request.schedule_lag_ns = schedule_lag_ns
+
+        metric_results = run_simple_metrics_pipeline(
+            records, CreditScheduleLagMetric.tag
+        )
+        assert metric_results[CreditScheduleLagMetric.tag] == [0, 1_500, 30_000]
+
+    def test_no_schedule_lag(self):
+        """Test that records without a schedule lag have no metric value"""
+        with pytest.raises(NoMetricValue):
+            CreditScheduleLagMetric().parse_record(create_record(), MetricRecordDict())
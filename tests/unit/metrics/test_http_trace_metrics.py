@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import HttpTraceTimings, ParsedResponseRecord
+from aiperf.metrics.metric_dicts import MetricRecordDict
+from aiperf.metrics.types.http_trace_metrics import (
+    HttpConnectionWaitMetric,
+    HttpConnectMetric,
+    HttpDNSLookupMetric,
+    HttpRequestSendMetric,
+    HttpTimeToFirstByteMetric,
+)
+from tests.unit.metrics.conftest import create_record, run_simple_metrics_pipeline
+
+ALL_HTTP_TRACE_METRICS = [
+    HttpConnectionWaitMetric,
+    HttpConnectMetric,
+    HttpDNSLookupMetric,
+    HttpRequestSendMetric,
+    HttpTimeToFirstByteMetric,
+]
+
+
+def create_traced_record(**trace_kwargs) -> ParsedResponseRecord:
+    record = create_record(start_ns=100, responses=[1000])
+    record.request.http_trace = HttpTraceTimings(**trace_kwargs)
+    return record
+
+
+NEW_CONNECTION_TRACE = {
+    "request_start_perf_ns": 100,
+    "connection_queued_start_perf_ns": 110,
+    "connection_queued_end_perf_ns": 150,
+    "connection_create_start_perf_ns": 150,
+    "dns_resolve_start_perf_ns": 160,
+    "dns_resolve_end_perf_ns": 180,
+    "connection_create_end_perf_ns": 250,
+    "request_headers_sent_perf_ns": 260,
+    "request_body_sent_perf_ns": 290,
+    "response_start_perf_ns": 600,
+}
+
+REUSED_CONNECTION_TRACE = {
+    "request_start_perf_ns": 100,
+    "connection_reused_perf_ns": 105,
+    "request_headers_sent_perf_ns": 110,
+    "request_body_sent_perf_ns": 115,
+    "response_start_perf_ns": 400,
+}
+
+
+class TestHttpTraceMetrics:
+    def test_new_connection(self):
+        """Test the breakdown of a request that waited for, and then opened a new connection"""
+        record = create_traced_record(**NEW_CONNECTION_TRACE)
+
+        metric_results = run_simple_metrics_pipeline(
+            [record], *[metric.tag for metric in ALL_HTTP_TRACE_METRICS]
+        )
+        assert metric_results[HttpConnectionWaitMetric.tag] == [40]
+        assert metric_results[HttpDNSLookupMetric.tag] == [20]
+        # 100ns to create the connection, minus 20ns of DNS resolution
+        assert metric_results[HttpConnectMetric.tag] == [80]
+        assert metric_results[HttpRequestSendMetric.tag] == [30]
+        assert metric_results[HttpTimeToFirstByteMetric.tag] == [310]
+
+    def test_reused_connection(self):
+        """Test that a reused connection has no wait, and no DNS or connect time"""
+        record = create_traced_record(**REUSED_CONNECTION_TRACE)
+
+        assert HttpConnectionWaitMetric().parse_record(record, MetricRecordDict()) == 0
+        assert HttpRequestSendMetric().parse_record(record, MetricRecordDict()) == 5
+        assert (
+            HttpTimeToFirstByteMetric().parse_record(record, MetricRecordDict()) == 285
+        )
+        for metric_class in [HttpDNSLookupMetric, HttpConnectMetric]:
+            with pytest.raises(NoMetricValue):
+                metric_class().parse_record(record, MetricRecordDict())
+
+    def test_request_without_body(self):
+        """Test that the request is considered sent once the headers are sent if there is no body"""
+        record = create_traced_record(
+            request_headers_sent_perf_ns=110, response_start_perf_ns=200
+        )
+
+        assert HttpRequestSendMetric().parse_record(record, MetricRecordDict()) == 0
+        assert (
+            HttpTimeToFirstByteMetric().parse_record(record, MetricRecordDict()) == 90
+        )
+
+    def test_dns_cache_hit_connect(self):
+        """Test that the connect time is the full connection create time if DNS was not resolved"""
+        record = create_traced_record(
+            connection_create_start_perf_ns=100, connection_create_end_perf_ns=175
+        )
+
+        assert HttpConnectMetric().parse_record(record, MetricRecordDict()) == 75
+
+    @pytest.mark.parametrize("metric_class", ALL_HTTP_TRACE_METRICS)
+    def test_no_http_trace(self, metric_class):
+        """Test that no value is produced when the record was not traced"""
+        record = create_record(start_ns=100, responses=[200])
+
+        with pytest.raises(NoMetricValue, match="not included in the record"):
+            metric_class().parse_record(record, MetricRecordDict())
+
+    def test_no_response_start(self):
+        """Test that no time to first byte is produced if the request failed before a response"""
+        record = create_traced_record(
+            request_headers_sent_perf_ns=110, request_body_sent_perf_ns=120
+        )
+
+        with pytest.raises(NoMetricValue):
+            HttpTimeToFirstByteMetric().parse_record(record, MetricRecordDict())
+
+    def test_invalid_timestamps(self):
+        """Test error when the response start is before the request was sent"""
+        record = create_traced_record(
+            request_headers_sent_perf_ns=300, response_start_perf_ns=200
+        )
+
+        with pytest.raises(ValueError, match="before its start"):
+            HttpTimeToFirstByteMetric().parse_record(record, MetricRecordDict())
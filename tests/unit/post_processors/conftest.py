@@ -330,6 +330,7 @@ def create_metric_metadata(
     benchmark_phase: CreditPhase = CreditPhase.PROFILING,
     x_request_id: str | None = None,
     x_correlation_id: str | None = None,
+    stage_index: int | None = None,
 ) -> MetricRecordMetadata:
     """
     Create a MetricRecordMetadata object with sensible defaults.
@@ -346,6 +347,7 @@ def create_metric_metadata(
         benchmark_phase: Benchmark phase (warmup or profiling)
         x_request_id: X-Request-ID header value (optional)
         x_correlation_id: X-Correlation-ID header value (optional)
+        stage_index: Index of the load stage (optional)
 
     Returns:
         MetricRecordMetadata object
@@ -362,6 +364,7 @@ def create_metric_metadata(
         benchmark_phase=benchmark_phase,
         x_request_id=x_request_id,
         x_correlation_id=x_correlation_id,
+        stage_index=stage_index,
     )
 
 
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest.mock import patch
+
 import orjson
 import pytest
 
@@ -140,6 +142,30 @@ class TestRawRecordWriterProcessorProcessRecord:
         assert record.error.message == "Internal server error"
         assert len(record.responses) == 0
 
+    def test_build_export_record_reuses_prerendered_payload(
+        self,
+        user_config_raw: UserConfig,
+        sample_parsed_record: ParsedResponseRecord,
+    ):
+        """Test that the pre-rendered payload sent by the worker is exported instead of re-formatting it."""
+        processor = RawRecordWriterProcessor(
+            service_id="processor-1", user_config=user_config_raw
+        )
+        expected_payload = processor._build_export_record(
+            sample_parsed_record, create_metric_metadata()
+        ).payload
+        sample_parsed_record.request.turns[0].rendered_payload = orjson.dumps(
+            expected_payload
+        ).decode("utf-8")
+
+        with patch.object(processor._endpoint, "format_payload") as mock_format:
+            record = processor._build_export_record(
+                sample_parsed_record, create_metric_metadata()
+            )
+
+        mock_format.assert_not_called()
+        assert record.payload == expected_payload
+
     @pytest.mark.asyncio
     async def test_process_multiple_records(
         self,
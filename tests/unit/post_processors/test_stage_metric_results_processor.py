@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import Mock
+
+import pytest
+
+from aiperf.common.config import LoadGeneratorConfig, LoadStageConfig, UserConfig
+from aiperf.common.enums import MetricType
+from aiperf.common.exceptions import PostProcessorDisabled
+from aiperf.common.models import MetricResult
+from aiperf.metrics.metric_dicts import MetricArray
+from aiperf.metrics.types.request_latency_metric import RequestLatencyMetric
+from aiperf.post_processors.stage_metric_results_processor import (
+    StageMetricResultsProcessor,
+)
+from tests.unit.post_processors.conftest import create_metric_records_message
+
+
+@pytest.fixture
+def stage_user_config(mock_user_config: UserConfig) -> UserConfig:
+    mock_user_config.loadgen = LoadGeneratorConfig(
+        load_stages=[
+            LoadStageConfig(name="low", concurrency=1, request_count=10),
+            LoadStageConfig(name="high", concurrency=8, request_count=10),
+        ]
+    )
+    return mock_user_config
+
+
+class TestStageMetricResultsProcessor:
+    """Test cases for StageMetricResultsProcessor."""
+
+    def test_initialization_without_load_stages_raises_exception(
+        self, mock_metric_registry: Mock, mock_user_config: UserConfig
+    ) -> None:
+        """Test that processor initialization fails when load stages are not set."""
+        with pytest.raises(PostProcessorDisabled, match="requires load_stages"):
+            StageMetricResultsProcessor(mock_user_config)
+
+    @pytest.mark.asyncio
+    async def test_process_result_separates_by_stage(
+        self, mock_metric_registry: Mock, stage_user_config: UserConfig
+    ) -> None:
+        """Test that metrics are separated by the stage index of each record."""
+        processor = StageMetricResultsProcessor(stage_user_config)
+        processor._tags_to_types = {"test_record": MetricType.RECORD}
+
+        for i, (stage_index, value) in enumerate([(0, 10.0), (1, 20.0), (0, 30.0)]):
+            message = create_metric_records_message(
+                x_request_id=f"test-{i}",
+                stage_index=stage_index,
+                results=[{"test_record": value}],
+            )
+            await processor.process_result(message.to_data())
+
+        assert list(processor._stage_results[0]["test_record"].data) == [10.0, 30.0]
+        assert list(processor._stage_results[1]["test_record"].data) == [20.0]
+
+    @pytest.mark.asyncio
+    async def test_process_result_skips_records_without_stage(
+        self, mock_metric_registry: Mock, stage_user_config: UserConfig
+    ) -> None:
+        """Test that records without a stage index are not assigned to any stage."""
+        processor = StageMetricResultsProcessor(stage_user_config)
+        processor._tags_to_types = {"test_record": MetricType.RECORD}
+
+        message = create_metric_records_message(
+            x_request_id="test-1", results=[{"test_record": 42.0}]
+        )
+        await processor.process_result(message.to_data())
+
+        assert len(processor._stage_results) == 0
+
+    @pytest.mark.asyncio
+    async def test_summarize_returns_dict_of_stages(
+        self, mock_metric_registry: Mock, stage_user_config: UserConfig
+    ) -> None:
+        """Test summarize returns dict mapping stage indices to metric results."""
+        processor = StageMetricResultsProcessor(stage_user_config)
+        processor._instances_map = {RequestLatencyMetric.tag: RequestLatencyMetric()}
+
+        for stage_index, value in [(1, 84.0), (0, 42.0)]:
+            processor._stage_results[stage_index][RequestLatencyMetric.tag] = (
+                MetricArray()
+            )
+            processor._stage_results[stage_index][RequestLatencyMetric.tag].append(
+                value
+            )
+
+        results = await processor.summarize()
+
+        assert list(results.keys()) == [0, 1]
+        assert all(isinstance(result[0], MetricResult) for result in results.values())
+        assert results[0][0].avg == 42.0
+        assert results[1][0].avg == 84.0
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.enums import CreditPhase
+from aiperf.common.messages.inference_messages import MetricRecordsData
+from aiperf.common.models.record_models import MetricRecordMetadata
+from aiperf.metrics.types.ttft_metric import TTFTMetric
+from aiperf.records.records_manager import RecordsManager
+
+NOW_NS = 100 * NANOS_PER_SECOND
+NANOS_PER_MILLIS = 1_000_000
+
+
+def create_mock_records_manager(target: float = 150.0) -> MagicMock:
+    """Create a mock RecordsManager instance for testing the adaptive window."""
+    instance = MagicMock()
+    instance._adaptive_window = deque()
+    instance.user_config.loadgen.adaptive_metric = TTFTMetric.tag
+    instance.user_config.loadgen.adaptive_target = target
+    instance.user_config.loadgen.adaptive_percentile = 90.0
+    instance.user_config.loadgen.adaptive_window = 10.0
+    return instance
+
+
+def add_records(instance: MagicMock, start_sec: float, ttfts_ms: list[float]) -> None:
+    """Add records that start at start_sec and complete 1 second later, with the given TTFTs."""
+    for ttft_ms in ttfts_ms:
+        start_ns = int(start_sec * NANOS_PER_SECOND)
+        RecordsManager._add_to_adaptive_window(
+            instance,
+            MetricRecordsData(
+                metadata=MetricRecordMetadata(
+                    session_num=0,
+                    request_start_ns=start_ns,
+                    request_end_ns=start_ns + NANOS_PER_SECOND,
+                    worker_id="worker-1",
+                    record_processor_id="processor-1",
+                    benchmark_phase=CreditPhase.PROFILING,
+                ),
+                metrics={TTFTMetric.tag: int(ttft_ms * NANOS_PER_MILLIS)},
+            ),
+        )
+
+
+def sample_window(instance: MagicMock, since_sec: float = 0.0):
+    with patch("aiperf.records.records_manager.time.time_ns", return_value=NOW_NS):
+        return RecordsManager._sample_adaptive_window(
+            instance, concurrency=4, since_ns=int(since_sec * NANOS_PER_SECOND)
+        )
+
+
+class TestRecordsManagerAdaptiveWindow:
+    """Test the sliding window of the adaptive concurrency controller."""
+
+    @pytest.mark.parametrize("target,target_met", [(200.0, True), (150.0, False)])
+    def test_percentile_in_display_unit(self, target: float, target_met: bool):
+        """Test that the percentile is computed in ms, and compared against the target."""
+        instance = create_mock_records_manager(target=target)
+        add_records(instance, 95.0, [float(ttft) for ttft in range(101, 201)])
+
+        sample = sample_window(instance)
+
+        assert sample.concurrency == 4
+        assert sample.request_count == 100
+        assert sample.metric_value == pytest.approx(190.1)
+        assert sample.target_met is target_met
+
+    def test_window_excludes_old_requests(self):
+        """Test that requests that completed before the window, or started before the last change of the
+        concurrency, are excluded from the window."""
+        instance = create_mock_records_manager()
+        add_records(instance, 50.0, [1000.0] * 20)
+        add_records(instance, 92.0, [500.0] * 20)
+        add_records(instance, 96.0, [100.0] * 20)
+
+        sample = sample_window(instance, since_sec=95.0)
+
+        assert len(instance._adaptive_window) == 40
+        assert sample.request_count == 20
+        assert sample.metric_value == pytest.approx(100.0)
+        assert sample.target_met is True
+
+    def test_not_enough_requests(self):
+        """Test that the sample has no value until the window has enough requests to make a decision."""
+        instance = create_mock_records_manager()
+        add_records(instance, 96.0, [100.0] * 3)
+
+        sample = sample_window(instance)
+
+        assert sample.request_count == 3
+        assert sample.metric_value is None
+        assert sample.target_met is None
@@ -5,6 +5,7 @@ import time
 from collections import deque
 from typing import Any, TypeVar
 
+import numpy as np
 import pytest
 
 from aiperf.common.aiperf_logger import AIPerfLogger
@@ -16,9 +17,17 @@ from aiperf.common.messages import (
     CreditPhaseSendingCompleteMessage,
     CreditPhaseStartMessage,
     CreditsCompleteMessage,
+    DatasetTimingResponse,
     Message,
+    TurnCreditDropMessage,
 )
 from aiperf.common.mixins.aiperf_lifecycle_mixin import AIPerfLifecycleMixin
+from aiperf.common.models import (
+    AdaptiveConcurrencySample,
+    NextTurnCredit,
+    OutputTokenStats,
+    SearchProbeResult,
+)
 from aiperf.common.models.credit_models import CreditPhaseStats
 from aiperf.timing import CreditIssuingStrategy
 from aiperf.timing.config import TimingManagerConfig
@@ -76,8 +85,10 @@ class MockCreditManager(AIPerfLifecycleMixin):
 
     def __init__(self, time_traveler: TimeTraveler, **kwargs):
         super().__init__(**kwargs)
+        self.service_id = "test-service"
         self.dropped_timestamps = []
         self.dropped_credits = []
+        self.dropped_batches = []
         self.progress_calls = []
         self.credits_complete_calls = []
         self.phase_start_calls = []
@@ -86,6 +97,17 @@ class MockCreditManager(AIPerfLifecycleMixin):
         self.credit_strategy: CreditIssuingStrategy | None = None
         self.time_traveler = time_traveler
         self.publish_calls = []
+        self.search_probe_calls = []
+        # Search probes at or below this load pass, and above it fail
+        self.search_capacity: float | None = None
+        self.adaptive_window_calls = []
+        # Whether each adaptive window sample met the target, in order. None means not enough requests.
+        self.adaptive_window_results: deque[bool | None] = deque()
+        # The output token stats returned to the token rate strategy
+        self.output_token_stats: OutputTokenStats | None = None
+        # The full fixed schedule, sorted by timestamp, from which the chunks are returned
+        self.timing_schedule: list[tuple[int, str]] = []
+        self.timing_chunk_calls = []
 
     def create_strategy(
         self,
@@ -114,6 +136,8 @@ class MockCreditManager(AIPerfLifecycleMixin):
         credit_drop_ns: int | None = None,
         should_cancel: bool = False,
         cancel_after_ns: int = 0,
+        schedule_lag_ns: int | None = None,
+        stage_index: int | None = None,
     ) -> None:
         """Mock drop_credit method."""
         drop_time_ns = self.time_traveler.time_ns()
@@ -127,9 +151,44 @@ class MockCreditManager(AIPerfLifecycleMixin):
                 credit_drop_ns=credit_drop_ns,
                 should_cancel=should_cancel,
                 cancel_after_ns=cancel_after_ns,
+                schedule_lag_ns=schedule_lag_ns,
+                stage_index=stage_index,
             )
         )
 
+    async def drop_turn_credit(
+        self,
+        credit_phase: CreditPhase,
+        next_turn: NextTurnCredit,
+        worker_id: str,
+        *,
+        should_cancel: bool = False,
+        cancel_after_ns: int = 0,
+    ) -> None:
+        """Mock drop_turn_credit method."""
+        self.dropped_timestamps.append(self.time_traveler.time_ns())
+        self.dropped_credits.append(
+            TurnCreditDropMessage(
+                service_id="test-service",
+                target_service_id=worker_id,
+                phase=credit_phase,
+                credit_num=next_turn.credit_num,
+                conversation_id=next_turn.conversation_id,
+                should_cancel=should_cancel,
+                cancel_after_ns=cancel_after_ns,
+                stage_index=next_turn.stage_index,
+                turn_index=next_turn.turn_index,
+                session_id=next_turn.session_id,
+            )
+        )
+
+    async def drop_credit_batch(self, credits: list[CreditDropMessage]) -> None:
+        """Mock drop_credit_batch method."""
+        drop_time_ns = self.time_traveler.time_ns()
+        self.dropped_batches.append(credits)
+        self.dropped_timestamps.extend(drop_time_ns for _ in credits)
+        self.dropped_credits.extend(credits)
+
     async def publish_progress(
         self, phase: CreditPhase, sent: int, completed: int
     ) -> None:
@@ -200,6 +259,60 @@ class MockCreditManager(AIPerfLifecycleMixin):
             )
         )
 
+    async def get_search_probe_result(
+        self,
+        stage_index: int,
+        load: float,
+        concurrency: int | None,
+        request_rate: float | None,
+        expected_records: int,
+    ) -> SearchProbeResult | None:
+        """Mock get_search_probe_result method, which passes the probes up to the search capacity."""
+        self.search_probe_calls.append((stage_index, load, expected_records))
+        passed = self.search_capacity is not None and load <= self.search_capacity
+        return SearchProbeResult(
+            stage_index=stage_index,
+            load=load,
+            concurrency=concurrency,
+            request_rate=request_rate,
+            request_count=expected_records,
+            good_request_count=expected_records if passed else 0,
+            slo_attainment=100.0 if passed else 0.0,
+            passed=passed,
+        )
+
+    async def get_adaptive_window_sample(
+        self, concurrency: int, since_ns: int
+    ) -> AdaptiveConcurrencySample | None:
+        """Mock get_adaptive_window_sample method, which returns the next of the adaptive window results."""
+        self.adaptive_window_calls.append((concurrency, since_ns))
+        target_met = (
+            self.adaptive_window_results.popleft()
+            if self.adaptive_window_results
+            else None
+        )
+        return AdaptiveConcurrencySample(
+            timestamp_ns=time.time_ns(),
+            concurrency=concurrency,
+            request_count=0 if target_met is None else 100,
+            metric_value=None if target_met is None else 100.0,
+            target_met=target_met,
+        )
+
+    async def get_output_token_stats(self) -> OutputTokenStats | None:
+        """Mock get_output_token_stats method, which returns the configured output token stats."""
+        return self.output_token_stats
+
+    async def get_dataset_timing_chunk(
+        self, offset: int, limit: int
+    ) -> DatasetTimingResponse:
+        """Mock get_dataset_timing_chunk method, which returns a chunk of the configured timing schedule."""
+        self.timing_chunk_calls.append((offset, limit))
+        return timing_response(
+            self.timing_schedule[offset : offset + limit],
+            total_count=len(self.timing_schedule),
+        )
+
     async def run_strategy(self, strategy: CreditIssuingStrategy):
         """Run the full credit issuing strategy."""
         self.credit_strategy = strategy
@@ -213,6 +326,30 @@ def mock_credit_manager(time_traveler: TimeTraveler):
     return MockCreditManager(time_traveler=time_traveler)
 
 
+def timing_response(
+    schedule: list[tuple[int, str]], total_count: int | None = None
+) -> DatasetTimingResponse:
+    """Pack a chunk of (timestamp, conversation_id) entries into a dataset timing response."""
+    conversation_ids = list(
+        dict.fromkeys(conversation_id for _, conversation_id in schedule)
+    )
+    conversation_indices = {
+        conversation_id: i for i, conversation_id in enumerate(conversation_ids)
+    }
+    return DatasetTimingResponse(
+        service_id="dataset_manager",
+        timestamps=np.array(
+            [timestamp for timestamp, _ in schedule], dtype=np.int64
+        ).tobytes(),
+        conversation_indices=np.array(
+            [conversation_indices[conversation_id] for _, conversation_id in schedule],
+            dtype=np.int64,
+        ).tobytes(),
+        conversation_ids=conversation_ids,
+        total_count=len(schedule) if total_count is None else total_count,
+    )
+
+
 def profiling_phase_stats_from_config(config: TimingManagerConfig) -> CreditPhaseStats:
     """Create a phase stats object from a config."""
     return CreditPhaseStats(
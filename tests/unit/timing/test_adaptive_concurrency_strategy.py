@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the AdaptiveConcurrencyStrategy class.
+"""
+
+import pytest
+
+from aiperf.timing.adaptive_concurrency_strategy import AdaptiveConcurrencyStrategy
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.request_rate_strategy import ConcurrencyBurstRateGenerator
+from tests.unit.timing.conftest import MockCreditManager
+from tests.unit.utils.time_traveler import TimeTraveler
+
+
+def adaptive_config(**kwargs) -> TimingManagerConfig:
+    """Create an adaptive concurrency config, between a concurrency of 1 and 10."""
+    kwargs.setdefault("adaptive_max_concurrency", 10)
+    return TimingManagerConfig(adaptive_target=500.0, **kwargs)
+
+
+class TestAdaptiveConcurrencyStrategy:
+    """Tests for the adaptive concurrency strategy."""
+
+    def test_starts_at_min_concurrency(self, mock_credit_manager: MockCreditManager):
+        """Test that the strategy starts at the minimum concurrency, sending credits as soon as possible."""
+        config = adaptive_config(adaptive_min_concurrency=3)
+        strategy = AdaptiveConcurrencyStrategy(config, mock_credit_manager)
+
+        assert strategy._concurrency == 3
+        assert strategy._semaphore._value == 3
+        assert not strategy._use_arrival_schedule
+        assert isinstance(
+            strategy._request_rate_generator, ConcurrencyBurstRateGenerator
+        )
+
+    @pytest.mark.parametrize(
+        "concurrency,target_met,expected",
+        [
+            (4, True, 6),
+            (9, True, 10),
+            (10, True, 10),
+            (8, False, 6),
+            (2, False, 1),
+            (1, False, 1),
+        ],
+    )
+    def test_next_concurrency(
+        self,
+        mock_credit_manager: MockCreditManager,
+        concurrency: int,
+        target_met: bool,
+        expected: int,
+    ):
+        """Test that the concurrency is increased additively, and decreased multiplicatively by at least 1,
+        within the bounds."""
+        config = adaptive_config(
+            concurrency=concurrency, adaptive_increase=2, adaptive_decrease=0.75
+        )
+        strategy = AdaptiveConcurrencyStrategy(config, mock_credit_manager)
+
+        assert strategy._next_concurrency(target_met) == expected
+
+    async def test_adjust_concurrency_resizes_semaphore(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that each window sample adjusts the concurrency limit, and resets the window when it changes."""
+        config = adaptive_config(concurrency=4)
+        strategy = AdaptiveConcurrencyStrategy(config, mock_credit_manager)
+        mock_credit_manager.adaptive_window_results.extend([None, True, False])
+        start_ns = strategy._last_adjustment_ns
+
+        # Not enough requests in the window to make a decision
+        await strategy._adjust_concurrency()
+        assert strategy._concurrency == 4
+        assert strategy._last_adjustment_ns == start_ns
+
+        time_traveler.advance_time(2.0)
+        await strategy._adjust_concurrency()
+        assert strategy._concurrency == 5
+        assert strategy._semaphore._value == 5
+        assert strategy._last_adjustment_ns > start_ns
+
+        await strategy._adjust_concurrency()
+        assert strategy._concurrency == 3
+        assert strategy._semaphore._value == 3
+
+        assert [
+            concurrency for concurrency, _ in mock_credit_manager.adaptive_window_calls
+        ] == [4, 4, 5]
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for credit_scheduler.py - waiting for the scheduled time of each credit.
+"""
+
+import asyncio
+import contextlib
+import time
+
+import numpy as np
+import pytest
+
+from aiperf.common.config import EndpointConfig, LoadGeneratorConfig, UserConfig
+from aiperf.common.constants import NANOS_PER_MILLIS, NANOS_PER_SECOND
+from aiperf.common.enums import CreditSchedulerType
+from aiperf.common.environment import Environment
+from aiperf.common.factories import CreditSchedulerFactory
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.credit_scheduler import (
+    AsyncioCreditScheduler,
+    HybridSpinCreditScheduler,
+)
+from aiperf.timing.request_rate_strategy import RequestRateStrategy
+from tests.unit.conftest import real_sleep
+from tests.unit.timing.conftest import MockCreditManager
+from tests.unit.utils.time_traveler import TimeTraveler
+
+
+@pytest.mark.asyncio
+class TestCreditScheduler:
+    async def test_factory_creates_schedulers(self):
+        assert isinstance(
+            CreditSchedulerFactory.create_instance(CreditSchedulerType.ASYNCIO),
+            AsyncioCreditScheduler,
+        )
+        scheduler = CreditSchedulerFactory.create_instance("hybrid_spin")
+        assert isinstance(scheduler, HybridSpinCreditScheduler)
+        scheduler.close()
+
+    async def test_asyncio_waits_until_target(self, time_traveler: TimeTraveler):
+        scheduler = AsyncioCreditScheduler()
+        target_perf_ns = time.perf_counter_ns() + NANOS_PER_SECOND // 2
+
+        with time_traveler.sleeps_for(0.5):
+            await scheduler.wait_until(target_perf_ns)
+
+    async def test_asyncio_past_target_does_not_wait(self, time_traveler: TimeTraveler):
+        scheduler = AsyncioCreditScheduler()
+
+        with time_traveler.sleeps_for(0):
+            await scheduler.wait_until(time.perf_counter_ns() - NANOS_PER_SECOND)
+
+    async def test_hybrid_spin_waits_until_target(self):
+        scheduler = HybridSpinCreditScheduler(spin_window=0.001)
+        try:
+            target_perf_ns = time.perf_counter_ns() + 5 * NANOS_PER_MILLIS
+            await scheduler.wait_until(target_perf_ns)
+            assert time.perf_counter_ns() >= target_perf_ns
+        finally:
+            scheduler.close()
+
+    async def test_hybrid_spin_past_target_does_not_wait(self):
+        scheduler = HybridSpinCreditScheduler(spin_window=0.001)
+        try:
+            scheduler._sleep_then_spin = None  # Must not be called
+            await scheduler.wait_until(time.perf_counter_ns() - NANOS_PER_MILLIS)
+        finally:
+            scheduler.close()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+class TestCreditSchedulerPerformance:
+    """Benchmark the inter-arrival jitter of each scheduler at sub-millisecond inter-arrival times, and its cost to the
+    rest of the event loop, such as the processing of credit returns."""
+
+    NUM_CREDITS = 2_000
+    INTERVAL_NS = 250_000  # 4,000 credits per second
+
+    async def _send_times(self, scheduler) -> np.ndarray:
+        start_perf_ns = time.perf_counter_ns()
+        send_times = []
+        for i in range(self.NUM_CREDITS):
+            await scheduler.wait_until(start_perf_ns + i * self.INTERVAL_NS)
+            send_times.append(time.perf_counter_ns())
+        return np.array(send_times)
+
+    async def _busy_loop(self, iterations: list[int]) -> None:
+        """Keep the event loop busy with other work, counting the number of iterations it gets to run."""
+        while True:
+            for _ in range(100):
+                pass
+            iterations[0] += 1
+            await real_sleep(0)
+
+    @pytest.mark.parametrize("busy_loop", [False, True])
+    async def test_inter_arrival_jitter(self, monkeypatch, busy_loop: bool):
+        # The asyncio scheduler needs the real sleep to be measured
+        monkeypatch.setattr(asyncio, "sleep", real_sleep)
+
+        for scheduler_type in CreditSchedulerType:
+            scheduler = CreditSchedulerFactory.create_instance(scheduler_type)
+            iterations = [0]
+            busy_task = (
+                asyncio.create_task(self._busy_loop(iterations)) if busy_loop else None
+            )
+            try:
+                start_perf_ns = time.perf_counter_ns()
+                send_times = await self._send_times(scheduler)
+                duration_sec = (
+                    time.perf_counter_ns() - start_perf_ns
+                ) / NANOS_PER_SECOND
+            finally:
+                if busy_task is not None:
+                    busy_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await busy_task
+                scheduler.close()
+
+            jitter_us = np.abs(np.diff(send_times) - self.INTERVAL_NS) / 1_000
+            p50, p90, p99 = np.percentile(jitter_us, [50, 90, 99])
+            print(
+                f"[{scheduler_type}{', busy loop' if busy_loop else ''}] inter-arrival jitter: "
+                f"p50={p50:,.1f}us p90={p90:,.1f}us p99={p99:,.1f}us max={jitter_us.max():,.1f}us"
+                + (
+                    f", event loop iterations: {iterations[0] / duration_sec:,.0f}/s"
+                    if busy_loop
+                    else ""
+                )
+            )
+
+            assert len(send_times) == self.NUM_CREDITS
+
+
+class TestCreditSchedulerSelection:
+    def test_credit_scheduler_option_overrides_environment(
+        self, mock_credit_manager: MockCreditManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(
+            Environment.TIMING, "SCHEDULER", CreditSchedulerType.ASYNCIO
+        )
+        user_config = UserConfig(
+            endpoint=EndpointConfig(model_names=["test-model"]),
+            loadgen=LoadGeneratorConfig(
+                request_rate=10.0, credit_scheduler=CreditSchedulerType.HYBRID_SPIN
+            ),
+        )
+        config = TimingManagerConfig.from_user_config(user_config)
+        assert config.credit_scheduler == CreditSchedulerType.HYBRID_SPIN
+
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        try:
+            assert isinstance(strategy.credit_scheduler, HybridSpinCreditScheduler)
+        finally:
+            strategy.credit_scheduler.close()
+
+    def test_environment_is_used_without_credit_scheduler_option(
+        self, mock_credit_manager: MockCreditManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(
+            Environment.TIMING, "SCHEDULER", CreditSchedulerType.HYBRID_SPIN
+        )
+        config = TimingManagerConfig(request_rate=10.0)
+        assert config.credit_scheduler is None
+
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        try:
+            assert isinstance(strategy.credit_scheduler, HybridSpinCreditScheduler)
+        finally:
+            strategy.credit_scheduler.close()
@@ -8,11 +8,12 @@ import time
 
 import pytest
 
-from aiperf.common.constants import MILLIS_PER_SECOND
+from aiperf.common.constants import MILLIS_PER_SECOND, NANOS_PER_MILLIS
 from aiperf.common.enums import CreditPhase, TimingMode
+from aiperf.common.environment import Environment
 from aiperf.common.models import CreditPhaseStats
 from aiperf.timing import FixedScheduleStrategy, TimingManagerConfig
-from tests.unit.timing.conftest import MockCreditManager
+from tests.unit.timing.conftest import MockCreditManager, timing_response
 from tests.unit.utils.time_traveler import TimeTraveler
 
 
@@ -49,7 +50,7 @@ class TestFixedScheduleStrategy:
         return FixedScheduleStrategy(
             config=config,
             credit_manager=mock_credit_manager,
-            schedule=schedule,
+            schedule=timing_response(schedule),
         ), CreditPhaseStats(
             type=CreditPhase.PROFILING,
             start_ns=time.time_ns(),
@@ -66,7 +67,7 @@ class TestFixedScheduleStrategy:
 
         assert len(strategy.ordered_phase_configs) == 1
         assert strategy._num_requests == len(simple_schedule)
-        assert strategy._schedule == simple_schedule
+        assert strategy._first_chunk.timing_arrays()[0].tolist() == [0, 100, 200]
 
         # Check phase types - only profiling phase supported
         assert strategy.ordered_phase_configs[0].type == CreditPhase.PROFILING
@@ -76,33 +77,21 @@ class TestFixedScheduleStrategy:
         with pytest.raises(ValueError, match="No schedule loaded"):
             self._create_strategy(mock_credit_manager, [])
 
-    @pytest.mark.parametrize(
-        "schedule,expected_groups,expected_keys",
-        [
-            (
-                [(0, "conv1"), (100, "conv2"), (200, "conv3")],
-                {0: ["conv1"], 100: ["conv2"], 200: ["conv3"]},
-                [0, 100, 200],
-            ),
-            (
-                [(0, "conv1"), (0, "conv2"), (100, "conv3"), (100, "conv4")],
-                {0: ["conv1", "conv2"], 100: ["conv3", "conv4"]},
-                [0, 100],
-            ),
-        ],
-    )
-    def test_timestamp_grouping(
-        self,
-        mock_credit_manager: MockCreditManager,
-        schedule: list[tuple[int, str]],
-        expected_groups: dict[int, list[str]],
-        expected_keys: list[int],
+    @pytest.mark.asyncio
+    async def test_execution_sends_conversations_of_chunk_indices(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
     ):
-        """Test that timestamps are properly grouped."""
-        strategy, _ = self._create_strategy(mock_credit_manager, schedule)
+        """Test that the credits are sent in the order of the chunk, with the conversation ID of each index."""
+        schedule = [(0, "conv1"), (0, "conv2"), (100, "conv1"), (200, "conv3")]
+        strategy, phase_stats = self._create_strategy(mock_credit_manager, schedule)
 
-        assert strategy._timestamp_groups == expected_groups
-        assert strategy._sorted_timestamp_keys == expected_keys
+        with time_traveler.sleeps_for(0.2):
+            await strategy._execute_single_phase(phase_stats)
+            await strategy.wait_for_tasks()
+
+        assert [
+            credit.conversation_id for credit in mock_credit_manager.dropped_credits
+        ] == ["conv1", "conv2", "conv1", "conv3"]
 
     @pytest.mark.parametrize(
         "auto_offset,manual_offset,expected_zero_ms",
@@ -194,3 +183,94 @@ class TestFixedScheduleStrategy:
         assert phase_stats.sent == 3
         expected_zero_ms = first_timestamp_ms if auto_offset else 0
         assert strategy._schedule_zero_ms == expected_zero_ms
+
+    @pytest.mark.asyncio
+    async def test_execution_fetches_schedule_in_chunks(
+        self,
+        mock_credit_manager: MockCreditManager,
+        time_traveler: TimeTraveler,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that the rest of the schedule is fetched one chunk at a time after the first chunk, and sent in order."""
+        monkeypatch.setattr(Environment.TIMING, "FIXED_SCHEDULE_CHUNK_SIZE", 2)
+        schedule = [(i * 100, f"conv{i}") for i in range(5)]
+        mock_credit_manager.timing_schedule = schedule
+        config = TimingManagerConfig.model_construct(
+            timing_mode=TimingMode.FIXED_SCHEDULE, auto_offset_timestamps=False
+        )
+        strategy = FixedScheduleStrategy(
+            config=config,
+            credit_manager=mock_credit_manager,
+            schedule=timing_response(schedule[:2], total_count=len(schedule)),
+        )
+        phase_stats = CreditPhaseStats(
+            type=CreditPhase.PROFILING,
+            start_ns=time.time_ns(),
+            total_expected_requests=len(schedule),
+        )
+        assert strategy.ordered_phase_configs[0].total_expected_requests == 5
+
+        with time_traveler.sleeps_for(0.4):
+            await strategy._execute_single_phase(phase_stats)
+            await strategy.wait_for_tasks()
+
+        assert mock_credit_manager.timing_chunk_calls == [(2, 2), (4, 2)]
+        assert [
+            credit.conversation_id for credit in mock_credit_manager.dropped_credits
+        ] == [conversation_id for _, conversation_id in schedule]
+        assert phase_stats.sent == 5
+
+    @pytest.mark.asyncio
+    async def test_execution_batches_credits_within_window(
+        self,
+        mock_credit_manager: MockCreditManager,
+        time_traveler: TimeTraveler,
+    ):
+        """Test that the credits scheduled within the batch window are sent ahead of time in a single batch."""
+        schedule = [(0, "conv0"), (0, "conv1"), (50, "conv2"), (300, "conv3")]
+        strategy, phase_stats = self._create_strategy(mock_credit_manager, schedule)
+        strategy.credit_drop_batch_size = 10
+        strategy.credit_drop_batch_window_ns = 100 * NANOS_PER_MILLIS
+
+        with time_traveler.sleeps_for(0.3):
+            await strategy._execute_single_phase(phase_stats)
+            await strategy.wait_for_tasks()
+
+        batches = mock_credit_manager.dropped_batches
+        assert [[credit.conversation_id for credit in batch] for batch in batches] == [
+            ["conv0", "conv1", "conv2"],
+            ["conv3"],
+        ]
+        first, second, third = batches[0]
+        assert first.credit_drop_ns is None and second.credit_drop_ns is None
+        assert third.credit_drop_ns is not None
+        assert [credit.credit_num for batch in batches for credit in batch] == [
+            0,
+            1,
+            2,
+            3,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execution_raises_if_schedule_ends_early(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that an error is raised if the DatasetManager returns fewer entries than the total count."""
+        schedule = [(0, "conv1"), (100, "conv2")]
+        mock_credit_manager.timing_schedule = schedule
+        config = TimingManagerConfig.model_construct(
+            timing_mode=TimingMode.FIXED_SCHEDULE, auto_offset_timestamps=True
+        )
+        strategy = FixedScheduleStrategy(
+            config=config,
+            credit_manager=mock_credit_manager,
+            schedule=timing_response(schedule, total_count=3),
+        )
+        phase_stats = CreditPhaseStats(
+            type=CreditPhase.PROFILING,
+            start_ns=time.time_ns(),
+            total_expected_requests=3,
+        )
+
+        with pytest.raises(ValueError, match="ended after 2 of 3 requests"):
+            await strategy._execute_single_phase(phase_stats)
@@ -12,16 +12,22 @@ import pytest
 from scipy import stats
 
 from aiperf.common import random_generator as rng
+from aiperf.common.config import LoadStageConfig
 from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase, RequestRateMode, TimingMode
+from aiperf.common.factories import RequestRateGeneratorFactory
 from aiperf.common.messages import CreditReturnMessage
-from aiperf.common.models import CreditPhaseStats
+from aiperf.common.models import CreditPhaseStats, NextTurnCredit
 from aiperf.timing.config import TimingManagerConfig
 from aiperf.timing.request_rate_strategy import (
     ConcurrencyBurstRateGenerator,
     ConstantRateGenerator,
+    GammaRateGenerator,
     PoissonRateGenerator,
+    RampRateGenerator,
     RequestRateStrategy,
+    SinusoidalRateGenerator,
+    StepRateGenerator,
 )
 from tests.unit.timing.conftest import (
     MockCreditManager,
@@ -460,6 +466,216 @@ class TestRequestRateStrategyMaxConcurrency:
         assert mock_semaphore.value == 0
 
 
+@pytest.mark.asyncio
+class TestRequestRateStrategyArrivalSchedule:
+    """Tests for scheduling credits against an absolute timeline."""
+
+    def _slow_drop_credit(
+        self,
+        mock_credit_manager: MockCreditManager,
+        time_traveler: TimeTraveler,
+        overhead_sec: float,
+    ):
+        """Make each credit drop take the given amount of time, to simulate the overhead of the loop."""
+        drop_credit = mock_credit_manager.drop_credit
+
+        async def slow_drop_credit(**kwargs):
+            await drop_credit(**kwargs)
+            time_traveler.advance_time(overhead_sec)
+
+        mock_credit_manager.drop_credit = slow_drop_credit
+
+    async def test_overhead_does_not_accumulate(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that credits stay on the schedule when each drop takes time."""
+        config, phase_stats = request_rate_config(
+            request_rate=10.0,
+            request_count=50,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        self._slow_drop_credit(mock_credit_manager, time_traveler, 0.03)
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+
+        await strategy._execute_single_phase(phase_stats)
+
+        timestamps = np.array(mock_credit_manager.dropped_timestamps)
+        offsets_sec = (timestamps - timestamps[0]) / NANOS_PER_SECOND
+        assert offsets_sec == pytest.approx(np.arange(50) * 0.1, abs=1e-6)
+        assert all(
+            credit.schedule_lag_ns == 0
+            for credit in mock_credit_manager.dropped_credits
+        )
+
+    async def test_catch_up_when_behind_schedule(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that credits are sent back to back when behind schedule, and the lag is reported."""
+        config, phase_stats = request_rate_config(
+            request_rate=10.0,
+            request_count=10,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        self._slow_drop_credit(mock_credit_manager, time_traveler, 0.15)
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+
+        await strategy._execute_single_phase(phase_stats)
+
+        timestamps = np.array(mock_credit_manager.dropped_timestamps)
+        assert np.diff(timestamps) == pytest.approx(0.15 * NANOS_PER_SECOND)
+        lags_sec = [
+            credit.schedule_lag_ns / NANOS_PER_SECOND
+            for credit in mock_credit_manager.dropped_credits
+        ]
+        assert lags_sec == pytest.approx([0.05 * i for i in range(10)], abs=1e-6)
+
+    async def test_credits_issued_ahead_of_time_with_lead_time(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that credits are issued ahead of time, with the time they must be sent at."""
+        config, phase_stats = request_rate_config(
+            request_rate=10.0,
+            request_count=5,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        strategy.credit_lead_ns = int(0.05 * NANOS_PER_SECOND)
+
+        await strategy._execute_single_phase(phase_stats)
+
+        timestamps = np.array(mock_credit_manager.dropped_timestamps)
+        credit_drop_ns = np.array(
+            [credit.credit_drop_ns for credit in mock_credit_manager.dropped_credits]
+        )
+        assert np.diff(timestamps) == pytest.approx(0.1 * NANOS_PER_SECOND)
+        assert credit_drop_ns - timestamps == pytest.approx(0.05 * NANOS_PER_SECOND)
+        assert all(
+            credit.schedule_lag_ns == 0
+            for credit in mock_credit_manager.dropped_credits
+        )
+
+    async def test_no_credit_drop_ns_without_lead_time(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that credits are sent as soon as possible without a lead time."""
+        config, phase_stats = request_rate_config(
+            request_rate=10.0,
+            request_count=5,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+
+        await strategy._execute_single_phase(phase_stats)
+
+        assert all(
+            credit.credit_drop_ns is None
+            for credit in mock_credit_manager.dropped_credits
+        )
+
+    async def test_credits_within_batch_window_are_sent_ahead_of_time(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that the credits scheduled within the batch window are batched, each with its own target time."""
+        config, phase_stats = request_rate_config(
+            request_rate=10.0,
+            request_count=10,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        strategy.credit_drop_batch_size = 4
+        strategy.credit_drop_batch_window_ns = int(0.25 * NANOS_PER_SECOND)
+
+        await strategy._execute_single_phase(phase_stats)
+
+        batches = mock_credit_manager.dropped_batches
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+        assert [credit.credit_num for batch in batches for credit in batch] == list(
+            range(10)
+        )
+        for batch in batches:
+            # The first credit of a batch is sent at its scheduled time, the others are sent ahead of time
+            assert batch[0].credit_drop_ns is None
+            assert np.diff(
+                [credit.credit_drop_ns for credit in batch[1:]]
+            ) == pytest.approx(0.1 * NANOS_PER_SECOND)
+        batch_timestamps = np.unique(mock_credit_manager.dropped_timestamps)
+        assert np.diff(batch_timestamps) == pytest.approx(0.3 * NANOS_PER_SECOND)
+
+    async def test_batches_do_not_exceed_free_concurrency(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that a batch is only filled with the credits that have a free concurrency slot."""
+        config, phase_stats = concurrency_config(concurrency=3, request_count=7)
+        strategy, _ = mock_credit_manager.create_strategy(
+            config, RequestRateStrategy, auto_return_delay=1.0
+        )
+        strategy.credit_drop_batch_size = 10
+
+        await strategy._execute_single_phase(phase_stats)
+
+        assert [len(batch) for batch in mock_credit_manager.dropped_batches] == [
+            3,
+            1,
+            1,
+            1,
+            1,
+        ]
+
+    async def test_concurrency_burst_has_no_schedule(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that concurrency burst mode does not report a schedule lag."""
+        config, phase_stats = concurrency_config(concurrency=5, request_count=5)
+        strategy, _ = mock_credit_manager.create_strategy(
+            config, RequestRateStrategy, auto_return_delay=1.0
+        )
+
+        await strategy._execute_single_phase(phase_stats)
+
+        assert len(mock_credit_manager.dropped_credits) == 5
+        assert all(
+            credit.schedule_lag_ns is None
+            for credit in mock_credit_manager.dropped_credits
+        )
+
+    async def test_arrival_offsets_span_chunks(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that the arrival offsets continue across chunks."""
+        config, _ = request_rate_config(
+            request_rate=1000.0,
+            request_count=10,
+            request_rate_mode=RequestRateMode.CONSTANT,
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        strategy._arrival_schedule_chunk_size = 3
+
+        offsets = strategy._arrival_offsets_ns()
+        assert [next(offsets) for _ in range(7)] == [i * 1_000_000 for i in range(1, 8)]
+
+    async def test_poisson_next_intervals(self):
+        """Test that the vectorized Poisson intervals have the expected mean."""
+        config, _ = request_rate_config(request_rate=100.0, request_count=10)
+        intervals = PoissonRateGenerator(config).next_intervals(100_000)
+
+        assert intervals.shape == (100_000,)
+        assert np.all(intervals >= 0)
+        assert np.mean(intervals) == pytest.approx(0.01, rel=0.02)
+
+    async def test_poisson_next_intervals_keep_seeded_sequence(self):
+        """Test that seeded runs produce the same intervals as drawing them one at a time."""
+        config, _ = request_rate_config(request_rate=100.0, request_count=10)
+        rng.reset()
+        rng.init(42)
+        generator = PoissonRateGenerator(config)
+        expected = [generator.next_interval() for _ in range(20)]
+
+        rng.reset()
+        rng.init(42)
+        generator = PoissonRateGenerator(config)
+        assert generator.next_intervals(20).tolist() == expected
+
+
 class TestConcurrencyBurstRateGeneratorExceptions:
     """Tests for ConcurrencyBurstRateGenerator initialization exceptions."""
 
@@ -645,3 +861,367 @@ class TestRequestRateStrategyEarlyExit:
 
         # Should take 1 second (no delay for first, 1 second for 2nd, and no final sleep)
         assert end_time - start_time == 1.0
+
+
+def _arrival_times(generator, count: int) -> np.ndarray:
+    return np.cumsum(generator.next_intervals(count))
+
+
+class TestTimeVaryingRateGenerators:
+    """Tests for the ramp, step, sinusoidal and gamma request rate generators."""
+
+    @pytest.mark.parametrize(
+        "request_rate_mode,generator_cls,kwargs",
+        [
+            (RequestRateMode.RAMP, RampRateGenerator, {"request_rate_end": 20.0, "request_rate_ramp_duration": 10.0}),
+            (RequestRateMode.STEP, StepRateGenerator, {"request_rate_step": 5.0, "request_rate_step_duration": 10.0}),
+            (RequestRateMode.SINUSOIDAL, SinusoidalRateGenerator, {"request_rate_amplitude": 5.0, "request_rate_period": 60.0}),
+            (RequestRateMode.GAMMA, GammaRateGenerator, {"request_rate_cv": 2.0}),
+        ],
+    )  # fmt: skip
+    def test_factory_creates_generator(self, request_rate_mode, generator_cls, kwargs):
+        config = TimingManagerConfig(
+            request_rate=10.0, request_rate_mode=request_rate_mode, **kwargs
+        )
+        assert isinstance(
+            RequestRateGeneratorFactory.create_instance(config), generator_cls
+        )
+
+    @pytest.mark.parametrize(
+        "request_rate_mode,generator_cls,kwargs,match",
+        [
+            (RequestRateMode.RAMP, RampRateGenerator, {}, "End request rate"),
+            (RequestRateMode.RAMP, RampRateGenerator, {"request_rate_end": 20.0}, "Ramp duration"),
+            (RequestRateMode.STEP, StepRateGenerator, {"request_rate_step": 5.0}, "Step duration"),
+            (RequestRateMode.STEP, StepRateGenerator, {"request_rate_step_duration": 10.0}, "Request rate step"),
+            (RequestRateMode.SINUSOIDAL, SinusoidalRateGenerator, {"request_rate_amplitude": 10.0, "request_rate_period": 60.0}, "Amplitude"),
+            (RequestRateMode.SINUSOIDAL, SinusoidalRateGenerator, {"request_rate_amplitude": 5.0}, "Period"),
+            (RequestRateMode.GAMMA, GammaRateGenerator, {}, "Coefficient of variation"),
+        ],
+    )  # fmt: skip
+    def test_missing_or_invalid_options_raise_value_error(
+        self, request_rate_mode, generator_cls, kwargs, match
+    ):
+        config = TimingManagerConfig(
+            request_rate=10.0, request_rate_mode=request_rate_mode, **kwargs
+        )
+        with pytest.raises(ValueError, match=match):
+            generator_cls(config)
+
+    def test_ramp_rate_follows_ramp(self):
+        config = TimingManagerConfig(
+            request_rate=100.0,
+            request_rate_mode=RequestRateMode.RAMP,
+            request_rate_end=300.0,
+            request_rate_ramp_duration=10.0,
+        )
+        generator = RampRateGenerator(config)
+
+        assert generator.rate_at(0) == 100.0
+        assert generator.rate_at(5.0) == pytest.approx(200.0)
+        assert generator.rate_at(10.0) == pytest.approx(300.0)
+        assert generator.rate_at(100.0) == pytest.approx(300.0)
+
+        # Over the ramp, the number of arrivals is the integral of the rate: (100 + 300) / 2 * 10
+        arrival_times = _arrival_times(generator, 5_000)
+        assert np.sum(arrival_times < 10.0) == pytest.approx(2_000, rel=0.05)
+
+    def test_ramp_duration_defaults_to_benchmark_duration(self):
+        config = TimingManagerConfig(
+            request_rate=10.0,
+            request_rate_mode=RequestRateMode.RAMP,
+            request_rate_end=20.0,
+            benchmark_duration=60.0,
+        )
+        assert RampRateGenerator(config).rate_at(30.0) == pytest.approx(15.0)
+
+    def test_step_rate_follows_ladder(self):
+        config = TimingManagerConfig(
+            request_rate=50.0,
+            request_rate_mode=RequestRateMode.STEP,
+            request_rate_step=50.0,
+            request_rate_step_duration=10.0,
+            request_rate_end=150.0,
+        )
+        generator = StepRateGenerator(config)
+
+        assert [generator.rate_at(t) for t in [0, 9.9, 10, 25, 35, 1000]] == [
+            50.0, 50.0, 100.0, 150.0, 150.0, 150.0,
+        ]  # fmt: skip
+
+        arrival_times = _arrival_times(generator, 5_000)
+        counts, _ = np.histogram(arrival_times, bins=[0, 10, 20, 30])
+        assert counts == pytest.approx([500, 1_000, 1_500], rel=0.1)
+
+    def test_sinusoidal_rate_follows_sinusoid(self):
+        config = TimingManagerConfig(
+            request_rate=100.0,
+            request_rate_mode=RequestRateMode.SINUSOIDAL,
+            request_rate_amplitude=50.0,
+            request_rate_period=20.0,
+        )
+        generator = SinusoidalRateGenerator(config)
+
+        assert generator.rate_at(5.0) == pytest.approx(150.0)
+        assert generator.rate_at(15.0) == pytest.approx(50.0)
+
+        arrival_times = _arrival_times(generator, 10_000)
+        counts, _ = np.histogram(arrival_times, bins=[0, 10, 20])
+        # Integral of the rate over each half period: 100 * 10 +/- 50 * 20 / π
+        expected_delta = 50.0 * 20.0 / math.pi
+        assert counts == pytest.approx(
+            [1_000 + expected_delta, 1_000 - expected_delta], rel=0.1
+        )
+
+    @pytest.mark.parametrize("cv", [0.5, 1.0, 3.0])
+    def test_gamma_intervals_have_expected_mean_and_cv(self, cv: float):
+        config = TimingManagerConfig(
+            request_rate=100.0,
+            request_rate_mode=RequestRateMode.GAMMA,
+            request_rate_cv=cv,
+        )
+        intervals = GammaRateGenerator(config).next_intervals(200_000)
+
+        assert np.mean(intervals) == pytest.approx(0.01, rel=0.03)
+        assert np.std(intervals) / np.mean(intervals) == pytest.approx(cv, rel=0.05)
+
+    def test_generators_are_reproducible(self):
+        config = TimingManagerConfig(
+            request_rate=10.0,
+            request_rate_mode=RequestRateMode.SINUSOIDAL,
+            request_rate_amplitude=5.0,
+            request_rate_period=60.0,
+        )
+        # Each generator derives its own RNG from the global seed
+        first = SinusoidalRateGenerator(config).next_intervals(100)
+        second = SinusoidalRateGenerator(config).next_intervals(100)
+
+        np.testing.assert_array_equal(first, second)
+
+
+def _credit_return() -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id="test-service",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=str(uuid.uuid4()),
+        requests_sent=1,
+    )
+
+
+class TestRequestRateStrategyLoadStages:
+    """Tests for running multiple load stages within the profiling phase."""
+
+    async def test_count_based_stages_run_in_order(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that each stage sends its request count at its own rate, tagged with its index."""
+        config = TimingManagerConfig(
+            load_stages=[
+                LoadStageConfig(
+                    request_rate=10.0, request_rate_mode="constant", request_count=5
+                ),
+                LoadStageConfig(
+                    request_rate=20.0, request_rate_mode="constant", request_count=4
+                ),
+            ]
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        phase_config = strategy.ordered_phase_configs[-1]
+        assert phase_config.total_expected_requests == 9
+
+        phase_stats = CreditPhaseStats.from_phase_config(phase_config)
+        phase_stats.start_ns = time_traveler.time_ns()
+        await strategy._execute_single_phase(phase_stats)
+
+        assert [
+            credit.stage_index for credit in mock_credit_manager.dropped_credits
+        ] == [0] * 5 + [1] * 4
+        intervals_sec = (
+            np.diff(mock_credit_manager.dropped_timestamps) / NANOS_PER_SECOND
+        )
+        assert intervals_sec[:4] == pytest.approx(0.1, abs=1e-6)
+        assert intervals_sec[5:] == pytest.approx(0.05, abs=1e-6)
+
+    async def test_duration_based_stages_end_on_time(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that each stage sends credits until its cumulative duration has elapsed."""
+        config = TimingManagerConfig(
+            load_stages=[
+                LoadStageConfig(
+                    request_rate=10.0, request_rate_mode="constant", duration=1.05
+                ),
+                LoadStageConfig(
+                    request_rate=20.0, request_rate_mode="constant", duration=1.05
+                ),
+            ]
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        phase_config = strategy.ordered_phase_configs[-1]
+        assert phase_config.expected_duration_sec == pytest.approx(2.1)
+
+        phase_stats = CreditPhaseStats.from_phase_config(phase_config)
+        phase_stats.start_ns = time_traveler.time_ns()
+        await strategy._execute_single_phase(phase_stats)
+
+        stage_indices = [
+            credit.stage_index for credit in mock_credit_manager.dropped_credits
+        ]
+        # The first stage sends at 0.0, 0.1, ..., 1.0 and the second at 1.1, 1.15, ..., 2.05
+        assert stage_indices == [0] * 11 + [1] * 20
+
+    async def test_warmup_uses_first_stage(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that the strategy starts with the load of the first stage, which the warmup phase uses."""
+        config = TimingManagerConfig(
+            warmup_request_count=5,
+            load_stages=[
+                LoadStageConfig(concurrency=2, request_count=10),
+                LoadStageConfig(concurrency=4, request_rate=5.0, request_count=10),
+            ],
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+
+        assert isinstance(
+            strategy._request_rate_generator, ConcurrencyBurstRateGenerator
+        )
+        assert not strategy._use_arrival_schedule
+        assert strategy._concurrency == 2
+
+    async def test_stage_change_resizes_semaphore(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that the concurrency limit is resized when the stage changes."""
+        config = TimingManagerConfig(
+            load_stages=[
+                LoadStageConfig(concurrency=2, request_count=10),
+                LoadStageConfig(concurrency=5, request_count=10),
+                LoadStageConfig(concurrency=1, request_rate=5.0, request_count=10),
+            ]
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        assert strategy._semaphore._value == 2
+
+        await strategy._apply_stage_config(strategy._stage_configs[1], in_flight=0)
+        assert strategy._semaphore._value == 5
+
+        await strategy._apply_stage_config(strategy._stage_configs[2], in_flight=0)
+        assert strategy._semaphore._value == 1
+        assert strategy._use_arrival_schedule
+        assert isinstance(strategy._request_rate_generator, PoissonRateGenerator)
+
+    async def test_stages_mix_concurrency_and_request_rate(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that a stage without a concurrency drops the semaphore, and that a later stage with a concurrency
+        only releases permits once the credits in flight beyond its limit have returned."""
+        config = TimingManagerConfig(
+            load_stages=[
+                LoadStageConfig(concurrency=2, request_count=10),
+                LoadStageConfig(request_rate=5.0, request_count=10),
+                LoadStageConfig(concurrency=3, request_count=10),
+            ]
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        assert strategy._semaphore._value == 2
+
+        await strategy._apply_stage_config(strategy._stage_configs[1], in_flight=2)
+        assert strategy._semaphore is None
+        # The credits of the first stage return without a semaphore to release
+        await strategy._on_credit_return(_credit_return())
+
+        await strategy._apply_stage_config(strategy._stage_configs[2], in_flight=5)
+        assert strategy._semaphore._value == 0
+        assert strategy._semaphore_debt == 2
+
+        for expected_value in [0, 0, 1, 2]:
+            await strategy._on_credit_return(_credit_return())
+            assert strategy._semaphore._value == expected_value
+
+
+def _next_turn_credit_return() -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id="worker-1",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=str(uuid.uuid4()),
+        requests_sent=1,
+        next_turn=NextTurnCredit(
+            conversation_id="session_1",
+            session_id="session-id-1",
+            turn_index=1,
+            credit_num=0,
+            delay_ns=2 * NANOS_PER_SECOND,
+        ),
+    )
+
+
+class TestRequestRateStrategyPerTurnCredits:
+    """Tests for issuing each turn of a multi-turn conversation as its own credit."""
+
+    async def test_next_turn_releases_slot_during_delay(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that a returned turn releases its concurrency slot, and the next turn is issued as its own credit
+        once its delay has elapsed, without completing the conversation."""
+        config, phase_stats = concurrency_config(concurrency=1, request_count=1)
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        strategy.phase_stats[CreditPhase.PROFILING] = phase_stats
+        phase_stats.sent = 1
+        await strategy._semaphore.acquire()
+
+        start_ns = time_traveler.time_ns()
+        await strategy._on_credit_return(_next_turn_credit_return())
+        # The slot is free during the turn delay, and the conversation is still in flight
+        assert strategy._semaphore._value == 1
+        assert phase_stats.completed == 0
+        assert phase_stats.in_flight == 1
+        assert phase_stats.requests_sent == 1
+
+        await strategy.wait_for_tasks()
+
+        assert strategy._semaphore._value == 0
+        [credit] = mock_credit_manager.dropped_credits
+        # The next turn only carries the IDs of its session, and is sent to the worker that keeps its history
+        assert credit.conversation_id == "session_1"
+        assert credit.session_id == "session-id-1"
+        assert credit.target_service_id == "worker-1"
+        assert credit.turn_index == 1
+        assert credit.credit_num == 0
+        assert mock_credit_manager.dropped_timestamps[0] - start_ns >= (
+            2 * NANOS_PER_SECOND
+        )
+
+    async def test_next_turn_not_sent_after_duration_ends(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that the conversations of a duration-based phase are not continued once the duration has ended,
+        and their credits are completed instead."""
+        config = TimingManagerConfig(
+            timing_mode=TimingMode.REQUEST_RATE,
+            concurrency=1,
+            request_rate_mode=RequestRateMode.CONCURRENCY_BURST,
+            benchmark_duration=1.0,
+        )
+        phase_stats = CreditPhaseStats(
+            type=CreditPhase.PROFILING,
+            start_ns=time_traveler.time_ns(),
+            expected_duration_sec=1.0,
+        )
+        strategy = RequestRateStrategy(config, mock_credit_manager)
+        strategy.phase_stats[CreditPhase.PROFILING] = phase_stats
+        phase_stats.sent = 2
+        await strategy._semaphore.acquire()
+
+        # The duration ends during the turn delay of the first conversation
+        await strategy._on_credit_return(_next_turn_credit_return())
+        time_traveler.advance_time(1.5)
+        await strategy.wait_for_tasks()
+        assert phase_stats.completed == 1
+        assert strategy._semaphore._value == 1
+
+        # The duration has already ended when the second conversation returns its first turn
+        await strategy._on_credit_return(_next_turn_credit_return())
+        await strategy.wait_for_tasks()
+        assert phase_stats.completed == 2
+        assert mock_credit_manager.dropped_credits == []
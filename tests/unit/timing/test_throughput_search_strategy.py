@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the ThroughputSearchStrategy class.
+"""
+
+from collections import Counter
+
+import pytest
+
+from aiperf.common.enums import CreditPhase, ThroughputSearchMode
+from aiperf.common.models import CreditPhaseStats
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.throughput_search_strategy import ThroughputSearchStrategy
+from tests.unit.timing.conftest import MockCreditManager
+from tests.unit.utils.time_traveler import TimeTraveler
+
+
+def search_config(search_mode: ThroughputSearchMode, **kwargs) -> TimingManagerConfig:
+    """Create a throughput search config, which does not wait for in-flight requests by default."""
+    kwargs.setdefault("benchmark_grace_period", 0)
+    return TimingManagerConfig(
+        search_mode=search_mode,
+        request_rate_mode="constant",
+        search_probe_duration=1.0,
+        **kwargs,
+    )
+
+
+class TestThroughputSearchStrategy:
+    """Tests for the throughput search strategy."""
+
+    @pytest.mark.parametrize(
+        "search_mode,highest_passed,lowest_failed,expected",
+        [
+            (ThroughputSearchMode.CONCURRENCY, None, None, 1),
+            (ThroughputSearchMode.CONCURRENCY, None, 1, None),
+            (ThroughputSearchMode.CONCURRENCY, 1, None, 64),
+            (ThroughputSearchMode.CONCURRENCY, 64, None, None),
+            (ThroughputSearchMode.CONCURRENCY, 1, 64, 32),
+            (ThroughputSearchMode.CONCURRENCY, 32, 35, 33),
+            (ThroughputSearchMode.CONCURRENCY, 32, 33, None),
+            (ThroughputSearchMode.REQUEST_RATE, 1, 64, 32.5),
+            (ThroughputSearchMode.REQUEST_RATE, 32.5, 33, 32.75),
+        ],
+    )
+    def test_next_probe_load(
+        self,
+        mock_credit_manager: MockCreditManager,
+        search_mode: ThroughputSearchMode,
+        highest_passed: float | None,
+        lowest_failed: float | None,
+        expected: float | None,
+    ):
+        """Test that the search probes the bounds first, and then bisects between the passing and failing loads."""
+        config = search_config(search_mode, search_max=64, concurrency=100)
+        strategy = ThroughputSearchStrategy(config, mock_credit_manager)
+
+        assert strategy._next_probe_load(highest_passed, lowest_failed) == expected
+
+    def test_concurrency_probe_stage(self, mock_credit_manager: MockCreditManager):
+        """Test that a concurrency probe sets the concurrency, and starts the search at the minimum concurrency."""
+        config = search_config(
+            ThroughputSearchMode.CONCURRENCY, search_min=4, search_max=64
+        )
+        strategy = ThroughputSearchStrategy(config, mock_credit_manager)
+
+        stage = strategy._probe_stage(16)
+        assert stage.concurrency == 16
+        assert stage.request_rate is None
+        assert stage.duration == 1.0
+        assert strategy._concurrency == 4
+
+    def test_profiling_phase_upper_bound(self, mock_credit_manager: MockCreditManager):
+        """Test that the profiling phase lasts at most the duration of all probes and their grace periods."""
+        config = search_config(
+            ThroughputSearchMode.REQUEST_RATE,
+            search_max=64,
+            search_max_probes=5,
+            benchmark_grace_period=2.0,
+        )
+        strategy = ThroughputSearchStrategy(config, mock_credit_manager)
+
+        phase_config = strategy.ordered_phase_configs[-1]
+        assert phase_config.type == CreditPhase.PROFILING
+        assert phase_config.expected_duration_sec == pytest.approx(15.0)
+
+    async def test_search_runs_probes_as_stages(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that each probe is run as its own stage, and the next load is bisected from the probe results."""
+        config = search_config(
+            ThroughputSearchMode.REQUEST_RATE,
+            search_min=2,
+            search_max=10,
+            search_max_probes=4,
+        )
+        mock_credit_manager.search_capacity = 5.0
+        strategy = ThroughputSearchStrategy(config, mock_credit_manager)
+
+        phase_stats = CreditPhaseStats.from_phase_config(
+            strategy.ordered_phase_configs[-1]
+        )
+        phase_stats.start_ns = time_traveler.time_ns()
+        await strategy._execute_single_phase(phase_stats)
+
+        assert [result.load for result in strategy.probe_results] == [2, 10, 6, 4]
+        assert [result.passed for result in strategy.probe_results] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        # Each probe only reports the credits that were sent during its own stage
+        stage_counts = Counter(
+            credit.stage_index for credit in mock_credit_manager.dropped_credits
+        )
+        assert [
+            (stage_index, expected_records)
+            for stage_index, _, expected_records in mock_credit_manager.search_probe_calls
+        ] == [(stage_index, stage_counts[stage_index]) for stage_index in range(4)]
+        assert stage_counts[1] > stage_counts[0]
+
+    async def test_search_stops_when_min_fails(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that the search stops after the first probe when the minimum load does not meet the SLOs."""
+        config = search_config(ThroughputSearchMode.REQUEST_RATE, search_max=10)
+        strategy = ThroughputSearchStrategy(config, mock_credit_manager)
+
+        phase_stats = CreditPhaseStats.from_phase_config(
+            strategy.ordered_phase_configs[-1]
+        )
+        phase_stats.start_ns = time_traveler.time_ns()
+        await strategy._execute_single_phase(phase_stats)
+
+        assert [result.load for result in strategy.probe_results] == [1]
+        assert not strategy.probe_results[0].passed
@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the TimingManager credit drop batching, credit return batch handling and turn credit tracking.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aiperf.common.config import EndpointConfig, ServiceConfig, UserConfig
+from aiperf.common.enums import CreditPhase
+from aiperf.common.messages import (
+    CreditDropBatchMessage,
+    CreditDropMessage,
+    CreditReturnBatchMessage,
+    CreditReturnMessage,
+    TurnCreditDropMessage,
+)
+from aiperf.common.models import NextTurnCredit
+from aiperf.timing.timing_manager import TimingManager
+
+
+def _credit_return(credit_drop_id: str) -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id="worker-1",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=credit_drop_id,
+        requests_sent=1,
+    )
+
+
+@pytest.fixture
+def timing_manager() -> TimingManager:
+    timing_manager = TimingManager(
+        service_config=ServiceConfig(),
+        user_config=UserConfig(endpoint=EndpointConfig(model_names=["test-model"])),
+        service_id="timing-manager",
+    )
+    timing_manager.credit_drop_push_client = Mock()
+    timing_manager.credit_drop_push_client.push = AsyncMock()
+    return timing_manager
+
+
+def _pushed_messages(timing_manager: TimingManager) -> list:
+    return [
+        call.kwargs["message"]
+        for call in timing_manager.credit_drop_push_client.push.await_args_list
+    ]
+
+
+def _credits(count: int) -> list[CreditDropMessage]:
+    return [
+        CreditDropMessage(
+            service_id="timing-manager",
+            phase=CreditPhase.PROFILING,
+            credit_num=credit_num,
+            credit_drop_ns=None if credit_num == 0 else 1000 + credit_num,
+        )
+        for credit_num in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+class TestTimingManagerCreditBatching:
+    async def test_drop_credit_pushes_each_credit(self, timing_manager):
+        for credit_num in range(3):
+            await timing_manager.drop_credit(CreditPhase.PROFILING, credit_num)
+        await asyncio.sleep(0)
+
+        messages = _pushed_messages(timing_manager)
+        assert len(messages) == 3
+        assert all(isinstance(message, CreditDropMessage) for message in messages)
+        # Credits without a target are sent as soon as possible, and are not stamped with a time
+        assert all(message.credit_drop_ns is None for message in messages)
+
+    async def test_batch_without_known_workers_is_pushed_whole(self, timing_manager):
+        await timing_manager.drop_credit_batch(_credits(5))
+        await asyncio.sleep(0)
+
+        messages = _pushed_messages(timing_manager)
+        assert len(messages) == 1
+        assert isinstance(messages[0], CreditDropBatchMessage)
+        assert [credit.credit_num for credit in messages[0].credits] == [0, 1, 2, 3, 4]
+
+    async def test_batch_is_split_across_workers(self, timing_manager):
+        for worker_id in ["worker-1", "worker-2"]:
+            await timing_manager._on_worker_health(Mock(service_id=worker_id))
+
+        await timing_manager.drop_credit_batch(_credits(5))
+        await asyncio.sleep(0)
+
+        messages = _pushed_messages(timing_manager)
+        assert len(messages) == 2
+        assert [credit.credit_num for credit in messages[0].credits] == [0, 2, 4]
+        assert [credit.credit_num for credit in messages[1].credits] == [1, 3]
+        # Each credit keeps its own target time, and credits without one are left without one
+        assert [credit.credit_drop_ns for credit in messages[0].credits] == [
+            None,
+            1002,
+            1004,
+        ]
+
+    async def test_single_credit_splits_are_sent_as_credit_drops(self, timing_manager):
+        for worker_id in ["worker-1", "worker-2", "worker-3"]:
+            await timing_manager._on_worker_health(Mock(service_id=worker_id))
+
+        await timing_manager.drop_credit_batch(_credits(2))
+        await asyncio.sleep(0)
+
+        messages = _pushed_messages(timing_manager)
+        assert [type(message) for message in messages] == [
+            CreditDropMessage,
+            CreditDropMessage,
+        ]
+        assert [message.credit_num for message in messages] == [0, 1]
+
+    async def test_credit_return_batch_is_handled_per_credit_in_order(
+        self, timing_manager
+    ):
+        strategy = Mock()
+        strategy._on_credit_return = AsyncMock()
+        timing_manager._credit_issuing_strategy = strategy
+        credit_returns = [_credit_return(str(i)) for i in range(5)]
+
+        await timing_manager._on_credit_return_batch(
+            CreditReturnBatchMessage(
+                service_id="worker-1", credit_returns=credit_returns
+            )
+        )
+
+        assert [
+            call.args[0] for call in strategy._on_credit_return.await_args_list
+        ] == credit_returns
+
+
+@pytest.mark.asyncio
+class TestTimingManagerTurnCredits:
+    @pytest.fixture
+    def strategy(self, timing_manager) -> Mock:
+        timing_manager.publish = AsyncMock()
+        strategy = Mock()
+        strategy._on_credit_return = AsyncMock()
+        timing_manager._credit_issuing_strategy = strategy
+        return strategy
+
+    async def _drop_turn_credit(self, timing_manager) -> str:
+        await timing_manager.drop_turn_credit(
+            CreditPhase.PROFILING,
+            NextTurnCredit(
+                conversation_id="conversation-1",
+                session_id="session-1",
+                turn_index=1,
+                credit_num=0,
+                delay_ns=0,
+            ),
+            "worker-1",
+        )
+        (credit_drop_id,) = timing_manager._pending_turn_credits
+        return credit_drop_id
+
+    async def test_returned_turn_credit_is_passed_to_strategy(
+        self, timing_manager, strategy
+    ):
+        credit_drop_id = await self._drop_turn_credit(timing_manager)
+
+        await timing_manager._on_credit_return(_credit_return(credit_drop_id))
+        await timing_manager.wait_for_tasks()
+
+        message = timing_manager.publish.await_args.args[0]
+        assert isinstance(message, TurnCreditDropMessage)
+        assert message.request_id == credit_drop_id
+        assert message.target_service_id == "worker-1"
+        assert strategy._on_credit_return.await_count == 1
+        assert timing_manager._pending_turn_credits == {}
+        assert timing_manager._expired_turn_credits == set()
+
+    async def test_turn_credit_not_returned_in_time_expires(
+        self, timing_manager, strategy
+    ):
+        """Test that a turn credit that is not returned in time is returned to the strategy, and its late return is
+        ignored, so that the phase does not wait for it, and it is not completed twice."""
+        credit_drop_id = await self._drop_turn_credit(timing_manager)
+        await timing_manager.wait_for_tasks()
+
+        strategy._on_credit_return.assert_awaited_once()
+        expired_return = strategy._on_credit_return.await_args.args[0]
+        assert expired_return.credit_drop_id == credit_drop_id
+        assert expired_return.service_id == "worker-1"
+        assert expired_return.requests_sent == 0
+        assert timing_manager._pending_turn_credits == {}
+
+        await timing_manager._on_credit_return(_credit_return(credit_drop_id))
+
+        strategy._on_credit_return.assert_awaited_once()
+        assert timing_manager._expired_turn_credits == set()
@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the TokenRateStrategy class.
+"""
+
+import pytest
+
+import aiperf.dataset.dataset_samplers  # noqa: F401 - registers the dataset samplers
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.enums import DatasetSamplingStrategy, TokenRateType
+from aiperf.common.models import (
+    ConversationTokenLengths,
+    CreditPhaseStats,
+    OutputTokenStats,
+)
+from aiperf.timing.config import TimingManagerConfig
+from aiperf.timing.token_rate_strategy import TokenBucket, TokenRateStrategy
+from tests.unit.timing.conftest import MockCreditManager
+from tests.unit.utils.time_traveler import TimeTraveler
+
+TOKEN_LENGTHS = [
+    ConversationTokenLengths(conversation_id="c1", input_tokens=50, output_tokens=20),
+    ConversationTokenLengths(
+        conversation_id="c2", input_tokens=100, output_tokens=None, turns=2
+    ),
+]
+
+
+def token_rate_config(**kwargs) -> TimingManagerConfig:
+    """Create a token rate config of 100 tokens per second, sampling the conversations sequentially."""
+    kwargs.setdefault("tokens_per_minute", 6000)
+    return TimingManagerConfig(
+        dataset_sampling_strategy=DatasetSamplingStrategy.SEQUENTIAL, **kwargs
+    )
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_admits_immediately_while_full(self):
+        bucket = TokenBucket(rate=100, capacity=100, start_perf_ns=0)
+
+        assert bucket.reserve(60, 0) == 0
+        assert bucket.reserve(40, 0) == 0
+
+    def test_delays_by_shortfall(self):
+        bucket = TokenBucket(rate=100, capacity=100, start_perf_ns=0)
+
+        assert bucket.reserve(100, 0) == 0
+        # Half a second of tokens is missing, and refilled after half a second
+        assert bucket.reserve(50, 0) == NANOS_PER_SECOND // 2
+        assert bucket.reserve(50, NANOS_PER_SECOND // 2) == NANOS_PER_SECOND
+
+    def test_oversized_request_waits_for_full_bucket_and_leaves_debt(self):
+        """Test that a request larger than the capacity waits for a full bucket, and delays the requests after it."""
+        bucket = TokenBucket(rate=100, capacity=100, start_perf_ns=0)
+
+        assert bucket.reserve(50, 0) == 0
+        assert bucket.reserve(300, 0) == NANOS_PER_SECOND // 2
+        # The bucket is 200 tokens in debt once the oversized request is admitted
+        assert bucket.reserve(100, NANOS_PER_SECOND // 2) == 7 * NANOS_PER_SECOND // 2
+
+
+class TestTokenRateStrategy:
+    """Tests for the token rate strategy."""
+
+    def test_empty_token_lengths_raises(self, mock_credit_manager: MockCreditManager):
+        with pytest.raises(ValueError, match="No token lengths loaded"):
+            TokenRateStrategy(token_rate_config(), mock_credit_manager, [])
+
+    def test_no_request_rate_generator(self, mock_credit_manager: MockCreditManager):
+        strategy = TokenRateStrategy(
+            token_rate_config(concurrency=2), mock_credit_manager, TOKEN_LENGTHS
+        )
+
+        assert strategy._request_rate_generator is None
+        assert strategy._semaphore._value == 2
+        assert strategy._bucket_capacity == 100
+
+    @pytest.mark.parametrize(
+        "token_rate_type,mean_output_tokens,expected",
+        [
+            (TokenRateType.INPUT, None, [50, 100]),
+            (TokenRateType.INPUT, 30.0, [50, 100]),
+            (TokenRateType.TOTAL, None, [70, 100]),
+            (TokenRateType.TOTAL, 30.0, [80, 160]),
+        ],
+    )
+    def test_credit_tokens(
+        self,
+        mock_credit_manager: MockCreditManager,
+        token_rate_type: TokenRateType,
+        mean_output_tokens: float | None,
+        expected: list[float],
+    ):
+        """Test that the output tokens are only counted for the total token rate type, estimated from the
+        max_tokens of each turn, or from the measured mean output tokens of each turn."""
+        strategy = TokenRateStrategy(
+            token_rate_config(token_rate_type=token_rate_type),
+            mock_credit_manager,
+            TOKEN_LENGTHS,
+        )
+        strategy._mean_output_tokens = mean_output_tokens
+
+        assert [
+            strategy._credit_tokens(lengths) for lengths in TOKEN_LENGTHS
+        ] == expected
+
+    async def test_update_output_token_estimate(
+        self, mock_credit_manager: MockCreditManager
+    ):
+        """Test that the output token estimate is only updated once requests have completed."""
+        config = token_rate_config(
+            token_rate_type=TokenRateType.TOTAL, token_rate_feedback=True
+        )
+        strategy = TokenRateStrategy(config, mock_credit_manager, TOKEN_LENGTHS)
+
+        mock_credit_manager.output_token_stats = OutputTokenStats()
+        await strategy._update_output_token_estimate()
+        assert strategy._mean_output_tokens is None
+
+        mock_credit_manager.output_token_stats = OutputTokenStats(
+            request_count=4, output_tokens=100
+        )
+        await strategy._update_output_token_estimate()
+        assert strategy._mean_output_tokens == 25.0
+
+    async def test_send_token_credits(
+        self, mock_credit_manager: MockCreditManager, time_traveler: TimeTraveler
+    ):
+        """Test that each credit is sent with its conversation, once the token bucket holds its tokens."""
+        strategy = TokenRateStrategy(
+            token_rate_config(request_count=4), mock_credit_manager, TOKEN_LENGTHS
+        )
+
+        phase_stats = CreditPhaseStats.from_phase_config(
+            strategy.ordered_phase_configs[-1]
+        )
+        phase_stats.start_ns = time_traveler.time_ns()
+        await strategy._execute_single_phase(phase_stats)
+
+        assert [
+            credit.conversation_id for credit in mock_credit_manager.dropped_credits
+        ] == ["c1", "c2", "c1", "c2"]
+        start_ns = mock_credit_manager.dropped_timestamps[0]
+        offsets_sec = [
+            (timestamp_ns - start_ns) / NANOS_PER_SECOND
+            for timestamp_ns in mock_credit_manager.dropped_timestamps
+        ]
+        assert offsets_sec == pytest.approx([0.0, 0.5, 1.0, 2.0], abs=0.01)
@@ -229,16 +229,10 @@ def setup_mock_session(
         ]
 
     mock_session = AsyncMock()
+    mock_session.closed = False
 
-    # Create a factory function that accepts the ClientSession parameters and returns the context manager
-    def session_factory(*args, **kwargs):
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_context.__aexit__ = AsyncMock(return_value=None)
-        return mock_session_context
-
-    # Set the session class to return our factory
-    mock_session_class.side_effect = session_factory
+    # The client keeps a long-lived session, so the session class returns the session directly
+    mock_session_class.return_value = mock_session
 
     # Setup context managers for all HTTP methods
     for method in methods:
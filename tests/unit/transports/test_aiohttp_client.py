@@ -4,15 +4,18 @@
 
 import asyncio
 import json
+import statistics
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import pytest
 
-from aiperf.common.enums import SSEEventType, SSEFieldType
-from aiperf.common.models import SSEField, SSEMessage
+from aiperf.common.enums import SSEEventType
+from aiperf.common.environment import Environment
+from aiperf.common.models import SSEMessage
 from aiperf.transports.aiohttp_client import AioHttpClient
-from aiperf.transports.sse_utils import AsyncSSEStreamReader
+from aiperf.transports.sse_utils import AsyncSSEStreamReader, SSEEvent
 from tests.unit.transports.conftest import (
     assert_error_request_record,
     assert_successful_request_record,
@@ -85,9 +88,9 @@ class TestAioHttpClient:
         self, aiohttp_client: AioHttpClient, mock_sse_response: Mock
     ) -> None:
         """Test SSE stream request handling."""
-        mock_messages = [
-            SSEMessage(perf_ns=123456789),
-            SSEMessage(perf_ns=123456790),
+        mock_events = [
+            SSEEvent(123456789, b"data: Hello"),
+            SSEEvent(123456790, b"data: World"),
         ]
 
         with (
@@ -104,12 +107,12 @@ class TestAioHttpClient:
 
             setup_mock_session(mock_session_class, mock_sse_response, ["request"])
 
-            async def mock_aiter():
-                for msg in mock_messages:
-                    yield msg
+            async def mock_iter_events():
+                for event in mock_events:
+                    yield event
 
             mock_reader = Mock()
-            mock_reader.__aiter__ = Mock(return_value=mock_aiter())
+            mock_reader.iter_events = Mock(return_value=mock_iter_events())
             mock_reader_class.return_value = mock_reader
 
             record = await aiohttp_client.post_request(
@@ -139,14 +142,15 @@ class TestAioHttpClient:
     ) -> None:
         """Test that SSE error events are properly caught and handled in the client."""
 
-        packets = [
-            SSEField(name=SSEFieldType.EVENT, value=SSEEventType.ERROR),
-        ]
+        raw_error = f"event: {SSEEventType.ERROR}\n"
         if comment_value:
-            packets.append(SSEField(name=SSEFieldType.COMMENT, value=comment_value))
-        packets.append(SSEField(name=SSEFieldType.DATA, value="{}"))
+            raw_error += f": {comment_value}\n"
+        raw_error += "data: {}"
 
-        mock_error_message = SSEMessage(perf_ns=123456789, packets=packets)
+        mock_events = [
+            SSEEvent(123456789, b"data: Hello"),
+            SSEEvent(123456790, raw_error.encode()),
+        ]
 
         with (
             patch("aiohttp.ClientSession") as mock_session_class,
@@ -165,14 +169,16 @@ class TestAioHttpClient:
 
             setup_mock_session(mock_session_class, mock_sse_response, ["request"])
 
-            async def mock_aiter():
-                yield mock_error_message
-
-                AsyncSSEStreamReader.inspect_message_for_error(mock_error_message)
+            async def mock_iter_events():
+                for event in mock_events:
+                    yield event
 
             mock_reader = Mock()
-            mock_reader.__aiter__ = Mock(return_value=mock_aiter())
+            mock_reader.iter_events = Mock(return_value=mock_iter_events())
             mock_reader_class.return_value = mock_reader
+            mock_reader_class.inspect_event_for_error = (
+                AsyncSSEStreamReader.inspect_event_for_error
+            )
 
             record = await aiohttp_client.post_request(
                 "http://test.com/stream",
@@ -309,10 +315,61 @@ class TestAioHttpClient:
             call_kwargs = mock_session_class.call_args[1]
             assert call_kwargs["connector"] == aiohttp_client.tcp_connector
             assert call_kwargs["timeout"] == aiohttp_client.timeout
-            assert call_kwargs["headers"] == headers
             assert call_kwargs["connector_owner"] is False
-            assert "Authorization" in call_kwargs["skip_auto_headers"]
-            assert "Custom-Header" in call_kwargs["skip_auto_headers"]
+            assert "headers" not in call_kwargs
+            assert "User-Agent" in call_kwargs["skip_auto_headers"]
+            assert "Accept-Encoding" in call_kwargs["skip_auto_headers"]
+            assert isinstance(call_kwargs["cookie_jar"], aiohttp.DummyCookieJar)
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_requests(
+        self, aiohttp_client: AioHttpClient, mock_aiohttp_response: Mock
+    ) -> None:
+        """Test that a single long-lived session is used for all requests, with per-request headers."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = setup_mock_session(
+                mock_session_class, mock_aiohttp_response, ["request"]
+            )
+
+            for i in range(3):
+                record = await aiohttp_client.post_request(
+                    "http://test.com", "{}", {"X-Request-ID": str(i)}
+                )
+                assert_successful_request_record(record)
+
+            mock_session_class.assert_called_once()
+            assert mock_session.request.call_count == 3
+            sent_headers = [
+                call[1]["headers"] for call in mock_session.request.call_args_list
+            ]
+            assert sent_headers == [{"X-Request-ID": str(i)} for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(
+        self, aiohttp_client: AioHttpClient, mock_aiohttp_response: Mock
+    ) -> None:
+        """Test that a closed session is replaced on the next request."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = setup_mock_session(
+                mock_session_class, mock_aiohttp_response, ["request"]
+            )
+
+            await aiohttp_client.post_request("http://test.com", "{}", {})
+            mock_session.closed = True
+            await aiohttp_client.post_request("http://test.com", "{}", {})
+
+            assert mock_session_class.call_count == 2
+
+    async def test_close_closes_session(self, aiohttp_client: AioHttpClient) -> None:
+        """Test that close() closes the long-lived session before the connector."""
+        mock_session = Mock()
+        mock_session.close = AsyncMock()
+        aiohttp_client.session = mock_session
+
+        await aiohttp_client.close()
+
+        mock_session.close.assert_called_once()
+        assert aiohttp_client.session is None
 
     @pytest.mark.asyncio
     async def test_end_to_end_json_request(
@@ -417,3 +474,205 @@ class TestAioHttpClient:
             mock_session.request.assert_called_once()
             call_args = mock_session.request.call_args
             assert call_args[1]["data"] == large_payload
+
+
+class TestAioHttpClientPrewarm:
+    """Tests for pre-warming the AioHttpClient connection pool against a local server."""
+
+    async def test_prewarm_connections_are_reused(self) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        peers: list[tuple] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            peers.append(request.transport.get_extra_info("peername"))
+            await request.read()
+            return web.Response(text="{}", content_type="application/json")
+
+        app = web.Application()
+        app.router.add_route("*", "/v1/chat/completions", handler)
+        server = TestServer(app)
+        await server.start_server()
+        client = AioHttpClient(timeout=10.0)
+        try:
+            url = str(server.make_url("/v1/chat/completions"))
+            errors = await client.prewarm_connections(url, 3)
+            assert errors == []
+            assert len(set(peers)) == 3
+
+            prewarmed = set(peers)
+            record = await client.post_request(url, "{}", {})
+            assert record.error is None
+            assert peers[-1] in prewarmed
+        finally:
+            await client.close()
+            await server.close()
+
+    async def test_prewarm_connections_failure(self) -> None:
+        client = AioHttpClient(timeout=10.0)
+        try:
+            errors = await client.prewarm_connections("http://127.0.0.1:1/", 2)
+        finally:
+            await client.close()
+        assert len(errors) == 2
+
+
+class TestAioHttpClientTraceTimings:
+    """Tests for capturing the connection level timings of requests against a local server."""
+
+    @pytest.fixture
+    async def local_server_url(self):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def handler(request: web.Request) -> web.Response:
+            await request.read()
+            return web.Response(text="{}", content_type="application/json")
+
+        app = web.Application()
+        app.router.add_route("*", "/v1/chat/completions", handler)
+        server = TestServer(app)
+        await server.start_server()
+        yield str(server.make_url("/v1/chat/completions"))
+        await server.close()
+
+    async def test_trace_timings_captured(self, local_server_url: str) -> None:
+        with patch.object(Environment.HTTP, "TRACE_TIMINGS", True):
+            client = AioHttpClient(timeout=10.0, tcp_kwargs={"limit": 1})
+        try:
+            records = await asyncio.gather(
+                *[client.post_request(local_server_url, "{}", {}) for _ in range(2)]
+            )
+        finally:
+            await client.close()
+
+        first, second = (record.http_trace for record in records)
+        for trace in (first, second):
+            assert trace is not None
+            assert (
+                trace.request_start_perf_ns
+                <= trace.request_headers_sent_perf_ns
+                <= trace.request_body_sent_perf_ns
+                <= trace.response_start_perf_ns
+            )
+
+        # The first request opens the only connection, and the second waits for it to be released
+        assert first.connection_queued_start_perf_ns is None
+        assert (
+            first.connection_create_start_perf_ns
+            <= first.connection_create_end_perf_ns
+            <= first.request_headers_sent_perf_ns
+        )
+        assert second.connection_create_start_perf_ns is None
+        assert (
+            second.connection_queued_start_perf_ns
+            <= second.connection_queued_end_perf_ns
+            <= second.connection_reused_perf_ns
+        )
+        assert second.connection_queued_end_perf_ns >= first.response_start_perf_ns
+
+    async def test_trace_timings_disabled(self, local_server_url: str) -> None:
+        with patch.object(Environment.HTTP, "TRACE_TIMINGS", False):
+            client = AioHttpClient(timeout=10.0)
+        try:
+            record = await client.post_request(local_server_url, "{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert record.http_trace is None
+
+    async def test_prewarm_not_traced(self, local_server_url: str) -> None:
+        """Pre-warm requests have no trace context, and must not fail when tracing is enabled."""
+        with patch.object(Environment.HTTP, "TRACE_TIMINGS", True):
+            client = AioHttpClient(timeout=10.0)
+        try:
+            errors = await client.prewarm_connections(local_server_url, 2)
+            record = await client.post_request(local_server_url, "{}", {})
+        finally:
+            await client.close()
+
+        assert errors == []
+        assert record.http_trace.connection_reused_perf_ns is not None
+
+
+@pytest.mark.performance
+class TestAioHttpClientPerformance:
+    """Microbenchmarks for the per-request client overhead of AioHttpClient."""
+
+    NUM_REQUESTS = 2_000
+
+    @pytest.fixture
+    async def local_server_url(self):
+        """Start a minimal local aiohttp server, so that the client overhead dominates the timing."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def handler(request: web.Request) -> web.Response:
+            await request.read()
+            return web.Response(text='{"ok": true}', content_type="application/json")
+
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", handler)
+        server = TestServer(app)
+        await server.start_server()
+        yield str(server.make_url("/v1/chat/completions"))
+        await server.close()
+
+    async def _session_per_request(
+        self, client: AioHttpClient, url: str, headers: dict[str, str]
+    ) -> None:
+        """The previous behavior: build a new ClientSession on the shared connector for every request."""
+        async with (
+            aiohttp.ClientSession(
+                connector=client.tcp_connector,
+                timeout=client.timeout,
+                headers=headers,
+                skip_auto_headers=[*headers.keys(), "User-Agent", "Accept-Encoding"],
+                connector_owner=False,
+            ) as session,
+            session.request("POST", url, data="{}", headers=headers) as response,
+        ):
+            await response.text()
+
+    async def _persistent_session(
+        self, client: AioHttpClient, url: str, headers: dict[str, str]
+    ) -> None:
+        """The current behavior: reuse the client's long-lived session with per-request headers."""
+        async with client._get_session().request(
+            "POST", url, data="{}", headers=headers
+        ) as response:
+            await response.text()
+
+    async def test_persistent_session_overhead(self, local_server_url: str) -> None:
+        """Compare the per-request cost of a session per request vs. the persistent session."""
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        client = AioHttpClient(timeout=60.0)
+        timings: dict[str, list[float]] = {"before": [], "after": []}
+        variants = {
+            "before": self._session_per_request,
+            "after": self._persistent_session,
+        }
+        try:
+            # Warm up the connection pool so both variants reuse keep-alive connections
+            for _ in range(10):
+                await self._persistent_session(client, local_server_url, headers)
+
+            # Interleave the variants so that any drift affects both equally
+            for _ in range(self.NUM_REQUESTS):
+                for name, send in variants.items():
+                    start = time.perf_counter_ns()
+                    await send(client, local_server_url, headers)
+                    timings[name].append(time.perf_counter_ns() - start)
+        finally:
+            await client.close()
+
+        before_us = statistics.median(timings["before"]) / 1e3
+        after_us = statistics.median(timings["after"]) / 1e3
+        print(
+            f"\nMedian per-request time over {self.NUM_REQUESTS:,} requests: "
+            f"session per request={before_us:.1f}us, persistent session={after_us:.1f}us "
+            f"(saved {before_us - after_us:.1f}us/request)"
+        )
+        assert after_us < before_us
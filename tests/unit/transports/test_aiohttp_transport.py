@@ -237,6 +237,21 @@ class TestAioHttpTransport:
         assert "messages" in json_str
         assert "gpt-4" in json_str
 
+    @pytest.mark.asyncio
+    async def test_send_request_prerendered_payload_sent_as_is(
+        self, transport, model_endpoint_non_streaming
+    ):
+        """Test that an already serialized payload is sent without re-serializing it."""
+        await self._setup_initialized_transport_with_mock(transport)
+
+        request_info = self._create_request_info(model_endpoint_non_streaming)
+        payload = '{"messages":[{"role":"user","content":"Test"}],"model":"gpt-4"}'
+
+        await transport.send_request(request_info, payload)
+
+        args = self._extract_call_args(transport.aiohttp_client.post_request.call_args)
+        assert args["json_str"] is payload
+
     @pytest.mark.asyncio
     async def test_send_request_handles_exception(
         self, transport, model_endpoint_non_streaming
@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aiperf.common.environment import Environment
+from aiperf.common.models import SSEMessage, TextResponse
+from aiperf.transports.raw_http_client import RawHttpClient
+
+
+class CannedHttpServer:
+    """A minimal local HTTP server that replies to each request with canned byte chunks."""
+
+    def __init__(self, responses: list[list[bytes]], close_after: bool = False):
+        self.responses = responses
+        self.close_after = close_after
+        self.requests: list[bytes] = []
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                body = await reader.readexactly(length)
+                self.requests.append(head + body)
+                for chunk in self.responses[
+                    min(len(self.requests), len(self.responses)) - 1
+                ]:
+                    writer.write(chunk)
+                    await writer.drain()
+                    await asyncio.sleep(0.001)
+                if self.close_after:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def _chunked(*parts: bytes) -> list[bytes]:
+    head = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+    )
+    chunks = [head]
+    chunks.extend(b"%x\r\n%s\r\n" % (len(part), part) for part in parts)
+    chunks.append(b"0\r\n\r\n")
+    return chunks
+
+
+def _json(body: bytes, status: bytes = b"200 OK") -> list[bytes]:
+    return [
+        b"HTTP/1.1 " + status + b"\r\nContent-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n" % len(body),
+        body,
+    ]
+
+
+@pytest.fixture
+async def client():
+    client = RawHttpClient(timeout=5.0)
+    yield client
+    await client.close()
+
+
+class TestRawHttpClient:
+    """Tests for RawHttpClient against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_chunked_sse_stream(self, client):
+        response = _chunked(
+            b'data: {"a": 1}\n\n',
+            b'data: {"b"',  # message split across chunks
+            b": 2}\n\ndata: [DONE]\n\n",
+        )
+        async with CannedHttpServer([response]) as server:
+            record = await client.post_request(
+                server.url, '{"x": 1}', {"Content-Type": "application/json"}
+            )
+
+        assert record.error is None
+        assert record.status == 200
+        assert all(isinstance(r, SSEMessage) for r in record.responses)
+        assert [r.extract_data_content() for r in record.responses] == [
+            '{"a": 1}',
+            '{"b": 2}',
+            "[DONE]",
+        ]
+        perf_ns = [r.perf_ns for r in record.responses]
+        assert perf_ns == sorted(perf_ns)
+        assert record.start_perf_ns <= record.recv_start_perf_ns <= perf_ns[0]
+        assert server.requests[0].startswith(b"POST /v1/chat/completions HTTP/1.1\r\n")
+        assert server.requests[0].endswith(b'\r\n\r\n{"x": 1}')
+
+    @pytest.mark.asyncio
+    async def test_chunked_sse_stream_raw_response_buffer(self, client):
+        response = _chunked(
+            b'data: {"a": 1}\n\ndata: {"b": 2}\n\n', b"data: [DONE]\n\n"
+        )
+        async with CannedHttpServer([response]) as server:
+            with patch.object(Environment.RECORD, "RAW_RESPONSE_BUFFER", True):
+                record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is None
+        assert record.responses == []
+        assert record.raw_responses.content_type == "text/event-stream"
+        assert record.response_count == 3
+        assert [r.get_json() for r in record.iter_responses()] == [
+            {"a": 1},
+            {"b": 2},
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_content_length_json_response(self, client):
+        async with CannedHttpServer([_json(b'{"ok": true}')]) as server:
+            record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is None
+        assert len(record.responses) == 1
+        assert isinstance(record.responses[0], TextResponse)
+        assert record.responses[0].text == '{"ok": true}'
+        assert record.responses[0].content_type == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection_reused(self, client):
+        async with CannedHttpServer([_json(b"{}")]) as server:
+            for _ in range(3):
+                record = await client.post_request(server.url, "{}", {})
+                assert record.error is None
+
+        assert server.connections == 1
+        assert len(server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connections(self, client):
+        async with CannedHttpServer([_json(b"{}")]) as server:
+            errors = await client.prewarm_connections(server.url, 3)
+            assert errors == []
+            await asyncio.sleep(0.01)
+            assert server.connections == 3
+
+            for _ in range(3):
+                record = await client.post_request(server.url, "{}", {})
+                assert record.error is None
+
+        # All requests reused the pre-warmed connections
+        assert server.connections == 3
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connections_failure(self, client):
+        errors = await client.prewarm_connections("http://127.0.0.1:1/", 2)
+        assert len(errors) == 2
+        assert all(isinstance(error, OSError) for error in errors)
+
+    @pytest.mark.asyncio
+    async def test_closed_pooled_connection_is_retried(self, client):
+        async with CannedHttpServer([_json(b"{}")], close_after=True) as server:
+            for _ in range(2):
+                record = await client.post_request(server.url, "{}", {})
+                assert record.error is None
+
+        assert server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_error_status(self, client):
+        response = _json(b'{"error": "bad"}', status=b"400 Bad Request")
+        async with CannedHttpServer([response]) as server:
+            record = await client.post_request(server.url, "{}", {})
+
+        assert record.status == 400
+        assert record.error.code == 400
+        assert record.error.type == "Bad Request"
+        assert record.error.message == '{"error": "bad"}'
+
+    @pytest.mark.asyncio
+    async def test_sse_error_event(self, client):
+        response = _chunked(b'data: {"a": 1}\n\n', b"event: error\ndata: boom\n\n")
+        async with CannedHttpServer([response]) as server:
+            record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is not None
+        assert record.error.code == 502
+        # The events received before the error are kept, as in the aiohttp client
+        assert len(record.responses) == 1
+        assert isinstance(record.responses[0], SSEMessage)
+        assert record.responses[0].extract_data_content() == '{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_sse_error_event_connection_not_reused(self, client):
+        error = _chunked(b"event: error\ndata: boom\n\n")
+        async with CannedHttpServer([error, _json(b"{}")]) as server:
+            first = await client.post_request(server.url, "{}", {})
+            second = await client.post_request(server.url, "{}", {})
+
+        assert first.error is not None
+        assert second.error is None
+        assert server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_dns_cache_expires(self, client):
+        client.ttl_dns_cache = 10
+        loop = asyncio.get_running_loop()
+        with (
+            patch.object(loop, "getaddrinfo", wraps=loop.getaddrinfo) as getaddrinfo,
+            patch("time.monotonic", return_value=100.0) as monotonic,
+        ):
+            await client._resolve("127.0.0.1", 80)
+            await client._resolve("127.0.0.1", 80)
+            assert getaddrinfo.call_count == 1
+
+            monotonic.return_value = 111.0
+            await client._resolve("127.0.0.1", 80)
+            assert getaddrinfo.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_mid_stream(self, client):
+        head = _chunked(b'data: {"a": 1}\n\n')[:2]
+        async with CannedHttpServer([head], close_after=True) as server:
+            record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is not None
+        assert record.error.type == "RawHttpDisconnectedError"
+
+    @pytest.mark.asyncio
+    async def test_read_until_close_body(self, client):
+        response = [
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\n",
+            b"hello ",
+            b"world",
+        ]
+        async with CannedHttpServer([response], close_after=True) as server:
+            record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is None
+        assert record.responses[0].text == "hello world"
+
+    @pytest.mark.asyncio
+    async def test_connection_refused(self, client):
+        record = await client.post_request("http://127.0.0.1:1/", "{}", {})
+        assert record.error is not None
+
+    @pytest.mark.asyncio
+    async def test_start_time_includes_connect(self, client):
+        """Test that the start time is stamped before the connection is opened, as in the aiohttp client."""
+        connect = client._connect
+        connect_perf_ns: list[int] = []
+
+        async def timed_connect(*args):
+            connect_perf_ns.append(time.perf_counter_ns())
+            return await connect(*args)
+
+        async with CannedHttpServer([_json(b"{}")]) as server:
+            with patch.object(client, "_connect", side_effect=timed_connect):
+                record = await client.post_request(server.url, "{}", {})
+
+        assert record.error is None
+        assert record.start_perf_ns < connect_perf_ns[0]
+
+    def test_caller_host_and_content_length_headers_are_replaced(self):
+        request = RawHttpClient._build_request(
+            "POST",
+            "/v1",
+            "localhost:8000",
+            {"host": "other", "CONTENT-LENGTH": "99", "X-Test": "1"},
+            b"{}",
+        )
+
+        assert request == (
+            b"POST /v1 HTTP/1.1\r\nHost: localhost:8000\r\nX-Test: 1\r\n"
+            b"Content-Length: 2\r\n\r\n{}"
+        )
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from aiperf.common.enums import TransportType
+from aiperf.common.exceptions import NotInitializedError
+from aiperf.common.factories import TransportFactory
+from aiperf.common.models.record_models import RequestInfo, RequestRecord
+from aiperf.transports.raw_http_client import RawHttpClient
+from aiperf.transports.raw_http_transport import RawHttpTransport
+
+
+class TestRawHttpTransport:
+    """Tests for RawHttpTransport."""
+
+    @pytest.fixture
+    def transport(self, model_endpoint_non_streaming):
+        return RawHttpTransport(model_endpoint=model_endpoint_non_streaming)
+
+    def _create_request_info(self, model_endpoint):
+        return RequestInfo(
+            model_endpoint=model_endpoint,
+            turns=[],
+            endpoint_headers={},
+            endpoint_params={},
+        )
+
+    def test_registered_with_factory(self):
+        assert (
+            TransportFactory.get_class_from_type(TransportType.RAW_HTTP)
+            is RawHttpTransport
+        )
+
+    def test_metadata(self, transport):
+        metadata = transport.metadata()
+        assert metadata.transport_type == TransportType.RAW_HTTP
+        assert "http" in metadata.url_schemes
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_creates_and_closes_client(self, transport):
+        assert transport.raw_http_client is None
+        await transport.initialize()
+        assert isinstance(transport.raw_http_client, RawHttpClient)
+        await transport.stop()
+        assert transport.raw_http_client is None
+
+    @pytest.mark.asyncio
+    async def test_send_request_not_initialized(
+        self, transport, model_endpoint_non_streaming
+    ):
+        with pytest.raises(NotInitializedError):
+            await transport.send_request(
+                self._create_request_info(model_endpoint_non_streaming), {}
+            )
+
+    @pytest.mark.asyncio
+    async def test_send_request_success(self, transport, model_endpoint_non_streaming):
+        await transport.initialize()
+        mock_record = RequestRecord()
+        transport.raw_http_client.post_request = AsyncMock(return_value=mock_record)
+        payload = {"messages": [{"role": "user", "content": "Hello"}]}
+
+        record = await transport.send_request(
+            self._create_request_info(model_endpoint_non_streaming), payload
+        )
+
+        assert record is mock_record
+        url, json_str, headers = transport.raw_http_client.post_request.call_args[0]
+        assert url == "http://localhost:8000/v1/chat/completions"
+        assert orjson.loads(json_str) == payload
+        assert headers["Content-Type"] == "application/json"
+        assert record.request_headers == headers
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_send_request_prerendered_payload(
+        self, transport, model_endpoint_non_streaming
+    ):
+        await transport.initialize()
+        transport.raw_http_client.post_request = AsyncMock(return_value=RequestRecord())
+        payload = '{"messages":[{"role":"user","content":"Hello"}]}'
+
+        await transport.send_request(
+            self._create_request_info(model_endpoint_non_streaming), payload
+        )
+
+        _, json_str, _ = transport.raw_http_client.post_request.call_args[0]
+        assert json_str is payload
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_send_request_exception_creates_error_record(
+        self, transport, model_endpoint_non_streaming
+    ):
+        await transport.initialize()
+        transport.raw_http_client.post_request = AsyncMock(
+            side_effect=ValueError("boom")
+        )
+
+        record = await transport.send_request(
+            self._create_request_info(model_endpoint_non_streaming), {}
+        )
+
+        assert record.error is not None
+        assert record.error.type == "ValueError"
+        assert record.start_perf_ns is not None
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connections(self, transport):
+        await transport.initialize()
+        transport.raw_http_client.prewarm_connections = AsyncMock(
+            return_value=[ConnectionRefusedError("refused")]
+        )
+
+        stats = await transport.prewarm_connections(4)
+
+        url, num_connections = transport.raw_http_client.prewarm_connections.call_args[
+            0
+        ]
+        assert url == "http://localhost:8000/v1/chat/completions"
+        assert num_connections == 4
+        assert stats.requested == 4
+        assert stats.opened == 3
+        assert stats.failed == 1
+        assert stats.errors[0].type == "ConnectionRefusedError"
+        await transport.stop()
@@ -1,5 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import statistics
 import time
 
 import pytest
@@ -7,7 +8,7 @@ import pytest
 from aiperf.common.enums import SSEFieldType
 from aiperf.common.exceptions import SSEResponseError
 from aiperf.common.models import SSEField, SSEMessage
-from aiperf.transports.sse_utils import AsyncSSEStreamReader
+from aiperf.transports.sse_utils import AsyncSSEStreamReader, SSEEvent, SSEStreamParser
 
 
 @pytest.fixture
@@ -671,3 +672,164 @@ class TestAsyncSSEStreamReaderErrorHandling:
 
             assert len(messages) == expected_msg_count
             assert expected_error in str(exc_info.value)
+
+
+class TestSSEStreamParser:
+    """Test suite for the incremental SSEStreamParser."""
+
+    @pytest.mark.parametrize(
+        "chunks,expected",
+        [
+            ([b"data: a\n\ndata: b\n\n"], [b"data: a", b"data: b"]),
+            ([b"data: a\r\n\r\ndata: b\r\n\r\n"], [b"data: a", b"data: b"]),
+            ([b"data: a\r\n\r\ndata: b\n\n"], [b"data: a", b"data: b"]),
+            ([b"data: a\n", b"\ndata: b\n\n"], [b"data: a", b"data: b"]),
+            ([b"data: a\r\n\r", b"\n"], [b"data: a"]),
+            ([b"data: a\r", b"\n", b"\r", b"\n"], [b"data: a"]),
+            ([b"da", b"ta", b": a", b"\n\n"], [b"data: a"]),
+            ([b"event: x\ndata: a\n\n"], [b"event: x\ndata: a"]),
+            ([b"\n\n\n\ndata: a\n\n"], [b"data: a"]),
+            ([b"data: a\rb\n\n"], [b"data: a\rb"]),
+        ],
+    )
+    def test_feed_splits_messages(
+        self, chunks: list[bytes], expected: list[bytes]
+    ) -> None:
+        """Test that messages are split correctly regardless of delimiter and chunk boundaries."""
+        parser = SSEStreamParser()
+        events = []
+        for i, chunk in enumerate(chunks):
+            events.extend(parser.feed(chunk, i))
+        assert [event.raw for event in events] == expected
+        assert parser.flush(99) is None
+
+    def test_feed_stamps_events_with_chunk_perf_ns(self) -> None:
+        """Test that each event gets the timestamp of the chunk that completed it."""
+        parser = SSEStreamParser()
+        assert parser.feed(b"data: a", 1) == []
+        assert parser.feed(b"\n\ndata: b\n\ndata: c", 2) == [
+            SSEEvent(2, b"data: a"),
+            SSEEvent(2, b"data: b"),
+        ]
+        assert parser.flush(3) == SSEEvent(3, b"data: c")
+        assert parser.flush(4) is None
+
+    def test_event_to_message(self) -> None:
+        """Test converting an event tuple into a full SSEMessage."""
+        message = SSEEvent(5, b"event: message\ndata: Hello").to_message()
+        assert message == SSEMessage(
+            perf_ns=5,
+            packets=[
+                SSEField(name=SSEFieldType.EVENT, value="message"),
+                SSEField(name=SSEFieldType.DATA, value="Hello"),
+            ],
+        )
+
+    def test_inspect_event_for_error(self) -> None:
+        """Test error detection directly on event tuples."""
+        AsyncSSEStreamReader.inspect_event_for_error(SSEEvent(1, b'data: {"error": 1}'))
+        with pytest.raises(SSEResponseError, match="overloaded"):
+            AsyncSSEStreamReader.inspect_event_for_error(
+                SSEEvent(1, b"event: error\n: overloaded")
+            )
+
+    async def test_iter_events(self, create_mock_sse_iterator) -> None:
+        """Test that iter_events yields raw event tuples."""
+        reader = AsyncSSEStreamReader(
+            create_mock_sse_iterator(b"data: Hello\n\n", b"data: World")
+        )
+        events = [event async for event in reader.iter_events()]
+        assert [event.raw for event in events] == [b"data: Hello", b"data: World"]
+        assert all(isinstance(event, SSEEvent) for event in events)
+
+
+@pytest.mark.performance
+class TestSSEStreamParserPerformance:
+    """Microbenchmarks for SSE stream parsing."""
+
+    NUM_TOKENS = 8_192
+    CHUNK_SIZE = 16
+
+    @staticmethod
+    def _synthetic_stream(num_tokens: int, chunk_size: int) -> list[bytes]:
+        """Build an OpenAI-style chat completion stream, split into tiny network chunks."""
+        stream = (
+            b"".join(
+                b'data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1749678185,'
+                b'"model":"gpt2","choices":[{"index":0,"delta":{"content":" tok%d"}}]}\n\n'
+                % i
+                for i in range(num_tokens)
+            )
+            + b"data: [DONE]\n\n"
+        )
+        return [stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+    @staticmethod
+    def _legacy_parse(chunks: list[bytes]) -> list[SSEMessage]:
+        """The previous implementation: rescan the whole buffer for both delimiters on every chunk,
+        trim it after every message and build validated pydantic models per message."""
+        buffer = bytearray()
+        messages = []
+        for chunk in chunks:
+            perf_ns = time.perf_counter_ns()
+            buffer += chunk
+            while True:
+                index = buffer.find(b"\r\n\r\n")
+                length = 4
+                if index == -1:
+                    index = buffer.find(b"\n\n")
+                    length = 2
+                if index == -1:
+                    break
+                message_bytes = bytes(buffer[:index])
+                del buffer[: index + length]
+                raw = message_bytes.decode("utf-8", errors="replace").strip()
+                if not raw:
+                    continue
+                message = SSEMessage(perf_ns=perf_ns)
+                for line in raw.splitlines():
+                    name, _, value = line.partition(":")
+                    message.packets.append(
+                        SSEField(name=name.strip(), value=value.strip())
+                    )
+                messages.append(message)
+        return messages
+
+    @staticmethod
+    def _incremental_parse(chunks: list[bytes]) -> list[SSEEvent]:
+        parser = SSEStreamParser()
+        events = []
+        for chunk in chunks:
+            events.extend(parser.feed(chunk, time.perf_counter_ns()))
+        return events
+
+    def test_incremental_parser_8k_token_stream(self) -> None:
+        """Compare the per-stream cost of the legacy parsing loop vs. the incremental parser."""
+        chunks = self._synthetic_stream(self.NUM_TOKENS, self.CHUNK_SIZE)
+        timings: dict[str, list[int]] = {"legacy": [], "events": [], "messages": []}
+        for _ in range(10):
+            start = time.perf_counter_ns()
+            legacy = self._legacy_parse(chunks)
+            timings["legacy"].append(time.perf_counter_ns() - start)
+
+            start = time.perf_counter_ns()
+            events = self._incremental_parse(chunks)
+            timings["events"].append(time.perf_counter_ns() - start)
+
+            messages = [event.to_message() for event in events]
+            timings["messages"].append(time.perf_counter_ns() - start)
+
+        assert len(events) == len(legacy) == self.NUM_TOKENS + 1
+        assert [m.get_text() for m in messages] == [m.get_text() for m in legacy]
+
+        legacy_ms, events_ms, messages_ms = (
+            statistics.median(timings[name]) / 1e6
+            for name in ("legacy", "events", "messages")
+        )
+        print(
+            f"\nMedian time to parse a {self.NUM_TOKENS:,} token stream in {len(chunks):,} chunks: "
+            f"legacy={legacy_ms:.2f}ms, incremental events={events_ms:.2f}ms, "
+            f"incremental events + models={messages_ms:.2f}ms"
+        )
+        # Only the event parsing happens while the stream is being received, the models can be built afterwards
+        assert events_ms < legacy_ms
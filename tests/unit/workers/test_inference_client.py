@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from aiperf.common.enums import EndpointType, ModelSelectionStrategy
+from aiperf.common.models.dataset_models import Text, Turn
 from aiperf.common.models.model_endpoint_info import (
     EndpointInfo,
     ModelEndpointInfo,
@@ -116,3 +117,44 @@ class TestInferenceClient:
         call_args = inference_client.transport.send_request.call_args
         assert call_args[0][0] == request_info
         assert record == expected_record
+
+    @pytest.mark.asyncio
+    async def test_send_request_uses_prerendered_payload(
+        self, inference_client, model_endpoint
+    ):
+        """Test that the pre-rendered payload of a first turn is sent as-is."""
+        turn = Turn(texts=[Text(contents=["Hello"])], rendered_payload='{"a":1}')
+        request_info = RequestInfo(model_endpoint=model_endpoint, turns=[turn])
+        inference_client.transport.send_request = AsyncMock(
+            return_value=RequestRecord()
+        )
+
+        await inference_client.send_request(request_info)
+
+        inference_client.endpoint.format_payload.assert_not_called()
+        call_args = inference_client.transport.send_request.call_args
+        assert call_args[1]["payload"] == '{"a":1}'
+
+    @pytest.mark.asyncio
+    async def test_send_request_formats_payload_with_history(
+        self, inference_client, model_endpoint
+    ):
+        """Test that later turns are always formatted, as they include the conversation history."""
+        turns = [
+            Turn(texts=[Text(contents=["Hello"])], rendered_payload='{"a":1}'),
+            Turn(role="assistant", texts=[Text(contents=["Hi"])]),
+            Turn(texts=[Text(contents=["How are you?"])]),
+        ]
+        request_info = RequestInfo(
+            model_endpoint=model_endpoint, turns=turns, turn_index=1
+        )
+        inference_client.endpoint.format_payload.return_value = {"b": 2}
+        inference_client.transport.send_request = AsyncMock(
+            return_value=RequestRecord()
+        )
+
+        await inference_client.send_request(request_info)
+
+        inference_client.endpoint.format_payload.assert_called_once_with(request_info)
+        call_args = inference_client.transport.send_request.call_args
+        assert call_args[1]["payload"] == {"b": 2}
@@ -13,10 +13,37 @@ from aiperf.common.config.service_config import ServiceConfig
 from aiperf.common.config.user_config import UserConfig
 from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase
-from aiperf.common.messages import CreditDropMessage
-from aiperf.common.models import ParsedResponse, TextResponseData
+from aiperf.common.environment import Environment
+from aiperf.common.exceptions import InvalidStateError
+from aiperf.common.messages import (
+    ConversationBatchRequestMessage,
+    ConversationBatchResponseMessage,
+    ConversationIdRequestMessage,
+    ConversationIdResponseMessage,
+    ConversationRequestMessage,
+    ConversationResponseMessage,
+    CreditDropBatchMessage,
+    CreditDropMessage,
+    CreditPhaseCompleteMessage,
+    CreditReturnBatchMessage,
+    CreditReturnMessage,
+    DatasetConfiguredNotification,
+    ErrorMessage,
+    TurnCreditDropMessage,
+)
+from aiperf.common.models import (
+    ConnectionPrewarmStats,
+    Conversation,
+    ErrorDetails,
+    ParsedResponse,
+    Text,
+    TextResponseData,
+    Turn,
+)
 from aiperf.common.models.record_models import RequestInfo, RequestRecord
+from aiperf.dataset.shared_memory_store import SharedMemoryDatasetStore
 from aiperf.workers.worker import Worker
+from tests.unit.conftest import real_sleep
 
 
 class MockWorker(Worker):
@@ -340,3 +367,568 @@ class TestWorker:
         assert captured_request_info is not None
         assert captured_request_info.x_request_id == x_request_id
         assert captured_request_info.x_correlation_id == message.request_id
+
+    async def test_future_credit_drop_ns_prepares_request_before_waiting(self, worker):
+        """Test that the request is prepared before waiting for a credit drop time in the future."""
+        events = []
+
+        def mock_format_payload(request_info):
+            events.append("prepare")
+            return {"test": "payload"}
+
+        async def mock_sleep(delay):
+            events.append("sleep")
+
+        async def mock_transport_send(request_info, payload):
+            events.append("send")
+            assert payload == {"test": "payload"}
+            return RequestRecord(start_perf_ns=1000)
+
+        worker.inference_client.endpoint.format_payload = Mock(
+            side_effect=mock_format_payload
+        )
+        worker.inference_client.transport.send_request = AsyncMock(
+            side_effect=mock_transport_send
+        )
+        request_info = RequestInfo(
+            model_endpoint=worker.model_endpoint,
+            turn_index=0,
+            turns=[Turn(texts=[Text(contents=["test"])], model="test-model")],
+        )
+
+        with patch("asyncio.sleep", side_effect=mock_sleep):
+            record = await worker._call_inference_api_internal(
+                request_info, time.time_ns() + 10 * NANOS_PER_SECOND
+            )
+
+        assert events == ["prepare", "sleep", "send"]
+        worker.inference_client.endpoint.format_payload.assert_called_once()
+        assert not record.delayed
+
+    async def test_past_credit_drop_ns_records_delay(self, worker):
+        """Test that a request sent after its credit drop time records the delay."""
+        worker.inference_client.transport.send_request = AsyncMock(
+            return_value=RequestRecord(start_perf_ns=1000)
+        )
+        worker.inference_client.endpoint.format_payload = Mock(
+            return_value={"test": "payload"}
+        )
+        request_info = RequestInfo(
+            model_endpoint=worker.model_endpoint,
+            turn_index=0,
+            turns=[Turn(texts=[Text(contents=["test"])], model="test-model")],
+        )
+
+        record = await worker._call_inference_api_internal(
+            request_info, time.time_ns() - NANOS_PER_SECOND
+        )
+
+        assert record.delayed
+        assert record.delayed_ns >= NANOS_PER_SECOND
+
+    async def test_profile_configure_prewarm_disabled(self, worker):
+        """Test that no connections are pre-warmed by default."""
+        worker.inference_client.prewarm_connections = AsyncMock()
+
+        result = await worker._profile_configure_command(Mock())
+
+        assert result is None
+        worker.inference_client.prewarm_connections.assert_not_called()
+
+    async def test_profile_configure_prewarms_connections(self, worker):
+        """Test that connections are pre-warmed during profile configure, and the stats are returned."""
+        stats = ConnectionPrewarmStats(
+            requested=4, opened=3, failed=1, duration_ns=1_000_000
+        )
+        worker.inference_client.prewarm_connections = AsyncMock(return_value=stats)
+
+        with patch.object(Environment.HTTP, "PREWARM_CONNECTIONS", 4):
+            result = await worker._profile_configure_command(Mock())
+
+        assert result == stats
+        worker.inference_client.prewarm_connections.assert_awaited_once_with(4)
+
+
+def _conversation(session_id: str) -> Conversation:
+    return Conversation(
+        session_id=session_id, turns=[Turn(texts=[Text(contents=["test"])])]
+    )
+
+
+@pytest.mark.asyncio
+class TestWorkerConversationRetrieval:
+    """Tests for retrieving conversations via the prefetch buffer and the LRU cache."""
+
+    @pytest.fixture
+    def worker(self):
+        worker = MockWorker()
+        worker._send_inference_result_message = AsyncMock()
+        return worker
+
+    async def _retrieve(self, worker: Worker, conversation_id: str | None = None):
+        return await worker._retrieve_conversation_response(
+            service_id=worker.service_id,
+            conversation_id=conversation_id,
+            phase=CreditPhase.PROFILING,
+        )
+
+    async def test_prefetch_disabled_requests_each_conversation(self, worker):
+        worker.conversation_request_client.request = AsyncMock(
+            return_value=ConversationResponseMessage(
+                service_id="dataset", conversation=_conversation("a")
+            )
+        )
+
+        for _ in range(3):
+            assert (await self._retrieve(worker)).session_id == "a"
+
+        assert worker.conversation_request_client.request.await_count == 3
+        requests = worker.conversation_request_client.request.await_args_list
+        assert all(
+            isinstance(call.args[0], ConversationRequestMessage) for call in requests
+        )
+
+    async def test_prefetch_serves_conversations_in_order(self, worker):
+        batches = iter(range(100))
+
+        async def mock_request(message):
+            assert isinstance(message, ConversationBatchRequestMessage)
+            batch = next(batches)
+            return ConversationBatchResponseMessage(
+                service_id="dataset",
+                conversations=[
+                    _conversation(f"{batch}-{i}") for i in range(message.count)
+                ],
+            )
+
+        worker.conversation_request_client.request = AsyncMock(side_effect=mock_request)
+        worker.conversation_prefetch_size = 4
+
+        session_ids = []
+        for _ in range(10):
+            session_ids.append((await self._retrieve(worker)).session_id)
+            await asyncio.sleep(0)  # Allow the background refill to run
+
+        assert session_ids == [f"{i // 4}-{i % 4}" for i in range(10)]
+        # The buffer is refilled in the background once it is half empty, so it is never empty
+        assert worker.conversation_request_client.request.await_count == 4
+        assert len(worker._prefetched_conversations) >= 2
+
+    async def test_prefetch_concurrent_credits_share_refill(self, worker):
+        async def mock_request(message):
+            await asyncio.sleep(0.01)
+            return ConversationBatchResponseMessage(
+                service_id="dataset",
+                conversations=[_conversation(str(i)) for i in range(message.count)],
+            )
+
+        worker.conversation_request_client.request = AsyncMock(side_effect=mock_request)
+        worker.conversation_prefetch_size = 8
+
+        conversations = await asyncio.gather(
+            *[self._retrieve(worker) for _ in range(4)]
+        )
+
+        assert [c.session_id for c in conversations] == ["0", "1", "2", "3"]
+        assert worker.conversation_request_client.request.await_count == 2
+
+    async def test_prefetch_error_sends_error_record(self, worker):
+        worker.conversation_request_client.request = AsyncMock(
+            return_value=ErrorMessage(
+                error=ErrorDetails(type="DatasetError", message="Dataset is empty")
+            )
+        )
+        worker.conversation_prefetch_size = 4
+
+        with pytest.raises(ValueError, match="Failed to retrieve conversation"):
+            await self._retrieve(worker)
+
+        record = worker._send_inference_result_message.await_args.args[0]
+        assert record.error.message == "Dataset is empty"
+        assert worker._prefetch_task is None
+
+    async def test_prefetch_buffer_is_reset_on_phase_change(self, worker):
+        async def mock_request(message):
+            return ConversationBatchResponseMessage(
+                service_id="dataset",
+                conversations=[
+                    _conversation(f"{message.credit_phase}-{i}")
+                    for i in range(message.count)
+                ],
+            )
+
+        worker.conversation_request_client.request = AsyncMock(side_effect=mock_request)
+        worker.conversation_prefetch_size = 4
+
+        warmup = await worker._retrieve_conversation_response(
+            service_id=worker.service_id,
+            conversation_id=None,
+            phase=CreditPhase.WARMUP,
+        )
+        profiling = await self._retrieve(worker)
+
+        assert warmup.session_id == f"{CreditPhase.WARMUP}-0"
+        assert profiling.session_id == f"{CreditPhase.PROFILING}-0"
+        assert all(
+            c.session_id.startswith(str(CreditPhase.PROFILING))
+            for c in worker._prefetched_conversations
+        )
+
+    async def test_prefetch_refill_for_previous_phase_is_cancelled(self, worker):
+        started = asyncio.Event()
+
+        async def mock_request(message):
+            if message.credit_phase == CreditPhase.WARMUP:
+                started.set()
+                await asyncio.Event().wait()  # Never completes
+            return ConversationBatchResponseMessage(
+                service_id="dataset",
+                conversations=[_conversation(str(i)) for i in range(message.count)],
+            )
+
+        worker.conversation_request_client.request = AsyncMock(side_effect=mock_request)
+        worker.conversation_prefetch_size = 4
+
+        warmup = asyncio.create_task(
+            worker._retrieve_conversation_response(
+                service_id=worker.service_id,
+                conversation_id=None,
+                phase=CreditPhase.WARMUP,
+            )
+        )
+        await started.wait()
+        warmup_task = worker._prefetch_task
+
+        assert (await self._retrieve(worker)).session_id == "0"
+        assert warmup_task.cancelled()
+        with pytest.raises(InvalidStateError):
+            await warmup
+
+    async def test_conversation_by_id_lru_cache(self, worker):
+        async def mock_request(message):
+            assert isinstance(message, ConversationRequestMessage)
+            return ConversationResponseMessage(
+                service_id="dataset",
+                conversation=_conversation(message.conversation_id),
+            )
+
+        worker.conversation_request_client.request = AsyncMock(side_effect=mock_request)
+        worker.conversation_cache_size = 2
+
+        for conversation_id in ["a", "b", "a", "c", "a", "b"]:
+            assert (await self._retrieve(worker, conversation_id)).session_id == (
+                conversation_id
+            )
+
+        # "a" stays cached as it was most recently used, while "b" is evicted by "c"
+        requested = [
+            call.args[0].conversation_id
+            for call in worker.conversation_request_client.request.await_args_list
+        ]
+        assert requested == ["a", "b", "c", "b"]
+        assert list(worker._conversation_cache) == ["a", "b"]
+
+    async def test_conversation_by_id_cache_disabled(self, worker):
+        worker.conversation_request_client.request = AsyncMock(
+            return_value=ConversationResponseMessage(
+                service_id="dataset", conversation=_conversation("a")
+            )
+        )
+        worker.conversation_cache_size = 0
+
+        for _ in range(2):
+            await self._retrieve(worker, "a")
+
+        assert worker.conversation_request_client.request.await_count == 2
+        assert not worker._conversation_cache
+
+    async def test_shared_memory_reads_conversation_by_id(self, worker):
+        store = SharedMemoryDatasetStore.create([_conversation("a")])
+        worker._shared_memory_store = store
+        worker.conversation_request_client.request = AsyncMock()
+        try:
+            assert (await self._retrieve(worker, "a")).session_id == "a"
+        finally:
+            worker._close_shared_memory_store()
+
+        worker.conversation_request_client.request.assert_not_called()
+
+    async def test_shared_memory_requests_only_next_conversation_id(self, worker):
+        store = SharedMemoryDatasetStore.create(
+            [_conversation("a"), _conversation("b")]
+        )
+        worker._shared_memory_store = store
+        worker.conversation_request_client.request = AsyncMock(
+            return_value=ConversationIdResponseMessage(
+                service_id="dataset", conversation_id="b"
+            )
+        )
+        try:
+            assert (await self._retrieve(worker)).session_id == "b"
+        finally:
+            worker._close_shared_memory_store()
+
+        message = worker.conversation_request_client.request.await_args.args[0]
+        assert isinstance(message, ConversationIdRequestMessage)
+
+    async def test_shared_memory_missing_conversation_sends_error_record(self, worker):
+        worker._shared_memory_store = SharedMemoryDatasetStore.create([])
+        try:
+            with pytest.raises(ValueError, match="Failed to retrieve conversation"):
+                await self._retrieve(worker, "missing")
+        finally:
+            worker._close_shared_memory_store()
+
+        record = worker._send_inference_result_message.await_args.args[0]
+        assert "missing not found" in record.error.message
+
+    async def test_dataset_configured_attaches_to_shared_memory(self, worker):
+        store = SharedMemoryDatasetStore.create([_conversation("a")])
+        try:
+            await worker._on_dataset_configured(
+                DatasetConfiguredNotification(
+                    service_id="dataset", shared_memory_name=store.name
+                )
+            )
+            assert worker._shared_memory_store is not None
+            assert "a" in worker._shared_memory_store
+
+            await worker._on_dataset_configured(
+                DatasetConfiguredNotification(service_id="dataset")
+            )
+            assert worker._shared_memory_store is None
+        finally:
+            worker._close_shared_memory_store()
+            store.close()
+
+
+def _credit_return(credit_drop_id: str) -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id="mock-service-id",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=credit_drop_id,
+        requests_sent=1,
+    )
+
+
+@pytest.mark.asyncio
+class TestWorkerCreditBatching:
+    """Tests for handling credit drop batches and coalescing credit returns."""
+
+    @pytest.fixture
+    def worker(self):
+        worker = MockWorker()
+        worker.credit_return_push_client = Mock()
+        worker.credit_return_push_client.push = AsyncMock()
+        return worker
+
+    async def test_credit_drop_batch_processes_each_credit(self, worker):
+        worker._process_credit_drop_internal = AsyncMock()
+        credits = [
+            CreditDropMessage(
+                service_id="timing-manager", phase=CreditPhase.PROFILING, credit_num=i
+            )
+            for i in range(3)
+        ]
+
+        await worker._credit_drop_batch_callback(
+            CreditDropBatchMessage(service_id="timing-manager", credits=credits)
+        )
+
+        calls = worker._process_credit_drop_internal.await_args_list
+        assert [call.args[0] for call in calls] == credits
+
+    async def test_credit_returns_sent_individually_by_default(self, worker):
+        await worker._return_credit(_credit_return("a"))
+
+        worker.credit_return_push_client.push.assert_awaited_once_with(
+            _credit_return("a")
+        )
+
+    async def test_credit_returns_coalesced_over_window(self, worker):
+        worker.credit_return_batch_window = 0.001
+
+        await worker._return_credit(_credit_return("a"))
+        await worker._return_credit(_credit_return("b"))
+        assert worker.credit_return_push_client.push.await_count == 0
+
+        await real_sleep(0.01)
+
+        worker.credit_return_push_client.push.assert_awaited_once()
+        message = worker.credit_return_push_client.push.await_args.args[0]
+        assert isinstance(message, CreditReturnBatchMessage)
+        assert [r.credit_drop_id for r in message.credit_returns] == ["a", "b"]
+
+    async def test_full_credit_return_batch_sent_immediately(self, worker):
+        worker.credit_return_batch_window = 10.0
+        worker.credit_return_batch_size = 2
+
+        for credit_drop_id in "abc":
+            await worker._return_credit(_credit_return(credit_drop_id))
+        await asyncio.sleep(0)
+
+        worker.credit_return_push_client.push.assert_awaited_once()
+        message = worker.credit_return_push_client.push.await_args.args[0]
+        assert [r.credit_drop_id for r in message.credit_returns] == ["a", "b"]
+
+        # The remaining credit return is sent when the worker stops
+        await worker._flush_pending_credit_returns()
+        await asyncio.sleep(0)
+        assert worker.credit_return_push_client.push.await_count == 2
+        assert worker._credit_return_flush_handle is None
+
+
+def _multi_turn_conversation() -> Conversation:
+    return Conversation(
+        session_id="session_1",
+        turns=[
+            Turn(texts=[Text(contents=["first"])]),
+            Turn(texts=[Text(contents=["second"])], delay=500),
+            Turn(texts=[Text(contents=["third"])], delay=1500),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+class TestWorkerPerTurnCredits:
+    """Tests for sending each turn of a multi-turn conversation as its own credit."""
+
+    @pytest.fixture
+    def worker(self):
+        worker = MockWorker()
+        worker.per_turn_credits = True
+        worker._retrieve_conversation_response = AsyncMock(
+            return_value=_multi_turn_conversation()
+        )
+        worker._build_response_record = AsyncMock(return_value=RequestRecord())
+        worker._send_inference_result_message = AsyncMock()
+        worker._process_response = AsyncMock(
+            side_effect=lambda record: Turn(
+                role="assistant", texts=[Text(contents=["response"])]
+            )
+        )
+        return worker
+
+    async def _execute(self, worker: Worker, message: CreditDropMessage):
+        return_message = CreditReturnMessage(
+            service_id=worker.service_id,
+            phase=message.phase,
+            credit_drop_id=message.request_id,
+            requests_sent=0,
+        )
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await worker._execute_single_credit_internal(message, return_message)
+        mock_sleep.assert_not_awaited()
+        return return_message
+
+    async def test_first_turn_returns_next_turn(self, worker):
+        """Test that only the first turn is sent, the next turn is returned with its delay, and the history is kept
+        on the worker by session ID."""
+        message = CreditDropMessage(
+            service_id="timing-manager",
+            phase=CreditPhase.PROFILING,
+            credit_num=3,
+            stage_index=1,
+        )
+
+        return_message = await self._execute(worker, message)
+
+        assert return_message.requests_sent == 1
+        next_turn = return_message.next_turn
+        assert next_turn.conversation_id == "session_1"
+        assert next_turn.session_id == message.request_id
+        assert next_turn.turn_index == 1
+        assert next_turn.credit_num == 3
+        assert next_turn.stage_index == 1
+        assert next_turn.delay_ns == 500 * 1_000_000
+        phase, _, turn_list = worker._sessions[message.request_id]
+        assert phase == CreditPhase.PROFILING
+        assert [turn.texts[0].contents[0] for turn in turn_list] == [
+            "first",
+            "response",
+        ]
+
+    async def test_later_turns_continue_from_session(self, worker):
+        """Test that later turns are sent after the turns of their session so far, and the last turn completes the
+        conversation and discards the session."""
+        message = CreditDropMessage(
+            service_id="timing-manager",
+            phase=CreditPhase.PROFILING,
+            credit_num=3,
+        )
+        next_turn = (await self._execute(worker, message)).next_turn
+        request_info = worker._build_response_record.await_args.kwargs["request_info"]
+        correlation_ids = [request_info.x_correlation_id]
+
+        for _ in range(2):
+            turn_message = TurnCreditDropMessage(
+                service_id="timing-manager",
+                target_service_id=worker.service_id,
+                phase=CreditPhase.PROFILING,
+                credit_num=next_turn.credit_num,
+                conversation_id=next_turn.conversation_id,
+                turn_index=next_turn.turn_index,
+                session_id=next_turn.session_id,
+            )
+            return_message = await self._execute(worker, turn_message)
+            assert return_message.requests_sent == 1
+            next_turn = return_message.next_turn
+            request_info = worker._build_response_record.await_args.kwargs[
+                "request_info"
+            ]
+            correlation_ids.append(request_info.x_correlation_id)
+
+        assert next_turn is None
+        assert worker._sessions == {}
+        # All of the turns of the session share the X-Correlation-ID of its first credit
+        assert correlation_ids == [message.request_id] * 3
+        worker._retrieve_conversation_response.assert_awaited_once()
+        request_info = worker._build_response_record.await_args.kwargs["request_info"]
+        assert request_info.turn_index == 2
+        assert [turn.texts[0].contents[0] for turn in request_info.turns[:5]] == [
+            "first",
+            "response",
+            "second",
+            "response",
+            "third",
+        ]
+
+    async def test_turn_of_unknown_session_raises(self, worker):
+        """Test that a turn of a session this worker does not keep raises an error."""
+        message = TurnCreditDropMessage(
+            service_id="timing-manager",
+            target_service_id=worker.service_id,
+            phase=CreditPhase.PROFILING,
+            credit_num=0,
+            conversation_id="session_1",
+            turn_index=1,
+            session_id="unknown",
+        )
+        return_message = CreditReturnMessage(
+            service_id=worker.service_id,
+            phase=message.phase,
+            credit_drop_id=message.request_id,
+            requests_sent=0,
+        )
+
+        with pytest.raises(InvalidStateError):
+            await worker._execute_single_credit_internal(message, return_message)
+
+    async def test_phase_complete_discards_sessions(self, worker):
+        """Test that the sessions of a completed credit phase are discarded."""
+        worker._sessions = {
+            "warmup": (CreditPhase.WARMUP, _multi_turn_conversation(), []),
+            "profiling": (CreditPhase.PROFILING, _multi_turn_conversation(), []),
+        }
+
+        await worker._on_credit_phase_complete(
+            CreditPhaseCompleteMessage(
+                service_id="timing-manager",
+                phase=CreditPhase.WARMUP,
+                completed=1,
+                end_ns=1,
+                final_request_count=1,
+            )
+        )
+
+        assert list(worker._sessions) == ["profiling"]
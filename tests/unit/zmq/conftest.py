@@ -24,8 +24,8 @@ def mock_zmq_socket():
     """Create a mock ZMQ socket with common methods.
 
     Mocks the methods actually used by ZMQ clients:
-    - send() / recv() - used by dealer, push, pull clients
-    - send_multipart() / recv_multipart() - used by pub, sub, router clients
+    - send() / recv() - used by dealer, push clients
+    - send_multipart() / recv_multipart() - used by pub, sub, router, pull clients (and push for multipart messages)
 
     By default, recv methods block forever (await on a never-completing Future)
     to avoid busy loops with mocked sleep. Tests should override these when
@@ -138,9 +138,9 @@ class BaseClientTestHelper:
         """Setup a mock socket with specified behavior.
 
         Args:
-            recv_side_effect: Side effect for socket.recv() (used by dealer, pull)
+            recv_side_effect: Side effect for socket.recv() (used by dealer)
             recv_return_value: Single return value for socket.recv(), then blocks forever
-            recv_multipart_side_effect: Side effect for socket.recv_multipart() (used by sub, router)
+            recv_multipart_side_effect: Side effect for socket.recv_multipart() (used by sub, router, pull)
             send_side_effect: Side effect for socket.send() (used by dealer, push)
             send_multipart_side_effect: Side effect for socket.send_multipart() (used by pub, router)
         """
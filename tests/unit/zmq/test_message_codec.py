@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for message_codec.py - JSON and msgpack message codecs.
+"""
+
+import time
+
+import pytest
+
+from aiperf.common.enums import CreditPhase, LifecycleState, MessageCodecType
+from aiperf.common.factories import MessageCodecFactory
+from aiperf.common.messages import (
+    HeartbeatMessage,
+    InferenceResultsMessage,
+    MetricRecordsMessage,
+)
+from aiperf.common.models import (
+    ErrorDetails,
+    MetricRecordMetadata,
+    RawResponseBuffer,
+    RequestRecord,
+    SSEField,
+    SSEMessage,
+    Text,
+    Turn,
+)
+from aiperf.zmq.message_codec import JSONMessageCodec, MsgpackMessageCodec
+
+
+def _sse_chunk(i: int) -> bytes:
+    return f'data: {{"choices":[{{"delta":{{"content":"token {i}"}}}}]}}\n\n'.encode()
+
+
+def _inference_results_message(
+    num_responses: int, raw: bool = False
+) -> InferenceResultsMessage:
+    record = RequestRecord(
+        turns=[Turn(texts=[Text(contents=["Hello, world! " * 50])], max_tokens=100)],
+        conversation_id="conversation-1",
+        turn_index=0,
+        model_name="test-model",
+        start_perf_ns=1_000,
+        end_perf_ns=2_000_000,
+        status=200,
+        credit_phase=CreditPhase.PROFILING,
+        x_request_id="request-1",
+    )
+    if raw:
+        record.raw_responses = RawResponseBuffer.from_chunks(
+            ((1_000 + i, _sse_chunk(i)) for i in range(num_responses)),
+            content_type="text/event-stream",
+        )
+    else:
+        record.responses = [
+            SSEMessage(
+                perf_ns=1_000 + i,
+                packets=[SSEField(name="data", value=_sse_chunk(i)[6:-2].decode())],
+            )
+            for i in range(num_responses)
+        ]
+    return InferenceResultsMessage(service_id="worker-1", record=record)
+
+
+def _metric_records_message() -> MetricRecordsMessage:
+    return MetricRecordsMessage(
+        service_id="record-processor-1",
+        metadata=MetricRecordMetadata(
+            session_num=1,
+            conversation_id="conversation-1",
+            turn_index=0,
+            request_start_ns=1_000,
+            request_end_ns=2_000_000,
+            worker_id="worker-1",
+            record_processor_id="record-processor-1",
+            benchmark_phase=CreditPhase.PROFILING,
+        ),
+        results=[
+            {
+                "request_latency": 1_999_000,
+                "time_to_first_token": 100_000,
+                "inter_token_latency": 1_234.5,
+                "output_sequence_length": 100,
+                "inter_chunk_latency": [10_000 + i for i in range(100)],
+            }
+        ],
+    )
+
+
+@pytest.fixture(params=[MessageCodecType.JSON, MessageCodecType.MSGPACK])
+def codec(request):
+    return MessageCodecFactory.create_instance(request.param)
+
+
+class TestMessageCodecRoundTrip:
+    """Test that every codec decodes the messages it encodes."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            HeartbeatMessage(service_id="test-service", state=LifecycleState.RUNNING, service_type="test"),
+            _inference_results_message(10),
+            _inference_results_message(10, raw=True),
+            _metric_records_message(),
+            MetricRecordsMessage(
+                service_id="record-processor-1",
+                metadata=_metric_records_message().metadata,
+                results=[],
+                error=ErrorDetails(type="Error", message="Request failed", code=500),
+            ),
+        ],
+    )  # fmt: skip
+    def test_round_trip(self, codec, message):
+        assert codec.decode(codec.encode(message)) == message
+        assert codec.decode_multipart(codec.encode_multipart(message)) == message
+
+    def test_factory_creates_codecs(self):
+        assert isinstance(
+            MessageCodecFactory.create_instance(MessageCodecType.JSON),
+            JSONMessageCodec,
+        )
+        assert isinstance(
+            MessageCodecFactory.create_instance("msgpack"), MsgpackMessageCodec
+        )
+
+
+class TestMsgpackMultipart:
+    """Test sending large byte fields as separate frames with the msgpack codec."""
+
+    def test_large_bytes_sent_as_separate_frame(self):
+        message = _inference_results_message(100, raw=True)
+        codec = MsgpackMessageCodec(multipart_threshold=1024)
+
+        frames = codec.encode_multipart(message)
+
+        assert len(frames) == 2
+        assert frames[1] == message.record.raw_responses.data
+        assert message.record.raw_responses.data not in frames[0]
+        assert codec.decode_multipart(frames) == message
+
+    def test_small_bytes_stay_in_body(self):
+        message = _inference_results_message(2, raw=True)
+        codec = MsgpackMessageCodec(multipart_threshold=1024)
+
+        frames = codec.encode_multipart(message)
+
+        assert len(frames) == 1
+        assert codec.decode_multipart(frames) == message
+
+    def test_threshold_zero_disables_multipart(self):
+        message = _inference_results_message(100, raw=True)
+        codec = MsgpackMessageCodec(multipart_threshold=0)
+
+        assert len(codec.encode_multipart(message)) == 1
+
+    def test_binary_is_smaller_than_json(self):
+        message = _inference_results_message(100, raw=True)
+
+        assert len(MsgpackMessageCodec().encode(message)) < len(
+            JSONMessageCodec().encode(message)
+        )
+
+
+@pytest.mark.performance
+class TestMessageCodecPerformance:
+    """Benchmark the encode+decode cost of the high volume messages for each codec."""
+
+    ITERATIONS = 1_000
+
+    def _benchmark(self, codec, message) -> float:
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            codec.decode_multipart(codec.encode_multipart(message))
+        return (time.perf_counter() - start) / self.ITERATIONS
+
+    @pytest.mark.parametrize(
+        "name,message",
+        [
+            ("InferenceResultsMessage (responses)", _inference_results_message(500)),
+            ("InferenceResultsMessage (raw_responses)", _inference_results_message(500, raw=True)),
+            ("MetricRecordsMessage", _metric_records_message()),
+        ],
+    )  # fmt: skip
+    def test_encode_decode_cost(self, name, message):
+        results = {
+            codec_type: self._benchmark(
+                MessageCodecFactory.create_instance(codec_type), message
+            )
+            for codec_type in MessageCodecType
+        }
+        for codec_type, seconds in results.items():
+            print(f"{name} [{codec_type}]: {seconds * 1e6:,.1f} us per encode+decode")
+
+        assert all(seconds < 0.05 for seconds in results.values())
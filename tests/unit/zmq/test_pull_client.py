@@ -11,9 +11,11 @@ import pytest
 import zmq
 import zmq.asyncio
 
-from aiperf.common.enums import LifecycleState, MessageType
+from aiperf.common.enums import LifecycleState, MessageCodecType, MessageType
 from aiperf.common.environment import Environment
-from aiperf.common.messages import HeartbeatMessage, Message
+from aiperf.common.messages import HeartbeatMessage, InferenceResultsMessage, Message
+from aiperf.common.models import RawResponseBuffer, RequestRecord
+from aiperf.zmq.message_codec import MsgpackMessageCodec
 from aiperf.zmq.pull_client import ZMQPullClient
 
 
@@ -105,7 +107,7 @@ class TestZMQPullClientBackgroundTask:
 
         async with pull_test_helper.create_client(
             auto_start=False,
-            recv_side_effect=[sample_message.to_json_bytes()],
+            recv_multipart_side_effect=[[sample_message.to_json_bytes()]],
         ) as client:
             # Register callback BEFORE starting
             client.register_pull_callback(sample_message.message_type, callback)
@@ -121,6 +123,43 @@ class TestZMQPullClientBackgroundTask:
 
             assert len(received_messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_background_task_decodes_multipart_message(
+        self,
+        mock_zmq_context,
+        create_callback_tracker,
+        wait_for_background_task,
+    ):
+        """Test that messages sent as multiple frames by the msgpack codec are decoded."""
+        callback, event, received_messages = create_callback_tracker()
+        message = InferenceResultsMessage(
+            service_id="test-service",
+            record=RequestRecord(raw_responses=RawResponseBuffer(data=b"x" * 4096)),
+        )
+        frames = MsgpackMessageCodec(multipart_threshold=1024).encode_multipart(message)
+        assert len(frames) == 2
+
+        mock_socket = AsyncMock(spec=zmq.asyncio.Socket)
+        mock_socket.bind = Mock()
+        mock_socket.setsockopt = Mock()
+        mock_socket.recv_multipart = AsyncMock(side_effect=[frames])
+        mock_zmq_context.socket = Mock(return_value=mock_socket)
+
+        client = ZMQPullClient(
+            address="tcp://127.0.0.1:5555",
+            bind=False,
+            message_codec=MessageCodecType.MSGPACK,
+        )
+        client.register_pull_callback(message.message_type, callback)
+
+        await client.initialize()
+        await client.start()
+        await wait_for_background_task()
+        await asyncio.wait_for(event.wait(), timeout=1.0)
+        await client.stop()
+
+        assert received_messages == [message]
+
     @pytest.mark.asyncio
     async def test_background_task_handles_zmq_again(
         self, pull_test_helper, wait_for_background_task
@@ -128,7 +167,7 @@ class TestZMQPullClientBackgroundTask:
         """Test that background task handles zmq.Again gracefully."""
         async with pull_test_helper.create_client(
             auto_start=True,
-            recv_side_effect=zmq.Again(),
+            recv_multipart_side_effect=zmq.Again(),
         ):
             # Should not raise
             await wait_for_background_task()
@@ -142,7 +181,7 @@ class TestZMQPullClientBackgroundTask:
         async with pull_test_helper.create_client(
             auto_start=True,
             max_pull_concurrency=5,
-            recv_side_effect=zmq.Again(),
+            recv_multipart_side_effect=zmq.Again(),
         ) as client:
             await wait_for_background_task()
 
@@ -156,7 +195,7 @@ class TestZMQPullClientBackgroundTask:
         """Test that background task handles exceptions gracefully."""
         async with pull_test_helper.create_client(
             auto_start=True,
-            recv_side_effect=[RuntimeError("Test error")],
+            recv_multipart_side_effect=[RuntimeError("Test error")],
         ):
             # Should not crash, just continue
             await wait_for_background_task()
@@ -170,7 +209,7 @@ class TestZMQPullClientBackgroundTask:
 
         async with pull_test_helper.create_client(
             auto_start=True,
-            recv_side_effect=[message.to_json_bytes()],
+            recv_multipart_side_effect=[[message.to_json_bytes()]],
         ):
             # Don't register any callbacks
             # Should not crash, just continue
@@ -198,8 +237,8 @@ class TestZMQPullClientConcurrency:
         mock_socket = AsyncMock(spec=zmq.asyncio.Socket)
         mock_socket.bind = Mock()
         mock_socket.setsockopt = Mock()
-        mock_socket.recv = AsyncMock(
-            side_effect=[msg.to_json_bytes() for msg in messages]
+        mock_socket.recv_multipart = AsyncMock(
+            side_effect=[[msg.to_json_bytes()] for msg in messages]
         )
         mock_zmq_context.socket = Mock(return_value=mock_socket)
 
@@ -235,7 +274,9 @@ class TestZMQPullClientConcurrency:
         mock_socket = AsyncMock(spec=zmq.asyncio.Socket)
         mock_socket.bind = Mock()
         mock_socket.setsockopt = Mock()
-        mock_socket.recv = AsyncMock(side_effect=[sample_message.to_json_bytes()])
+        mock_socket.recv_multipart = AsyncMock(
+            side_effect=[[sample_message.to_json_bytes()]]
+        )
         mock_zmq_context.socket = Mock(return_value=mock_socket)
 
         client = ZMQPullClient(
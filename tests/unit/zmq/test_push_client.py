@@ -10,10 +10,11 @@ import pytest
 import zmq
 import zmq.asyncio
 
-from aiperf.common.enums import MessageType
+from aiperf.common.enums import MessageCodecType, MessageType
 from aiperf.common.environment import Environment
 from aiperf.common.exceptions import CommunicationError, NotInitializedError
-from aiperf.common.messages import Message
+from aiperf.common.messages import InferenceResultsMessage, Message
+from aiperf.common.models import RawResponseBuffer, RequestRecord
 from aiperf.zmq.push_client import ZMQPushClient
 
 
@@ -74,6 +75,33 @@ class TestZMQPushClientPush:
         )
         assert "test-123" in sent_str
 
+    @pytest.mark.asyncio
+    async def test_push_sends_large_bytes_as_separate_frames(
+        self, mock_zmq_socket, mock_zmq_context
+    ):
+        """Test that the msgpack codec sends large byte fields as separate frames."""
+        client = ZMQPushClient(
+            address="tcp://127.0.0.1:5555",
+            bind=True,
+            message_codec=MessageCodecType.MSGPACK,
+        )
+        client.codec.multipart_threshold = 1024
+        await client.initialize()
+
+        data = b"x" * 4096
+        message = InferenceResultsMessage(
+            service_id="test-service",
+            record=RequestRecord(raw_responses=RawResponseBuffer(data=data)),
+        )
+
+        await client.push(message)
+
+        mock_zmq_socket.send.assert_not_called()
+        mock_zmq_socket.send_multipart.assert_called_once()
+        frames = mock_zmq_socket.send_multipart.call_args[0][0]
+        assert frames[1] == data
+        assert client.codec.decode_multipart(frames) == message
+
     @pytest.mark.asyncio
     async def test_push_retries_on_zmq_again(self, mock_zmq_context):
         """Test that push retries on zmq.Again (timeout)."""